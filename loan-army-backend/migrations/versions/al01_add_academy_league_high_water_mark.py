@@ -0,0 +1,29 @@
+"""Add last_fixture_timestamp high-water mark to academy_leagues
+
+Revision ID: al01
+Revises: pl01
+Create Date: 2026-10-18
+
+Lets academy league syncs skip FT fixtures that were already fully
+processed instead of re-fetching lineups/events for the whole window.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'al01'
+down_revision = 'pl01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'academy_leagues',
+        sa.Column('last_fixture_timestamp', sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column('academy_leagues', 'last_fixture_timestamp')
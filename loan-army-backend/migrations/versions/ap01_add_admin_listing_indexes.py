@@ -0,0 +1,66 @@
+"""Add keyset pagination indexes for the admin loan and player listings
+
+Revision ID: ap01
+Revises: cs01
+Create Date: 2026-10-18
+
+GET /admin/loans and GET /admin/players now page with (sort key, id)
+cursors and filter in SQL. loaned_players had no index beyond its unique
+key, so every page sorted the whole table. Rows with NULL timestamps are
+backfilled first; the cursors compare on those columns. On PostgreSQL a
+trigram index serves the name search when pg_trgm can be enabled.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ap01'
+down_revision = 'cs01'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_loaned_players_updated_at_id', ['updated_at', 'id']),
+    ('ix_loaned_players_created_at_id', ['created_at', 'id']),
+    ('ix_loaned_players_name_lower_id', [sa.text('lower(player_name)'), 'id']),
+    ('ix_loaned_players_primary_active_updated', ['primary_team_id', 'is_active', 'updated_at', 'id']),
+    ('ix_loaned_players_loan_team_id', ['loan_team_id']),
+)
+TRGM_INDEX = 'ix_loaned_players_name_trgm'
+
+
+def upgrade():
+    op.execute('UPDATE loaned_players SET created_at = COALESCE(created_at, updated_at, CURRENT_TIMESTAMP) '
+               'WHERE created_at IS NULL')
+    op.execute('UPDATE loaned_players SET updated_at = created_at WHERE updated_at IS NULL')
+
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns in INDEXES:
+            op.create_index(name, 'loaned_players', columns)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, 'loaned_players', columns, postgresql_concurrently=True, if_not_exists=True)
+        try:
+            op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRGM_INDEX} '
+                       'ON loaned_players USING gin (player_name gin_trgm_ops)')
+        except sa.exc.DBAPIError:
+            # Managed databases may not allow the extension; search still works, unindexed
+            pass
+        op.execute('ANALYZE loaned_players')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='loaned_players')
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(TRGM_INDEX, table_name='loaned_players', postgresql_concurrently=True, if_exists=True)
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='loaned_players', postgresql_concurrently=True, if_exists=True)
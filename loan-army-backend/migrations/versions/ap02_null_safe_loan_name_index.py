@@ -0,0 +1,43 @@
+"""Make the admin loan listing's player-name index NULL-safe
+
+Revision ID: ap02
+Revises: ss01
+Create Date: 2026-10-18
+
+GET /admin/loans?sort=player_name now sorts on
+coalesce(lower(player_name), ''): a NULL name in the (sort key, id) cursor
+compared as unknown and ended the listing early. The index on
+lower(player_name) is replaced with one on the new expression.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ap02'
+down_revision = 'ss01'
+branch_labels = None
+depends_on = None
+
+
+OLD_INDEX = ('ix_loaned_players_name_lower_id', [sa.text('lower(player_name)'), 'id'])
+NEW_INDEX = ('ix_loaned_players_name_sort_id', [sa.text("coalesce(lower(player_name), '')"), 'id'])
+
+
+def _swap(drop, create):
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index(drop[0], table_name='loaned_players')
+        op.create_index(create[0], 'loaned_players', create[1])
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(create[0], 'loaned_players', create[1], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index(drop[0], table_name='loaned_players', postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade():
+    _swap(OLD_INDEX, NEW_INDEX)
+
+
+def downgrade():
+    _swap(NEW_INDEX, OLD_INDEX)
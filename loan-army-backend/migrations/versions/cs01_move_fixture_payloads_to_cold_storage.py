@@ -0,0 +1,135 @@
+"""Move raw fixture payloads out of the hot fixture tables
+
+Revision ID: cs01
+Revises: fs01
+Create Date: 2026-10-18
+
+fixtures.raw_json, fixture_player_stats.raw_json and
+fixture_team_stats.stats_json held full API-Football payloads inline, so
+every ORM load of a fixture or stats row pulled them in. They move,
+zlib-compressed, to fixture_payloads keyed by (fixture_id, kind,
+subject_api_id), and the inline columns are dropped.
+"""
+import zlib
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cs01'
+down_revision = 'fs01'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 1000
+
+# (table, payload column, kind, column holding subject_api_id or None for 0)
+SOURCES = (
+    ('fixtures', 'raw_json', 'fixture', None),
+    ('fixture_player_stats', 'raw_json', 'player', 'player_api_id'),
+    ('fixture_team_stats', 'stats_json', 'team', 'team_api_id'),
+)
+
+
+def _payloads_table():
+    return sa.table(
+        'fixture_payloads',
+        sa.column('id', sa.Integer),
+        sa.column('fixture_id', sa.Integer),
+        sa.column('kind', sa.String),
+        sa.column('subject_api_id', sa.Integer),
+        sa.column('payload', sa.LargeBinary),
+        sa.column('updated_at', sa.DateTime),
+    )
+
+
+def _source_table(name, payload_column, subject_column):
+    columns = [sa.column('id', sa.Integer), sa.column(payload_column, sa.Text)]
+    if name != 'fixtures':
+        columns.append(sa.column('fixture_id', sa.Integer))
+    if subject_column:
+        columns.append(sa.column(subject_column, sa.Integer))
+    return sa.table(name, *columns)
+
+
+def _copy_out(bind, name, payload_column, kind, subject_column):
+    source = _source_table(name, payload_column, subject_column)
+    payloads = _payloads_table()
+    fixture_col = source.c.id if name == 'fixtures' else source.c.fixture_id
+    subject_col = source.c[subject_column] if subject_column else sa.literal(0)
+    now = datetime.now(timezone.utc)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(source.c.id, fixture_col, subject_col, source.c[payload_column])
+            .where(source.c.id > last_id, source.c[payload_column].isnot(None))
+            .order_by(source.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        bind.execute(payloads.insert(), [
+            {'fixture_id': fixture_id, 'kind': kind, 'subject_api_id': subject or 0,
+             'payload': zlib.compress(text.encode('utf-8')), 'updated_at': now}
+            for _, fixture_id, subject, text in rows
+        ])
+
+
+def _copy_back(bind, name, payload_column, kind, subject_column):
+    source = _source_table(name, payload_column, subject_column)
+    payloads = _payloads_table()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(payloads.c.id, payloads.c.fixture_id, payloads.c.subject_api_id, payloads.c.payload)
+            .where(payloads.c.kind == kind, payloads.c.id > last_id)
+            .order_by(payloads.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        for _, fixture_id, subject, blob in rows:
+            stmt = source.update().values({payload_column: zlib.decompress(blob).decode('utf-8')})
+            if name == 'fixtures':
+                stmt = stmt.where(source.c.id == fixture_id)
+            else:
+                stmt = stmt.where(source.c.fixture_id == fixture_id, source.c[subject_column] == subject)
+            bind.execute(stmt)
+
+
+def upgrade():
+    op.create_table(
+        'fixture_payloads',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('fixture_id', sa.Integer(), sa.ForeignKey('fixtures.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('kind', sa.String(16), nullable=False),
+        sa.Column('subject_api_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('fixture_id', 'kind', 'subject_api_id', name='uq_fixture_payload'),
+    )
+
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for name, payload_column, kind, subject_column in SOURCES:
+        if not inspector.has_table(name):
+            continue
+        if payload_column not in {col['name'] for col in inspector.get_columns(name)}:
+            continue
+        _copy_out(bind, name, payload_column, kind, subject_column)
+        with op.batch_alter_table(name) as batch_op:
+            batch_op.drop_column(payload_column)
+
+
+def downgrade():
+    bind = op.get_bind()
+    for name, payload_column, kind, subject_column in SOURCES:
+        with op.batch_alter_table(name) as batch_op:
+            batch_op.add_column(sa.Column(payload_column, sa.Text(), nullable=True))
+        _copy_back(bind, name, payload_column, kind, subject_column)
+    op.drop_table('fixture_payloads')
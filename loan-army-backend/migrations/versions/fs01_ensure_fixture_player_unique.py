@@ -0,0 +1,52 @@
+"""Ensure the (fixture_id, player_api_id) unique constraint on fixture_player_stats
+
+Revision ID: fs01
+Revises: fx01
+Create Date: 2026-10-18
+
+Fixture syncs now write player stats with INSERT ... ON CONFLICT
+(fixture_id, player_api_id), which needs a unique constraint or index on
+exactly those columns. uq_fixture_player is in the model, but databases
+whose table was created before it (or by hand) may lack it. Duplicate
+rows are collapsed onto the newest one before the constraint is added.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fs01'
+down_revision = 'fx01'
+branch_labels = None
+depends_on = None
+
+
+KEY = ['fixture_id', 'player_api_id']
+
+
+def _has_unique_key(inspector):
+    for constraint in inspector.get_unique_constraints('fixture_player_stats'):
+        if sorted(constraint['column_names']) == sorted(KEY):
+            return True
+    for index in inspector.get_indexes('fixture_player_stats'):
+        if index.get('unique') and sorted(index['column_names']) == sorted(KEY):
+            return True
+    return False
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('fixture_player_stats') or _has_unique_key(inspector):
+        return
+
+    op.execute(
+        'DELETE FROM fixture_player_stats WHERE id NOT IN ('
+        'SELECT max(id) FROM fixture_player_stats GROUP BY fixture_id, player_api_id)'
+    )
+    with op.batch_alter_table('fixture_player_stats') as batch_op:
+        batch_op.create_unique_constraint('uq_fixture_player', KEY)
+
+
+def downgrade():
+    # The constraint is part of the model and earlier schemas; leave it.
+    pass
@@ -0,0 +1,51 @@
+"""Add indexes for the hot fixture and fixture_player_stats queries
+
+Revision ID: fx01
+Revises: pp01
+Create Date: 2026-10-18
+
+Player stats pages, loan totals, graphs and journalist charts filter
+fixtures by date and home/away club + season, and player stats by
+(player, fixture) and (club, player); none of those columns were indexed.
+On PostgreSQL the indexes are built CONCURRENTLY so writes to the tables
+are not blocked while they build.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'fx01'
+down_revision = 'pp01'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_fixtures_date_utc', 'fixtures', ['date_utc']),
+    ('ix_fixtures_home_team_season_date', 'fixtures', ['home_team_api_id', 'season', 'date_utc']),
+    ('ix_fixtures_away_team_season_date', 'fixtures', ['away_team_api_id', 'season', 'date_utc']),
+    ('ix_fixture_player_stats_player_fixture', 'fixture_player_stats', ['player_api_id', 'fixture_id']),
+    ('ix_fixture_player_stats_team_player', 'fixture_player_stats', ['team_api_id', 'player_api_id']),
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+            op.execute('ANALYZE fixtures')
+            op.execute('ANALYZE fixture_player_stats')
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,36 @@
+"""Add geocode_cache table
+
+Revision ID: gc01
+Revises: al01
+Create Date: 2026-10-18
+
+Persists network geocoding results (including negative results) so club
+locations are not re-geocoded by every process and sync.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'gc01'
+down_revision = 'al01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'geocode_cache',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('city_key', sa.String(120), nullable=False),
+        sa.Column('country_key', sa.String(100), nullable=False, server_default=''),
+        sa.Column('latitude', sa.Float(), nullable=True),
+        sa.Column('longitude', sa.Float(), nullable=True),
+        sa.Column('source', sa.String(20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint('city_key', 'country_key', name='uq_geocode_cache_city_country'),
+    )
+
+
+def downgrade():
+    op.drop_table('geocode_cache')
@@ -0,0 +1,44 @@
+"""Add work-queue columns to background_jobs
+
+Revision ID: jq01
+Revises: gc01
+Create Date: 2026-10-18
+
+Turns background_jobs into a claimable queue: jobs are inserted as
+'queued' with a priority and handler payload, claimed by workers with
+SELECT ... FOR UPDATE SKIP LOCKED, retried after run_after, and kept
+alive by heartbeat_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'jq01'
+down_revision = 'gc01'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = (
+    ('priority', sa.Integer(), dict(nullable=False, server_default='100')),
+    ('payload_json', sa.Text(), dict(nullable=True)),
+    ('attempts', sa.Integer(), dict(nullable=False, server_default='0')),
+    ('max_attempts', sa.Integer(), dict(nullable=False, server_default='1')),
+    ('run_after', sa.DateTime(), dict(nullable=True)),
+    ('heartbeat_at', sa.DateTime(), dict(nullable=True)),
+    ('worker_id', sa.String(length=64), dict(nullable=True)),
+)
+
+
+def upgrade():
+    for name, type_, kwargs in COLUMNS:
+        op.add_column('background_jobs', sa.Column(name, type_, **kwargs))
+    op.create_index('ix_background_jobs_queue', 'background_jobs',
+                    ['status', 'priority', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_background_jobs_queue', table_name='background_jobs')
+    for name, _, _ in reversed(COLUMNS):
+        op.drop_column('background_jobs', name)
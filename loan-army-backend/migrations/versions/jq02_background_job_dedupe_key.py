@@ -0,0 +1,30 @@
+"""Add dedupe_key to background_jobs
+
+Revision ID: jq02
+Revises: jq01
+Create Date: 2026-10-18
+
+Lets enqueue_job() skip a job when one with the same key is already
+queued or running, or was created within a caller-supplied window (e.g.
+one background refresh per player per interval).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'jq02'
+down_revision = 'jq01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('background_jobs', sa.Column('dedupe_key', sa.String(length=100), nullable=True))
+    op.create_index('ix_background_jobs_dedupe', 'background_jobs',
+                    ['dedupe_key', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_background_jobs_dedupe', table_name='background_jobs')
+    op.drop_column('background_jobs', 'dedupe_key')
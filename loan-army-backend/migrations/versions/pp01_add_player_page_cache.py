@@ -0,0 +1,35 @@
+"""Add player_page_cache table
+
+Revision ID: pp01
+Revises: jq02
+Create Date: 2026-10-18
+
+Stores the denormalized public player page document served by
+GET /players/<id>/page, invalidated when its source rows change.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'pp01'
+down_revision = 'jq02'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'player_page_cache',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('player_id', sa.Integer(), nullable=False, unique=True),
+        sa.Column('payload_json', sa.Text(), nullable=False),
+        sa.Column('etag', sa.String(64), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('invalidated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table('player_page_cache')
@@ -0,0 +1,34 @@
+"""Add stats_snapshots table
+
+Revision ID: ss01
+Revises: ap01
+Create Date: 2026-10-18
+
+Stores the precomputed documents behind /admin/dashboard-stats,
+/admin/subscriber-stats, /sync-status and /api/debug/database, rebuilt when
+their source tables change or they reach their max age.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ss01'
+down_revision = 'ap01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'stats_snapshots',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('key', sa.String(50), nullable=False, unique=True),
+        sa.Column('payload_json', sa.Text(), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=False),
+        sa.Column('invalidated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table('stats_snapshots')
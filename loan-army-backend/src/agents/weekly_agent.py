@@ -30,7 +30,7 @@ from src.models.league import db, Team, LoanedPlayer, Newsletter, Player, TeamPr
 from sqlalchemy import func
 from src.agents.errors import NoActiveLoaneesError
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from src.api_football_client import APIFootballClient
+from src.api_football_client import LazyAPIFootballClient, LazyClient, get_api_client
 from src.utils.newsletter_slug import compose_newsletter_public_slug
 import dotenv
 dotenv.load_dotenv(dotenv.find_dotenv())
@@ -493,7 +493,8 @@ def _filter_hits_for_player(cat: dict, player_name: str, loan_team: str, week_st
     except Exception:
         return cat
 
-api_client = APIFootballClient()
+# Built on first use so importing the agent never touches the network
+api_client = LazyAPIFootballClient(get_api_client)
 
 # Cache player photo lookups keyed by API-Football player id
 _PLAYER_PHOTO_CACHE: dict[int, str | None] = {}
@@ -503,9 +504,16 @@ _TEAM_LOGO_CACHE: dict[int, str | None] = {}
 #     base_url="https://openrouter.ai/api/v1",
 #     api_key=os.getenv("OPENROUTER_API_KEY")
 # )
-aio_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-set_default_openai_client(aio_client)
-print(f'weekly agent client: {aio_client}')
+
+
+def _build_aio_client() -> AsyncOpenAI:
+    client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    set_default_openai_client(client)
+    return client
+
+
+# Built on first use so importing the agent doesn't require OPENAI_API_KEY
+aio_client = LazyClient(_build_aio_client)
 
 # ---------- JSON safety helpers ----------
 
@@ -1332,6 +1340,7 @@ async def generate_weekly_newsletter(team_db_id: int, target_date: date, force_r
 
     max_attempts = 3
     delay = 0.6
+    aio_client._resolve()  # installs the default client the Runner uses
     for attempt in range(max_attempts):
         result = await Runner.run(
             starting_agent=agent,
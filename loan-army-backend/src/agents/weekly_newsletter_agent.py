@@ -19,7 +19,7 @@ except ImportError:  # pragma: no cover
 from src.models.league import db, Team, LoanedPlayer, Newsletter, AdminSetting, NewsletterCommentary
 from src.models.tracked_player import TrackedPlayer
 from src.models.journey import PlayerJourney, PlayerJourneyEntry, derive_journey_context
-from src.api_football_client import APIFootballClient
+from src.api_football_client import LazyAPIFootballClient, LazyClient, get_api_client
 from src.agents.weekly_agent import (
     lint_and_enrich as legacy_lint_and_enrich,
     _apply_player_lookup,
@@ -29,7 +29,7 @@ from src.agents.weekly_agent import (
     _render_variants,
 )
 from src.utils.newsletter_slug import compose_newsletter_public_slug
-from src.services.graph_service import GraphService
+from src.services.graph_service import GRAPH_FIELDS, GraphService
 
 # If you have an MCP client already for Brave (Model Context Protocol), import it here.
 # This is a thin wrapper that exposes a Python function brave_search(query: str, since: str, until: str) -> List[dict]
@@ -42,10 +42,19 @@ dotenv.load_dotenv(dotenv.find_dotenv())
 #     base_url="https://openrouter.ai/api/v1",
 #     api_key=os.getenv("OPENROUTER_API_KEY")
 # )
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-set_default_openai_client(client)
-api_client = APIFootballClient()
-graph_service = GraphService()
+
+
+def _build_client() -> OpenAI:
+    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    set_default_openai_client(openai_client)
+    return openai_client
+
+
+# Built on first use so importing the agent never touches the network, needs
+# OPENAI_API_KEY or creates the graphs directory
+client = LazyClient(_build_client)
+api_client = LazyAPIFootballClient(get_api_client)
+graph_service = LazyClient(GraphService)
 _GROQ_CLIENT: Optional["Groq"] = None
 
 def _get_groq_client() -> Groq:
@@ -1420,13 +1429,23 @@ POSITION_STAT_KEYS = {
 }
 
 
-def _generate_player_charts(player_api_id: int, player_name: str,
-                            week_start, week_end) -> dict:
-    """Generate platform data charts for a player's newsletter section.
+# (url field, chart type, date range, width, height) for each newsletter chart
+PLAYER_CHART_SPECS = (
+    ('radar_chart_url', 'radar', 'season', 400, 400),
+    ('stat_table_url', 'stat_table', 'week', 500, 250),
+    ('trend_chart_url', 'line', 'season', 500, 300),
+    ('match_card_url', 'match_card', 'week', 500, 200),
+)
 
-    Returns a dict of chart file URLs (``/static/charts/...``) keyed by chart
-    type.  All errors are swallowed so chart generation never blocks the
-    newsletter pipeline.
+
+def _player_chart_jobs(player_api_id: int, week_start, week_end) -> list[dict]:
+    """Fetch the data for a player's newsletter charts.
+
+    Returns ``render_charts_batch`` jobs, each tagged with the item ``field``
+    its URL belongs in. Season-level charts get a week-independent chart id,
+    so they are rendered once and reused until the player's data changes.
+    All errors are swallowed so chart generation never blocks the newsletter
+    pipeline.
     """
     try:
         from src.routes.journalist import (
@@ -1434,15 +1453,12 @@ def _generate_player_charts(player_api_id: int, player_name: str,
             _get_primary_position,
             _categorize_position,
         )
-        from src.services.chart_renderer import save_chart_to_file
+        from src.services.chart_renderer import generate_chart_id
     except Exception:
-        return {}
+        return []
 
     if not player_api_id:
-        return {}
-
-    ts = int(datetime.now(timezone.utc).timestamp())
-    charts: dict[str, str] = {}
+        return []
 
     # Helper: determine position-appropriate stat keys from season data
     position_category = 'Midfielder'  # default
@@ -1461,52 +1477,78 @@ def _generate_player_charts(player_api_id: int, player_name: str,
     ws = week_start.isoformat() if hasattr(week_start, 'isoformat') else str(week_start)
     we = week_end.isoformat() if hasattr(week_end, 'isoformat') else str(week_end)
 
-    # 1. Radar chart (season-level)
-    try:
-        radar_data = _fetch_chart_data_for_rendering(
-            player_api_id, 'radar', stat_keys, 'season')
-        if radar_data and radar_data.get('data'):
-            fname = f"{player_api_id}_radar_{ts}"
-            path = save_chart_to_file('radar', radar_data, fname, width=400, height=400)
-            charts['radar_chart_url'] = '/static/charts/' + os.path.basename(path)
-    except Exception:
-        pass
+    jobs: list[dict] = []
+    for field, chart_type, date_range, width, height in PLAYER_CHART_SPECS:
+        # The season trend line only plots rating
+        keys = ['rating'] if chart_type == 'line' else stat_keys
+        week = (ws, we) if date_range == 'week' else (None, None)
+        try:
+            data = _fetch_chart_data_for_rendering(
+                player_api_id, chart_type, keys, date_range,
+                week_start=week[0], week_end=week[1])
+        except Exception:
+            continue
+        if not data or not data.get('fixtures' if chart_type == 'match_card' else 'data'):
+            continue
+        block = {'chart_type': chart_type,
+                 'chart_config': {'stat_keys': keys, 'date_range': date_range}}
+        jobs.append({
+            'field': field,
+            'chart_type': chart_type,
+            'data': data,
+            'chart_id': generate_chart_id(block, player_api_id, *week),
+            'width': width,
+            'height': height,
+        })
+    return jobs
 
-    # 2. Stat table (week data)
-    try:
-        table_data = _fetch_chart_data_for_rendering(
-            player_api_id, 'stat_table', stat_keys, 'week',
-            week_start=ws, week_end=we)
-        if table_data and table_data.get('data'):
-            fname = f"{player_api_id}_stat_table_{ts}"
-            path = save_chart_to_file('stat_table', table_data, fname, width=500, height=250)
-            charts['stat_table_url'] = '/static/charts/' + os.path.basename(path)
-    except Exception:
-        pass
 
-    # 3. Season trend line (rating)
+def _render_player_charts(chart_jobs: list[tuple[dict, list[dict]]]) -> None:
+    """Render charts for many report items in one batch and attach their URLs.
+
+    *chart_jobs* pairs each item with its ``_player_chart_jobs`` result, so a
+    whole newsletter's charts go through the chart cache and render pool
+    together.
+    """
+    flat = [(item, job) for item, jobs in chart_jobs for job in jobs]
+    if not flat:
+        return
     try:
-        trend_data = _fetch_chart_data_for_rendering(
-            player_api_id, 'line', ['rating'], 'season')
-        if trend_data and trend_data.get('data'):
-            fname = f"{player_api_id}_trend_{ts}"
-            path = save_chart_to_file('line', trend_data, fname, width=500, height=300)
-            charts['trend_chart_url'] = '/static/charts/' + os.path.basename(path)
-    except Exception:
-        pass
+        from src.services.chart_renderer import render_charts_batch
+        paths = render_charts_batch([job for _, job in flat])
+    except Exception as e:
+        _nl_dbg(f"Chart rendering failed: {e}")
+        return
+    for (item, job), path in zip(flat, paths):
+        if path:
+            item[job['field']] = '/static/charts/' + os.path.basename(path)
+
 
-    # 4. Match performance card (week data)
+def _attach_player_graphs(graph_items: list[tuple[dict, int]]) -> None:
+    """Generate rating/minutes graphs for many report items in one batch."""
+    if not graph_items:
+        return
     try:
-        card_data = _fetch_chart_data_for_rendering(
-            player_api_id, 'match_card', stat_keys, 'week',
-            week_start=ws, week_end=we)
-        if card_data and card_data.get('fixtures'):
-            fname = f"{player_api_id}_match_card_{ts}"
-            path = save_chart_to_file('match_card', card_data, fname, width=500, height=200)
-            charts['match_card_url'] = '/static/charts/' + os.path.basename(path)
-    except Exception:
-        pass
+        graphs = graph_service.generate_graphs_batch(
+            [(pid, item.get("player_name")) for item, pid in graph_items])
+    except Exception as e:
+        _nl_dbg(f"Graph generation failed: {e}")
+        return
+    for item, pid in graph_items:
+        for kind, url in graphs.get(pid, {}).items():
+            item[GRAPH_FIELDS[kind]] = url
+
+
+def _generate_player_charts(player_api_id: int, player_name: str,
+                            week_start, week_end) -> dict:
+    """Generate platform data charts for a player's newsletter section.
 
+    Returns a dict of chart file URLs (``/static/charts/...``) keyed by chart
+    type.  All errors are swallowed so chart generation never blocks the
+    newsletter pipeline.
+    """
+    charts: dict[str, str] = {}
+    _render_player_charts([(charts, _player_chart_jobs(player_api_id, week_start, week_end))])
     return charts
 
 
@@ -1567,6 +1609,8 @@ def _apply_stat_driven_summaries(content: dict, report: dict, brave_ctx: dict) -
 
     hits_by_player = _hits_by_player(brave_ctx)
     player_entries: list[dict[str, Any]] = []
+    chart_jobs: list[tuple[dict, list[dict]]] = []
+    graph_items: list[tuple[dict, int]] = []
 
     for sec in sections:
         if not isinstance(sec, dict):
@@ -1615,27 +1659,18 @@ def _apply_stat_driven_summaries(content: dict, report: dict, brave_ctx: dict) -
                     item["player_name"] = display
 
                 if canonical_pid:
-                    try:
-                        rating_graph = graph_service.generate_player_rating_graph(canonical_pid, item.get("player_name"))
-                        if rating_graph:
-                            item["rating_graph_url"] = rating_graph
-                        minutes_graph = graph_service.generate_player_minutes_graph(canonical_pid, item.get("player_name"))
-                        if minutes_graph:
-                            item["minutes_graph_url"] = minutes_graph
-                    except Exception as e:
-                        _nl_dbg(f"Graph generation failed for {canonical_pid}: {e}")
-
-                    # Generate platform data charts (radar, stat table, trend, match card)
+                    # Rating/minutes graphs are generated in one batch after the loop
+                    graph_items.append((item, canonical_pid))
+
+                    # Collect platform data charts (radar, stat table, trend, match card);
+                    # they are rendered in one batch after the loop
                     if item.get("can_fetch_stats", True):
                         try:
                             range_info = report.get("range") or []
                             ws = range_info[0] if len(range_info) > 0 else None
                             we = range_info[1] if len(range_info) > 1 else None
                             if ws and we:
-                                charts = _generate_player_charts(
-                                    canonical_pid, item.get("player_name"), ws, we)
-                                if charts:
-                                    item.update(charts)
+                                chart_jobs.append((item, _player_chart_jobs(canonical_pid, ws, we)))
                         except Exception as e:
                             _nl_dbg(f"Chart generation failed for {canonical_pid}: {e}")
 
@@ -1710,6 +1745,9 @@ def _apply_stat_driven_summaries(content: dict, report: dict, brave_ctx: dict) -
                 }
             )
 
+    _render_player_charts(chart_jobs)
+    _attach_player_graphs(graph_items)
+
     if player_entries:
         player_entries.sort(key=lambda entry: entry["score"], reverse=True)
         summary_bits: list[str] = []
@@ -2709,36 +2747,24 @@ def compose_team_weekly_newsletter(team_db_id: int, target_date: date, force_ref
 
         hits_by_player = _hits_by_player(brave_ctx)
 
-        # Build items per group using the appropriate builder
+        # Build items per group using the appropriate builder; charts for the
+        # whole issue are rendered in one batch once every item exists
+        chart_jobs: list[tuple[dict, list[dict]]] = []
         for player in groups.get("on_loan", []):
             hits = _extract_hits_for_loanee(player, hits_by_player)
             item = _build_player_report_item(player, hits, week_start=week_start, week_end=week_end)
             item["pathway_status"] = "on_loan"
-            # Generate platform data charts for players with stats coverage
+            # Collect platform data charts for players with stats coverage
             if item.get("can_fetch_stats") and item.get("player_id"):
-                try:
-                    charts = _generate_player_charts(
-                        item["player_id"], item.get("player_name"),
-                        week_start, week_end)
-                    if charts:
-                        item.update(charts)
-                except Exception as e:
-                    _nl_dbg(f"Chart generation failed for {item.get('player_id')}: {e}")
+                chart_jobs.append((item, _player_chart_jobs(item["player_id"], week_start, week_end)))
             on_loan_items.append(item)
 
         for player in groups.get("first_team", []):
             hits = _extract_hits_for_loanee(player, hits_by_player)
             item = _build_first_team_report_item(player, hits, week_start=week_start, week_end=week_end)
-            # Generate platform data charts for first-team players with stats
+            # Collect platform data charts for first-team players with stats
             if item.get("can_fetch_stats") and item.get("player_id"):
-                try:
-                    charts = _generate_player_charts(
-                        item["player_id"], item.get("player_name"),
-                        week_start, week_end)
-                    if charts:
-                        item.update(charts)
-                except Exception as e:
-                    _nl_dbg(f"Chart generation failed for {item.get('player_id')}: {e}")
+                chart_jobs.append((item, _player_chart_jobs(item["player_id"], week_start, week_end)))
             first_team_items.append(item)
 
         for player in groups.get("academy", []):
@@ -2746,6 +2772,8 @@ def compose_team_weekly_newsletter(team_db_id: int, target_date: date, force_ref
             item = _build_academy_report_item(player, hits, week_start=week_start, week_end=week_end)
             academy_items.append(item)
 
+        _render_player_charts(chart_jobs)
+
         # Flat list for summary generation and post-processing
         player_items = first_team_items + on_loan_items + academy_items
 
@@ -10,6 +10,7 @@ from functools import lru_cache
 from itertools import chain
 from copy import deepcopy
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 from sqlalchemy.exc import IntegrityError, DataError
 from src.data.transfer_windows import WINDOWS
 # external_stats is lazy-loaded where needed to reduce cold start time
@@ -66,6 +67,291 @@ def is_new_loan_transfer(transfer_type: str) -> bool:
     # We use exact match to avoid false positives
     return normalized == 'loan'
 
+# ------------------------------------------------------------------
+# ♻️ Process-wide client state (handshake + in-memory caches)
+# ------------------------------------------------------------------
+# Re-run the live ``status`` handshake at most this often per process
+HANDSHAKE_TTL_SECONDS = int(os.getenv("API_FOOTBALL_HANDSHAKE_TTL_SECONDS", "3600"))
+# Upper bound for each shared per-player cache before the oldest entries go
+CACHE_MAX_ENTRIES = int(os.getenv("API_FOOTBALL_CACHE_MAX_ENTRIES", "5000"))
+
+
+class _BoundedCache(dict):
+    """Dict that drops its oldest entries once it grows past ``maxsize``.
+
+    Only item assignment is bounded; ``update()`` is used for the small
+    team-name map and is left alone.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            while self.maxsize and len(self) > self.maxsize:
+                try:
+                    super().__delitem__(next(iter(self)))
+                except (StopIteration, KeyError, RuntimeError):
+                    break
+
+
+class _SharedClientState:
+    """Caches and handshake bookkeeping shared by every client for one key."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.created_at = datetime.now(timezone.utc)
+        self.lock = threading.Lock()
+        self.instances = 0
+        self.handshakes = 0
+        self.handshake_failures = 0
+        self.handshake_at: Optional[float] = None
+        self.last_handshake_error: Optional[str] = None
+
+        self.team_name_cache: Dict[int, str] = {}
+        self.team_profile_cache: Dict[int, dict] = _BoundedCache(CACHE_MAX_ENTRIES)
+        self.player_profile_cache: dict = _BoundedCache(CACHE_MAX_ENTRIES)
+        self.transfer_cache: dict = _BoundedCache(CACHE_MAX_ENTRIES)
+        self.stats_cache: dict = _BoundedCache(CACHE_MAX_ENTRIES)
+        self.player_team_season_cache: dict = _BoundedCache(CACHE_MAX_ENTRIES)
+
+    def handshake_fresh(self) -> bool:
+        return (
+            self.handshake_at is not None
+            and time.monotonic() - self.handshake_at < HANDSHAKE_TTL_SECONDS
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        age = None if self.handshake_at is None else round(time.monotonic() - self.handshake_at, 1)
+        return {
+            'mode': self.mode,
+            'created_at': self.created_at.isoformat(),
+            'instances': self.instances,
+            'handshakes': self.handshakes,
+            'handshake_failures': self.handshake_failures,
+            'handshake_age_seconds': age,
+            'handshake_fresh': self.handshake_fresh(),
+            'last_handshake_error': self.last_handshake_error,
+            'caches': {
+                'team_names': len(self.team_name_cache),
+                'team_profiles': len(self.team_profile_cache),
+                'player_profiles': len(self.player_profile_cache),
+                'transfers': len(self.transfer_cache),
+                'stats': len(self.stats_cache),
+                'player_team_seasons': len(self.player_team_season_cache),
+            },
+        }
+
+
+_client_states: Dict[tuple, _SharedClientState] = {}
+_client_states_lock = threading.Lock()
+
+
+def _shared_state(mode: str, api_key: Optional[str]) -> _SharedClientState:
+    key = (mode, api_key)
+    with _client_states_lock:
+        state = _client_states.get(key)
+        if state is None:
+            state = _client_states[key] = _SharedClientState(mode)
+        return state
+
+
+def get_api_client(api_key: Optional[str] = None) -> "APIFootballClient":
+    """Return an API-Football client backed by the process-wide shared state.
+
+    Clients are cheap: the handshake runs at most once per
+    ``HANDSHAKE_TTL_SECONDS`` and the in-memory caches are shared, while
+    season settings stay per-instance so concurrent requests can't change
+    each other's season.
+    """
+    return APIFootballClient(api_key)
+
+
+class LazyClient:
+    """Proxy that builds a module-level client with *factory* on first attribute access.
+
+    Keeps imports free of side effects: no network calls, credentials or
+    directories are needed until the client is actually used.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def __getattr__(self, item: str):
+        return getattr(self._resolve(), item)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self._instance is not None else "uninitialized"
+        return f"<{type(self).__name__} {state}>"
+
+
+class LazyAPIFootballClient(LazyClient):
+    """Instantiate APIFootballClient only when first touched to avoid early network calls."""
+
+
+def get_api_client_stats() -> List[Dict[str, Any]]:
+    """Lifecycle and cache stats for every shared client state in this process."""
+    with _client_states_lock:
+        states = list(_client_states.values())
+    return [state.stats() for state in states]
+
+
+def reset_api_clients() -> None:
+    """Drop the shared caches and cached handshakes (tests, key rotation)."""
+    with _client_states_lock:
+        _client_states.clear()
+
+
+class WeekFixtureBatch:
+    """Fixture-centric cache for summarizing one match week.
+
+    Loanees at the same club (and loanees who meet each other) share
+    fixtures. The batch fetches each club's fixtures and each fixture's
+    full ``fixtures/players`` payload once. It loads the week's Fixture and
+    FixturePlayerStats rows with one query per table and collects stats
+    rows until ``flush()`` writes them with ``upsert_fixture_player_stats``
+    (an ON CONFLICT upsert, so concurrent summaries of the same fixture
+    don't collide). ``summarize_parent_loans_week``
+    builds one per week and passes it to every ``summarize_loanee_week``
+    call; a standalone ``summarize_loanee_week`` builds its own.
+    """
+
+    def __init__(self, client: "APIFootballClient", season: int, start: str, end: str, db_session=None):
+        self.client = client
+        self.season = season
+        self.start = start
+        self.end = end
+        self.db_session = db_session
+        self._team_fixtures: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._fixture_players: Dict[int, list] = {}
+        self._fixture_statistics: Dict[int, Dict[str, Any]] = {}
+        self._db_fixtures: Dict[int, Any] = {}
+        self._fixtures_loaded: set = set()
+        self._stat_rows: Dict[tuple, Any] = {}
+        self._stats_loaded: set = set()
+        self._pending: Dict[tuple, Dict[str, Any]] = {}
+
+    def fixtures_for_team(self, team_id: int, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        key = (team_id, start or self.start, end or self.end)
+        if key not in self._team_fixtures:
+            self._team_fixtures[key] = self.client.get_fixtures_for_team(team_id, self.season, key[1], key[2])
+        return self._team_fixtures[key]
+
+    def fixture_players(self, fixture_id: int) -> list:
+        """Every team block of ``fixtures/players`` for *fixture_id*, fetched once."""
+        if fixture_id not in self._fixture_players:
+            self._fixture_players[fixture_id] = self.client.get_fixture_players(fixture_id)
+        return self._fixture_players[fixture_id]
+
+    def fixture_statistics(self, fixture_id: int) -> Dict[str, Any]:
+        if fixture_id not in self._fixture_statistics:
+            self._fixture_statistics[fixture_id] = self.client.get_fixture_statistics(fixture_id)
+        return self._fixture_statistics[fixture_id]
+
+    def prepare(self, team_ids: Iterable[int], player_ids: Iterable[int]) -> None:
+        """Load the DB rows for *team_ids*' fixtures and *player_ids* in bulk."""
+        fixture_ids = {
+            (fx.get('fixture') or {}).get('id')
+            for team_id in set(team_ids) if team_id
+            for fx in self.fixtures_for_team(team_id)
+        }
+        fixture_ids.discard(None)
+        if self.db_session is None:
+            return
+        from src.models.weekly import Fixture, FixturePlayerStats
+
+        new_fixture_ids = fixture_ids - self._fixtures_loaded
+        if new_fixture_ids:
+            rows = self.db_session.query(Fixture).filter(Fixture.fixture_id_api.in_(new_fixture_ids)).all()
+            self._db_fixtures.update({row.fixture_id_api: row for row in rows})
+            self._fixtures_loaded |= new_fixture_ids
+
+        fixture_pks = {row.id for api_id, row in self._db_fixtures.items() if api_id in fixture_ids}
+        pairs = {(pk, pid) for pk in fixture_pks for pid in set(player_ids) if pid} - self._stats_loaded
+        if pairs:
+            rows = self.db_session.query(FixturePlayerStats).filter(
+                FixturePlayerStats.fixture_id.in_({pk for pk, _ in pairs}),
+                FixturePlayerStats.player_api_id.in_({pid for _, pid in pairs}),
+            ).all()
+            self._stat_rows.update({(row.fixture_id, row.player_api_id): row for row in rows})
+            self._stats_loaded |= pairs
+
+    def db_fixture(self, fixture_id: int):
+        if fixture_id not in self._fixtures_loaded:
+            from src.models.weekly import Fixture
+            self._db_fixtures[fixture_id] = self.db_session.query(Fixture).filter_by(fixture_id_api=fixture_id).first()
+            self._fixtures_loaded.add(fixture_id)
+        return self._db_fixtures.get(fixture_id)
+
+    def ensure_fixture(self, fx: Dict[str, Any]):
+        row = self.client._get_or_create_fixture(self.db_session, fx, self.season)
+        if row is not None:
+            self._db_fixtures[row.fixture_id_api] = row
+            self._fixtures_loaded.add(row.fixture_id_api)
+        return row
+
+    def stats_row(self, fixture_pk: int, player_id: int):
+        key = (fixture_pk, player_id)
+        if key not in self._stats_loaded:
+            from src.models.weekly import FixturePlayerStats
+            self._stat_rows[key] = self.db_session.query(FixturePlayerStats).filter_by(
+                fixture_id=fixture_pk, player_api_id=player_id,
+            ).first()
+            self._stats_loaded.add(key)
+        return self._stat_rows.get(key)
+
+    def upsert_player_stats(self, fixture_pk: int, player_id: int, team_id: int, pstats: Dict[str, Any]):
+        """Queue the stats row for ``flush()``; returns an unsaved row with the new values."""
+        from src.models.weekly import FixturePlayerStats
+
+        values = {
+            **self.client._player_fixture_stats_values(pstats),
+            'fixture_id': fixture_pk,
+            'player_api_id': player_id,
+            'team_api_id': team_id,
+        }
+        existing = self.stats_row(fixture_pk, player_id)
+        row = FixturePlayerStats(**values)
+        row.id = existing.id if existing is not None else None
+        self._stat_rows[(fixture_pk, player_id)] = row
+        self._pending[(fixture_pk, player_id)] = {**values, 'raw_json': pstats or {}}
+        return row
+
+    def flush(self) -> None:
+        """Upsert the queued stats rows and payloads.
+
+        On failure the session is rolled back (so the caller's next loanee
+        starts from a clean transaction), the batch's cached DB rows are
+        dropped and the error is re-raised.
+        """
+        pending, self._pending = list(self._pending.values()), {}
+        if self.db_session is None or not pending:
+            return
+        from src.services.fixture_stats import upsert_fixture_player_stats
+
+        try:
+            upsert_fixture_player_stats(pending, session=self.db_session)
+        except Exception:
+            self.db_session.rollback()
+            self._db_fixtures.clear()
+            self._fixtures_loaded.clear()
+            self._stat_rows.clear()
+            self._stats_loaded.clear()
+            raise
+
+
 class APIFootballClient:
     """Client for API-Football integration."""
     
@@ -92,14 +378,14 @@ class APIFootballClient:
         if self.mode == "direct":
             self.base_url = "https://v3.football.api-sports.io"
             self.headers  = {"x-apisports-key": self.api_key}
-            logger.info("🔗 API‑Football mode: DIRECT (v3.football.api-sports.io)")
+            logger.debug("🔗 API‑Football mode: DIRECT (v3.football.api-sports.io)")
         elif self.mode == "rapidapi":
             self.base_url = "https://api-football-v1.p.rapidapi.com/v3"
             self.headers  = {
                 "X-RapidAPI-Key":  self.api_key,
                 "X-RapidAPI-Host": "api-football-v1.p.rapidapi.com"
             }
-            logger.info("🔗 API‑Football mode: RAPIDAPI (api-football-v1.p.rapidapi.com)")
+            logger.debug("🔗 API‑Football mode: RAPIDAPI (api-football-v1.p.rapidapi.com)")
         elif self.mode == "stub":
             if not self.use_stub:
                 raise RuntimeError(
@@ -108,7 +394,7 @@ class APIFootballClient:
                 )
             self.base_url = None
             self.headers  = {}
-            logger.info("🔗 API‑Football mode: STUB (sample data ONLY)")
+            logger.debug("🔗 API‑Football mode: STUB (sample data ONLY)")
         else:
             raise ValueError(
                 f"Unknown API_FOOTBALL_MODE: {mode_env}. "
@@ -130,7 +416,7 @@ class APIFootballClient:
         # Set default season based on current date if no window_key provided
         self._set_default_season_from_date()
         
-        logger.info(f"Default football season: {self.current_season} ({self.season_start_date} to {self.season_end_date})")
+        logger.debug(f"Default football season: {self.current_season} ({self.season_start_date} to {self.season_end_date})")
         
         # Check team filter from environment
         # self.enable_team_filter = os.getenv("TEST_ONLY_MANU", "false").lower() == "true"
@@ -138,8 +424,6 @@ class APIFootballClient:
         # Log team filter status
         if self.enable_team_filter:
             logger.warning(f"🧪 TEAM FILTER ACTIVE: Only processing teams {ONLY_TEST_TEAM_IDS}")
-        else:
-            logger.info("🌍 Team filter disabled: Processing all teams")
         
         # European league IDs from API-Football
         self.european_leagues = {
@@ -150,32 +434,35 @@ class APIFootballClient:
             61: {'name': 'Ligue 1', 'country': 'France'}
         }
 
-        # --- Local cache for team_id -> team_name look‑ups (populated lazily) ---
-        self._team_name_cache: Dict[int, str] = {}
+        # --- In-memory caches, shared with every client in this process ---
+        self._shared = _shared_state(self.mode, self.api_key)
+        with self._shared.lock:
+            self._shared.instances += 1
+        # team_id -> team_name look‑ups (populated lazily)
+        self._team_name_cache: Dict[int, str] = self._shared.team_name_cache
         # Cache team profiles for quick reuse (API payloads)
-        self._team_profile_cache: Dict[int, dict] = {}
+        self._team_profile_cache: Dict[int, dict] = self._shared.team_profile_cache
         # Cache player payloads to avoid repeated API calls for profile details
-        self._player_profile_cache: dict[tuple[int, int | None], dict] = {}
+        self._player_profile_cache: dict[tuple[int, int | None], dict] = self._shared.player_profile_cache
         
         # --- Performance optimization caches (added Oct 2025) ---
         # Transfer cache: {player_id: (data, timestamp)} - 24hr TTL
-        self._transfer_cache: Dict[int, tuple[List[Dict[str, Any]], datetime]] = {}
+        self._transfer_cache: Dict[int, tuple[List[Dict[str, Any]], datetime]] = self._shared.transfer_cache
         self._transfer_cache_ttl = timedelta(hours=24)
         
         # Player statistics cache: {(player_id, season): (data, timestamp)} - 24hr TTL
-        self._stats_cache: Dict[tuple[int, int], tuple[List[Dict[str, Any]], datetime]] = {}
+        self._stats_cache: Dict[tuple[int, int], tuple[List[Dict[str, Any]], datetime]] = self._shared.stats_cache
         self._stats_cache_ttl = timedelta(hours=24)
         # Player-season totals cache (players endpoint) scoped to team
-        self._player_team_season_cache: Dict[tuple[int, int, int], tuple[Dict[str, Any], datetime]] = {}
+        self._player_team_season_cache: Dict[tuple[int, int, int], tuple[Dict[str, Any], datetime]] = (
+            self._shared.player_team_season_cache
+        )
         self._player_team_season_cache_ttl = timedelta(hours=24)
         
-        logger.info("🚀 Performance caches initialized (24hr TTL)")
-        
         # Test API connection unless explicitly skipped
         if not os.getenv("SKIP_API_HANDSHAKE") and self.mode != "stub":
             try:
-                self.handshake()
-                logger.info("✅ API handshake successful")
+                self._ensure_handshake()
             except Exception as e:
                 logger.error(f"❌ API handshake failed: {e}")
                 if self.use_stub:
@@ -183,6 +470,25 @@ class APIFootballClient:
                     self.mode = "stub"
                 else:
                     raise
+
+    def _ensure_handshake(self):
+        """Handshake unless this process already did so within the TTL."""
+        state = self._shared
+        if state.handshake_fresh():
+            return
+        with state.lock:
+            # Another thread may have finished the handshake while we waited
+            if state.handshake_fresh():
+                return
+            state.handshakes += 1
+            try:
+                self.handshake()
+            except Exception as e:
+                state.handshake_failures += 1
+                state.last_handshake_error = str(e)
+                raise
+            state.handshake_at = time.monotonic()
+            state.last_handshake_error = None
     
     def _set_default_season_from_date(self):
         """Set default season based on current date."""
@@ -365,6 +671,15 @@ class APIFootballClient:
         except ImportError:
             pass
 
+    def _get_db_cached(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Return a DB-cached response without calling the API (None on a miss)."""
+        try:
+            from src.models.api_cache import APICache
+            return APICache.get_cached(endpoint, params)
+        except Exception as exc:
+            logger.debug("DB cache lookup failed for %s: %s", endpoint, exc)
+            return None
+
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make authenticated request to API-Football with DB cache + quota tracking."""
 
@@ -468,10 +783,14 @@ class APIFootballClient:
         player_id: int,
         team_id: int,
         season: int,
-    ) -> Dict[str, Any]:
+        cached_only: bool = False,
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetch season totals (games played, minutes, goals, assists) for a player with a specific team.
         Uses the /players endpoint; cached for 24h to reduce quota.
+
+        With ``cached_only`` no request is made: returns None unless the
+        in-memory or DB cache already holds the response.
         """
         cache_key = (player_id, team_id, season)
         now = datetime.now(timezone.utc)
@@ -483,17 +802,21 @@ class APIFootballClient:
         if self.mode == "stub":
             return {}
 
-        try:
-            payload = self._make_request(
-                "players",
-                params={"id": player_id, "team": team_id, "season": season},
-            )
+        params = {"id": player_id, "team": team_id, "season": season}
+        if cached_only:
+            payload = self._get_db_cached("players", params)
+            if payload is None:
+                return None
             response = payload.get("response", []) or []
-        except Exception as exc:
-            logger.warning(
-                f"Failed to fetch player totals from API for player={player_id}, team={team_id}, season={season}: {exc}"
-            )
-            return {}
+        else:
+            try:
+                payload = self._make_request("players", params=params)
+                response = payload.get("response", []) or []
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to fetch player totals from API for player={player_id}, team={team_id}, season={season}: {exc}"
+                )
+                return {}
 
         totals = {"games_played": 0, "minutes": 0, "goals": 0, "assists": 0, "saves": 0, "goals_conceded": 0}
 
@@ -1121,6 +1444,7 @@ class APIFootballClient:
         try:
             from src.models.weekly import Fixture
             from src.models.league import db
+            from src.services.fixture_stats import load_fixture_payloads
             from sqlalchemy import or_ as sa_or
             import json as _json
 
@@ -1139,14 +1463,16 @@ class APIFootballClient:
                 ),
             ).all()
 
+            raw_payloads = load_fixture_payloads('fixture', [f.id for f in db_fixtures])
             db_fixture_ids = set()
             db_results = []
             for f in db_fixtures:
                 db_fixture_ids.add(f.fixture_id_api)
-                # Reconstruct API-shape dict from raw_json if available
-                if f.raw_json:
+                # Reconstruct API-shape dict from the stored payload if available
+                raw_json = raw_payloads.get((f.id, 0))
+                if raw_json:
                     try:
-                        db_results.append(_json.loads(f.raw_json))
+                        db_results.append(_json.loads(raw_json))
                         continue
                     except (_json.JSONDecodeError, TypeError):
                         pass
@@ -1231,17 +1557,26 @@ class APIFootballClient:
             logger.error(f"Error fetching fixture result for id={fixture_id}: {e}")
             return {}
 
-    def get_player_stats_for_fixture(self, player_id: int, season: int, fixture_id: int, fixture_obj: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def get_player_stats_for_fixture(
+        self,
+        player_id: int,
+        season: int,
+        fixture_id: int,
+        fixture_obj: Optional[Dict[str, Any]] = None,
+        team_blocks: Optional[list] = None,
+    ) -> Dict[str, Any]:
         """
         Fetch player stats for a specific fixture. Returns {} if not found.
 
         The method now prefers the dedicated `/fixtures/players` endpoint, which
         provides full per‑player statistics (minutes, goals, assists, cards, etc.).
         If that endpoint yields no data (plan/coverage limits), the previous
-        line‑ups + events fallback is used.
+        line‑ups + events fallback is used. Pass *team_blocks* when the
+        fixture's `/fixtures/players` payload was already fetched.
         """
         # 1️⃣ Try the preferred `/fixtures/players` endpoint first
-        team_blocks = self.get_fixture_players(fixture_id)
+        if team_blocks is None:
+            team_blocks = self.get_fixture_players(fixture_id)
         try:
             logger.debug(
                 f"get_player_stats_for_fixture: player={player_id}, fixture_id={fixture_id}, season={season}, team_blocks={len(team_blocks or [])}"
@@ -1965,14 +2300,17 @@ class APIFootballClient:
         week_end: date,
         *,
         include_team_stats: bool = False,
-        db_session = None
+        db_session = None,
+        batch: Optional[WeekFixtureBatch] = None,
     ) -> Dict[str, Any]:
         """
         Summarize a loanee's week between week_start and week_end (inclusive).
         Now includes comprehensive stats (position, rating, saves, tackles, passes, shots, etc.)
+
+        Fixtures, fixture player payloads and DB rows come from *batch*
+        (see WeekFixtureBatch) so teammates summarized for the same week
+        share them.
         """
-        from src.models.weekly import Fixture, FixturePlayerStats
-        
         start_str, end_str = week_start.isoformat(), week_end.isoformat()
 
         def _initial_totals() -> Dict[str, Any]:
@@ -2033,7 +2371,10 @@ class APIFootballClient:
         logger.info(
             f"summarize_loanee_week: player={player_id}, loan_team={loan_team_id}, season={season}, range={start_str}..{end_str}"
         )
-        fixtures = self.get_fixtures_for_team(loan_team_id, season, start_str, end_str)
+        if batch is None:
+            batch = WeekFixtureBatch(self, season, start_str, end_str, db_session)
+        batch.prepare([loan_team_id], [player_id])
+        fixtures = batch.fixtures_for_team(loan_team_id)
         logger.info(
             f"summarize_loanee_week: fixtures_count={len(fixtures)} for team={loan_team_id}"
         )
@@ -2066,7 +2407,7 @@ class APIFootballClient:
             db_fixture = None
             player_stats_row = None
             if db_session:
-                db_fixture = db_session.query(Fixture).filter_by(fixture_id_api=fixture_id).first()
+                db_fixture = batch.db_fixture(fixture_id)
                 if db_fixture:
                     # 🔍 TROUBLESHOOTING: Log DB query parameters
                     logger.debug(
@@ -2075,10 +2416,7 @@ class APIFootballClient:
                         f"fixture_api_id={fixture_id}"
                     )
                     
-                    player_stats_row = db_session.query(FixturePlayerStats).filter_by(
-                        fixture_id=db_fixture.id,
-                        player_api_id=player_id
-                    ).first()
+                    player_stats_row = batch.stats_row(db_fixture.id, player_id)
                     
                     if player_stats_row:
                         logger.debug(f"🔍 [DB_QUERY] Found DB row id={player_stats_row.id}")
@@ -2086,7 +2424,10 @@ class APIFootballClient:
                         logger.debug(f"🔍 [DB_QUERY] No DB row found, will use API fallback")
             
             # Fetch from API (for stats aggregation and potential storage)
-            pstats = self.get_player_stats_for_fixture(player_id, season, fixture_id, fixture_obj=fx)
+            pstats = self.get_player_stats_for_fixture(
+                player_id, season, fixture_id, fixture_obj=fx,
+                team_blocks=batch.fixture_players(fixture_id),
+            )
             played = pstats.get('played', False) if pstats else False
             
             # Always update DB with fresh API stats when available
@@ -2094,7 +2435,7 @@ class APIFootballClient:
                 try:
                     # Create/get fixture record
                     if not db_fixture:
-                        db_fixture = self._get_or_create_fixture(db_session, fx, season)
+                        db_fixture = batch.ensure_fixture(fx)
                     
                     # Store/update player stats with fresh API data
                     if db_fixture and pstats:
@@ -2102,18 +2443,12 @@ class APIFootballClient:
                             f"{'Updating' if player_stats_row else 'Creating'} fixture stats: "
                             f"fixture_id={fixture_id}, player_id={player_id}"
                         )
-                        self._upsert_player_fixture_stats(
-                            db_session,
+                        player_stats_row = batch.upsert_player_stats(
                             db_fixture.id,
                             player_id,
                             loan_team_id,
                             pstats
                         )
-                        # Refresh the player_stats_row from what we just stored/updated
-                        player_stats_row = db_session.query(FixturePlayerStats).filter_by(
-                            fixture_id=db_fixture.id,
-                            player_api_id=player_id
-                        ).first()
                 except Exception as e:
                     logger.warning(f"Failed to store/update fixture/player stats for fixture {fixture_id}, player {player_id}: {e}")
                     # Continue processing even if storage fails
@@ -2480,11 +2815,16 @@ class APIFootballClient:
             }
 
             if include_team_stats:
-                stats = self.get_fixture_statistics(fixture_id)
+                stats = batch.fixture_statistics(fixture_id)
                 match_row['team_statistics'] = stats.get('response', [])
 
             matches.append(match_row)
 
+        try:
+            batch.flush()
+        except Exception as e:
+            logger.warning(f"Failed to store fixture stats for player {player_id}, week {start_str}..{end_str}: {e}")
+
         # Calculate average rating if we have ratings
         if rating_count > 0:
             totals['rating'] = round(rating_sum / rating_count, 2)
@@ -2513,9 +2853,7 @@ class APIFootballClient:
                 f"range={upcoming_start_str}..{upcoming_end_str}"
             )
             
-            upcoming_raw = self.get_fixtures_for_team(
-                loan_team_id, season, upcoming_start_str, upcoming_end_str
-            )
+            upcoming_raw = batch.fixtures_for_team(loan_team_id, upcoming_start_str, upcoming_end_str)
             
             for fx in upcoming_raw:
                 fixture_info = fx.get('fixture', {})
@@ -2943,6 +3281,22 @@ class APIFootballClient:
         # ------------------------------------------------------------------
         # 2️⃣ Summarise each loanee via API-Football
         # ------------------------------------------------------------------
+        # Fixture-centric: each loan club's fixtures, each fixture's player
+        # payload and the week's DB rows are loaded once for all loanees
+        batch = WeekFixtureBatch(self, season, start_str, end_str, db_session)
+        full_coverage = [
+            info for info in loanees
+            if info["player_api_id"] > 0 and info.get("can_fetch_stats", True)
+            and info.get("stats_coverage", "full") != "limited" and info["loan_team_api_id"]
+        ]
+        try:
+            batch.prepare(
+                [info["loan_team_api_id"] for info in full_coverage],
+                [info["player_api_id"] for info in full_coverage],
+            )
+        except Exception as exc:
+            logger.warning(f"Week fixture prefetch failed for parent {parent_team_api_id}: {exc}")
+
         summaries: list[dict] = []
         for info in loanees:
             player_id = info["player_api_id"]
@@ -3123,6 +3477,7 @@ class APIFootballClient:
                         week_end=week_end,
                         include_team_stats=include_team_stats,
                         db_session=db_session,
+                        batch=batch,
                     )
                     s["player_name"] = info["player_name"]
                     s["loan_team_name"] = info["loan_team_name"]
@@ -4467,6 +4822,7 @@ class APIFootballClient:
     # Upsert helper functions
     def _get_or_create_fixture(self, db_session, fx, season: int):
         from src.models.weekly import Fixture  # new module
+        from src.services.fixture_stats import store_fixture_payloads
         fixture_api_id = (fx.get('fixture') or {}).get('id')
         row = db_session.query(Fixture).filter_by(fixture_id_api=fixture_api_id).first()
         if row:
@@ -4499,11 +4855,11 @@ class APIFootballClient:
             away_team_api_id=away.get('id'),
             home_goals=goals.get('home') or 0,
             away_goals=goals.get('away') or 0,
-            raw_json=json.dumps(fx),
         )
         db_session.add(row)
         try:
             db_session.flush()
+            store_fixture_payloads([(row.id, 'fixture', 0, fx)], session=db_session)
         except IntegrityError:
             logger.debug("Fixture %s already exists, reusing", fixture_api_id)
             db_session.rollback()
@@ -4517,6 +4873,32 @@ class APIFootballClient:
     def _upsert_player_fixture_stats(self, db_session, fixture_pk, player_api_id, team_api_id, pstats_row):
         """
         Extract and store comprehensive player statistics from API-Football fixture data.
+        """
+        from src.models.weekly import FixturePlayerStats
+        from src.services.fixture_stats import upsert_fixture_player_stats
+
+        upsert_fixture_player_stats(
+            [self._player_fixture_stats_row(fixture_pk, player_api_id, team_api_id, pstats_row)],
+            session=db_session,
+        )
+        return db_session.query(FixturePlayerStats).populate_existing().filter_by(
+            fixture_id=fixture_pk,
+            player_api_id=player_api_id
+        ).first()
+
+    def _player_fixture_stats_row(self, fixture_pk, player_api_id, team_api_id, pstats_row) -> Dict[str, Any]:
+        """Full ``fixture_player_stats`` row for ``upsert_fixture_player_stats``."""
+        return {
+            'fixture_id': fixture_pk,
+            'player_api_id': player_api_id,
+            'team_api_id': team_api_id,
+            **self._player_fixture_stats_values(pstats_row),
+            'raw_json': json.dumps(pstats_row or {}),
+        }
+
+    def _player_fixture_stats_values(self, pstats_row) -> Dict[str, Any]:
+        """
+        Map an API-Football player stats entry to FixturePlayerStats columns.
         
         Handles all available statistics from /fixtures/players endpoint including:
         - Basic game info (minutes, position, rating, captain, substitute)
@@ -4525,8 +4907,6 @@ class APIFootballClient:
         - Fouls, penalties, offsides
         - Goalkeeper-specific stats (saves, goals conceded)
         """
-        from src.models.weekly import FixturePlayerStats
-        
         stats = (pstats_row or {}).get('statistics', [])
         
         # Initialize all stats with defaults
@@ -4638,48 +5018,26 @@ class APIFootballClient:
             # Offsides
             stats_dict['offsides'] = stat_block.get('offsides')
 
-        # Find or create the stats record
-        row = db_session.query(FixturePlayerStats).filter_by(
-            fixture_id=fixture_pk,
-            player_api_id=player_api_id
-        ).first()
-        
-        if row:
-            # Update existing record
-            row.team_api_id = team_api_id
-            for key, value in stats_dict.items():
-                setattr(row, key, value)
-            row.raw_json = json.dumps(pstats_row or {})
-        else:
-            # Create new record
-            row = FixturePlayerStats(
-                fixture_id=fixture_pk,
-                player_api_id=player_api_id,
-                team_api_id=team_api_id,
-                raw_json=json.dumps(pstats_row or {}),
-                **stats_dict
-            )
-            db_session.add(row)
-        
-        db_session.flush()
-        return row
+        return stats_dict
 
     def _upsert_fixture_team_stats(self, db_session, fixture_pk, team_api_id, stats_response):
         from src.models.weekly import FixtureTeamStats
+        from src.services.fixture_stats import store_fixture_payloads
         row = db_session.query(FixtureTeamStats).filter_by(
             fixture_id=fixture_pk,
             team_api_id=team_api_id
         ).first()
-        if row:
-            row.stats_json = json.dumps(stats_response.get('response', []))
-        else:
+        if not row:
             row = FixtureTeamStats(
                 fixture_id=fixture_pk,
                 team_api_id=team_api_id,
-                stats_json=json.dumps(stats_response.get('response', []))
             )
             db_session.add(row)
         db_session.flush()
+        store_fixture_payloads(
+            [(fixture_pk, 'team', team_api_id, stats_response.get('response', []))],
+            session=db_session,
+        )
         return row
 
     def _get_sample_transfers(self, team_id: int = None, player_id: int = None) -> List[Dict[str, Any]]:
@@ -5009,6 +5367,7 @@ class APIFootballClient:
         
         logger.info(f"🚀 Batch fetching transfers for {len(player_ids)} players with {max_workers} workers")
         
+        @self._bind_app_context
         def fetch_with_delay(player_id: int):
             """Fetch transfers with rate limiting."""
             time.sleep(rate_limit_delay)  # Simple rate limiting
@@ -5039,6 +5398,77 @@ class APIFootballClient:
         
         logger.info(f"✅ Batch complete: {len(results)}/{len(player_ids)} successful")
         return results
+
+    def batch_get_team_players(
+        self,
+        team_ids: Iterable[int],
+        season: int = None,
+        max_workers: int = 4,
+        rate_limit_delay: float = 0.2
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch squads for multiple teams in parallel with rate limiting.
+
+        Mirrors ``batch_get_player_transfers``: each team is fetched with
+        ``get_team_players`` on a worker thread (which still paginates
+        serially within a team). Failed teams are omitted from the result
+        so callers can tell "empty squad" apart from "fetch failed".
+
+        Args:
+            team_ids: Team IDs to fetch squads for (duplicates are ignored)
+            season: Season start year (defaults to the client's current season)
+            max_workers: Number of parallel threads (default 4)
+            rate_limit_delay: Delay before each team fetch in seconds
+
+        Returns:
+            Dict mapping team_id to its list of player entries
+        """
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        unique_ids = list(dict.fromkeys(int(t) for t in team_ids if t))
+        if not unique_ids:
+            return results
+
+        logger.info(f"🚀 Batch fetching squads for {len(unique_ids)} teams with {max_workers} workers")
+
+        @self._bind_app_context
+        def fetch_with_delay(team_id: int):
+            """Fetch one squad with rate limiting."""
+            time.sleep(rate_limit_delay)
+            return team_id, self.get_team_players(team_id, season)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch_with_delay, tid): tid for tid in unique_ids}
+            for future in as_completed(futures):
+                try:
+                    team_id, squad = future.result()
+                    results[team_id] = squad or []
+                except Exception as e:
+                    logger.error(f"   Error fetching squad for team {futures[future]}: {e}")
+
+        logger.info(f"✅ Squad batch complete: {len(results)}/{len(unique_ids)} successful")
+        return results
+
+    @staticmethod
+    def _bind_app_context(fn):
+        """Run *fn* inside the caller's Flask app context when there is one.
+
+        Worker threads don't inherit the app context, so without this the
+        DB-backed API cache and quota tracking silently fall through to live
+        calls. Outside Flask (scripts, tests) *fn* is returned unchanged.
+        """
+        try:
+            from flask import current_app, has_app_context
+            if not has_app_context():
+                return fn
+            app = current_app._get_current_object()
+        except ImportError:
+            return fn
+
+        def _wrapped(*args, **kwargs):
+            with app.app_context():
+                return fn(*args, **kwargs)
+
+        return _wrapped
     
     def detect_incremental_loans(
         self,
@@ -5142,8 +5572,7 @@ class APIFootballClient:
                       If None, clear entire cache.
         """
         if player_id is not None:
-            if player_id in self._transfer_cache:
-                del self._transfer_cache[player_id]
+            if self._transfer_cache.pop(player_id, None) is not None:
                 logger.info(f"🗑️ Cleared transfer cache for player {player_id}")
             else:
                 logger.info(f"ℹ️ No cache entry for player {player_id}")
@@ -5163,16 +5592,15 @@ class APIFootballClient:
         """
         if player_id is not None and season is not None:
             cache_key = (player_id, season)
-            if cache_key in self._stats_cache:
-                del self._stats_cache[cache_key]
+            if self._stats_cache.pop(cache_key, None) is not None:
                 logger.info(f"🗑️ Cleared stats cache for player {player_id}, season {season}")
             else:
                 logger.info(f"ℹ️ No cache entry for player {player_id}, season {season}")
         elif player_id is not None:
             # Clear all seasons for this player
-            keys_to_delete = [k for k in self._stats_cache.keys() if k[0] == player_id]
+            keys_to_delete = [k for k in list(self._stats_cache) if k[0] == player_id]
             for key in keys_to_delete:
-                del self._stats_cache[key]
+                self._stats_cache.pop(key, None)
             logger.info(f"🗑️ Cleared stats cache for player {player_id} ({len(keys_to_delete)} seasons)")
         else:
             cache_size = len(self._stats_cache)
@@ -5200,12 +5628,12 @@ class APIFootballClient:
         now = datetime.now(timezone.utc)
         
         transfer_expired = sum(
-            1 for _, (_, timestamp) in self._transfer_cache.items()
+            1 for _, (_, timestamp) in list(self._transfer_cache.items())
             if now - timestamp >= self._transfer_cache_ttl
         )
         
         stats_expired = sum(
-            1 for _, (_, timestamp) in self._stats_cache.items()
+            1 for _, (_, timestamp) in list(self._stats_cache.items())
             if now - timestamp >= self._stats_cache_ttl
         )
         
@@ -5221,5 +5649,6 @@ class APIFootballClient:
                 'expired_entries': stats_expired,
                 'active_entries': len(self._stats_cache) - stats_expired,
                 'ttl_hours': self._stats_cache_ttl.total_seconds() / 3600
-            }
+            },
+            'client': self._shared.stats(),
         }
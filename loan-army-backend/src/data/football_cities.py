@@ -0,0 +1,620 @@
+"""
+Offline gazetteer of football cities.
+
+Coordinates (approximate city centres) for cities that host professional
+clubs, used by ``src.utils.geocoding`` before any cache or network lookup.
+Keys are lower-case city names as they appear in API-Football venue data;
+lookups also try the keys with accents stripped, so 'münchen' and 'munchen'
+both match.
+"""
+
+# Format: 'city_name_lower': (latitude, longitude)
+CITY_COORDINATES = {
+    # England
+    'manchester': (53.4808, -2.2426),
+    'london': (51.5074, -0.1278),
+    'liverpool': (53.4084, -2.9916),
+    'birmingham': (52.4862, -1.8904),
+    'leeds': (53.8008, -1.5491),
+    'newcastle upon tyne': (54.9783, -1.6178),
+    'newcastle': (54.9783, -1.6178),
+    'sheffield': (53.3811, -1.4701),
+    'nottingham': (52.9548, -1.1581),
+    'leicester': (52.6369, -1.1398),
+    'southampton': (50.9097, -1.4044),
+    'brighton': (50.8225, -0.1372),
+    'bournemouth': (50.7192, -1.8808),
+    'wolverhampton': (52.5870, -2.1288),
+    'west bromwich': (52.5095, -1.9946),
+    'stoke-on-trent': (53.0027, -2.1794),
+    'sunderland': (54.9069, -1.3838),
+    'middlesbrough': (54.5742, -1.2350),
+    'derby': (52.9225, -1.4746),
+    'ipswich': (52.0567, 1.1482),
+    'norwich': (52.6309, 1.2974),
+    'hull': (53.7676, -0.3274),
+    'bristol': (51.4545, -2.5879),
+    'cardiff': (51.4816, -3.1791),
+    'swansea': (51.6214, -3.9436),
+    'burnley': (53.7897, -2.2480),
+    'fulham': (51.4749, -0.2214),
+    'brentford': (51.4882, -0.3028),
+    'watford': (51.6565, -0.3965),
+    'luton': (51.8787, -0.4200),
+    'reading': (51.4543, -0.9781),
+    'coventry': (52.4068, -1.5197),
+    'blackburn': (53.7487, -2.4890),
+    'bolton': (53.5785, -2.4299),
+    'wigan': (53.5448, -2.6318),
+    'preston': (53.7632, -2.7031),
+    'huddersfield': (53.6450, -1.7798),
+    'barnsley': (53.5526, -1.4794),
+    'rotherham': (53.4326, -1.3635),
+    'millwall': (51.4862, -0.0509),  # South Bermondsey
+    'charlton': (51.4865, 0.0363),
+    'portsmouth': (50.7961, -1.0631),
+    'plymouth': (50.3755, -4.1427),
+    'exeter': (50.7184, -3.5339),
+    'oxford': (51.7520, -1.2577),
+    'wycombe': (51.6308, -0.8003),
+    'peterborough': (52.5695, -0.2405),
+    'crewe': (53.0986, -2.4414),
+
+    # Spain
+    'madrid': (40.4168, -3.7038),
+    'barcelona': (41.3874, 2.1686),
+    'sevilla': (37.3891, -5.9845),
+    'seville': (37.3891, -5.9845),
+    'valencia': (39.4699, -0.3763),
+    'bilbao': (43.2630, -2.9350),
+    'san sebastian': (43.3183, -1.9812),
+    'malaga': (36.7213, -4.4214),
+    'vigo': (42.2406, -8.7207),
+    'villarreal': (39.9439, -0.1006),
+    'pamplona': (42.8125, -1.6458),
+
+    # Germany
+    'munich': (48.1351, 11.5820),
+    'münchen': (48.1351, 11.5820),
+    'dortmund': (51.5136, 7.4653),
+    'berlin': (52.5200, 13.4050),
+    'frankfurt': (50.1109, 8.6821),
+    'hamburg': (53.5511, 9.9937),
+    'leipzig': (51.3397, 12.3731),
+    'cologne': (50.9375, 6.9603),
+    'köln': (50.9375, 6.9603),
+    'gelsenkirchen': (51.5177, 7.0857),
+    'leverkusen': (51.0459, 7.0192),
+    'mönchengladbach': (51.1805, 6.4428),
+    'wolfsburg': (52.4227, 10.7865),
+    'stuttgart': (48.7758, 9.1829),
+    'bremen': (53.0793, 8.8017),
+    'freiburg': (47.9990, 7.8421),
+    'hoffenheim': (49.2372, 8.8869),  # Sinsheim
+    'mainz': (49.9929, 8.2473),
+    'augsburg': (48.3705, 10.8978),
+    'bochum': (51.4818, 7.2196),
+
+    # Italy
+    'milan': (45.4642, 9.1900),
+    'milano': (45.4642, 9.1900),
+    'rome': (41.9028, 12.4964),
+    'roma': (41.9028, 12.4964),
+    'turin': (45.0703, 7.6869),
+    'torino': (45.0703, 7.6869),
+    'naples': (40.8518, 14.2681),
+    'napoli': (40.8518, 14.2681),
+    'florence': (43.7696, 11.2558),
+    'firenze': (43.7696, 11.2558),
+    'genoa': (44.4056, 8.9463),
+    'genova': (44.4056, 8.9463),
+    'bologna': (44.4949, 11.3426),
+    'verona': (45.4384, 10.9916),
+    'bergamo': (45.6983, 9.6773),
+
+    # France
+    'paris': (48.8566, 2.3522),
+    'marseille': (43.2965, 5.3698),
+    'lyon': (45.7640, 4.8357),
+    'monaco': (43.7384, 7.4246),
+    'lille': (50.6292, 3.0573),
+    'nice': (43.7102, 7.2620),
+    'bordeaux': (44.8378, -0.5792),
+    'toulouse': (43.6047, 1.4442),
+    'nantes': (47.2184, -1.5536),
+    'strasbourg': (48.5734, 7.7521),
+    'montpellier': (43.6108, 3.8767),
+    'rennes': (48.1173, -1.6778),
+    'lens': (50.4323, 2.8269),
+    'reims': (49.2583, 4.0317),
+
+    # Netherlands
+    'amsterdam': (52.3676, 4.9041),
+    'rotterdam': (51.9244, 4.4777),
+    'eindhoven': (51.4416, 5.4697),
+    'alkmaar': (52.6324, 4.7534),
+    'enschede': (52.2215, 6.8937),
+    'arnhem': (51.9851, 5.8987),
+    'utrecht': (52.0907, 5.1214),
+
+    # Portugal
+    'lisbon': (38.7223, -9.1393),
+    'lisboa': (38.7223, -9.1393),
+    'porto': (41.1579, -8.6291),
+    'braga': (41.5454, -8.4265),
+    'guimaraes': (41.4425, -8.2918),
+
+    # Scotland
+    'glasgow': (55.8642, -4.2518),
+    'edinburgh': (55.9533, -3.1883),
+    'aberdeen': (57.1497, -2.0943),
+    'dundee': (56.4620, -2.9707),
+
+    # Belgium
+    'brussels': (50.8503, 4.3517),
+    'bruxelles': (50.8503, 4.3517),
+    'bruges': (51.2093, 3.2247),
+    'brugge': (51.2093, 3.2247),
+    'ghent': (51.0543, 3.7174),
+    'gent': (51.0543, 3.7174),
+    'antwerp': (51.2194, 4.4025),
+    'antwerpen': (51.2194, 4.4025),
+    'liege': (50.6326, 5.5797),
+
+    # Turkey
+    'istanbul': (41.0082, 28.9784),
+    'ankara': (39.9334, 32.8597),
+
+    # Other
+    'zurich': (47.3769, 8.5417),
+    'vienna': (48.2082, 16.3738),
+    'wien': (48.2082, 16.3738),
+    'athens': (37.9838, 23.7275),
+    'moscow': (55.7558, 37.6173),
+
+    # England (EFL and National League towns)
+    'stoke': (53.0027, -2.1794),
+    'blackpool': (53.8175, -3.0357),
+    'cheltenham': (51.8994, -2.0783),
+    'doncaster': (53.5228, -1.1285),
+    'bradford': (53.7960, -1.7594),
+    'birkenhead': (53.3934, -3.0148),
+    'salford': (53.4875, -2.2901),
+    'milton keynes': (52.0406, -0.7594),
+    'northampton': (52.2405, -0.9027),
+    'cambridge': (52.2053, 0.1218),
+    'colchester': (51.8959, 0.8919),
+    'gillingham': (51.3890, 0.5486),
+    'stevenage': (51.9038, -0.1966),
+    'lincoln': (53.2307, -0.5406),
+    'mansfield': (53.1472, -1.1987),
+    'shrewsbury': (52.7073, -2.7553),
+    'walsall': (52.5862, -1.9829),
+    'burton upon trent': (52.8019, -1.6366),
+    'accrington': (53.7534, -2.3640),
+    'morecambe': (54.0690, -2.8617),
+    'carlisle': (54.8925, -2.9329),
+    'fleetwood': (53.9166, -3.0357),
+    'harrogate': (53.9921, -1.5418),
+    'barrow-in-furness': (54.1108, -3.2261),
+    'oldham': (53.5409, -2.1114),
+    'rochdale': (53.6097, -2.1561),
+    'bury': (53.5933, -2.2966),
+    'stockport': (53.4106, -2.1575),
+    'swindon': (51.5558, -1.7797),
+    'southend-on-sea': (51.5459, 0.7077),
+    'crawley': (51.1091, -0.1872),
+    'sutton': (51.3618, -0.1945),
+    'bromley': (51.4039, 0.0198),
+    'wimbledon': (51.4214, -0.2064),
+    'leyton': (51.5600, -0.0120),
+    'grimsby': (53.5675, -0.0800),
+    'cleethorpes': (53.5600, -0.0290),
+    'scunthorpe': (53.5896, -0.6544),
+    'hartlepool': (54.6861, -1.2125),
+    'gateshead': (54.9527, -1.6034),
+    'york': (53.9600, -1.0873),
+    'chesterfield': (53.2350, -1.4210),
+    'burslem': (53.0480, -2.1980),
+    'aldershot': (51.2480, -0.7580),
+    'eastleigh': (50.9697, -1.3502),
+    'dagenham': (51.5397, 0.1466),
+    'solihull': (52.4118, -1.7776),
+    'maidstone': (51.2704, 0.5227),
+    'nailsworth': (51.6942, -2.2206),
+
+    # Wales and Northern Ireland
+    'newport': (51.5842, -2.9977),
+    'wrexham': (53.0466, -2.9925),
+    'belfast': (54.5973, -5.9301),
+
+    # Ireland
+    'dublin': (53.3498, -6.2603),
+    'cork': (51.8985, -8.4756),
+    'derry': (54.9966, -7.3086),
+    'galway': (53.2707, -9.0568),
+    'limerick': (52.6638, -8.6267),
+
+    # Scotland
+    'kilmarnock': (55.6117, -4.4958),
+    'motherwell': (55.7893, -3.9919),
+    'paisley': (55.8456, -4.4239),
+    'livingston': (55.9029, -3.5226),
+    'dingwall': (57.5950, -4.4280),
+    'inverness': (57.4778, -4.2247),
+    'kirkcaldy': (56.1107, -3.1674),
+    'dunfermline': (56.0719, -3.4393),
+    'falkirk': (56.0019, -3.7839),
+    'greenock': (55.9486, -4.7645),
+    'airdrie': (55.8661, -3.9806),
+
+    # Spain
+    'getafe': (40.3057, -3.7329),
+    'leganes': (40.3272, -3.7635),
+    'vitoria-gasteiz': (42.8467, -2.6716),
+    'vitoria': (42.8467, -2.6716),
+    'girona': (41.9794, 2.8214),
+    'palma': (39.5696, 2.6502),
+    'palma de mallorca': (39.5696, 2.6502),
+    'las palmas': (28.1235, -15.4363),
+    'santa cruz de tenerife': (28.4636, -16.2518),
+    'cadiz': (36.5271, -6.2886),
+    'granada': (37.1773, -3.5986),
+    'almeria': (36.8340, -2.4637),
+    'elche': (38.2669, -0.6983),
+    'alicante': (38.3452, -0.4810),
+    'gijon': (43.5322, -5.6611),
+    'oviedo': (43.3614, -5.8494),
+    'santander': (43.4623, -3.8099),
+    'zaragoza': (41.6488, -0.8891),
+    'valladolid': (41.6523, -4.7245),
+    'la coruna': (43.3623, -8.4115),
+    'a coruna': (43.3623, -8.4115),
+    'eibar': (43.1844, -2.4734),
+    'huesca': (42.1401, -0.4089),
+    'burgos': (42.3439, -3.6969),
+    'castellon': (39.9864, -0.0513),
+    'tarragona': (41.1189, 1.2445),
+    'ferrol': (43.4832, -8.2369),
+    'miranda de ebro': (42.6865, -2.9469),
+    'ponferrada': (42.5466, -6.5962),
+    'albacete': (38.9943, -1.8585),
+    'lugo': (43.0097, -7.5568),
+    'sabadell': (41.5433, 2.1094),
+
+    # Germany
+    'hannover': (52.3759, 9.7320),
+    'hanover': (52.3759, 9.7320),
+    'nuremberg': (49.4521, 11.0767),
+    'nürnberg': (49.4521, 11.0767),
+    'düsseldorf': (51.2277, 6.7735),
+    'kaiserslautern': (49.4401, 7.7491),
+    'karlsruhe': (49.0069, 8.4037),
+    'darmstadt': (49.8728, 8.6512),
+    'heidenheim': (48.6760, 10.1516),
+    'sinsheim': (49.2530, 8.8790),
+    'bielefeld': (52.0302, 8.5325),
+    'paderborn': (51.7189, 8.7575),
+    'kiel': (54.3233, 10.1228),
+    'rostock': (54.0924, 12.0991),
+    'magdeburg': (52.1205, 11.6276),
+    'braunschweig': (52.2689, 10.5268),
+    'fürth': (49.4771, 10.9887),
+    'regensburg': (49.0134, 12.1016),
+    'sandhausen': (49.3431, 8.6592),
+    'osnabrück': (52.2799, 8.0472),
+    'duisburg': (51.4344, 6.7623),
+    'essen': (51.4556, 7.0116),
+    'dresden': (51.0504, 13.7373),
+    'ingolstadt': (48.7665, 11.4258),
+    'aachen': (50.7753, 6.0839),
+
+    # Italy
+    'udine': (46.0711, 13.2346),
+    'sassuolo': (44.5440, 10.7840),
+    'reggio emilia': (44.6989, 10.6297),
+    'cagliari': (39.2238, 9.1217),
+    'lecce': (40.3515, 18.1750),
+    'empoli': (43.7184, 10.9466),
+    'monza': (45.5845, 9.2744),
+    'salerno': (40.6824, 14.7681),
+    'cremona': (45.1333, 10.0227),
+    'frosinone': (41.6396, 13.3420),
+    'como': (45.8081, 9.0852),
+    'venice': (45.4408, 12.3155),
+    'venezia': (45.4408, 12.3155),
+    'parma': (44.8015, 10.3279),
+    'palermo': (38.1157, 13.3615),
+    'bari': (41.1171, 16.8719),
+    'pisa': (43.7228, 10.4017),
+    'brescia': (45.5416, 10.2118),
+    'cesena': (44.1391, 12.2431),
+    'la spezia': (44.1025, 9.8241),
+    'modena': (44.6471, 10.9252),
+    'catanzaro': (38.9098, 16.5877),
+    'cosenza': (39.2983, 16.2537),
+    'ferrara': (44.8381, 11.6198),
+    'perugia': (43.1107, 12.3908),
+    'ascoli piceno': (42.8540, 13.5745),
+    'benevento': (41.1298, 14.7826),
+    'crotone': (39.0808, 17.1271),
+    'catania': (37.5079, 15.0830),
+    'vicenza': (45.5455, 11.5354),
+    'padua': (45.4064, 11.8768),
+    'padova': (45.4064, 11.8768),
+    'trieste': (45.6495, 13.7768),
+    'terni': (42.5636, 12.6427),
+    'reggio calabria': (38.1147, 15.6500),
+    'novara': (45.4469, 8.6220),
+    'siena': (43.3188, 11.3308),
+    'livorno': (43.5485, 10.3106),
+
+    # France
+    'saint-etienne': (45.4397, 4.3872),
+    'saint etienne': (45.4397, 4.3872),
+    'auxerre': (47.7982, 3.5673),
+    'angers': (47.4784, -0.5632),
+    'brest': (48.3904, -4.4861),
+    'le havre': (49.4944, 0.1079),
+    'lorient': (47.7483, -3.3700),
+    'metz': (49.1193, 6.1757),
+    'clermont-ferrand': (45.7772, 3.0870),
+    'troyes': (48.2973, 4.0744),
+    'ajaccio': (41.9192, 8.7386),
+    'bastia': (42.6970, 9.4503),
+    'caen': (49.1829, -0.3707),
+    'guingamp': (48.5625, -3.1500),
+    'dijon': (47.3220, 5.0415),
+    'nimes': (43.8367, 4.3601),
+    'amiens': (49.8941, 2.2958),
+    'grenoble': (45.1885, 5.7245),
+    'montbeliard': (47.5100, 6.7983),
+    'valenciennes': (50.3570, 3.5235),
+    'laval': (48.0707, -0.7734),
+    'rodez': (44.3506, 2.5750),
+    'annecy': (45.8992, 6.1294),
+    'pau': (43.2951, -0.3708),
+    'niort': (46.3237, -0.4588),
+
+    # Netherlands
+    'heerenveen': (52.9600, 5.9200),
+    'groningen': (53.2194, 6.5665),
+    'nijmegen': (51.8126, 5.8372),
+    'tilburg': (51.5555, 5.0913),
+    'breda': (51.5719, 4.7683),
+    'zwolle': (52.5168, 6.0830),
+    'deventer': (52.2661, 6.1552),
+    'sittard': (51.0000, 5.8667),
+    'waalwijk': (51.6828, 5.0706),
+    'almere': (52.3508, 5.2647),
+    'the hague': (52.0705, 4.3007),
+    'den haag': (52.0705, 4.3007),
+    'almelo': (52.3570, 6.6625),
+    'doetinchem': (51.9650, 6.2889),
+    'venlo': (51.3704, 6.1724),
+    'volendam': (52.4950, 5.0700),
+    'maastricht': (50.8514, 5.6910),
+    'emmen': (52.7792, 6.9069),
+    'kerkrade': (50.8657, 6.0636),
+    'dordrecht': (51.8133, 4.6901),
+    'leeuwarden': (53.2012, 5.7999),
+
+    # Portugal
+    'faro': (37.0194, -7.9304),
+    'funchal': (32.6669, -16.9241),
+    'coimbra': (40.2033, -8.4103),
+    'vila do conde': (41.3533, -8.7450),
+    'famalicao': (41.4079, -8.5197),
+    'vila nova de famalicao': (41.4079, -8.5197),
+    'chaves': (41.7403, -7.4707),
+    'barcelos': (41.5388, -8.6151),
+    'estoril': (38.7057, -9.3977),
+    'portimao': (37.1386, -8.5376),
+    'arouca': (40.9284, -8.2448),
+    'vizela': (41.3766, -8.3066),
+    'setubal': (38.5244, -8.8882),
+    'amadora': (38.7538, -9.2308),
+    'tondela': (40.5167, -8.0833),
+    'leiria': (39.7436, -8.8071),
+
+    # Belgium
+    'genk': (50.9650, 5.5008),
+    'charleroi': (50.4108, 4.4446),
+    'mechelen': (51.0257, 4.4776),
+    'leuven': (50.8798, 4.7005),
+    'sint-truiden': (50.8167, 5.1833),
+    'waregem': (50.8896, 3.4275),
+    'kortrijk': (50.8279, 3.2649),
+    'ostend': (51.2154, 2.9286),
+    'oostende': (51.2154, 2.9286),
+    'eupen': (50.6275, 6.0364),
+    'westerlo': (51.0917, 4.9167),
+    'anderlecht': (50.8333, 4.3000),
+
+    # Switzerland and Austria
+    'basel': (47.5596, 7.5886),
+    'bern': (46.9480, 7.4474),
+    'geneva': (46.2044, 6.1432),
+    'lausanne': (46.5197, 6.6323),
+    'lugano': (46.0037, 8.9511),
+    'st. gallen': (47.4245, 9.3767),
+    'st gallen': (47.4245, 9.3767),
+    'lucerne': (47.0502, 8.3093),
+    'luzern': (47.0502, 8.3093),
+    'sion': (46.2331, 7.3606),
+    'winterthur': (47.5000, 8.7241),
+    'salzburg': (47.8095, 13.0550),
+    'graz': (47.0707, 15.4395),
+    'linz': (48.3069, 14.2858),
+    'klagenfurt': (46.6249, 14.3050),
+    'innsbruck': (47.2692, 11.4041),
+    'wolfsberg': (46.8406, 14.8442),
+    'hartberg': (47.2806, 15.9700),
+
+    # Scandinavia
+    'copenhagen': (55.6761, 12.5683),
+    'københavn': (55.6761, 12.5683),
+    'aarhus': (56.1629, 10.2039),
+    'odense': (55.4038, 10.4024),
+    'aalborg': (57.0488, 9.9217),
+    'herning': (56.1387, 8.9738),
+    'brøndby': (55.6490, 12.4180),
+    'brondby': (55.6490, 12.4180),
+    'randers': (56.4607, 10.0364),
+    'silkeborg': (56.1697, 9.5451),
+    'viborg': (56.4532, 9.4020),
+    'vejle': (55.7113, 9.5364),
+    'stockholm': (59.3293, 18.0686),
+    'gothenburg': (57.7089, 11.9746),
+    'göteborg': (57.7089, 11.9746),
+    'malmö': (55.6050, 13.0038),
+    'norrköping': (58.5877, 16.1924),
+    'helsingborg': (56.0465, 12.6945),
+    'oslo': (59.9139, 10.7522),
+    'bergen': (60.3913, 5.3221),
+    'trondheim': (63.4305, 10.3951),
+    'bodø': (67.2804, 14.4049),
+    'stavanger': (58.9700, 5.7331),
+    'molde': (62.7375, 7.1591),
+    'tromsø': (69.6492, 18.9553),
+    'helsinki': (60.1699, 24.9384),
+
+    # Central and Eastern Europe
+    'prague': (50.0755, 14.4378),
+    'praha': (50.0755, 14.4378),
+    'plzen': (49.7384, 13.3736),
+    'warsaw': (52.2297, 21.0122),
+    'krakow': (50.0647, 19.9450),
+    'poznan': (52.4064, 16.9252),
+    'zagreb': (45.8150, 15.9819),
+    'split': (43.5081, 16.4402),
+    'rijeka': (45.3271, 14.4422),
+    'belgrade': (44.7866, 20.4489),
+    'budapest': (47.4979, 19.0402),
+    'bucharest': (44.4268, 26.1025),
+    'sofia': (42.6977, 23.3219),
+    'kyiv': (50.4501, 30.5234),
+    'kiev': (50.4501, 30.5234),
+    'donetsk': (48.0159, 37.8029),
+    'kharkiv': (49.9935, 36.2304),
+    'saint petersburg': (59.9311, 30.3609),
+    'st petersburg': (59.9311, 30.3609),
+    'bratislava': (48.1486, 17.1077),
+    'ljubljana': (46.0569, 14.5058),
+
+    # Greece, Cyprus, Israel and Turkey
+    'thessaloniki': (40.6401, 22.9444),
+    'piraeus': (37.9420, 23.6465),
+    'nicosia': (35.1856, 33.3823),
+    'limassol': (34.7071, 33.0226),
+    'larnaca': (34.9229, 33.6233),
+    'tel aviv': (32.0853, 34.7818),
+    'haifa': (32.7940, 34.9896),
+    'trabzon': (41.0015, 39.7178),
+    'izmir': (38.4237, 27.1428),
+    'konya': (37.8746, 32.4932),
+    'antalya': (36.8969, 30.7133),
+    'kayseri': (38.7312, 35.4787),
+
+    # North America
+    'new york': (40.7128, -74.0060),
+    'los angeles': (34.0522, -118.2437),
+    'miami': (25.7617, -80.1918),
+    'fort lauderdale': (26.1224, -80.1373),
+    'atlanta': (33.7490, -84.3880),
+    'seattle': (47.6062, -122.3321),
+    'toronto': (43.6532, -79.3832),
+    'vancouver': (49.2827, -123.1207),
+    'montreal': (45.5019, -73.5674),
+    'chicago': (41.8781, -87.6298),
+    'philadelphia': (39.9526, -75.1652),
+    'columbus': (39.9612, -82.9988),
+    'cincinnati': (39.1031, -84.5120),
+    'nashville': (36.1627, -86.7816),
+    'orlando': (28.5383, -81.3792),
+    'charlotte': (35.2271, -80.8431),
+    'austin': (30.2672, -97.7431),
+    'houston': (29.7604, -95.3698),
+    'dallas': (32.7767, -96.7970),
+    'frisco': (33.1507, -96.8236),
+    'salt lake city': (40.7608, -111.8910),
+    'denver': (39.7392, -104.9903),
+    'kansas city': (39.0997, -94.5786),
+    'minneapolis': (44.9778, -93.2650),
+    'st. louis': (38.6270, -90.1994),
+    'portland': (45.5152, -122.6784),
+    'washington': (38.9072, -77.0369),
+    'boston': (42.3601, -71.0589),
+    'foxborough': (42.0654, -71.2478),
+    'mexico city': (19.4326, -99.1332),
+    'ciudad de mexico': (19.4326, -99.1332),
+    'guadalajara': (20.6597, -103.3496),
+    'monterrey': (25.6866, -100.3161),
+
+    # South America
+    'são paulo': (-23.5505, -46.6333),
+    'rio de janeiro': (-22.9068, -43.1729),
+    'belo horizonte': (-19.9167, -43.9345),
+    'porto alegre': (-30.0346, -51.2177),
+    'santos': (-23.9608, -46.3336),
+    'curitiba': (-25.4284, -49.2733),
+    'salvador': (-12.9777, -38.5016),
+    'recife': (-8.0476, -34.8770),
+    'fortaleza': (-3.7319, -38.5267),
+    'buenos aires': (-34.6037, -58.3816),
+    'rosario': (-32.9442, -60.6505),
+    'la plata': (-34.9205, -57.9536),
+    'avellaneda': (-34.6625, -58.3650),
+    'montevideo': (-34.9011, -56.1645),
+    'bogota': (4.7110, -74.0721),
+    'medellin': (6.2476, -75.5658),
+    'lima': (-12.0464, -77.0428),
+    'quito': (-0.1807, -78.4678),
+
+    # Middle East, Asia, Oceania and Africa
+    'riyadh': (24.7136, 46.6753),
+    'jeddah': (21.4858, 39.1925),
+    'dammam': (26.4207, 50.0888),
+    'doha': (25.2854, 51.5310),
+    'dubai': (25.2048, 55.2708),
+    'abu dhabi': (24.4539, 54.3773),
+    'al ain': (24.2075, 55.7447),
+    'tokyo': (35.6762, 139.6503),
+    'yokohama': (35.4437, 139.6380),
+    'seoul': (37.5665, 126.9780),
+    'sydney': (-33.8688, 151.2093),
+    'melbourne': (-37.8136, 144.9631),
+    'brisbane': (-27.4698, 153.0251),
+    'adelaide': (-34.9285, 138.6007),
+    'johannesburg': (-26.2041, 28.0473),
+    'cape town': (-33.9249, 18.4241),
+    'cairo': (30.0444, 31.2357),
+    'casablanca': (33.5731, -7.5898),
+    'tunis': (36.8065, 10.1815),
+    'lagos': (6.5244, 3.3792),
+}
+
+# City names shared by several football cities, keyed by (city, country).
+# Checked before CITY_COORDINATES whenever a country is known.
+CITY_COUNTRY_COORDINATES = {
+    ('valencia', 'venezuela'): (10.1620, -68.0077),
+    ('perth', 'scotland'): (56.3950, -3.4308),
+    ('perth', 'australia'): (-31.9505, 115.8605),
+    ('hamilton', 'scotland'): (55.7775, -4.0390),
+    ('hamilton', 'canada'): (43.2557, -79.8711),
+    ('cordoba', 'spain'): (37.8882, -4.7794),
+    ('cordoba', 'argentina'): (-31.4201, -64.1888),
+    ('leon', 'spain'): (42.5987, -5.5671),
+    ('leon', 'mexico'): (21.1250, -101.6860),
+    ('cartagena', 'spain'): (37.6257, -0.9966),
+    ('cartagena', 'colombia'): (10.3910, -75.4794),
+    ('santiago', 'chile'): (-33.4489, -70.6693),
+    ('guadalajara', 'spain'): (40.6326, -3.1670),
+    ('san jose', 'usa'): (37.3382, -121.8863),
+    ('san jose', 'costa rica'): (9.9281, -84.0907),
+    ('newcastle', 'australia'): (-32.9283, 151.7817),
+    ('birmingham', 'usa'): (33.5186, -86.8104),
+    ('london', 'canada'): (42.9849, -81.2453),
+    ('portland', 'england'): (50.5500, -2.4400),
+    ('bergen', 'netherlands'): (52.6690, 4.7000),
+}
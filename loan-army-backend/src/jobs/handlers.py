@@ -0,0 +1,78 @@
+"""Job queue handlers for the admin background jobs.
+
+Each handler runs on a job queue worker (src/utils/job_queue.py) inside an
+app context, receives the job id plus the payload given to enqueue_job(),
+and returns the results stored on the job. Implementations are imported
+lazily so registering the handlers stays cheap for web processes.
+"""
+
+from src.utils.job_queue import register_job_handler
+
+# Rebuild and Big 6 seeding wipe and re-create the same tables, so they
+# share one slot and never run alongside each other.
+REBUILD_GROUP = 'rebuild'
+
+
+@register_job_handler('full_rebuild', group=REBUILD_GROUP, priority=200)
+def full_rebuild(job_id, **config):
+    from src.utils.rebuild_runner import run_full_rebuild
+    run_full_rebuild(job_id, config)
+
+
+@register_job_handler('seed_big6', group=REBUILD_GROUP, priority=200)
+def seed_big6(job_id, seasons=None, team_ids=None, league_ids=None):
+    from src.services.big6_seeding_service import run_big6_seed
+    return run_big6_seed(job_id, seasons=seasons, team_ids=team_ids, league_ids=league_ids)
+
+
+@register_job_handler('refresh_statuses', max_attempts=3)
+def refresh_statuses(job_id, team_id=None, resync_journeys=False):
+    from src.routes.api import _run_refresh_statuses_job
+    return _run_refresh_statuses_job(job_id, team_id=team_id, resync_journeys=resync_journeys)
+
+
+@register_job_handler('seed_team', concurrency=2, max_attempts=3, priority=50)
+def seed_team(job_id, team_id, max_age=30, sync_journeys=True, years=4):
+    from src.routes.api import _run_seed_team_job
+    return _run_seed_team_job(job_id, team_id, max_age=max_age,
+                              sync_journeys=sync_journeys, years=years)
+
+
+@register_job_handler('seed_all_tracked', max_attempts=2)
+def seed_all_tracked(job_id, max_age=30, sync_journeys=True, years=4):
+    from src.routes.api import _run_seed_all_tracked_job
+    return _run_seed_all_tracked_job(job_id, max_age=max_age,
+                                     sync_journeys=sync_journeys, years=years)
+
+
+@register_job_handler('seed_top5')
+def seed_top5(job_id, data):
+    from src.routes.api import _run_seed_top5_logic
+    return _run_seed_top5_logic(data, job_id)
+
+
+@register_job_handler('fix_miscategorized')
+def fix_miscategorized(job_id, data):
+    from src.routes.api import _run_fix_miscategorized_logic
+    return _run_fix_miscategorized_logic(data, job_id)
+
+
+@register_job_handler('reconcile_ids')
+def reconcile_ids(job_id, data):
+    from src.routes.api import _run_reconcile_ids_logic
+    return _run_reconcile_ids_logic(data, job_id)
+
+
+@register_job_handler('team_fixtures_sync', concurrency=2, max_attempts=3, priority=50)
+def team_fixtures_sync(job_id, team_id, data):
+    from src.routes.api import _run_team_fixtures_sync
+    return _run_team_fixtures_sync(team_id, data, job_id)
+
+
+# Queued by the public player endpoints (deduplicated per player), so keep
+# them behind admin work and cap how many hit API-Football at once.
+@register_job_handler('player_refresh', concurrency=2, max_attempts=2, priority=150)
+def player_refresh(job_id, player_id, season, team_ids, player_name=None, force=False):
+    from src.routes.api import _run_player_refresh_job
+    return _run_player_refresh_job(job_id, player_id, season, team_ids,
+                                   player_name=player_name, force=force)
@@ -1,9 +1,10 @@
+import click
 import json
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from flask import Flask, send_from_directory, jsonify
-from src.models.league import db, League, Team, LoanedPlayer, Newsletter, UserSubscription
+from flask import Flask, request, send_from_directory, jsonify
+from src.models.league import db, League, Team, UserSubscription
 import src.models.weekly  # Ensure weekly models are registered with SQLAlchemy
 import src.models.journey  # Ensure journey models are registered with SQLAlchemy
 import src.models.cohort   # Ensure cohort models are registered with SQLAlchemy
@@ -11,6 +12,7 @@ import src.models.formation  # Ensure formation models are registered with SQLAl
 import src.models.api_cache  # Ensure API cache models are registered with SQLAlchemy
 import src.models.tracked_player  # Ensure TrackedPlayer model is registered with SQLAlchemy
 from src.routes.api import api_bp, require_api_key
+from src.services.stats_snapshot import get_snapshot, snapshot_payload
 from src.routes.auth_routes import auth_bp
 from src.routes.journalist import journalist_bp
 from src.routes.newsletter_deadline import newsletter_deadline_bp
@@ -212,20 +214,13 @@ def handle_http_exception(exc: HTTPException):
 @app.route('/api/debug/database', methods=['GET'])
 @require_api_key
 def debug_database():
-    """Debug endpoint to check database state. Requires admin authentication."""
+    """Debug endpoint to check database state. Requires admin authentication.
+
+    Served from the ``database`` stats snapshot; ``refresh=1`` rebuilds it.
+    """
     try:
-        stats = {
-            'tables': {
-                'leagues': League.query.count(),
-                'teams': Team.query.count(),
-                'active_teams': Team.query.filter_by(is_active=True).count(),
-                'loans': LoanedPlayer.query.count(),
-                'active_loans': LoanedPlayer.query.filter_by(is_active=True).count(),
-                'newsletters': Newsletter.query.count(),
-                'subscriptions': UserSubscription.query.count()
-            }
-        }
-        return jsonify(stats)
+        refresh = request.args.get('refresh', '').strip().lower() in ('1', 'true', 'yes')
+        return jsonify(snapshot_payload(get_snapshot('database', rebuild=refresh)))
     except Exception as e:
         logger.error(f"Debug database check failed: {e}")
         return jsonify({'error': 'Database check failed'}), 500
@@ -267,6 +262,34 @@ def backfill_unsubscribe_tokens():
     print(f"✅ Backfilled {count} subscription(s) with unsubscribe tokens")
 
 
+@app.cli.command("job-worker")
+@click.option("--processes", "-p", type=int, default=None,
+              help="Worker processes (default: JOB_WORKER_PROCESSES or 2)")
+def job_worker(processes):
+    """Run a dedicated pool of background job queue workers."""
+    from src.utils.job_queue import run_worker_pool
+    run_worker_pool(processes)
+
+
+@app.cli.command("import-profile")
+@click.option("--module", "-m", default="src.main", show_default=True,
+              help="Module to import in a fresh interpreter")
+@click.option("--top", type=int, default=20, show_default=True)
+@click.option("--max-ms", type=float, default=None,
+              help="Fail when start-up imports take longer than this")
+@click.option("--json", "as_json", is_flag=True, help="Print the summary as JSON")
+def import_profile(module, top, max_ms, as_json):
+    """Report per-module import cost and fail on start-up regressions."""
+    from src.utils.import_profile import check_budget, format_report, profile_imports, summarize
+    summary = summarize(profile_imports(module), top=top)
+    click.echo(json.dumps(summary, indent=2) if as_json else format_report(summary))
+    problems = check_budget(summary, max_ms)
+    for problem in problems:
+        click.echo(f"❌ {problem}", err=True)
+    if problems:
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
     # Only run when you execute `python src/main.py`,
     # NOT when Flask CLI imports the app.
@@ -1,4 +1,5 @@
-"""Persistent API response cache and daily usage tracking."""
+"""Persistent API response cache, geocoding cache, player page documents,
+admin stats snapshots and daily usage tracking."""
 
 import hashlib
 import json
@@ -153,6 +154,168 @@ class APICache(db.Model):
         return {"total_entries": total, "by_endpoint": by_endpoint}
 
 
+class GeocodeCache(db.Model):
+    """DB-backed cache for network geocoding results.
+
+    Keyed by normalized (city_key, country_key); country_key is '' when the
+    lookup had no country. Rows with NULL coordinates are negative results
+    (the geocoder answered but found nothing) and are trusted for a limited
+    time so that unknown cities are not re-queried on every sync.
+    """
+
+    __tablename__ = "geocode_cache"
+
+    id = db.Column(db.Integer, primary_key=True)
+    city_key = db.Column(db.String(120), nullable=False)
+    country_key = db.Column(db.String(100), nullable=False, default="")
+    latitude = db.Column(db.Float)
+    longitude = db.Column(db.Float)
+    source = db.Column(db.String(20))
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint("city_key", "country_key", name="uq_geocode_cache_city_country"),
+    )
+
+    @property
+    def coords(self) -> tuple[float, float] | None:
+        if self.latitude is None or self.longitude is None:
+            return None
+        return (self.latitude, self.longitude)
+
+    def is_fresh(self, negative_ttl_seconds: int) -> bool:
+        """Positive results never expire; negative ones after the TTL."""
+        if self.coords is not None:
+            return True
+        created = self.created_at
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created).total_seconds() < negative_ttl_seconds
+
+    @classmethod
+    def get_many(cls, keys) -> dict:
+        """Return ``{(city_key, country_key): row}`` for the cached *keys*."""
+        keys = set(keys)
+        if not keys:
+            return {}
+        rows = cls.query.filter(cls.city_key.in_({city for city, _ in keys})).all()
+        return {
+            (row.city_key, row.country_key): row
+            for row in rows
+            if (row.city_key, row.country_key) in keys
+        }
+
+    @classmethod
+    def store_many(cls, results: dict, source: str = "nominatim") -> None:
+        """Insert or refresh rows for ``{(city_key, country_key): coords or None}``.
+
+        Writes in its own transaction on a separate connection, so the
+        caller's session (often mid-sync) is neither committed nor rolled back.
+        """
+        if not results:
+            return
+        table = cls.__table__
+        now = datetime.now(timezone.utc)
+        records = [
+            {
+                "city_key": city_key,
+                "country_key": country_key,
+                "latitude": coords[0] if coords else None,
+                "longitude": coords[1] if coords else None,
+                "source": source,
+                "created_at": now,
+            }
+            for (city_key, country_key), coords in results.items()
+        ]
+
+        def _apply(conn):
+            existing = {
+                (row.city_key, row.country_key): row.id
+                for row in conn.execute(
+                    db.select(table.c.id, table.c.city_key, table.c.country_key)
+                    .where(table.c.city_key.in_({r["city_key"] for r in records}))
+                )
+            }
+            inserts = [r for r in records if (r["city_key"], r["country_key"]) not in existing]
+            updates = [
+                {**r, "row_id": existing[(r["city_key"], r["country_key"])]}
+                for r in records if (r["city_key"], r["country_key"]) in existing
+            ]
+            if inserts:
+                conn.execute(table.insert(), inserts)
+            if updates:
+                conn.execute(
+                    table.update().where(table.c.id == db.bindparam("row_id")),
+                    updates,
+                )
+
+        try:
+            with db.engine.begin() as conn:
+                _apply(conn)
+        except IntegrityError:
+            # Race condition – another worker inserted some keys first
+            with db.engine.begin() as conn:
+                _apply(conn)
+
+
+class _BuiltDocument:
+    """Freshness rules shared by stored documents with built/invalidated stamps."""
+
+    @staticmethod
+    def _utc(value: datetime | None) -> datetime | None:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    def is_fresh(self, max_age_seconds: int) -> bool:
+        built = self._utc(self.built_at)
+        invalidated = self._utc(self.invalidated_at)
+        if invalidated is not None and invalidated >= built:
+            return False
+        return (datetime.now(timezone.utc) - built).total_seconds() < max_age_seconds
+
+
+class PlayerPageCache(_BuiltDocument, db.Model):
+    """Denormalized public player page document, one row per player.
+
+    ``payload_json`` is the combined profile/stats/season-stats/journey/
+    commentaries/links document served by ``GET /players/<id>/page``.
+    Writes to the underlying rows set ``invalidated_at``; a row is only
+    served while it was built after its last invalidation (see
+    src/services/player_page.py). ``updated_at`` moves only when the
+    payload itself changes and backs the Last-Modified header.
+    """
+
+    __tablename__ = "player_page_cache"
+
+    id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, nullable=False, unique=True)
+    payload_json = db.Column(db.Text, nullable=False)
+    etag = db.Column(db.String(64), nullable=False)
+    built_at = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+    invalidated_at = db.Column(db.DateTime)
+
+
+class StatsSnapshot(_BuiltDocument, db.Model):
+    """Precomputed admin/status aggregates, one row per snapshot key.
+
+    ``payload_json`` holds what the dashboard-stats, subscriber-stats,
+    sync-status and debug/database endpoints used to aggregate per request
+    (see src/services/stats_snapshot.py). ``built_at`` is reported to
+    clients as ``as_of``; writes to the source tables set
+    ``invalidated_at``.
+    """
+
+    __tablename__ = "stats_snapshots"
+
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(50), nullable=False, unique=True)
+    payload_json = db.Column(db.Text, nullable=False)
+    built_at = db.Column(db.DateTime, nullable=False)
+    invalidated_at = db.Column(db.DateTime)
+
+
 class APIUsageDaily(db.Model):
     """Tracks the number of live API calls made per day per endpoint."""
 
@@ -216,6 +216,12 @@ class LoanedPlayer(db.Model):
     __table_args__ = (
         # Ensure one row per player/parent/loan/window
         db.UniqueConstraint('player_id', 'primary_team_id', 'loan_team_id', 'window_key', name='uq_loans_player_parent_loan_window'),
+        # Keyset pagination for the admin loan/player listings: (sort key, id)
+        db.Index('ix_loaned_players_updated_at_id', 'updated_at', 'id'),
+        db.Index('ix_loaned_players_created_at_id', 'created_at', 'id'),
+        db.Index('ix_loaned_players_name_sort_id', db.func.coalesce(db.func.lower(player_name), ''), 'id'),
+        db.Index('ix_loaned_players_primary_active_updated', 'primary_team_id', 'is_active', 'updated_at', 'id'),
+        db.Index('ix_loaned_players_loan_team_id', 'loan_team_id'),
     )
 
     def _compute_stats(self):
@@ -1295,7 +1301,7 @@ class BackgroundJob(db.Model):
 
     id = db.Column(db.String(36), primary_key=True)  # UUID
     job_type = db.Column(db.String(50), nullable=False)  # seed_top5, fix_miscategorized, etc.
-    status = db.Column(db.String(20), nullable=False, default='running')  # running, completed, failed
+    status = db.Column(db.String(20), nullable=False, default='running')  # queued, running, completed, failed, cancelled
     progress = db.Column(db.Integer, default=0)
     total = db.Column(db.Integer, default=0)
     current_player = db.Column(db.String(200))
@@ -1305,10 +1311,21 @@ class BackgroundJob(db.Model):
     completed_at = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    # Work queue (src/utils/job_queue.py): lower priority values run first
+    priority = db.Column(db.Integer, nullable=False, default=100)
+    payload_json = db.Column(db.Text)  # JSON kwargs for the job handler
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=1)
+    run_after = db.Column(db.DateTime)  # not claimable before this (retry backoff)
+    heartbeat_at = db.Column(db.DateTime)
+    worker_id = db.Column(db.String(64))
+    dedupe_key = db.Column(db.String(100))  # enqueue_job() skips duplicates sharing this key
 
     __table_args__ = (
         db.Index('ix_background_jobs_status', 'status'),
         db.Index('ix_background_jobs_created', 'created_at'),
+        db.Index('ix_background_jobs_queue', 'status', 'priority', 'created_at'),
+        db.Index('ix_background_jobs_dedupe', 'dedupe_key', 'created_at'),
     )
 
     def to_dict(self):
@@ -1331,6 +1348,8 @@ class BackgroundJob(db.Model):
             'error': self.error,
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
         }
 
 
@@ -1502,6 +1521,9 @@ class AcademyLeague(db.Model):
     # Sync tracking
     last_synced_at = db.Column(db.DateTime, nullable=True)
     sync_enabled = db.Column(db.Boolean, default=True)
+    # High-water mark: kickoff timestamp (unix) up to which every FT fixture
+    # has been fully processed. Fixtures at or before it are skipped on sync.
+    last_fixture_timestamp = db.Column(db.BigInteger, nullable=True)
 
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
@@ -1521,6 +1543,7 @@ class AcademyLeague(db.Model):
             'parent_team_id': self.parent_team_id,
             'parent_team_name': self.parent_team.name if self.parent_team else None,
             'last_synced_at': self.last_synced_at.isoformat() if self.last_synced_at else None,
+            'last_fixture_timestamp': self.last_fixture_timestamp,
             'sync_enabled': self.sync_enabled,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
@@ -1,3 +1,4 @@
+import zlib
 from datetime import datetime, timezone
 from src.models.league import db
 
@@ -33,7 +34,14 @@ class Fixture(db.Model):
     away_team_api_id = db.Column(db.Integer)
     home_goals = db.Column(db.Integer, default=0)
     away_goals = db.Column(db.Integer, default=0)
-    raw_json = db.Column(db.Text)
+
+    __table_args__ = (
+        # Weekly windows and "latest fixtures" listings
+        db.Index('ix_fixtures_date_utc', 'date_utc'),
+        # A club's fixtures in a season/date range (home OR away -> two scans)
+        db.Index('ix_fixtures_home_team_season_date', 'home_team_api_id', 'season', 'date_utc'),
+        db.Index('ix_fixtures_away_team_season_date', 'away_team_api_id', 'season', 'date_utc'),
+    )
 
 
 class FixtureTeamStats(db.Model):
@@ -41,12 +49,40 @@ class FixtureTeamStats(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     fixture_id = db.Column(db.Integer, db.ForeignKey('fixtures.id'), nullable=False)
     team_api_id = db.Column(db.Integer, nullable=False)
-    stats_json = db.Column(db.Text)
     __table_args__ = (
         db.UniqueConstraint('fixture_id', 'team_api_id', name='uq_fixture_team'),
     )
 
 
+class FixturePayload(db.Model):
+    """Raw API-Football payloads, zlib-compressed and kept out of the hot tables.
+
+    ``kind`` is ``'fixture'`` (the /fixtures object, ``subject_api_id`` 0),
+    ``'player'`` (a /fixtures/players entry, keyed by player API id) or
+    ``'team'`` (a /fixtures/statistics response, keyed by team API id).
+    Read and write them through ``src.services.fixture_stats``.
+    """
+    __tablename__ = 'fixture_payloads'
+    id = db.Column(db.Integer, primary_key=True)
+    fixture_id = db.Column(db.Integer, db.ForeignKey('fixtures.id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String(16), nullable=False)
+    subject_api_id = db.Column(db.Integer, nullable=False, default=0)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc),
+                           onupdate=lambda: datetime.now(timezone.utc))
+    __table_args__ = (
+        db.UniqueConstraint('fixture_id', 'kind', 'subject_api_id', name='uq_fixture_payload'),
+    )
+
+    @staticmethod
+    def pack(text: str) -> bytes:
+        return zlib.compress(text.encode('utf-8'))
+
+    @staticmethod
+    def unpack(blob: bytes) -> str:
+        return zlib.decompress(blob).decode('utf-8')
+
+
 class FixturePlayerStats(db.Model):
     __tablename__ = 'fixture_player_stats'
     id = db.Column(db.Integer, primary_key=True)
@@ -109,12 +145,13 @@ class FixturePlayerStats(db.Model):
     # Other
     offsides = db.Column(db.Integer)
     
-    # Raw JSON for future expansion
-    raw_json = db.Column(db.Text)
-    
     __table_args__ = (
         db.UniqueConstraint('fixture_id', 'player_api_id',
                             name='uq_fixture_player'),
+        # A player's appearances joined to fixtures (stats pages, charts)
+        db.Index('ix_fixture_player_stats_player_fixture', 'player_api_id', 'fixture_id'),
+        # Club totals, with or without a player (loan stats, squad views)
+        db.Index('ix_fixture_player_stats_team_player', 'team_api_id', 'player_api_id'),
     )
     
     def to_dict(self):
@@ -171,7 +208,6 @@ class FixturePlayerStats(db.Model):
                 'saved': self.penalty_saved
             },
             'offsides': self.offsides,
-            'raw_json': self.raw_json
         }
 
 
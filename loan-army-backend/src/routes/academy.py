@@ -151,6 +151,7 @@ def sync_academy_league(league_id):
     Optional body:
     - date_from: Start date (YYYY-MM-DD), default: 7 days ago
     - date_to: End date (YYYY-MM-DD), default: today
+    - force: Reprocess fixtures already behind the league's high-water mark
     """
     league = db.session.get(AcademyLeague, league_id)
     if not league:
@@ -177,6 +178,7 @@ def sync_academy_league(league_id):
         league=league,
         date_from=date_from,
         date_to=date_to,
+        force=bool(data.get('force', False)),
     )
 
     return jsonify({
@@ -188,7 +190,10 @@ def sync_academy_league(league_id):
 @academy_bp.route('/admin/academy-leagues/sync-all', methods=['POST'])
 @require_api_key
 def sync_all_academy_leagues():
-    """Trigger a sync for all active academy leagues."""
+    """Trigger a sync for all active academy leagues.
+
+    Optional body: date_from, date_to, force (same as the single-league sync).
+    """
     data = request.get_json() or {}
 
     date_from = None
@@ -209,6 +214,7 @@ def sync_all_academy_leagues():
     results = academy_sync_service.sync_all_active_leagues(
         date_from=date_from,
         date_to=date_to,
+        force=bool(data.get('force', False)),
     )
 
     total_fixtures = sum(r.get('fixtures_processed', 0) for r in results)
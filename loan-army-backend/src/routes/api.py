@@ -1,16 +1,8 @@
-from flask import Blueprint, request, jsonify, make_response, render_template, Response, current_app, g
+from flask import Blueprint, request, jsonify, make_response, render_template, Response, current_app, g, stream_with_context
 from src.models.league import db, League, Team, LoanedPlayer, Newsletter, UserSubscription, EmailToken, LoanFlag, AdminSetting, NewsletterComment, UserAccount, SupplementalLoan, NewsletterPlayerYoutubeLink, NewsletterCommentary, Player, JournalistTeamAssignment, CommentaryApplause, TeamTrackingRequest, StripeSubscription, NewsletterDigestQueue, JournalistSubscription, BackgroundJob, TeamSubreddit, RedditPost, TeamAlias, ManualPlayerSubmission, CommunityTake, AcademyAppearance, PlayerComment, PlayerLink, _as_utc, _dedupe_loans
 from src.models.tracked_player import TrackedPlayer
 from src.models.sponsor import Sponsor
-from src.api_football_client import APIFootballClient
-from src.admin.sandbox_tasks import (
-    SandboxContext,
-    TaskExecutionError,
-    TaskNotFoundError,
-    TaskValidationError,
-    list_tasks as sandbox_list_tasks,
-    run_task as sandbox_run_task,
-)
+from src.api_football_client import LazyAPIFootballClient, get_api_client
 from datetime import datetime, date, timedelta, timezone
 import uuid
 import json
@@ -24,7 +16,7 @@ import shutil
 from io import BytesIO
 from functools import wraps
 from uuid import uuid4
-from sqlalchemy import or_, func
+from sqlalchemy import or_, func, select
 import time
 from datetime import timedelta
 from typing import Any
@@ -41,7 +33,11 @@ from src.utils.slug import resolve_team_by_identifier, generate_unique_team_slug
 from src.utils.academy_classifier import classify_tracked_player, flatten_transfers, is_same_club, _get_latest_season
 from src.utils.newsletter_slug import compose_newsletter_public_slug
 from src.services.email_service import email_service
-import threading
+from src.services import player_sections
+from src.services.player_page import get_player_page, player_page_response
+from src.services.stats_snapshot import get_snapshot, snapshot_payload
+from src.services.fixture_stats import FIXTURE_STATS_BATCH_SIZE, upsert_fixture_player_stats
+from src.utils.pagination import COUNT_MODES, CursorError, after_cursor, count_rows, order_by as keyset_order_by, page_of
 
 # Import auth utilities from the extracted auth module
 from src.auth import (
@@ -60,10 +56,12 @@ from src.auth import (
     _safe_error_payload,
     _is_production,
 )
+from src.utils.job_queue import enqueue_job
 from src.utils.background_jobs import (
     create_background_job as _create_background_job,
     update_job as _update_job,
     get_job as _get_job,
+    stream_job_events,
     STALE_JOB_TIMEOUT,
 )
 
@@ -74,28 +72,8 @@ api_bp = Blueprint('api', __name__)
 # Background job functions (_create_background_job, _update_job, _get_job) are imported from src.utils.background_jobs
 
 
-class LazyAPIFootballClient:
-    """Instantiate APIFootballClient only when first touched to avoid early network calls."""
-
-    def __init__(self, factory):
-        self._factory = factory
-        self._instance = None
-
-    def _resolve(self):
-        if self._instance is None:
-            self._instance = self._factory()
-        return self._instance
-
-    def __getattr__(self, item: str):
-        return getattr(self._resolve(), item)
-
-    def __repr__(self) -> str:
-        state = "initialized" if self._instance is not None else "uninitialized"
-        return f"<LazyAPIFootballClient {state}>"
-
-
 # Initialize API-Football client lazily to keep migrations/test tools offline-friendly
-api_client = LazyAPIFootballClient(APIFootballClient)
+api_client = LazyAPIFootballClient(get_api_client)
 
 SUBSCRIPTIONS_REQUIRE_VERIFY = os.getenv('SUBSCRIPTIONS_REQUIRE_VERIFY', '1').lower() in ('1', 'true', 'yes', 'on')
 try:
@@ -131,6 +109,8 @@ def admin_auth_check():
 @require_api_key
 def admin_sandbox_home():
     """Render the admin sandbox interface with available diagnostic tasks."""
+    from src.admin.sandbox_tasks import list_tasks as sandbox_list_tasks
+
     teams = Team.query.order_by(Team.name.asc()).all()
     logger.info("[admin-sandbox] fetched %d teams (pre-dedupe) for dropdown", len(teams))
     # Deduplicate by lowercase name, keep the latest id
@@ -187,6 +167,13 @@ def admin_sandbox_home():
 @require_api_key
 def admin_sandbox_run(task_id: str):
     """Execute a sandbox diagnostic task and return the structured result."""
+    from src.admin.sandbox_tasks import (
+        SandboxContext,
+        TaskExecutionError,
+        TaskNotFoundError,
+        TaskValidationError,
+        run_task as sandbox_run_task,
+    )
 
     payload = request.get_json(silent=True) or {}
     context = SandboxContext(db_session=db.session, api_client=api_client)
@@ -446,45 +433,7 @@ def health_check():
 @api_bp.route('/sync-status', methods=['GET'])
 def public_sync_status():
     """Public endpoint: returns whether a major background sync is running."""
-    STALE_THRESHOLD = STALE_JOB_TIMEOUT
-    MAJOR_JOB_TYPES = ('full_rebuild', 'seed_big6')
-    now = datetime.now(timezone.utc)
-
-    running = BackgroundJob.query.filter(
-        BackgroundJob.status == 'running',
-        BackgroundJob.job_type.in_(MAJOR_JOB_TYPES),
-    ).all()
-
-    syncing = False
-    for job in running:
-        last_active = job.updated_at or job.started_at or job.created_at
-        if last_active:
-            elapsed = now - last_active.replace(tzinfo=timezone.utc)
-            if elapsed > STALE_THRESHOLD:
-                job.status = 'failed'
-                job.error = f'Stale job auto-failed (no update in {elapsed}).'
-                job.completed_at = now
-                db.session.commit()
-                continue
-        syncing = True
-
-    payload = {'syncing': syncing}
-    if syncing:
-        payload['message'] = "We're currently updating player data. Some information may be temporarily unavailable."
-        # Find the most recently updated active job for progress info
-        active = [j for j in running if j.status == 'running']
-        if active:
-            job = max(active, key=lambda j: j.updated_at or j.created_at)
-            payload['stage'] = job.current_player
-            payload['progress'] = job.progress
-            payload['total'] = job.total
-        # Include tracked team logos for the public banner animation
-        tracked = Team.query.filter_by(is_tracked=True).all()
-        payload['teams'] = [
-            {'name': t.name, 'logo': t.logo, 'team_id': t.team_id}
-            for t in tracked if t.logo
-        ]
-    return jsonify(payload)
+    return jsonify(snapshot_payload(get_snapshot('sync_status')))
 
 
 @api_bp.route('/options', methods=['OPTIONS'])
@@ -1436,8 +1385,8 @@ def refresh_newsletter_fixtures(newsletter_id: int):
             return jsonify({'updated': False, 'message': 'No sections found'})
         
         # Initialize API client for fixture lookups
-        from src.api_football_client import APIFootballClient
-        api_client = APIFootballClient()
+        from src.api_football_client import get_api_client
+        api_client = get_api_client()
         
         now = datetime.now(timezone.utc)
         fixtures_updated = 0
@@ -1597,171 +1546,22 @@ def refresh_newsletter_fixtures(newsletter_id: int):
 def get_public_player_stats(player_id: int):
     """
     Get historical stats for a player (public endpoint).
-    Fetches directly from API-Football if local data is incomplete.
+    Served from local data only. When cached API-Football totals show
+    missing games, a background refresh is queued and the response carries
+    X-Data-Stale / X-Data-Refreshing headers.
     Only returns CLUB games (not international).
     
     Query params:
-    - force_sync: If 'true', force sync from API-Football even if local count matches
+    - force_sync: If 'true', queue a refresh even if local count matches
     """
     try:
-        from src.models.weekly import FixturePlayerStats, Fixture
-        from src.models.league import LoanedPlayer
-        from src.api_football_client import APIFootballClient
-        
-        # Check for force sync flag
-        force_sync = request.args.get('force_sync', '').lower() == 'true'
-        
-        # Get current season
-        now_utc = datetime.now(timezone.utc)
-        current_year = now_utc.year
-        current_month = now_utc.month
-        season = current_year if current_month >= 8 else current_year - 1
-        season_prefix = f"{season}-{str(season + 1)[-2:]}"  # e.g., "2025-26"
-        
-        # Find ALL loan teams for this player this season (handles mid-season transfers)
-        all_loans = LoanedPlayer.query.filter(
-            LoanedPlayer.player_id == player_id,
-            LoanedPlayer.window_key.like(f"{season_prefix}%")
-        ).order_by(LoanedPlayer.updated_at.desc()).all()
-        
-        # If no season-specific loans, try getting any loan
-        if not all_loans:
-            all_loans = [LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()]
-            all_loans = [l for l in all_loans if l]  # Remove None
-
-        # TrackedPlayer fallback — resolve loan team for academy-tracked players
-        tracked_player_for_stats = None
-        if not all_loans:
-            tracked_player_for_stats = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
-            if tracked_player_for_stats:
-                # If TrackedPlayer links to a LoanedPlayer, use that
-                if tracked_player_for_stats.loaned_player_id:
-                    linked_loan = LoanedPlayer.query.get(tracked_player_for_stats.loaned_player_id)
-                    if linked_loan:
-                        all_loans = [linked_loan]
-
-        # Build a map of team_api_id -> team info for all loan teams
-        loan_teams_info = {}  # {api_team_id: {name, logo, window_type}}
-        for loan in all_loans:
-            if loan and loan.loan_team_id:
-                loan_team = Team.query.get(loan.loan_team_id)
-                if loan_team:
-                    window_type = 'Summer'
-                    if loan.window_key and '::' in loan.window_key:
-                        window_part = loan.window_key.split('::')[1]
-                        if window_part.upper() == 'JANUARY':
-                            window_type = 'January'
-                    loan_teams_info[loan_team.team_id] = {
-                        'name': loan_team.name,
-                        'logo': loan_team.logo,
-                        'window_type': window_type,
-                        'is_active': loan.is_active,
-                    }
-        
-        # TrackedPlayer fallback: inject loan club if no LoanedPlayer provided teams
-        if not loan_teams_info and tracked_player_for_stats and tracked_player_for_stats.loan_club_api_id:
-            loan_team_record = Team.query.filter_by(team_id=tracked_player_for_stats.loan_club_api_id).first()
-            if loan_team_record:
-                loan_teams_info[loan_team_record.team_id] = {
-                    'name': loan_team_record.name,
-                    'logo': loan_team_record.logo,
-                    'window_type': 'Summer',
-                    'is_active': True,
-                }
-
-        loan_team_api_ids = list(loan_teams_info.keys())
-
-        # Query local stats for ALL loan teams
-        stats_query = db.session.query(
-            FixturePlayerStats, Fixture
-        ).join(
-            Fixture, FixturePlayerStats.fixture_id == Fixture.id
-        ).filter(
-            FixturePlayerStats.player_api_id == player_id
-        )
-
-        # Filter to only loan team games
-        if loan_team_api_ids:
-            stats_query = stats_query.filter(
-                FixturePlayerStats.team_api_id.in_(loan_team_api_ids)
-            )
-        
-        stats_query = stats_query.order_by(Fixture.date_utc.asc()).all()
-        
-        # Sync missing games from each loan team
-        # Get player name from loan records for ID verification during sync
-        player_name_for_sync = all_loans[0].player_name if all_loans else None
-        if not player_name_for_sync and tracked_player_for_stats:
-            player_name_for_sync = tracked_player_for_stats.player_name
-        
-        for loan_team_api_id in loan_team_api_ids:
-            try:
-                local_count = sum(1 for s, f in stats_query if s.team_api_id == loan_team_api_id)
-                api_client = APIFootballClient()
-                api_totals = api_client._fetch_player_team_season_totals_api(
-                    player_id=player_id,
-                    team_id=loan_team_api_id,
-                    season=season,
-                )
-                api_appearances = api_totals.get('games_played', 0)
-                
-                # Sync if API has more games OR force_sync is requested
-                if api_appearances > local_count or force_sync:
-                    logger.info(f"Player {player_id} at team {loan_team_api_id}: API={api_appearances}, local={local_count}, force={force_sync}. Syncing...")
-                    _sync_player_club_fixtures(player_id, loan_team_api_id, season, player_name=player_name_for_sync)
-            except Exception as e:
-                logger.warning(f"Failed to sync for player {player_id} at team {loan_team_api_id}: {e}")
-        
-        # Re-query after potential sync
-        stats_query = db.session.query(
-            FixturePlayerStats, Fixture
-        ).join(
-            Fixture, FixturePlayerStats.fixture_id == Fixture.id
-        ).filter(
-            FixturePlayerStats.player_api_id == player_id
+        result, freshness = player_sections.player_stats(
+            player_id, force_sync=request.args.get('force_sync', '').lower() == 'true',
         )
-        if loan_team_api_ids:
-            stats_query = stats_query.filter(
-                FixturePlayerStats.team_api_id.in_(loan_team_api_ids)
-            )
-        stats_query = stats_query.order_by(Fixture.date_utc.asc()).all()
-
-        result = []
-        for stats, fixture in stats_query:
-            # Get opponent name using robust resolution with fallbacks
-            is_home = (stats.team_api_id == fixture.home_team_api_id)
-            opponent_api_id = fixture.away_team_api_id if is_home else fixture.home_team_api_id
-            opponent_name, _ = resolve_team_name_and_logo(opponent_api_id, season)
-            
-            # Get loan team info for this stat
-            team_info = loan_teams_info.get(stats.team_api_id, {})
-            
-            # Fallback: use robust team name resolution if not in loan_teams_info
-            if not team_info or not team_info.get('name'):
-                loan_team_name, loan_team_logo = resolve_team_name_and_logo(stats.team_api_id, season)
-                team_info = {
-                    'name': loan_team_name,
-                    'logo': loan_team_logo,
-                    'window_type': 'Summer',
-                }
-            
-            stats_dict = stats.to_dict()
-            stats_dict['fixture_date'] = fixture.date_utc.isoformat() if fixture.date_utc else None
-            stats_dict['opponent'] = opponent_name
-            stats_dict['is_home'] = is_home
-            stats_dict['competition'] = fixture.competition_name
-            stats_dict['loan_team_name'] = team_info.get('name') or "Unknown"
-            stats_dict['loan_team_logo'] = team_info.get('logo')
-            stats_dict['loan_window'] = team_info.get('window_type', 'Summer')
-            
-            # Include match score for context
-            stats_dict['home_goals'] = fixture.home_goals
-            stats_dict['away_goals'] = fixture.away_goals
-            stats_dict['opponent_api_id'] = opponent_api_id
-            
-            result.append(stats_dict)
-
-        return jsonify(result)
+        response = jsonify(result)
+        response.headers['X-Data-Stale'] = '1' if freshness['stale'] else '0'
+        response.headers['X-Data-Refreshing'] = '1' if freshness['refreshing'] else '0'
+        return response
 
     except Exception as e:
         logger.error(f"Error fetching player stats for player_id={player_id}: {e}")
@@ -1779,11 +1579,11 @@ def _sync_player_club_fixtures(player_id: int, loan_team_api_id: int, season: in
     a matching player name is found with a different ID, updates the LoanedPlayer
     record and syncs with the correct ID.
     """
-    from src.api_football_client import APIFootballClient
+    from src.api_football_client import get_api_client
     from src.models.weekly import Fixture, FixturePlayerStats
     from src.models.league import LoanedPlayer, Team
     
-    api_client = APIFootballClient()
+    api_client = get_api_client()
     
     # Fetch all fixtures for the loan team this season
     season_start = f"{season}-08-01"
@@ -1951,6 +1751,125 @@ def _sync_player_club_fixtures(player_id: int, loan_team_api_id: int, season: in
     
     return synced
 
+
+# Public player pages read local data only. Stale data queues at most one
+# 'player_refresh' job per player per interval (forced syncs: per
+# PLAYER_FORCE_REFRESH_SECONDS), which verifies the player ID and syncs
+# missing fixtures on a job worker.
+PLAYER_REFRESH_INTERVAL_SECONDS = int(os.getenv('PLAYER_REFRESH_INTERVAL_SECONDS', str(6 * 3600)))
+PLAYER_FORCE_REFRESH_SECONDS = int(os.getenv('PLAYER_FORCE_REFRESH_SECONDS', '300'))
+
+
+def _request_player_refresh(player_id: int, season: int, team_api_ids, player_name: str | None = None,
+                            *, stale: bool | None = None, force: bool = False) -> dict:
+    """Queue a deduplicated background refresh for a player and return freshness hints.
+
+    *stale* is the caller's verdict on its local data; None means "stale
+    unless a refresh completed within the interval".
+    """
+    from src.utils.background_jobs import ACTIVE_STATUSES
+    from src.utils.job_queue import enqueue_job
+
+    hints = {'stale': False, 'refreshing': False, 'refreshed_at': None}
+    team_api_ids = [t for t in (team_api_ids or []) if t]
+    if not team_api_ids:
+        return hints
+
+    dedupe_key = f'player_refresh:{player_id}'
+    latest_done = BackgroundJob.query.filter_by(
+        dedupe_key=dedupe_key, status='completed'
+    ).order_by(BackgroundJob.completed_at.desc()).first()
+    refreshed_at = _as_utc(latest_done.completed_at) if latest_done and latest_done.completed_at else None
+    hints['refreshed_at'] = refreshed_at.isoformat() if refreshed_at else None
+    if stale is None:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=PLAYER_REFRESH_INTERVAL_SECONDS)
+        stale = refreshed_at is None or refreshed_at < cutoff
+    hints['stale'] = bool(stale)
+    if not (stale or force):
+        return hints
+
+    try:
+        job_id = enqueue_job(
+            'player_refresh',
+            {
+                'player_id': player_id,
+                'season': season,
+                'team_ids': team_api_ids,
+                'player_name': player_name,
+                'force': bool(force),
+            },
+            dedupe_key=dedupe_key,
+            dedupe_seconds=PLAYER_FORCE_REFRESH_SECONDS if force else PLAYER_REFRESH_INTERVAL_SECONDS,
+        )
+        job = db.session.get(BackgroundJob, job_id)
+        hints['refreshing'] = bool(job and job.status in ACTIVE_STATUSES)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Could not queue refresh for player {player_id}: {e}")
+    return hints
+
+
+def _correct_player_api_id(old_id: int, new_id: int, team_api_ids) -> None:
+    """Move loan records at *team_api_ids* to the verified API-Football ID and drop ghost stats."""
+    from src.models.weekly import FixturePlayerStats
+
+    team_db_ids = [t.id for t in Team.query.filter(Team.team_id.in_(team_api_ids)).all()]
+    now = datetime.now(timezone.utc)
+    if team_db_ids:
+        loans = LoanedPlayer.query.filter(
+            LoanedPlayer.player_id == old_id,
+            LoanedPlayer.loan_team_id.in_(team_db_ids),
+        ).all()
+        for loan in loans:
+            loan.player_id = new_id
+            loan.reviewer_notes = (loan.reviewer_notes or '') + f' | ID auto-corrected by refresh: {old_id} → {new_id}'
+            loan.updated_at = now
+    FixturePlayerStats.query.filter(
+        FixturePlayerStats.player_api_id == old_id,
+        FixturePlayerStats.team_api_id.in_(team_api_ids),
+        FixturePlayerStats.minutes == 0,
+    ).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _run_player_refresh_job(job_id: str, player_id: int, season: int, team_ids,
+                            player_name: str | None = None, force: bool = False) -> dict:
+    """Job handler body: verify the player ID, then sync fixtures missing locally."""
+    from src.models.weekly import FixturePlayerStats
+
+    api_client = get_api_client()
+    _update_job(job_id, total=len(team_ids), progress=0)
+
+    corrected_from = None
+    if player_name and team_ids:
+        verified_id, method = api_client.verify_player_id_via_fixtures(
+            candidate_player_id=player_id,
+            player_name=player_name,
+            loan_team_id=team_ids[0],
+            season=season,
+            max_fixtures=3,
+        )
+        if verified_id and verified_id != player_id:
+            logger.warning(
+                f"🔄 Player refresh ID correction for '{player_name}': {player_id} → {verified_id} ({method})"
+            )
+            _correct_player_api_id(player_id, verified_id, team_ids)
+            corrected_from, player_id = player_id, verified_id
+
+    synced = 0
+    for index, team_id in enumerate(team_ids, start=1):
+        local_count = FixturePlayerStats.query.filter_by(player_api_id=player_id, team_api_id=team_id).count()
+        api_totals = api_client._fetch_player_team_season_totals_api(
+            player_id=player_id, team_id=team_id, season=season,
+        ) or {}
+        if force or api_totals.get('games_played', 0) > local_count:
+            synced += _sync_player_club_fixtures(player_id, team_id, season)
+        _update_job(job_id, progress=index)
+
+    # Pages for both ids are invalidated once the job's final status is
+    # written (see src/services/player_page.py)
+    return {'player_id': player_id, 'corrected_from': corrected_from, 'synced': synced}
+
 @api_bp.route('/players/search', methods=['GET'])
 def public_player_search():
     """Public search for tracked players by name."""
@@ -1989,247 +1908,11 @@ def public_player_search():
 def get_public_player_profile(player_id: int):
     """
     Get player profile info including name, team, position, photo.
-    Used for the public player profile pages.
+    Used for the public player profile pages. Served from local data;
+    ``stale``/``refreshing`` report the player's background refresh.
     """
     try:
-        from src.models.league import LoanedPlayer, SupplementalLoan, Player
-        
-        result = {
-            'player_id': player_id,
-            'name': None,
-            'photo': None,
-            'position': None,
-            'loan_team_name': None,
-            'loan_team_id': None,
-            'loan_team_logo': None,
-            'parent_team_name': None,
-            'parent_team_id': None,
-            'parent_team_logo': None,
-            'nationality': None,
-            'age': None,
-        }
-        
-        # Get player base info from Player table (has photo)
-        player = Player.query.filter_by(player_id=player_id).first()
-        if player:
-            result['name'] = player.name
-            result['photo'] = player.photo_url
-            result['position'] = player.position
-            result['nationality'] = player.nationality
-            result['age'] = player.age
-        
-        # Get loan info from LoanedPlayer (most recent active loan)
-        loaned = LoanedPlayer.query.filter_by(player_id=player_id, is_active=True).order_by(LoanedPlayer.updated_at.desc()).first()
-        if not loaned:
-            # Try any loan record for this player
-            loaned = LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()
-        
-        if loaned:
-            # 🔄 VERIFY player ID for Player Profile page
-            # This ensures we show correct data and fix the database if ID was wrong
-            if loaned.loan_team_id and loaned.can_fetch_stats:
-                try:
-                    from src.api_football_client import APIFootballClient
-                    from src.models.weekly import FixturePlayerStats
-                    
-                    loan_team = Team.query.get(loaned.loan_team_id)
-                    if loan_team and loan_team.team_id:
-                        # Get current season
-                        now_utc = datetime.now(timezone.utc)
-                        season = now_utc.year if now_utc.month >= 8 else now_utc.year - 1
-                        
-                        api_client = APIFootballClient()
-                        verified_id, method = api_client.verify_player_id_via_fixtures(
-                            candidate_player_id=player_id,
-                            player_name=loaned.player_name,
-                            loan_team_id=loan_team.team_id,
-                            season=season,
-                            max_fixtures=3
-                        )
-                        if verified_id != player_id:
-                            logger.warning(
-                                f"🔄 Player Profile ID correction for '{loaned.player_name}': "
-                                f"{player_id} → {verified_id}"
-                            )
-                            # Update the database record
-                            loaned.player_id = verified_id
-                            loaned.reviewer_notes = (loaned.reviewer_notes or '') + f' | ID auto-corrected in profile: {player_id} → {verified_id}'
-                            loaned.updated_at = datetime.now(timezone.utc)
-                            db.session.commit()
-                            # Delete ghost stats
-                            ghost_deleted = FixturePlayerStats.query.filter(
-                                FixturePlayerStats.player_api_id == player_id,
-                                FixturePlayerStats.team_api_id == loan_team.team_id,
-                                FixturePlayerStats.minutes == 0
-                            ).delete()
-                            if ghost_deleted:
-                                db.session.commit()
-                            # Update result to use corrected ID
-                            result['player_id'] = verified_id
-                            # Also update Player table if exists
-                            if player:
-                                player.player_id = verified_id
-                                db.session.commit()
-                except Exception as verify_err:
-                    logger.debug(f"ID verification failed for profile: {verify_err}")
-            
-            if not result['name']:
-                result['name'] = loaned.player_name
-            result['loan_team_name'] = loaned.loan_team_name
-            result['parent_team_name'] = loaned.primary_team_name
-            
-            # Get team logos from Team table
-            if loaned.loan_team_id:
-                loan_team = Team.query.get(loaned.loan_team_id)
-                if loan_team:
-                    result['loan_team_logo'] = loan_team.logo
-                    result['loan_team_id'] = loan_team.team_id
-                    result['loan_team_db_id'] = loaned.loan_team_id  # DB ID for API calls
-            
-            if loaned.primary_team_id:
-                parent_team = Team.query.get(loaned.primary_team_id)
-                if parent_team:
-                    result['parent_team_logo'] = parent_team.logo
-                    result['parent_team_id'] = parent_team.team_id
-                    result['primary_team_db_id'] = loaned.primary_team_id  # DB ID for API calls
-        
-        # TrackedPlayer fallback — fills in gaps for academy/first_team/released players
-        tracked = None
-        if not result['name'] or not result['photo'] or not loaned:
-            tracked = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
-            if tracked:
-                if not result['name']:
-                    result['name'] = tracked.player_name
-                if not result['photo']:
-                    result['photo'] = tracked.photo_url
-                if not result['age']:
-                    result['age'] = tracked.age
-                if not result['nationality']:
-                    result['nationality'] = tracked.nationality
-                if not result['position']:
-                    result['position'] = tracked.position
-                # Parent team from tracked player's team relationship
-                if not result['parent_team_name'] and tracked.team:
-                    result['parent_team_name'] = tracked.team.name
-                    result['parent_team_logo'] = tracked.team.logo
-                    result['parent_team_id'] = tracked.team.team_id
-                    result['primary_team_db_id'] = tracked.team_id
-                # Loan team from tracked player (if on_loan)
-                if not result['loan_team_name'] and tracked.loan_club_api_id:
-                    result['loan_team_name'] = tracked.loan_club_name
-                    loan_team_record = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
-                    if loan_team_record:
-                        result['loan_team_logo'] = loan_team_record.logo
-                        result['loan_team_id'] = loan_team_record.team_id
-                        result['loan_team_db_id'] = loan_team_record.id
-                # Additive fields
-                result['pathway_status'] = tracked.status
-                result['current_level'] = tracked.current_level
-
-        # PlayerJourney fallback — last resort for name/photo/nationality
-        if not result['name'] or not result['photo']:
-            from src.models.journey import PlayerJourney
-            journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
-            if journey:
-                if not result['name']:
-                    result['name'] = journey.player_name
-                if not result['photo']:
-                    result['photo'] = journey.player_photo
-                if not result['nationality']:
-                    result['nationality'] = journey.nationality
-
-        # If still no name, try supplemental loans
-        if not result['name']:
-            supplemental = SupplementalLoan.query.filter_by(api_player_id=player_id).first()
-            if supplemental:
-                result['name'] = supplemental.player_name
-                result['loan_team_name'] = supplemental.loan_team_name
-                result['parent_team_name'] = supplemental.parent_team_name
-                if supplemental.loan_team:
-                    result['loan_team_logo'] = supplemental.loan_team.logo
-                if supplemental.parent_team:
-                    result['parent_team_logo'] = supplemental.parent_team.logo
-        
-        # If still no name, try to get from fixture stats position
-        if not result['name']:
-            from src.models.weekly import FixturePlayerStats
-            stats = FixturePlayerStats.query.filter_by(player_api_id=player_id).first()
-            if stats:
-                result['position'] = stats.position
-        
-        # Final fallback for name
-        if not result['name']:
-            result['name'] = f"Player #{player_id}"
-        
-        # Get ALL loans for this season (for mid-season transfers)
-        now_utc = datetime.now(timezone.utc)
-        current_year = now_utc.year
-        current_month = now_utc.month
-        season_year = current_year if current_month >= 8 else current_year - 1
-        season_prefix = f"{season_year}-{str(season_year + 1)[-2:]}"  # e.g., "2025-26"
-        
-        all_season_loans = LoanedPlayer.query.filter(
-            LoanedPlayer.player_id == player_id,
-            LoanedPlayer.window_key.like(f"{season_prefix}%")
-        ).order_by(LoanedPlayer.created_at.asc()).all()
-
-        # Deduplicate by (loan_team_id, window_key) - keep only the first (earliest) entry
-        seen_loan_keys = set()
-        loan_history = []
-        for loan in all_season_loans:
-            # Create unique key for deduplication
-            dedup_key = (loan.loan_team_id, loan.window_key)
-            if dedup_key in seen_loan_keys:
-                continue
-            seen_loan_keys.add(dedup_key)
-            
-            loan_team = Team.query.get(loan.loan_team_id) if loan.loan_team_id else None
-            parent_team = Team.query.get(loan.primary_team_id) if loan.primary_team_id else None
-            
-            # Determine window type from window_key (e.g., "2025-26::FULL" or "2025-26::JANUARY")
-            window_type = 'Summer'
-            if loan.window_key and '::' in loan.window_key:
-                window_part = loan.window_key.split('::')[1]
-                if window_part.upper() == 'JANUARY':
-                    window_type = 'January'
-                elif window_part.upper() == 'FULL':
-                    window_type = 'Summer'
-                else:
-                    window_type = window_part.title()
-            
-            loan_history.append({
-                'loan_team_name': loan.loan_team_name,
-                'loan_team_id': loan_team.team_id if loan_team else None,
-                'loan_team_db_id': loan.loan_team_id,  # DB ID for API calls
-                'loan_team_logo': loan_team.logo if loan_team else None,
-                'parent_team_name': loan.primary_team_name,
-                'parent_team_id': parent_team.team_id if parent_team else None,
-                'parent_team_logo': parent_team.logo if parent_team else None,
-                'window_type': window_type,
-                'window_key': loan.window_key,
-                'is_active': loan.is_active,
-            })
-        
-        # If loan_history is empty and TrackedPlayer is on_loan, synthesize an entry
-        if not loan_history and tracked and tracked.status == 'on_loan' and tracked.loan_club_api_id:
-            loan_team_record = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
-            loan_history.append({
-                'loan_team_name': tracked.loan_club_name or (loan_team_record.name if loan_team_record else None),
-                'loan_team_id': tracked.loan_club_api_id,
-                'loan_team_db_id': loan_team_record.id if loan_team_record else None,
-                'loan_team_logo': loan_team_record.logo if loan_team_record else None,
-                'parent_team_name': tracked.team.name if tracked.team else None,
-                'parent_team_id': tracked.team.team_id if tracked.team else None,
-                'parent_team_logo': tracked.team.logo if tracked.team else None,
-                'window_type': 'Summer',
-                'window_key': None,
-                'is_active': True,
-            })
-
-        result['loan_history'] = loan_history
-        result['has_multiple_loans'] = len(loan_history) > 1
-
-        return jsonify(result)
+        return jsonify(player_sections.player_profile(player_id))
 
     except Exception as e:
         logger.error(f"Error fetching player profile for player_id={player_id}: {e}")
@@ -2237,320 +1920,32 @@ def get_public_player_profile(player_id: int):
         traceback.print_exc()
         return jsonify(_safe_error_payload(e, 'Failed to fetch player profile')), 500
 
+@api_bp.route('/players/<int:player_id>/page', methods=['GET'])
+def get_public_player_page(player_id: int):
+    """
+    Get everything the public player page shows in one document: profile,
+    stats, season_stats, journey_map, commentaries and links, plus the
+    ``stale``/``refreshing`` hints. The document is precomputed and rebuilt
+    only after its source rows change, and is served with ETag and
+    Last-Modified so unchanged pages revalidate with a 304.
+    """
+    try:
+        return player_page_response(get_player_page(player_id))
+    except Exception as e:
+        logger.exception(f'Failed to build player page for player_id={player_id}')
+        return jsonify(_safe_error_payload(e, 'Failed to fetch player page')), 500
+
+
 @api_bp.route('/players/<int:player_id>/season-stats', methods=['GET'])
 def get_public_player_season_stats(player_id: int):
     """
     Get aggregated season stats for a player at their LOAN CLUB only.
     Does NOT include international games or games at other clubs.
+    Uses local fixtures plus cached API-Football totals; missing data queues
+    a background refresh (``stale``/``refreshing`` in the response).
     """
     try:
-        from src.models.weekly import FixturePlayerStats, Fixture
-        from src.models.league import LoanedPlayer
-        from src.api_football_client import APIFootballClient
-        from sqlalchemy import func
-        
-        # Get current season
-        now_utc = datetime.now(timezone.utc)
-        current_year = now_utc.year
-        current_month = now_utc.month
-        season_start_year = current_year if current_month >= 8 else current_year - 1
-        season_start = datetime(season_start_year, 8, 1, tzinfo=timezone.utc)
-        
-        season_prefix = f"{season_start_year}-{str(season_start_year + 1)[-2:]}"  # e.g., "2025-26"
-        
-        result = {
-            'player_id': player_id,
-            'season': f"{season_start_year}/{season_start_year + 1}",
-            'appearances': 0,
-            'minutes': 0,
-            'goals': 0,
-            'assists': 0,
-            'yellows': 0,
-            'reds': 0,
-            'avg_rating': None,
-            'saves': 0,
-            'goals_conceded': 0,
-            'clean_sheets': 0,
-            'source': 'none',
-            'loan_clubs_only': True,  # Stats are only from loan clubs (not international)
-            'clubs': [],  # Per-club breakdown
-        }
-        
-        # Find ALL loan teams for this player this season
-        all_loans = LoanedPlayer.query.filter(
-            LoanedPlayer.player_id == player_id,
-            LoanedPlayer.window_key.like(f"{season_prefix}%")
-        ).order_by(LoanedPlayer.updated_at.desc()).all()
-        
-        if not all_loans:
-            # Fallback to any loan
-            loaned = LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()
-            all_loans = [loaned] if loaned else []
-        
-        # TrackedPlayer fallback for season-stats
-        tracked_for_season = None
-        if not all_loans:
-            tracked_for_season = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
-            if tracked_for_season:
-                # If TrackedPlayer links to a LoanedPlayer, use that
-                if tracked_for_season.loaned_player_id:
-                    linked_loan = LoanedPlayer.query.get(tracked_for_season.loaned_player_id)
-                    if linked_loan:
-                        all_loans = [linked_loan]
-                # If on loan with a club but no LoanedPlayer, inject the loan club
-                elif tracked_for_season.loan_club_api_id:
-                    loan_team_record = Team.query.filter_by(team_id=tracked_for_season.loan_club_api_id).first()
-                    if loan_team_record:
-                        # Create a minimal object-like dict for downstream processing
-                        # We'll handle this in the loan_teams_info block below
-                        pass
-
-        if not all_loans:
-            # For non-loan tracked players (academy/first_team), return journey aggregates
-            if tracked_for_season and tracked_for_season.status in ('academy', 'first_team', 'released'):
-                from src.models.journey import PlayerJourney
-                journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
-                if journey and (journey.total_first_team_apps or journey.total_goals or journey.total_assists):
-                    result['appearances'] = journey.total_first_team_apps or 0
-                    result['goals'] = journey.total_goals or 0
-                    result['assists'] = journey.total_assists or 0
-                    result['source'] = 'journey-aggregate'
-                    result['stats_coverage'] = 'limited'
-                    result['limited_stats_note'] = 'Career aggregate stats from journey data. Match-by-match stats not available.'
-                return jsonify(result)
-            # For on_loan tracked players with a loan club but no LoanedPlayer row,
-            # proceed with loan_teams_info injection below
-            if not (tracked_for_season and tracked_for_season.loan_club_api_id):
-                return jsonify(result)
-
-        # 📊 CHECK FOR LIMITED COVERAGE (e.g., National League)
-        # If the player has limited stats coverage, use denormalized stats from LoanedPlayer
-        primary_loan = all_loans[0] if all_loans else None
-        if getattr(primary_loan, 'stats_coverage', 'full') == 'limited':
-            logger.info(f"Using limited coverage stats for player {player_id} ({primary_loan.player_name})")
-            result['appearances'] = primary_loan.appearances or 0
-            result['minutes'] = 0  # Not available for limited coverage
-            result['goals'] = primary_loan.goals or 0
-            result['assists'] = primary_loan.assists or 0
-            result['yellows'] = primary_loan.yellows or 0
-            result['reds'] = primary_loan.reds or 0
-            result['source'] = 'limited-coverage'
-            result['stats_coverage'] = 'limited'
-            result['limited_stats_note'] = 'Full match stats not available for this league. Showing appearances, goals, and assists from lineup/event data.'
-            
-            # Get loan team info
-            if primary_loan.loan_team_id:
-                loan_team = Team.query.get(primary_loan.loan_team_id)
-                if loan_team:
-                    result['loan_team'] = loan_team.name
-                    result['clubs'] = [{
-                        'team_name': loan_team.name,
-                        'team_logo': loan_team.logo,
-                        'appearances': primary_loan.appearances or 0,
-                        'goals': primary_loan.goals or 0,
-                        'assists': primary_loan.assists or 0,
-                        'is_current': primary_loan.is_active,
-                    }]
-            
-            return jsonify(result)
-        
-        # Build list of loan teams with their API IDs
-        loan_teams_info = []
-        loan_team_api_ids = []
-        for loan in all_loans:
-            if loan and loan.loan_team_id:
-                loan_team = Team.query.get(loan.loan_team_id)
-                if loan_team and loan_team.team_id not in loan_team_api_ids:
-                    window_type = 'Summer'
-                    if loan.window_key and '::' in loan.window_key:
-                        window_part = loan.window_key.split('::')[1]
-                        if window_part.upper() == 'JANUARY':
-                            window_type = 'January'
-                    loan_teams_info.append({
-                        'api_id': loan_team.team_id,
-                        'name': loan_team.name,
-                        'logo': loan_team.logo,
-                        'window_type': window_type,
-                        'is_active': loan.is_active,
-                    })
-                    loan_team_api_ids.append(loan_team.team_id)
-        
-        # TrackedPlayer fallback: inject loan club if no LoanedPlayer provided teams
-        if not loan_teams_info and tracked_for_season and tracked_for_season.loan_club_api_id:
-            loan_team_record = Team.query.filter_by(team_id=tracked_for_season.loan_club_api_id).first()
-            if loan_team_record:
-                loan_teams_info.append({
-                    'api_id': loan_team_record.team_id,
-                    'name': loan_team_record.name,
-                    'logo': loan_team_record.logo,
-                    'window_type': 'Summer',
-                    'is_active': True,
-                })
-                loan_team_api_ids.append(loan_team_record.team_id)
-
-        result['loan_team'] = loan_teams_info[0]['name'] if loan_teams_info else None
-        result['has_multiple_clubs'] = len(loan_teams_info) > 1
-
-        # 🔄 VERIFY player ID before fetching season stats
-        # This ensures we show correct stats even if player was seeded with wrong ID
-        api_client = APIFootballClient()
-        player_id_to_use = player_id
-        player_name_for_verify = all_loans[0].player_name if all_loans else None
-        if not player_name_for_verify and tracked_for_season:
-            player_name_for_verify = tracked_for_season.player_name
-        
-        if player_name_for_verify and loan_teams_info:
-            verified_id, method = api_client.verify_player_id_via_fixtures(
-                candidate_player_id=player_id,
-                player_name=player_name_for_verify,
-                loan_team_id=loan_teams_info[0]['api_id'],
-                season=season_start_year,
-                max_fixtures=3
-            )
-            if verified_id != player_id:
-                logger.warning(
-                    f"🔄 Season-stats ID correction for '{player_name_for_verify}': "
-                    f"{player_id} → {verified_id}"
-                )
-                player_id_to_use = verified_id
-                # Update the database record
-                for loan in all_loans:
-                    if loan.player_id == player_id:
-                        loan.player_id = verified_id
-                        loan.reviewer_notes = (loan.reviewer_notes or '') + f' | ID auto-corrected in season-stats: {player_id} → {verified_id}'
-                        loan.updated_at = datetime.now(timezone.utc)
-                db.session.commit()
-                # Delete ghost stats
-                ghost_deleted = FixturePlayerStats.query.filter(
-                    FixturePlayerStats.player_api_id == player_id,
-                    FixturePlayerStats.team_api_id.in_(loan_team_api_ids),
-                    FixturePlayerStats.minutes == 0
-                ).delete()
-                if ghost_deleted:
-                    db.session.commit()
-                # Update result to reflect new ID
-                result['player_id'] = verified_id
-        
-        # Aggregate stats from API-Football for ALL loan clubs
-        total_appearances = 0
-        total_minutes = 0
-        total_goals = 0
-        total_assists = 0
-        clubs_breakdown = []
-        
-        for team_info in loan_teams_info:
-            try:
-                api_totals = api_client._fetch_player_team_season_totals_api(
-                    player_id=player_id_to_use,
-                    team_id=team_info['api_id'],
-                    season=season_start_year,
-                )
-                
-                if api_totals and api_totals.get('games_played', 0) > 0:
-                    club_stats = {
-                        'team_name': team_info['name'],
-                        'team_logo': team_info['logo'],
-                        'window_type': team_info['window_type'],
-                        'is_current': team_info['is_active'],
-                        'appearances': api_totals.get('games_played', 0),
-                        'minutes': api_totals.get('minutes', 0),
-                        'goals': api_totals.get('goals', 0),
-                        'assists': api_totals.get('assists', 0),
-                        'saves': api_totals.get('saves', 0),
-                        'goals_conceded': api_totals.get('goals_conceded', 0),
-                    }
-                    clubs_breakdown.append(club_stats)
-                    total_appearances += club_stats['appearances']
-                    total_minutes += club_stats['minutes']
-                    total_goals += club_stats['goals']
-                    total_assists += club_stats['assists']
-                    result['source'] = 'api-football'
-            except Exception as api_err:
-                logger.warning(f"Failed to get API-Football stats for player {player_id} at {team_info['name']}: {api_err}")
-        
-        result['appearances'] = total_appearances
-        result['minutes'] = total_minutes
-        result['goals'] = total_goals
-        result['assists'] = total_assists
-        result['clubs'] = clubs_breakdown
-        
-        # Get detailed stats from local DB (aggregate across ALL loan clubs)
-        stats_query = db.session.query(
-            func.count(FixturePlayerStats.id).label('appearances'),
-            func.sum(FixturePlayerStats.minutes).label('total_minutes'),
-            func.sum(FixturePlayerStats.goals).label('total_goals'),
-            func.sum(FixturePlayerStats.assists).label('total_assists'),
-            func.sum(FixturePlayerStats.yellows).label('total_yellows'),
-            func.sum(FixturePlayerStats.reds).label('total_reds'),
-            func.avg(FixturePlayerStats.rating).label('avg_rating'),
-            func.sum(FixturePlayerStats.shots_total).label('total_shots'),
-            func.sum(FixturePlayerStats.shots_on).label('shots_on_target'),
-            func.sum(FixturePlayerStats.passes_key).label('total_key_passes'),
-            func.sum(FixturePlayerStats.tackles_total).label('total_tackles'),
-            func.sum(FixturePlayerStats.saves).label('total_saves'),
-            func.sum(FixturePlayerStats.goals_conceded).label('total_goals_conceded'),
-        ).join(
-            Fixture, FixturePlayerStats.fixture_id == Fixture.id
-        ).filter(
-            FixturePlayerStats.player_api_id == player_id,
-            FixturePlayerStats.team_api_id.in_(loan_team_api_ids),  # ALL loan clubs
-            Fixture.date_utc >= season_start
-        ).first()
-        
-        if stats_query and stats_query.appearances:
-            local_appearances = stats_query.appearances or 0
-            local_minutes = int(stats_query.total_minutes or 0)
-            local_goals = int(stats_query.total_goals or 0)
-            local_assists = int(stats_query.total_assists or 0)
-            
-            result['yellows'] = int(stats_query.total_yellows or 0)
-            result['reds'] = int(stats_query.total_reds or 0)
-            result['avg_rating'] = round(float(stats_query.avg_rating or 0), 2) if stats_query.avg_rating else None
-            result['shots'] = int(stats_query.total_shots or 0)
-            result['shots_on_target'] = int(stats_query.shots_on_target or 0)
-            result['key_passes'] = int(stats_query.total_key_passes or 0)
-            result['tackles'] = int(stats_query.total_tackles or 0)
-            result['saves'] = int(stats_query.total_saves or 0)
-            result['goals_conceded'] = int(stats_query.total_goals_conceded or 0)
-            result['local_appearances'] = local_appearances
-            
-            # PREFER local fixture data when it has MORE appearances than API-Football
-            # This handles cases where API-Football's aggregated endpoint is incomplete
-            # Our fixture data is captured per-game and is more reliable
-            if local_appearances > result.get('appearances', 0):
-                logger.info(
-                    f"Using local fixture data for player {player_id}: "
-                    f"local={local_appearances} apps > API={result.get('appearances', 0)} apps"
-                )
-                result['appearances'] = local_appearances
-                result['minutes'] = local_minutes
-                result['goals'] = local_goals
-                result['assists'] = local_assists
-                result['source'] = 'local-db'
-            elif result['source'] == 'none':
-                # Fallback to local DB if API-Football returned nothing
-                result['appearances'] = local_appearances
-                result['minutes'] = local_minutes
-                result['goals'] = local_goals
-                result['assists'] = local_assists
-                result['source'] = 'local-db'
-        
-        # Calculate clean sheets for goalkeepers (games with 0 goals conceded and >= 45 mins)
-        clean_sheets_query = db.session.query(
-            func.count(FixturePlayerStats.id).label('clean_sheets')
-        ).join(
-            Fixture, FixturePlayerStats.fixture_id == Fixture.id
-        ).filter(
-            FixturePlayerStats.player_api_id == player_id,
-            FixturePlayerStats.team_api_id.in_(loan_team_api_ids),
-            Fixture.date_utc >= season_start,
-            FixturePlayerStats.goals_conceded == 0,
-            FixturePlayerStats.minutes >= 45
-        ).first()
-        
-        result['clean_sheets'] = clean_sheets_query.clean_sheets if clean_sheets_query else 0
-        
-        return jsonify(result)
+        return jsonify(player_sections.player_season_stats(player_id))
 
     except Exception as e:
         logger.error(f"Error fetching season stats for player_id={player_id}: {e}")
@@ -2566,62 +1961,7 @@ def get_player_commentaries(player_id: int):
     Returns journalist writeups with author info.
     """
     try:
-        # Find all commentaries that reference this player
-        commentaries = NewsletterCommentary.query.filter(
-            NewsletterCommentary.player_id == player_id,
-            NewsletterCommentary.is_active == True
-        ).order_by(NewsletterCommentary.created_at.desc()).all()
-        
-        result = []
-        for c in commentaries:
-            author = c.author
-            newsletter = c.newsletter
-            
-            commentary_data = {
-                'id': c.id,
-                'content': c.content,
-                'title': c.title,
-                'commentary_type': c.commentary_type,
-                'is_premium': c.is_premium,
-                'created_at': c.created_at.isoformat() if c.created_at else None,
-                'updated_at': c.updated_at.isoformat() if c.updated_at else None,
-                'author': {
-                    'id': author.id if author else None,
-                    'display_name': author.display_name if author else None,
-                    'profile_image_url': author.profile_image_url if author else None,
-                    'is_journalist': author.is_journalist if author else False,
-                } if author else None,
-                'newsletter': {
-                    'id': newsletter.id if newsletter else None,
-                    'title': newsletter.title if newsletter else None,
-                    'week_start_date': newsletter.week_start_date.isoformat() if newsletter and newsletter.week_start_date else None,
-                    'week_end_date': newsletter.week_end_date.isoformat() if newsletter and newsletter.week_end_date else None,
-                    'team_name': newsletter.team.name if newsletter and newsletter.team else None,
-                } if newsletter else None,
-            }
-            result.append(commentary_data)
-        
-        # Also get unique authors who have written about this player
-        unique_authors = {}
-        for c in commentaries:
-            if c.author and c.author.id not in unique_authors:
-                unique_authors[c.author.id] = {
-                    'id': c.author.id,
-                    'display_name': c.author.display_name,
-                    'profile_image_url': c.author.profile_image_url,
-                    'is_journalist': c.author.is_journalist,
-                    'commentary_count': 0,
-                }
-            if c.author:
-                unique_authors[c.author.id]['commentary_count'] += 1
-        
-        return jsonify({
-            'player_id': player_id,
-            'commentaries': result,
-            'total_count': len(result),
-            'authors': list(unique_authors.values()),
-        })
-        
+        return jsonify(player_sections.player_commentaries(player_id))
     except Exception as e:
         logger.error(f"Error fetching commentaries for player_id={player_id}: {e}")
         import traceback
@@ -2737,35 +2077,7 @@ def create_player_comment(player_id: int):
 @api_bp.route('/players/<int:player_id>/links', methods=['GET'])
 def list_player_links(player_id: int):
     try:
-        rows = PlayerLink.query\
-            .filter_by(player_id=player_id, status='approved')\
-            .order_by(PlayerLink.upvotes.desc(), PlayerLink.created_at.desc())\
-            .all()
-        results = [r.to_dict() for r in rows]
-
-        # Merge YouTube links from newsletters for this player
-        yt_rows = NewsletterPlayerYoutubeLink.query\
-            .filter_by(player_id=player_id)\
-            .order_by(NewsletterPlayerYoutubeLink.created_at.desc())\
-            .all()
-        seen_urls = {r['url'] for r in results}
-        for yt in yt_rows:
-            if yt.youtube_link in seen_urls:
-                continue
-            seen_urls.add(yt.youtube_link)
-            results.append({
-                'id': f'yt-{yt.id}',
-                'player_id': yt.player_id,
-                'url': yt.youtube_link,
-                'title': yt.player_name + ' Highlights' if yt.player_name else 'Match Highlights',
-                'link_type': 'highlight',
-                'status': 'approved',
-                'upvotes': 0,
-                'source': 'newsletter',
-                'created_at': yt.created_at.isoformat() if yt.created_at else None,
-            })
-
-        return jsonify(results)
+        return jsonify(player_sections.player_links(player_id))
     except Exception as e:
         return jsonify(_safe_error_payload(e, 'Failed to fetch player links')), 500
 
@@ -4170,12 +3482,17 @@ def export_loan_candidates_csv():
         return jsonify(_safe_error_payload(e, 'An unexpected error occurred. Please try again later.')), 500
 
 # Newsletter rendering helpers
-try:
-    # Reuse lint/enrich if available via weekly agent
-    from src.agents.weekly_agent import lint_and_enrich  # type: ignore
-except Exception:
-    def lint_and_enrich(x: dict) -> dict:  # fallback
+def lint_and_enrich(x: dict) -> dict:
+    """Reuse the weekly agent's lint/enrich when it can be imported.
+
+    Imported on first use: the agent pulls in the OpenAI Agents SDK, which
+    dominates web worker start-up time.
+    """
+    try:
+        from src.agents.weekly_agent import lint_and_enrich as _agent_lint_and_enrich  # type: ignore
+    except Exception:
         return x
+    return _agent_lint_and_enrich(x)
 
 def _load_newsletter_json(n: Newsletter) -> dict | None:
     try:
@@ -5338,19 +4655,69 @@ def set_run_status():
         return jsonify(_safe_error_payload(e, 'An unexpected error occurred. Please try again later.')), 500
 
 # --- Admin: Loans management ---
+# Columns returned by the slim admin listings (no per-row stats queries)
+_ADMIN_LOAN_COLUMNS = (
+    'id', 'player_id', 'player_name', 'primary_team_id', 'primary_team_name', 'loan_team_id',
+    'loan_team_name', 'window_key', 'is_active', 'data_source', 'can_fetch_stats', 'stats_coverage',
+    'pathway_status', 'current_level', 'appearances', 'goals', 'assists', 'minutes_played',
+    'created_at', 'updated_at',
+)
+_ADMIN_LOAN_SORTS = {
+    'updated_at': LoanedPlayer.updated_at,
+    'created_at': LoanedPlayer.created_at,
+    # Never NULL, so the (sort key, id) cursor comparison always holds
+    'player_name': func.coalesce(func.lower(LoanedPlayer.player_name), ''),
+    'id': LoanedPlayer.id,
+}
+ADMIN_LIST_DEFAULT_LIMIT = 100
+ADMIN_LIST_MAX_LIMIT = 500
+
+
+def _admin_list_paging_args(default_sort: str, sorts, default_count: str = 'estimate') -> tuple:
+    """Parse limit/cursor/sort/order/count query args shared by admin listings."""
+    limit = request.args.get('limit', type=int) or ADMIN_LIST_DEFAULT_LIMIT
+    limit = max(1, min(limit, ADMIN_LIST_MAX_LIMIT))
+    sort = request.args.get('sort', default_sort)
+    if sort not in sorts:
+        raise ValueError(f"sort must be one of: {', '.join(sorts)}")
+    order = request.args.get('order', 'desc' if sort in ('updated_at', 'created_at') else 'asc').lower()
+    if order not in ('asc', 'desc'):
+        raise ValueError('order must be asc or desc')
+    count_mode = request.args.get('count', default_count).lower()
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"count must be one of: {', '.join(COUNT_MODES)}")
+    return limit, request.args.get('cursor') or None, sort, order, count_mode
+
+
 @api_bp.route('/admin/loans', methods=['GET'])
 @require_api_key
 def admin_list_loans():
+    """
+    Keyset-paginated loan listing with server-side filters.
+
+    Query params:
+    - primary_team_db_id / primary_team_api_id (+ season), player_id, player_name,
+      active_only (default true), loan_season (start year, e.g. 2025)
+    - sort: updated_at (default) | created_at | player_name | id; order: asc | desc
+    - limit (default 100, max 500), cursor: ``next_cursor`` from the previous page
+    - count: estimate (default) | exact | none
+    - fields: slim (default, stored columns only) | full (``to_dict`` with computed stats)
+    """
     try:
+        try:
+            limit, cursor, sort, order, count_mode = _admin_list_paging_args('updated_at', _ADMIN_LOAN_SORTS)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         primary_team_api_id = request.args.get('primary_team_api_id', type=int)
         primary_team_db_id = request.args.get('primary_team_db_id', type=int)
         season = request.args.get('season', type=int)
         active_only = request.args.get('active_only', 'true').lower() in ('true','1','yes','y')
+        full = request.args.get('fields', 'slim').lower() == 'full'
 
-        q = LoanedPlayer.query
+        filters = []
         # Filter by primary team
         if primary_team_db_id:
-            q = q.filter(LoanedPlayer.primary_team_id == primary_team_db_id)
+            filters.append(LoanedPlayer.primary_team_id == primary_team_db_id)
         elif primary_team_api_id:
             # Resolve DB id from API id (requires season)
             if season is None:
@@ -5358,21 +4725,75 @@ def admin_list_loans():
             row = Team.query.filter_by(team_id=primary_team_api_id, season=season).first()
             if not row:
                 return jsonify({'error': f'Primary team api_id={primary_team_api_id} not found for season {season}'}), 404
-            q = q.filter(LoanedPlayer.primary_team_id == row.id)
+            filters.append(LoanedPlayer.primary_team_id == row.id)
 
         if active_only:
-            q = q.filter(LoanedPlayer.is_active.is_(True))
+            filters.append(LoanedPlayer.is_active.is_(True))
 
         # Optional: basic search by player_id or name
         player_id = request.args.get('player_id', type=int)
         if player_id:
-            q = q.filter(LoanedPlayer.player_id == player_id)
-        player_name = request.args.get('player_name')
+            filters.append(LoanedPlayer.player_id == player_id)
+        player_name = (request.args.get('player_name') or '').strip()
         if player_name:
-            q = q.filter(LoanedPlayer.player_name.ilike(f"%{player_name}%"))
+            filters.append(LoanedPlayer.player_name.ilike(f"%{player_name}%"))
+        loan_season = request.args.get('loan_season', type=int)
+        if loan_season:
+            filters.append(LoanedPlayer.window_key.like(f"{loan_season}-%"))
+
+        sort_expr = _ADMIN_LOAN_SORTS[sort]
+        descending = order == 'desc'
+        total, total_is_estimate = count_rows(db.session, select(LoanedPlayer.id).where(*filters), count_mode)
+
+        parent_team = db.aliased(Team)
+        loan_team = db.aliased(Team)
+        parent_league = db.aliased(League)
+        loan_league = db.aliased(League)
+        stmt = (
+            select(
+                *(getattr(LoanedPlayer, name) for name in _ADMIN_LOAN_COLUMNS),
+                parent_team.team_id.label('primary_team_api_id'),
+                loan_team.team_id.label('loan_team_api_id'),
+                parent_league.name.label('primary_team_league_name'),
+                loan_league.name.label('loan_team_league_name'),
+                sort_expr.label('_sort_key'),
+            )
+            .outerjoin(parent_team, parent_team.id == LoanedPlayer.primary_team_id)
+            .outerjoin(loan_team, loan_team.id == LoanedPlayer.loan_team_id)
+            .outerjoin(parent_league, parent_league.id == parent_team.league_id)
+            .outerjoin(loan_league, loan_league.id == loan_team.league_id)
+            .where(*filters)
+        )
+        after = after_cursor(sort_expr, LoanedPlayer.id, cursor, descending)
+        if after is not None:
+            stmt = stmt.where(after)
+        rows = db.session.execute(
+            stmt.order_by(*keyset_order_by(sort_expr, LoanedPlayer.id, descending)).limit(limit + 1)
+        ).all()
+        rows, next_cursor = page_of(rows, limit, lambda r: r._sort_key, lambda r: r.id)
 
-        loans = q.order_by(LoanedPlayer.updated_at.desc()).all()
-        return jsonify([l.to_dict() for l in loans])
+        if full:
+            loans = {l.id: l for l in LoanedPlayer.query.filter(LoanedPlayer.id.in_([r.id for r in rows])).all()}
+            items = [loans[r.id].to_dict() for r in rows if r.id in loans]
+        else:
+            items = []
+            for r in rows:
+                item = {key: value for key, value in r._mapping.items() if key != '_sort_key'}
+                item['created_at'] = r.created_at.isoformat() if r.created_at else None
+                item['updated_at'] = r.updated_at.isoformat() if r.updated_at else None
+                items.append(item)
+
+        return jsonify({
+            'items': items,
+            'limit': limit,
+            'next_cursor': next_cursor,
+            'sort': sort,
+            'order': order,
+            'total': total,
+            'total_is_estimate': total_is_estimate,
+        })
+    except CursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.exception('admin_list_loans failed')
         return jsonify(_safe_error_payload(e, 'An unexpected error occurred. Please try again later.')), 500
@@ -6219,8 +5640,6 @@ def admin_seed_top5_loans():
     - league_ids default: [39, 140, 78, 135, 61]
     - background: if true, run in background and return job ID
     """
-    from flask import copy_current_request_context
-    
     data = request.get_json() or {}
     season = int(data.get('season') or 0)
     if not season:
@@ -6229,25 +5648,13 @@ def admin_seed_top5_loans():
     background = bool(data.get('background', False))
     
     if background:
-        # Start background job
-        job_id = _create_background_job('seed_top5')
-        
-        @copy_current_request_context
-        def run_seed_in_background():
-            try:
-                result = _run_seed_top5_logic(data, job_id)
-                _update_job(job_id, status='completed', results=result, completed_at=datetime.now(timezone.utc).isoformat())
-            except Exception as e:
-                logger.exception(f'Background seed job {job_id} failed')
-                _update_job(job_id, status='failed', error=str(e), completed_at=datetime.now(timezone.utc).isoformat())
-        
-        thread = threading.Thread(target=run_seed_in_background)
-        thread.start()
-        
+        # Hand off to a job queue worker
+        job_id = enqueue_job('seed_top5', {'data': data})
+
         return jsonify({
-            'message': 'Seed Top 5 job started in background',
+            'message': 'Seed Top 5 job queued',
             'job_id': job_id,
-            'status': 'running',
+            'status': 'queued',
             'check_status_url': f'/api/admin/jobs/{job_id}'
         })
     
@@ -6841,7 +6248,7 @@ def admin_resync_goalkeeper_saves():
     """
     import time
     from src.models.weekly import FixturePlayerStats, Fixture
-    from src.api_football_client import APIFootballClient
+    from src.api_football_client import get_api_client
     
     try:
         data = request.get_json(force=True) if request.data else {}
@@ -6874,7 +6281,7 @@ def admin_resync_goalkeeper_saves():
                 'processed': 0,
             })
         
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         
         updated = 0
         skipped = 0
@@ -6962,7 +6369,7 @@ def admin_sync_limited_stats():
     }
     """
     import time
-    from src.api_football_client import APIFootballClient
+    from src.api_football_client import get_api_client
     
     try:
         data = request.get_json(force=True) if request.data else {}
@@ -7001,7 +6408,7 @@ def admin_sync_limited_stats():
                 'processed': 0,
             })
         
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         
         # Determine season
         now_utc = datetime.now(timezone.utc)
@@ -7136,31 +6543,17 @@ def admin_fix_miscategorized_loans():
         background?: bool (default: false) - run in background and return job ID
     }
     """
-    from flask import copy_current_request_context
-    
     data = request.get_json() or {}
     background = bool(data.get('background', False))
     
     if background:
-        # Start background job
-        job_id = _create_background_job('fix_miscategorized')
-        
-        @copy_current_request_context
-        def run_fix_in_background():
-            try:
-                result = _run_fix_miscategorized_logic(data, job_id)
-                _update_job(job_id, status='completed', results=result, completed_at=datetime.now(timezone.utc).isoformat())
-            except Exception as e:
-                logger.exception(f'Background fix job {job_id} failed')
-                _update_job(job_id, status='failed', error=str(e), completed_at=datetime.now(timezone.utc).isoformat())
-        
-        thread = threading.Thread(target=run_fix_in_background)
-        thread.start()
-        
+        # Hand off to a job queue worker
+        job_id = enqueue_job('fix_miscategorized', {'data': data})
+
         return jsonify({
-            'message': 'Fix miscategorized job started in background',
+            'message': 'Fix miscategorized job queued',
             'job_id': job_id,
-            'status': 'running',
+            'status': 'queued',
             'check_status_url': f'/api/admin/jobs/{job_id}'
         })
     
@@ -7559,18 +6952,25 @@ def admin_fix_midseason_transfer():
 @api_bp.route('/admin/jobs/active', methods=['GET'])
 @require_api_key
 def list_active_jobs():
-    """List all currently running background jobs."""
+    """List all queued and running background jobs."""
+    from src.utils.job_queue import ensure_worker, reap_stale_jobs
     STALE_THRESHOLD = STALE_JOB_TIMEOUT
     now = datetime.now(timezone.utc)
 
-    running = BackgroundJob.query.filter_by(status='running').order_by(
-        BackgroundJob.started_at.desc()
+    # Jobs whose worker died are re-queued; make sure something picks them up
+    if reap_stale_jobs():
+        ensure_worker()
+
+    active = BackgroundJob.query.filter(
+        BackgroundJob.status.in_(('queued', 'running'))
+    ).order_by(
+        BackgroundJob.priority.asc(), BackgroundJob.created_at.desc()
     ).all()
 
     results = []
-    for job in running:
+    for job in active:
         last_active = (job.updated_at or job.started_at or job.created_at)
-        if last_active:
+        if job.status == 'running' and not job.heartbeat_at and last_active:
             elapsed = now - last_active.replace(tzinfo=timezone.utc)
             if elapsed > STALE_THRESHOLD:
                 job.status = 'failed'
@@ -7593,6 +6993,46 @@ def get_job_status(job_id: str):
     return jsonify(job)
 
 
+def _job_event_stream(job_id=None):
+    def generate():
+        try:
+            for event, data in stream_job_events(job_id):
+                if event == 'ping':
+                    yield ": ping\n\n"
+                else:
+                    yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        except Exception as e:
+            logger.error(f"Job stream error: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        }
+    )
+
+
+@api_bp.route('/admin/jobs/active/stream', methods=['GET'])
+@require_api_key
+def stream_active_jobs():
+    """SSE stream of running jobs.
+
+    Sends a `jobs` event with the full list of running jobs whenever one
+    starts, progresses or finishes, replacing polling of /admin/jobs/active.
+    """
+    return _job_event_stream()
+
+
+@api_bp.route('/admin/jobs/<job_id>/stream', methods=['GET'])
+@require_api_key
+def stream_job_status(job_id: str):
+    """SSE stream of one job: `job` events on progress, then a final `done`."""
+    return _job_event_stream(job_id)
+
+
 @api_bp.route('/admin/jobs/<job_id>/cancel', methods=['POST'])
 @require_api_key
 def cancel_job_endpoint(job_id: str):
@@ -7610,7 +7050,7 @@ def force_fail_job(job_id: str):
     job = db.session.get(BackgroundJob, job_id)
     if not job:
         return jsonify({'error': 'Job not found'}), 404
-    if job.status not in ('running', 'cancelled'):
+    if job.status not in ('queued', 'running', 'cancelled'):
         return jsonify({'error': f'Job already {job.status}'}), 400
     job.status = 'failed'
     job.error = 'Force-failed by admin'
@@ -7622,9 +7062,9 @@ def force_fail_job(job_id: str):
 @api_bp.route('/admin/jobs/force-fail-all', methods=['POST'])
 @require_api_key
 def force_fail_all_jobs():
-    """Force-fail all running/cancelled jobs."""
+    """Force-fail all queued/running/cancelled jobs."""
     stuck = BackgroundJob.query.filter(
-        BackgroundJob.status.in_(('running', 'cancelled'))
+        BackgroundJob.status.in_(('queued', 'running', 'cancelled'))
     ).all()
     if not stuck:
         return jsonify({'message': 'No stuck jobs found', 'count': 0})
@@ -7752,31 +7192,18 @@ def admin_reconcile_player_ids():
     }
     """
     from src.models.weekly import FixturePlayerStats, Fixture
-    from flask import copy_current_request_context
     
     data = request.get_json() or {}
     background = bool(data.get('background', False))
     
     if background:
-        # Start background job
-        job_id = _create_background_job('reconcile_ids')
-        
-        @copy_current_request_context
-        def run_reconcile_in_background():
-            try:
-                result = _run_reconcile_ids_logic(data, job_id)
-                _update_job(job_id, status='completed', results=result, completed_at=datetime.now(timezone.utc).isoformat())
-            except Exception as e:
-                logger.exception(f'Background reconcile job {job_id} failed')
-                _update_job(job_id, status='failed', error=str(e), completed_at=datetime.now(timezone.utc).isoformat())
-        
-        thread = threading.Thread(target=run_reconcile_in_background)
-        thread.start()
-        
+        # Hand off to a job queue worker
+        job_id = enqueue_job('reconcile_ids', {'data': data})
+
         return jsonify({
-            'message': 'Reconcile job started in background',
+            'message': 'Reconcile job queued',
             'job_id': job_id,
-            'status': 'running',
+            'status': 'queued',
             'check_status_url': f'/api/admin/jobs/{job_id}'
         })
     
@@ -8869,6 +8296,65 @@ def admin_backfill_team_leagues_all():
         db.session.rollback()
         return jsonify(_safe_error_payload(e, 'An unexpected error occurred. Please try again later.')), 500
 
+def _collect_player_fixture_stats(api_client, player_id: int, team_api_id: int, season: int,
+                                  fixtures: list, dry_run: bool = False):
+    """Parse a player's missing stats rows from their loan club's *fixtures*.
+
+    Fixture and existing stats rows are loaded with one query each; unknown
+    finished fixtures are created unless *dry_run*. Returns
+    ``(synced, skipped, errors, rows)`` where *rows* are ready for
+    ``upsert_fixture_player_stats``.
+    """
+    from src.models.weekly import Fixture, FixturePlayerStats
+
+    finished = [
+        fx for fx in fixtures
+        if ((fx.get('fixture') or {}).get('status') or {}).get('short', '') in ('FT', 'AET', 'PEN')
+    ]
+    skipped = len(fixtures) - len(finished)
+    fixture_ids = {(fx.get('fixture') or {}).get('id') for fx in finished}
+    db_fixtures = {
+        row.fixture_id_api: row
+        for row in Fixture.query.filter(Fixture.fixture_id_api.in_(fixture_ids)).all()
+    } if fixture_ids else {}
+    have_stats = {
+        fixture_pk for (fixture_pk,) in db.session.query(FixturePlayerStats.fixture_id).filter(
+            FixturePlayerStats.player_api_id == player_id,
+            FixturePlayerStats.fixture_id.in_([row.id for row in db_fixtures.values()]),
+        ).all()
+    } if db_fixtures else set()
+
+    synced = 0
+    errors = []
+    rows = []
+    for fx in finished:
+        fixture_id_api = fx['fixture'].get('id')
+        db_fixture = db_fixtures.get(fixture_id_api)
+        if db_fixture is None and not dry_run:
+            db_fixture = api_client._get_or_create_fixture(db.session, fx, season)
+        if db_fixture is not None and db_fixture.id in have_stats:
+            skipped += 1
+            continue
+
+        try:
+            player_stats = api_client.get_player_stats_for_fixture(player_id, season, fixture_id_api)
+            stat_list = (player_stats or {}).get('statistics') or []
+            st = (stat_list[0] if isinstance(stat_list, list) else stat_list) if stat_list else {}
+            minutes = (st.get('games') or {}).get('minutes') or 0
+            # Only add if player actually played
+            if minutes <= 0:
+                skipped += 1
+                continue
+            synced += 1  # Dry run counts this as would-sync
+            if not dry_run and db_fixture is not None:
+                rows.append(api_client._player_fixture_stats_row(
+                    db_fixture.id, player_id, team_api_id, player_stats,
+                ))
+        except Exception as e:
+            errors.append(f"Fixture {fixture_id_api}: {str(e)}")
+    return synced, skipped, errors, rows
+
+
 @api_bp.route('/admin/players/<int:player_id>/sync-fixtures', methods=['POST'])
 @require_api_key
 def admin_sync_player_fixtures(player_id: int):
@@ -8878,8 +8364,7 @@ def admin_sync_player_fixtures(player_id: int):
     and stores any missing fixture stats in the database.
     """
     try:
-        from src.api_football_client import APIFootballClient
-        from src.models.weekly import Fixture, FixturePlayerStats
+        from src.api_football_client import get_api_client
         from src.models.league import LoanedPlayer
         
         data = request.get_json() or {}
@@ -8905,7 +8390,7 @@ def admin_sync_player_fixtures(player_id: int):
         
         loan_team_api_id = loan_team.team_id
         
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         
         # Fetch all fixtures for this team in the season
         season_start = f"{season}-08-01"
@@ -8920,120 +8405,11 @@ def admin_sync_player_fixtures(player_id: int):
             season_end
         )
         
-        synced = 0
-        skipped = 0
-        errors = []
-        
-        for fx in fixtures:
-            fixture_info = fx.get('fixture', {})
-            fixture_id_api = fixture_info.get('id')
-            fixture_status = fixture_info.get('status', {}).get('short', '')
-            
-            # Only process finished games
-            if fixture_status not in ('FT', 'AET', 'PEN'):
-                skipped += 1
-                continue
-            
-            # Check if we already have this fixture
-            existing_fixture = Fixture.query.filter_by(fixture_id_api=fixture_id_api).first()
-            
-            if not existing_fixture:
-                # Create the fixture
-                if not dry_run:
-                    teams = fx.get('teams', {})
-                    goals = fx.get('goals', {})
-                    league = fx.get('league', {})
-                    
-                    existing_fixture = Fixture(
-                        fixture_id_api=fixture_id_api,
-                        date_utc=datetime.fromisoformat(fixture_info.get('date', '').replace('Z', '+00:00')) if fixture_info.get('date') else None,
-                        season=season,
-                        competition_name=league.get('name'),
-                        home_team_api_id=teams.get('home', {}).get('id'),
-                        away_team_api_id=teams.get('away', {}).get('id'),
-                        home_goals=goals.get('home'),
-                        away_goals=goals.get('away'),
-                    )
-                    db.session.add(existing_fixture)
-                    db.session.flush()
-            
-            # Check if we have player stats for this fixture
-            if existing_fixture:
-                existing_stats = FixturePlayerStats.query.filter_by(
-                    fixture_id=existing_fixture.id,
-                    player_api_id=player_id
-                ).first()
-                
-                if existing_stats:
-                    skipped += 1
-                    continue
-            
-            # Fetch player stats for this fixture
-            try:
-                player_stats = api_client.get_player_stats_for_fixture(player_id, season, fixture_id_api)
-                
-                if player_stats and player_stats.get('statistics'):
-                    # statistics is a LIST, get first element
-                    stat_list = player_stats['statistics']
-                    if not stat_list:
-                        skipped += 1
-                        continue
-                    st = stat_list[0] if isinstance(stat_list, list) else stat_list
-                    
-                    # Extract stats from the nested structure
-                    games = st.get('games', {}) or {}
-                    goals_block = st.get('goals', {}) or {}
-                    cards = st.get('cards', {}) or {}
-                    shots = st.get('shots', {}) or {}
-                    passes = st.get('passes', {}) or {}
-                    tackles = st.get('tackles', {}) or {}
-                    duels = st.get('duels', {}) or {}
-                    dribbles = st.get('dribbles', {}) or {}
-                    fouls = st.get('fouls', {}) or {}
-                    penalty = st.get('penalty', {}) or {}
-                    
-                    minutes = games.get('minutes', 0) or 0
-                    
-                    # Only add if player actually played
-                    if minutes and minutes > 0 and not dry_run and existing_fixture:
-                        fps = FixturePlayerStats(
-                            fixture_id=existing_fixture.id,
-                            player_api_id=player_id,
-                            team_api_id=loan_team_api_id,
-                            minutes=minutes,
-                            position=games.get('position'),
-                            rating=games.get('rating'),
-                            goals=goals_block.get('total', 0) or 0,
-                            assists=goals_block.get('assists', 0) or 0,
-                            yellows=cards.get('yellow', 0) or 0,
-                            reds=cards.get('red', 0) or 0,
-                            shots_total=shots.get('total'),
-                            shots_on=shots.get('on'),
-                            passes_total=passes.get('total'),
-                            passes_key=passes.get('key'),
-                            tackles_total=tackles.get('total'),
-                            duels_won=duels.get('won'),
-                            duels_total=duels.get('total'),
-                            dribbles_success=dribbles.get('success'),
-                            # Goalkeeper stats - saves and conceded are in goals block
-                            saves=goals_block.get('saves'),
-                            goals_conceded=goals_block.get('conceded'),
-                            # Additional stats
-                            fouls_drawn=fouls.get('drawn'),
-                            fouls_committed=fouls.get('committed'),
-                            penalty_saved=penalty.get('saved'),
-                        )
-                        db.session.add(fps)
-                        synced += 1
-                    elif minutes and minutes > 0:
-                        synced += 1  # Dry run counts this as would-sync
-                    else:
-                        skipped += 1
-                else:
-                    skipped += 1
-                    
-            except Exception as e:
-                errors.append(f"Fixture {fixture_id_api}: {str(e)}")
+        synced, skipped, errors, rows = _collect_player_fixture_stats(
+            api_client, player_id, loan_team_api_id, season, fixtures, dry_run=dry_run,
+        )
+        if rows:
+            upsert_fixture_player_stats(rows)
         
         if not dry_run:
             db.session.commit()
@@ -9078,22 +8454,10 @@ def admin_sync_team_fixtures(team_id: int):
     try:
         data = request.get_json() or {}
         background = bool(data.get('background', False))
-        job_id = str(uuid4()) if background else None
         
         if background:
-            _create_background_job('team_fixtures_sync')
-            # Override job_id from uuid() to use the one from _create_background_job
-            def run_sync_in_background():
-                try:
-                    result = _run_team_fixtures_sync(team_id, data, job_id)
-                    _update_job(job_id, status='completed', results=result, completed_at=datetime.now(timezone.utc).isoformat())
-                except Exception as e:
-                    logger.exception(f'Background team sync job {job_id} failed')
-                    _update_job(job_id, status='failed', error=str(e), completed_at=datetime.now(timezone.utc).isoformat())
-            
-            thread = threading.Thread(target=run_sync_in_background)
-            thread.start()
-            return jsonify({'message': 'Team fixture sync started in background', 'job_id': job_id}), 202
+            job_id = enqueue_job('team_fixtures_sync', {'team_id': team_id, 'data': data})
+            return jsonify({'message': 'Team fixture sync queued', 'job_id': job_id}), 202
         else:
             result = _run_team_fixtures_sync(team_id, data)
             return jsonify(result), 200
@@ -9107,10 +8471,11 @@ def admin_sync_team_fixtures(team_id: int):
 @require_api_key
 def admin_backfill_fixture_raw_json():
     """
-    Backfill raw_json for fixtures that are missing it.
+    Backfill the raw fixture payload for fixtures that are missing it.
     
-    This fetches the full fixture data from API-Football and stores it,
-    which enables team name extraction for older fixtures.
+    This fetches the full fixture data from API-Football and stores it
+    (compressed, in fixture_payloads), which enables team name extraction
+    for older fixtures.
     
     Body:
     - player_id: (optional) Only backfill fixtures for this player
@@ -9119,9 +8484,9 @@ def admin_backfill_fixture_raw_json():
     - dry_run: (optional) If true, don't actually update DB
     """
     try:
-        from src.api_football_client import APIFootballClient
-        from src.models.weekly import Fixture, FixturePlayerStats
-        import json
+        from src.api_football_client import get_api_client
+        from src.models.weekly import Fixture, FixturePayload, FixturePlayerStats
+        from src.services.fixture_stats import store_fixture_payloads
         
         data = request.get_json() or {}
         player_id = data.get('player_id')
@@ -9129,8 +8494,11 @@ def admin_backfill_fixture_raw_json():
         limit = min(data.get('limit', 50), 200)  # Cap at 200 to avoid API abuse
         dry_run = data.get('dry_run', False)
         
-        # Build query for fixtures missing raw_json
-        query = Fixture.query.filter(Fixture.raw_json.is_(None))
+        # Build query for fixtures missing their stored payload
+        query = Fixture.query.filter(~db.exists().where(
+            FixturePayload.fixture_id == Fixture.id,
+            FixturePayload.kind == 'fixture',
+        ))
         
         # Filter by player if specified
         if player_id:
@@ -9157,9 +8525,10 @@ def admin_backfill_fixture_raw_json():
                 'updated': 0
             })
         
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         updated = 0
         errors = []
+        payloads = []
         
         for fixture in fixtures_to_update:
             try:
@@ -9168,13 +8537,8 @@ def admin_backfill_fixture_raw_json():
                 api_fixtures = resp.get('response', [])
                 
                 if api_fixtures:
-                    # Store the full fixture object as raw_json
-                    raw_json_str = json.dumps(api_fixtures[0])
-                    
-                    if not dry_run:
-                        fixture.raw_json = raw_json_str
-                        db.session.add(fixture)
-                    
+                    # Store the full fixture object as its payload
+                    payloads.append((fixture.id, 'fixture', 0, api_fixtures[0]))
                     updated += 1
                     logger.info(f"Backfilled raw_json for fixture {fixture.fixture_id_api}")
                 else:
@@ -9189,6 +8553,7 @@ def admin_backfill_fixture_raw_json():
                 })
         
         if not dry_run:
+            store_fixture_payloads(payloads)
             db.session.commit()
         
         return jsonify({
@@ -9207,8 +8572,7 @@ def admin_backfill_fixture_raw_json():
 
 def _run_team_fixtures_sync(team_id: int, data: dict, job_id: str = None) -> dict:
     """Run the team fixture sync logic, optionally with progress updates."""
-    from src.api_football_client import APIFootballClient
-    from src.models.weekly import Fixture, FixturePlayerStats
+    from src.api_football_client import get_api_client
     
     try:
         dry_run = data.get('dry_run', False)
@@ -9234,165 +8598,83 @@ def _run_team_fixtures_sync(team_id: int, data: dict, job_id: str = None) -> dic
         if job_id:
             _update_job(job_id, total=total_players, progress=0, current_player=f'Syncing {total_players} players from {team.name}...')
         
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         
         results = []
         total_synced = 0
         total_skipped = 0
         total_errors = 0
-        
-        for idx, loaned in enumerate(players):
-            player_result = {
-                'player_id': loaned.player_id,
-                'player_name': loaned.player_name,
-                'loan_team': loaned.loan_team_name,
-                'synced': 0,
-                'skipped': 0,
-                'errors': []
-            }
+        # Stats rows for several players go out in one upsert per batch
+        pending_rows = []
+
+        def _write_pending():
+            if pending_rows:
+                batch = pending_rows[:]
+                pending_rows.clear()
+                upsert_fixture_player_stats(batch)
+            if not dry_run:
+                db.session.commit()
+
+        try:
+            for idx, loaned in enumerate(players):
+                player_result = {
+                    'player_id': loaned.player_id,
+                    'player_name': loaned.player_name,
+                    'loan_team': loaned.loan_team_name,
+                    'synced': 0,
+                    'skipped': 0,
+                    'errors': []
+                }
             
-            try:
-                loan_team = Team.query.get(loaned.loan_team_id)
-                if not loan_team:
-                    player_result['errors'].append('Loan team not found')
-                    results.append(player_result)
-                    total_errors += 1
-                    continue
+                try:
+                    loan_team = Team.query.get(loaned.loan_team_id)
+                    if not loan_team:
+                        player_result['errors'].append('Loan team not found')
+                        results.append(player_result)
+                        total_errors += 1
+                        continue
                 
-                loan_team_api_id = loan_team.team_id
+                    loan_team_api_id = loan_team.team_id
                 
-                # Fetch all fixtures for the loan team this season
-                season_start = f"{season}-08-01"
-                season_end = f"{season + 1}-06-30"
+                    # Fetch all fixtures for the loan team this season
+                    season_start = f"{season}-08-01"
+                    season_end = f"{season + 1}-06-30"
                 
-                fixtures = api_client.get_fixtures_for_team(
-                    loan_team_api_id, 
-                    season, 
-                    season_start, 
-                    season_end
-                )
+                    fixtures = api_client.get_fixtures_for_team(
+                        loan_team_api_id, 
+                        season, 
+                        season_start, 
+                        season_end
+                    )
                 
-                for fx in fixtures:
-                    fixture_info = fx.get('fixture', {})
-                    fixture_id_api = fixture_info.get('id')
-                    fixture_status = fixture_info.get('status', {}).get('short', '')
-                    
-                    # Only process finished games
-                    if fixture_status not in ('FT', 'AET', 'PEN'):
-                        player_result['skipped'] += 1
-                        continue
-                    
-                    # Check if we already have this fixture
-                    existing_fixture = Fixture.query.filter_by(fixture_id_api=fixture_id_api).first()
-                    
-                    if not existing_fixture:
-                        # Create the fixture
-                        if not dry_run:
-                            teams = fx.get('teams', {})
-                            goals = fx.get('goals', {})
-                            league = fx.get('league', {})
-                            
-                            existing_fixture = Fixture(
-                                fixture_id_api=fixture_id_api,
-                                date_utc=datetime.fromisoformat(fixture_info.get('date', '').replace('Z', '+00:00')) if fixture_info.get('date') else None,
-                                season=season,
-                                competition_name=league.get('name'),
-                                home_team_api_id=teams.get('home', {}).get('id'),
-                                away_team_api_id=teams.get('away', {}).get('id'),
-                                home_goals=goals.get('home'),
-                                away_goals=goals.get('away'),
-                            )
-                            db.session.add(existing_fixture)
-                            db.session.flush()
-                    
-                    # Check if we have player stats for this fixture
-                    if existing_fixture:
-                        existing_stats = FixturePlayerStats.query.filter_by(
-                            fixture_id=existing_fixture.id,
-                            player_api_id=loaned.player_id
-                        ).first()
-                        
-                        if existing_stats:
-                            player_result['skipped'] += 1
-                            continue
-                    
-                    # Fetch player stats for this fixture
-                    try:
-                        player_stats = api_client.get_player_stats_for_fixture(loaned.player_id, season, fixture_id_api)
-                        
-                        if player_stats and player_stats.get('statistics'):
-                            stat_list = player_stats['statistics']
-                            if not stat_list:
-                                player_result['skipped'] += 1
-                                continue
-                            st = stat_list[0] if isinstance(stat_list, list) else stat_list
-                            
-                            # Extract stats
-                            games = st.get('games', {}) or {}
-                            goals_block = st.get('goals', {}) or {}
-                            cards = st.get('cards', {}) or {}
-                            shots = st.get('shots', {}) or {}
-                            passes = st.get('passes', {}) or {}
-                            tackles = st.get('tackles', {}) or {}
-                            duels = st.get('duels', {}) or {}
-                            dribbles = st.get('dribbles', {}) or {}
-                            fouls = st.get('fouls', {}) or {}
-                            penalty = st.get('penalty', {}) or {}
-                            
-                            minutes = games.get('minutes', 0) or 0
-                            
-                            if minutes and minutes > 0 and not dry_run and existing_fixture:
-                                fps = FixturePlayerStats(
-                                    fixture_id=existing_fixture.id,
-                                    player_api_id=loaned.player_id,
-                                    player_name=loaned.player_name,
-                                    team_api_id=loan_team_api_id,
-                                    minutes=minutes,
-                                    position=games.get('position'),
-                                    rating=games.get('rating'),
-                                    goals=goals_block.get('total', 0) or 0,
-                                    assists=goals_block.get('assists', 0) or 0,
-                                    yellows=cards.get('yellow', 0) or 0,
-                                    reds=cards.get('red', 0) or 0,
-                                    shots_total=shots.get('total'),
-                                    shots_on=shots.get('on'),
-                                    passes_total=passes.get('total'),
-                                    passes_key=passes.get('key'),
-                                    tackles_total=tackles.get('total'),
-                                    duels_won=duels.get('won'),
-                                    duels_total=duels.get('total'),
-                                    dribbles_success=dribbles.get('success'),
-                                    saves=goals_block.get('saves'),
-                                    goals_conceded=goals_block.get('conceded'),
-                                    fouls_drawn=fouls.get('drawn'),
-                                    fouls_committed=fouls.get('committed'),
-                                    penalty_saved=penalty.get('saved'),
-                                )
-                                db.session.add(fps)
-                                player_result['synced'] += 1
-                            elif minutes and minutes > 0:
-                                player_result['synced'] += 1  # Dry run counts this
-                            else:
-                                player_result['skipped'] += 1
-                        else:
-                            player_result['skipped'] += 1
-                            
-                    except Exception as e:
-                        player_result['errors'].append(f"Fixture {fixture_id_api}: {str(e)[:50]}")
+                    synced, skipped, errors, rows = _collect_player_fixture_stats(
+                        api_client, loaned.player_id, loan_team_api_id, season, fixtures, dry_run=dry_run,
+                    )
+                    player_result['synced'] += synced
+                    player_result['skipped'] += skipped
+                    player_result['errors'].extend(error[:60] for error in errors)
+                    pending_rows.extend(rows)
                 
-                if not dry_run:
-                    db.session.commit()
+                    if len(pending_rows) >= FIXTURE_STATS_BATCH_SIZE:
+                        _write_pending()
+                    elif not dry_run:
+                        db.session.commit()
                     
-            except Exception as e:
-                player_result['errors'].append(str(e)[:100])
-                total_errors += 1
+                except Exception as e:
+                    db.session.rollback()
+                    player_result['errors'].append(str(e)[:100])
+                    total_errors += 1
             
-            total_synced += player_result['synced']
-            total_skipped += player_result['skipped']
-            results.append(player_result)
+                total_synced += player_result['synced']
+                total_skipped += player_result['skipped']
+                results.append(player_result)
             
-            if job_id and idx % 5 == 0:
-                _update_job(job_id, progress=idx + 1, current_player=f"{loaned.player_name} ({player_result['synced']} new)")
+                if job_id and idx % 5 == 0:
+                    _update_job(job_id, progress=idx + 1, current_player=f"{loaned.player_name} ({player_result['synced']} new)")
+        
+        finally:
+            # Rows collected for earlier players are written even if the loop stops early
+            _write_pending()
         
         # Update denormalized stats after syncing
         if not dry_run:
@@ -11980,21 +11262,32 @@ def admin_update_author_permission(user_id: int):
 
 
 # Unified Player Management endpoints
+_ADMIN_PLAYER_SORTS = ('player_name', 'player_id')
+
+
 @api_bp.route('/admin/players', methods=['GET'])
 @require_api_key
 def admin_list_players():
     """
-    List all players with comprehensive information, team filtering, and pagination.
+    List players (one row per player across their loans) with team filtering
+    and keyset pagination. Grouping, filtering, sorting and paging all run in
+    the database.
     Query params:
     - team_id: filter by primary or loan team
     - search: search player names
     - has_sofascore: filter by sofascore ID presence ('true', 'false', or omit for all)
-    - page: page number (default 1)
-    - page_size: items per page (default 50, max 200)
+    - sort: player_name (default) | player_id; order: asc | desc
+    - limit / page_size: items per page (default 50, max 200)
+    - cursor: ``next_cursor`` from the previous page; ``page`` still works (OFFSET)
+    - count: estimate (default) | exact | none
     """
     try:
+        try:
+            _, cursor, sort, order, count_mode = _admin_list_paging_args('player_name', _ADMIN_PLAYER_SORTS)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         page = request.args.get('page', type=int, default=1)
-        page_size = request.args.get('page_size', type=int, default=50)
+        page_size = request.args.get('limit', type=int) or request.args.get('page_size', type=int, default=50)
         if page < 1:
             page = 1
         if page_size < 1 or page_size > 200:
@@ -12004,118 +11297,104 @@ def admin_list_players():
         search_query = request.args.get('search', '').strip()
         has_sofascore_param = request.args.get('has_sofascore', '').lower()
         
-        # Get all loaned players first
-        loan_query = LoanedPlayer.query
-        
+        loan_filters = []
         # Apply team filter
         if team_id_param:
-            loan_query = loan_query.filter(
-                or_(
-                    LoanedPlayer.primary_team_id == team_id_param,
-                    LoanedPlayer.loan_team_id == team_id_param
-                )
-            )
-        
+            loan_filters.append(or_(
+                LoanedPlayer.primary_team_id == team_id_param,
+                LoanedPlayer.loan_team_id == team_id_param
+            ))
         # Apply search filter
         if search_query:
-            loan_query = loan_query.filter(LoanedPlayer.player_name.ilike(f'%{search_query}%'))
-        
-        # Get all loans
-        all_loans = loan_query.all()
-        
-        # Group by player_id
-        player_map = {}
-        for loan in all_loans:
-            if loan.player_id not in player_map:
-                # Extract season from window_key (e.g., "2024-25::summer" -> "2024-25")
-                loan_season = None
-                if loan.window_key:
-                    loan_season = loan.window_key.split('::')[0] if '::' in loan.window_key else loan.window_key
-                
-                player_map[loan.player_id] = {
-                    'player_id': loan.player_id,
-                    'player_name': loan.player_name,
-                    'primary_team_name': loan.primary_team_name,
-                    'loan_team_name': loan.loan_team_name,
-                    'primary_team_id': loan.primary_team_id,
-                    'loan_team_id': loan.loan_team_id,
-                    'is_active': loan.is_active,
-                    'loan_count': 0,
-                    'loan_id': loan.id,  # ID of the first/primary loan record for team editing
-                    'window_key': loan.window_key,  # Full window key (e.g., "2024-25::summer")
-                    'loan_season': loan_season  # Human-readable season (e.g., "2024-25")
-                }
-            player_map[loan.player_id]['loan_count'] += 1
+            loan_filters.append(LoanedPlayer.player_name.ilike(f'%{search_query}%'))
+        
+        # One row per player: the lowest loan id is the record used for team edits
+        grouped = (
+            select(
+                LoanedPlayer.player_id.label('player_id'),
+                func.min(LoanedPlayer.id).label('loan_id'),
+                func.count(LoanedPlayer.id).label('loan_count'),
+            )
+            .where(*loan_filters)
+            .group_by(LoanedPlayer.player_id)
+            .subquery()
+        )
+        display_name = func.coalesce(
+            func.nullif(func.trim(Player.name), ''),
+            func.nullif(func.trim(LoanedPlayer.player_name), ''),
+            'Player ' + func.cast(grouped.c.player_id, db.String),
+        )
+        sort_expr = func.lower(display_name) if sort == 'player_name' else grouped.c.player_id
+        descending = order == 'desc'
+        
+        stmt = (
+            select(
+                grouped.c.player_id, grouped.c.loan_id, grouped.c.loan_count,
+                display_name.label('display_name'),
+                LoanedPlayer.primary_team_name, LoanedPlayer.loan_team_name,
+                LoanedPlayer.primary_team_id, LoanedPlayer.loan_team_id,
+                LoanedPlayer.is_active, LoanedPlayer.window_key,
+                Player.sofascore_id, Player.photo_url, Player.position, Player.nationality, Player.age,
+                sort_expr.label('_sort_key'),
+            )
+            .join(LoanedPlayer, LoanedPlayer.id == grouped.c.loan_id)
+            .outerjoin(Player, Player.player_id == grouped.c.player_id)
+        )
+        # Apply sofascore filter
+        if has_sofascore_param == 'true':
+            stmt = stmt.where(Player.sofascore_id.isnot(None))
+        elif has_sofascore_param == 'false':
+            stmt = stmt.where(Player.sofascore_id.is_(None))
+        
+        total, total_is_estimate = count_rows(db.session, stmt, count_mode)
+        
+        after = after_cursor(sort_expr, grouped.c.player_id, cursor, descending)
+        stmt = stmt.order_by(*keyset_order_by(sort_expr, grouped.c.player_id, descending)).limit(page_size + 1)
+        if after is not None:
+            stmt = stmt.where(after)
+        elif page > 1:
+            stmt = stmt.offset((page - 1) * page_size)
+        rows, next_cursor = page_of(db.session.execute(stmt).all(), page_size,
+                                    lambda r: r._sort_key, lambda r: r.player_id)
         
-        # Get Player records with sofascore IDs
-        player_ids = list(player_map.keys())
-        player_records = {}
-        if player_ids:
-            try:
-                players = Player.query.filter(Player.player_id.in_(player_ids)).all()
-                player_records = {p.player_id: p for p in players}
-            except Exception as player_error:
-                logger.warning(f'Could not fetch Player records: {player_error}')
-                # Continue without player records if table doesn't exist yet
-                player_records = {}
-        
-        # Build comprehensive player list
         players_data = []
-        for player_id, player_info in player_map.items():
-            player_record = player_records.get(player_id)
-            sofascore_id = player_record.sofascore_id if player_record else None
-            display_name = ''
-            if player_record and player_record.name:
-                display_name = player_record.name.strip()
-            if not display_name:
-                display_name = (player_info.get('player_name') or '').strip()
-            if not display_name:
-                display_name = f'Player {player_id}'
-            
-            # Apply sofascore filter
-            if has_sofascore_param == 'true' and not sofascore_id:
-                continue
-            if has_sofascore_param == 'false' and sofascore_id:
-                continue
-            
-            player_data = {
-                'player_id': player_info['player_id'],
-                'player_name': display_name,
-                'primary_team_name': player_info['primary_team_name'],
-                'loan_team_name': player_info['loan_team_name'],
-                'primary_team_id': player_info['primary_team_id'],
-                'loan_team_id': player_info['loan_team_id'],
-                'is_active': player_info['is_active'],
-                'loan_count': player_info['loan_count'],
-                'window_key': player_info.get('window_key'),
-                'loan_season': player_info.get('loan_season'),
-                'loan_id': player_info['loan_id'],  # Primary loan record ID for team updates
-                'sofascore_id': sofascore_id,
-                'has_sofascore_id': bool(sofascore_id),
-                'photo_url': player_record.photo_url if player_record else None,
-                'position': player_record.position if player_record else None,
-                'nationality': player_record.nationality if player_record else None,
-                'age': player_record.age if player_record else None,
-            }
-            players_data.append(player_data)
-        
-        # Sort by name
-        players_data.sort(key=lambda x: x['player_name'].lower())
-        
-        # Paginate
-        total = len(players_data)
-        total_pages = max(1, math.ceil(total / page_size)) if total > 0 else 1
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_data = players_data[start:end]
+        for r in rows:
+            # Extract season from window_key (e.g., "2024-25::summer" -> "2024-25")
+            loan_season = None
+            if r.window_key:
+                loan_season = r.window_key.split('::')[0] if '::' in r.window_key else r.window_key
+            players_data.append({
+                'player_id': r.player_id,
+                'player_name': r.display_name,
+                'primary_team_name': r.primary_team_name,
+                'loan_team_name': r.loan_team_name,
+                'primary_team_id': r.primary_team_id,
+                'loan_team_id': r.loan_team_id,
+                'is_active': r.is_active,
+                'loan_count': r.loan_count,
+                'window_key': r.window_key,
+                'loan_season': loan_season,
+                'loan_id': r.loan_id,  # Primary loan record ID for team updates
+                'sofascore_id': r.sofascore_id,
+                'has_sofascore_id': bool(r.sofascore_id),
+                'photo_url': r.photo_url,
+                'position': r.position,
+                'nationality': r.nationality,
+                'age': r.age,
+            })
         
+        total_pages = max(1, math.ceil(total / page_size)) if total else 1
         return jsonify({
-            'items': paginated_data,
+            'items': players_data,
             'page': page,
             'page_size': page_size,
+            'next_cursor': next_cursor,
             'total': total,
+            'total_is_estimate': total_is_estimate,
             'total_pages': total_pages
         })
+    except CursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.exception('admin_list_players failed')
         return jsonify(_safe_error_payload(e, 'An unexpected error occurred. Please try again later.')), 500
@@ -12737,43 +12016,16 @@ def admin_delete_supplemental_loan(loan_id: int):
 
 
 # --- Admin: Dashboard Stats ---
+def _wants_refresh() -> bool:
+    return request.args.get('refresh', '').strip().lower() in ('1', 'true', 'yes')
+
+
 @api_bp.route('/admin/dashboard-stats', methods=['GET'])
 @require_api_key
 def admin_dashboard_stats():
-    """Get overview stats for the admin dashboard."""
+    """Get overview stats for the admin dashboard; ``refresh=1`` rebuilds them."""
     try:
-        # Player stats from TrackedPlayer
-        total_players = TrackedPlayer.query.filter_by(is_active=True).count()
-        academy_count = TrackedPlayer.query.filter_by(is_active=True, status='academy').count()
-        on_loan_count = TrackedPlayer.query.filter_by(is_active=True, status='on_loan').count()
-        first_team_count = TrackedPlayer.query.filter_by(is_active=True, status='first_team').count()
-        released_count = TrackedPlayer.query.filter_by(is_active=True, status='released').count()
-
-        # Team stats
-        tracked_teams = Team.query.filter_by(is_tracked=True).count()
-
-        # Newsletter stats
-        total_newsletters = Newsletter.query.count()
-        published_newsletters = Newsletter.query.filter_by(published=True).count()
-        draft_newsletters = total_newsletters - published_newsletters
-
-        return jsonify({
-            'players': {
-                'total': total_players,
-                'academy': academy_count,
-                'on_loan': on_loan_count,
-                'first_team': first_team_count,
-                'released': released_count,
-            },
-            'teams': {
-                'tracked': tracked_teams,
-            },
-            'newsletters': {
-                'total': total_newsletters,
-                'published': published_newsletters,
-                'drafts': draft_newsletters,
-            },
-        })
+        return jsonify(snapshot_payload(get_snapshot('dashboard', rebuild=_wants_refresh())))
     except Exception as e:
         logger.exception('admin_dashboard_stats failed')
         return jsonify(_safe_error_payload(e, 'Failed to fetch dashboard stats')), 500
@@ -12783,7 +12035,7 @@ def admin_dashboard_stats():
 @api_bp.route('/admin/subscriber-stats', methods=['GET'])
 @require_api_key
 def admin_subscriber_stats():
-    """Get subscriber statistics aggregated by team."""
+    """Get subscriber statistics aggregated by team; ``refresh=1`` rebuilds them."""
     request_id = request.headers.get('X-Debug-Request-ID') or uuid4().hex[:12]
     started_at = time.monotonic()
     try:
@@ -12798,87 +12050,17 @@ def admin_subscriber_stats():
             sort_order,
         )
         
-        # Query for teams with their subscriber counts
-        from sqlalchemy import func
-        
-        # Subquery to get the latest season for each team_id
-        latest_season_subq = db.session.query(
-            Team.team_id,
-            func.max(Team.season).label('latest_season')
-        ).group_by(Team.team_id).subquery()
-        
-        # Subquery to aggregate subscriptions by team_id (API team ID) across all seasons
-        # This ensures we count all subscriptions for a team regardless of which season's team record they're linked to
-        subscription_agg_subq = db.session.query(
-            Team.team_id,
-            func.count(UserSubscription.id).label('subscriber_count'),
-            func.count(db.case((UserSubscription.active == True, 1))).label('active_subscriber_count')
-        ).join(
-            UserSubscription, Team.id == UserSubscription.team_id
-        ).group_by(Team.team_id).subquery()
-        
-        # Subquery to get latest newsletter date by team_id
-        newsletter_agg_subq = db.session.query(
-            Team.team_id,
-            func.max(Newsletter.published_date).label('latest_newsletter_date')
-        ).join(
-            Newsletter, Team.id == Newsletter.team_id
-        ).group_by(Team.team_id).subquery()
-        
-        # Main query: get latest season team records and join with aggregated subscription data
-        query = db.session.query(
-            Team,
-            func.coalesce(subscription_agg_subq.c.subscriber_count, 0).label('subscriber_count'),
-            func.coalesce(subscription_agg_subq.c.active_subscriber_count, 0).label('active_subscriber_count'),
-            newsletter_agg_subq.c.latest_newsletter_date.label('latest_newsletter_date')
-        ).join(
-            latest_season_subq,
-            db.and_(
-                Team.team_id == latest_season_subq.c.team_id,
-                Team.season == latest_season_subq.c.latest_season
-            )
-        ).outerjoin(
-            subscription_agg_subq, Team.team_id == subscription_agg_subq.c.team_id
-        ).outerjoin(
-            newsletter_agg_subq, Team.team_id == newsletter_agg_subq.c.team_id
-        )
-        
-        # Apply search filter
+        snapshot = snapshot_payload(get_snapshot('subscribers', rebuild=_wants_refresh()))
+        teams_data = snapshot['teams']
         if search:
-            query = query.filter(Team.name.ilike(f'%{search}%'))
-        
-        # Execute query
-        results = query.all()
-        
-        # Filter by minimum subscribers if specified
+            needle = search.lower()
+            teams_data = [t for t in teams_data if needle in (t['name'] or '').lower()]
         if min_subs is not None:
-            results = [r for r in results if r.subscriber_count >= min_subs]
-        
-        # Sort by subscriber count
+            teams_data = [t for t in teams_data if t['subscriber_count'] >= min_subs]
+        # The snapshot is stored most subscribed first
         if sort_order == 'asc':
-            results.sort(key=lambda r: r.subscriber_count)
-        else:
-            results.sort(key=lambda r: r.subscriber_count, reverse=True)
-        
-        # Format response
-        teams_data = []
-        for team, sub_count, active_sub_count, latest_date in results:
-            teams_data.append({
-                'id': team.id,
-                'team_id': team.team_id,
-                'name': team.name,
-                'logo': team.logo,
-                'season': team.season,
-                'subscriber_count': sub_count,
-                'active_subscriber_count': active_sub_count,
-                'newsletters_active': team.newsletters_active,
-                'latest_newsletter_date': latest_date.isoformat() if latest_date else None
-            })
-        
-        # Calculate total unique subscribers
-        total_subscribers = db.session.query(
-            func.count(func.distinct(UserSubscription.email))
-        ).filter(UserSubscription.active == True).scalar() or 0
+            teams_data.sort(key=lambda t: t['subscriber_count'])
+        total_subscribers = snapshot['total_subscribers']
 
         duration_ms = (time.monotonic() - started_at) * 1000
         logger.info(
@@ -12892,6 +12074,7 @@ def admin_subscriber_stats():
         payload = {
             'teams': teams_data,
             'total_subscribers': total_subscribers,
+            'as_of': snapshot['as_of'],
             'request_id': request_id,
         }
         response = jsonify(payload)
@@ -13323,92 +12506,12 @@ def get_player_journey_map(player_id: int):
     - sync: bool - Trigger sync if journey doesn't exist (default: false)
     """
     try:
-        from src.models.journey import PlayerJourney, ClubLocation
-
-        should_sync = request.args.get('sync', 'false').lower() == 'true'
-
-        journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
-
-        if not journey and should_sync:
-            from src.services.journey_sync import JourneySyncService
-            service = JourneySyncService()
-            journey = service.sync_player(player_id)
-
-        if not journey:
-            # Fallback: build a minimal journey from TrackedPlayer if available
-            tracked = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
-            if tracked and tracked.team:
-                map_data = {
-                    'player_api_id': player_id,
-                    'player_name': tracked.player_name,
-                    'player_photo': tracked.photo_url,
-                    'stops': [{
-                        'club_id': tracked.team.team_id,
-                        'club_name': tracked.team.name,
-                        'club_logo': tracked.team.logo,
-                        'years': str(datetime.now().year),
-                        'levels': [tracked.current_level or tracked.status or 'Academy'],
-                        'entry_types': ['academy'],
-                        'total_apps': 0,
-                        'total_goals': 0,
-                        'total_assists': 0,
-                        'breakdown': {},
-                        'competitions': [],
-                        'lat': None,
-                        'lng': None,
-                    }],
-                    'path': [],
-                    'source': 'tracked-player',
-                }
-                # Add loan club stop if on loan
-                if tracked.loan_club_api_id:
-                    loan_team = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
-                    if loan_team:
-                        map_data['stops'].append({
-                            'club_id': tracked.loan_club_api_id,
-                            'club_name': tracked.loan_club_name or loan_team.name,
-                            'club_logo': loan_team.logo,
-                            'years': str(datetime.now().year),
-                            'levels': ['First Team'],
-                            'entry_types': ['loan'],
-                            'total_apps': 0,
-                            'total_goals': 0,
-                            'total_assists': 0,
-                            'breakdown': {},
-                            'competitions': [],
-                            'lat': None,
-                            'lng': None,
-                        })
-                return jsonify(map_data)
+        map_data = player_sections.player_journey_map(
+            player_id, sync=request.args.get('sync', 'false').lower() == 'true',
+        )
+        if map_data is None:
             return jsonify({'error': 'Journey not found', 'player_id': player_id}), 404
-
-        map_data = journey.to_map_dict()
-        
-        # Add coordinates for each stop
-        club_ids = [stop['club_id'] for stop in map_data['stops']]
-        locations = ClubLocation.query.filter(ClubLocation.club_api_id.in_(club_ids)).all()
-        location_map = {loc.club_api_id: loc for loc in locations}
-        
-        for stop in map_data['stops']:
-            loc = location_map.get(stop['club_id'])
-            if loc:
-                stop['lat'] = loc.latitude
-                stop['lng'] = loc.longitude
-                stop['city'] = loc.city
-                stop['country'] = loc.country
-            else:
-                stop['lat'] = None
-                stop['lng'] = None
-        
-        # Build path (ordered list of coordinates)
-        map_data['path'] = [
-            [stop['lat'], stop['lng']]
-            for stop in map_data['stops']
-            if stop.get('lat') and stop.get('lng')
-        ]
-        
         return jsonify(map_data)
-        
     except Exception as e:
         logger.exception(f'Failed to get journey map for player {player_id}')
         return jsonify(_safe_error_payload(e, 'Failed to get player journey map')), 500
@@ -13615,10 +12718,16 @@ def admin_api_usage():
 @api_bp.route('/admin/api-cache/stats', methods=['GET'])
 @require_api_key
 def admin_api_cache_stats():
-    """Return cache stats: entry counts by endpoint, oldest/newest entries."""
+    """Return cache stats: entry counts by endpoint, oldest/newest entries.
+
+    ``clients`` lists this process's shared API clients: handshake age and
+    in-memory cache sizes.
+    """
     try:
+        from src.api_football_client import get_api_client_stats
         from src.models.api_cache import APICache
         stats = APICache.stats()
+        stats['clients'] = get_api_client_stats()
         return jsonify(stats)
     except Exception as e:
         logger.exception('admin_api_cache_stats failed')
@@ -13652,8 +12761,8 @@ def admin_search_api_players():
         return jsonify({'results': []})
     season = request.args.get('season', type=int)
     try:
-        from src.api_football_client import APIFootballClient
-        api = APIFootballClient()
+        from src.api_football_client import get_api_client
+        api = get_api_client()
         raw = api.search_player_profiles(query, season=season)
         results = []
         for item in raw[:20]:
@@ -13693,7 +12802,7 @@ def admin_test_classify():
     try:
         from src.models.journey import PlayerJourney, PlayerJourneyEntry
         from src.services.journey_sync import JourneySyncService
-        from src.api_football_client import APIFootballClient
+        from src.api_football_client import get_api_client
         service = JourneySyncService()
         journey = service.sync_player(player_api_id, force_full=force_sync)
         if not journey:
@@ -13711,7 +12820,7 @@ def admin_test_classify():
             parent_ids = journey.academy_club_ids or []
 
         # Fetch transfers for upgrade check
-        api = APIFootballClient()
+        api = get_api_client()
         raw_transfers = api.get_player_transfers(player_api_id)
         transfers = flatten_transfers(raw_transfers)
 
@@ -13984,138 +13093,59 @@ def admin_delete_tracked_player(player_id):
         return jsonify(_safe_error_payload(e, 'Failed to delete tracked player')), 500
 
 
+def _run_refresh_statuses_job(job_id, team_id=None, resync_journeys=False):
+    """Job handler body: re-derive TrackedPlayer statuses."""
+    from src.utils.background_jobs import update_job, is_job_cancelled
+    from src.services.tracked_status_refresh import (
+        RefreshCancelled, TrackedStatusRefreshService,
+    )
+    try:
+        return TrackedStatusRefreshService().refresh(
+            team_id=team_id,
+            resync_journeys=resync_journeys,
+            progress_fn=lambda **kw: update_job(job_id, **kw),
+            cancel_fn=lambda: is_job_cancelled(job_id),
+        )
+    except RefreshCancelled as cancelled:
+        raise InterruptedError(str(cancelled)) from cancelled
+
+
 @api_bp.route('/admin/tracked-players/refresh-statuses', methods=['POST'])
 @require_api_key
 def admin_refresh_tracked_player_statuses():
     """Re-derive status/loan fields for TrackedPlayers using the academy classifier.
 
-    Body: { team_id?: int, resync_journeys?: bool } — if omitted, refreshes all active TrackedPlayers.
+    Body: { team_id?: int, resync_journeys?: bool, background?: bool }
+    — if team_id is omitted, refreshes all active TrackedPlayers.
     When resync_journeys is true, re-syncs each player's journey data from API-Football
     before re-deriving statuses (fixes stale current_club data).
+
+    Runs as a background job by default and returns its job_id; pass
+    background=false to run inline and get the result directly.
     """
     try:
         data = request.get_json(force=True) or {}
         team_id = data.get('team_id')
-        resync_journeys = data.get('resync_journeys', False)
-
-        from src.models.journey import PlayerJourney
-
-        query = TrackedPlayer.query.filter_by(is_active=True)
-        if team_id:
-            query = query.filter_by(team_id=team_id)
-
-        players = query.all()
-        updated = 0
-        journeys_resynced = 0
-
-        # Optionally re-sync journeys first to refresh current_club data
-        journey_svc = None
-        if resync_journeys:
-            from src.services.journey_sync import JourneySyncService
-            journey_svc = JourneySyncService()
-
-        # Batch pre-fetch transfers for all players to avoid per-player API calls
-        from src.api_football_client import APIFootballClient
-        api_client = APIFootballClient()
-        player_api_ids = [tp.player_api_id for tp in players if tp.player_api_id]
-        raw_transfers_map = api_client.batch_get_player_transfers(player_api_ids)
-        transfers_map = {
-            pid: flatten_transfers(raw)
-            for pid, raw in raw_transfers_map.items()
-        }
-
-        # Batch pre-fetch squads for loan clubs + parent clubs
-        squad_members_by_club = {}
-        loan_club_ids = {tp.loan_club_api_id for tp in players if tp.loan_club_api_id}
-        parent_club_ids = set()
-        _team_cache = {}
-        for tp in players:
-            if tp.team_id not in _team_cache:
-                _team_cache[tp.team_id] = Team.query.get(tp.team_id)
-            pt = _team_cache[tp.team_id]
-            if pt:
-                parent_club_ids.add(pt.team_id)
-        for club_id in (loan_club_ids | parent_club_ids):
-            try:
-                squad = api_client.get_team_players(club_id)
-                squad_members_by_club[club_id] = {
-                    int(e['player']['id']) for e in squad
-                    if e and e.get('player', {}).get('id')
-                }
-            except Exception as exc:
-                logger.warning('Squad fetch failed for club %d: %s', club_id, exc)
-
-        for tp in players:
-            journey = None
-
-            # Re-sync the journey from API-Football if requested
-            if resync_journeys and journey_svc and tp.player_api_id:
-                try:
-                    journey = journey_svc.sync_player(tp.player_api_id, force_full=True)
-                    if journey:
-                        journeys_resynced += 1
-                        # Link journey if not already linked
-                        if not tp.journey_id and journey:
-                            tp.journey_id = journey.id
-                except Exception as sync_err:
-                    logger.warning(
-                        'refresh-statuses: journey resync failed for player %d: %s',
-                        tp.player_api_id, sync_err,
-                    )
-
-            if not journey:
-                if tp.journey_id:
-                    journey = db.session.get(PlayerJourney, tp.journey_id)
-                if not journey:
-                    journey = PlayerJourney.query.filter_by(
-                        player_api_id=tp.player_api_id
-                    ).first()
+        resync_journeys = bool(data.get('resync_journeys', False))
+        background = data.get('background', True)
 
-            if not journey:
-                continue
-
-            # Look up the parent club name from the team row
-            parent_team = Team.query.get(tp.team_id)
-            if not parent_team:
-                continue
-
-            new_status, new_loan_id, new_loan_name = classify_tracked_player(
-                current_club_api_id=journey.current_club_api_id,
-                current_club_name=journey.current_club_name,
-                current_level=journey.current_level,
-                parent_api_id=parent_team.team_id,
-                parent_club_name=parent_team.name,
-                transfers=transfers_map.get(tp.player_api_id),
-                player_api_id=tp.player_api_id,
-                api_client=api_client,
-                latest_season=_get_latest_season(journey.id, parent_api_id=parent_team.team_id, parent_club_name=parent_team.name),
-                squad_members_by_club=squad_members_by_club,
+        if not background:
+            from src.services.tracked_status_refresh import TrackedStatusRefreshService
+            result = TrackedStatusRefreshService().refresh(
+                team_id=team_id, resync_journeys=resync_journeys,
             )
+            return jsonify(result)
 
-            changed = False
-            if tp.status != new_status:
-                tp.status = new_status
-                changed = True
-            if tp.loan_club_api_id != new_loan_id:
-                tp.loan_club_api_id = new_loan_id
-                changed = True
-            if tp.loan_club_name != new_loan_name:
-                tp.loan_club_name = new_loan_name
-                changed = True
-            if journey.current_level and tp.current_level != journey.current_level:
-                tp.current_level = journey.current_level
-                changed = True
-            if changed:
-                updated += 1
+        job_id = enqueue_job('refresh_statuses', {
+            'team_id': team_id, 'resync_journeys': resync_journeys,
+        })
 
-        db.session.commit()
-        result = {
-            'total': len(players),
-            'updated': updated,
-        }
-        if resync_journeys:
-            result['journeys_resynced'] = journeys_resynced
-        return jsonify(result)
+        return jsonify({
+            'message': 'Status refresh queued',
+            'job_id': job_id,
+            'status': 'queued',
+            'check_status_url': f'/api/admin/jobs/{job_id}',
+        }), 202
     except Exception as e:
         db.session.rollback()
         logger.exception('admin_refresh_tracked_player_statuses failed')
@@ -14133,7 +13163,7 @@ def _seed_single_team(team, max_age=30, sync_journeys=True, years=4, season=None
     from sqlalchemy import cast
     from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
 
-    _api = APIFootballClient()
+    _api = get_api_client()
     if season is None:
         season = _api.current_season_start_year
 
@@ -14360,125 +13390,56 @@ def _seed_single_team(team, max_age=30, sync_journeys=True, years=4, season=None
 
 # ── Background seed workers ──
 
-def _run_seed_team_process(job_id, team_id, max_age=30, sync_journeys=True, years=4):
-    """Background worker: seed TrackedPlayers for one team."""
-    import signal
-    import sys
-    logging.basicConfig(
-        stream=sys.stderr, level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', force=True,
-    )
-    from src.main import app
-
-    def _sigterm_handler(signum, frame):
-        try:
-            with app.app_context():
-                from src.utils.background_jobs import update_job as _upd
-                _upd(job_id, status='failed',
-                     error='Process terminated (SIGTERM)',
-                     completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception:
-            pass
-        sys.exit(1)
+def _run_seed_team_job(job_id, team_id, max_age=30, sync_journeys=True, years=4):
+    """Job handler body: seed TrackedPlayers for one team."""
+    from src.utils.background_jobs import update_job
+    team = Team.query.get(team_id)
+    if not team:
+        raise ValueError(f'Team {team_id} not found')
+    update_job(job_id, progress=0, total=1, current_player=f'Seeding {team.name}...')
+    result = _seed_single_team(team, max_age=max_age,
+                               sync_journeys=sync_journeys, years=years)
+    update_job(job_id, progress=1, total=1)
+    return result
 
-    signal.signal(signal.SIGTERM, _sigterm_handler)
 
-    with app.app_context():
-        from src.utils.background_jobs import update_job
-        try:
-            team = Team.query.get(team_id)
-            if not team:
-                update_job(job_id, status='failed', error=f'Team {team_id} not found',
-                           completed_at=datetime.now(timezone.utc).isoformat())
-                return
-            update_job(job_id, status='running', progress=0, total=1,
-                       current_player=f'Seeding {team.name}...')
-            result = _seed_single_team(team, max_age=max_age,
-                                       sync_journeys=sync_journeys, years=years)
-            update_job(job_id, status='completed', progress=1, total=1,
-                       results=result,
+def _run_seed_all_tracked_job(job_id, max_age=30, sync_journeys=True, years=4):
+    """Job handler body: seed all tracked teams that have no TrackedPlayers."""
+    from src.utils.background_jobs import update_job, is_job_cancelled
+    teams = Team.query.filter_by(is_tracked=True, is_active=True).all()
+    empty_teams = [t for t in teams
+                   if TrackedPlayer.query.filter_by(team_id=t.id, is_active=True).count() == 0]
+    update_job(job_id, progress=0, total=len(empty_teams))
+    results = {'teams': {}, 'errors': []}
+    for i, team in enumerate(empty_teams):
+        if is_job_cancelled(job_id):
+            update_job(job_id, status='cancelled',
+                       error=f'Cancelled after {i}/{len(empty_teams)} teams',
+                       results=results,
                        completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception as e:
-            logger.exception('Background seed for team %s failed', team_id)
-            db.session.rollback()
-            update_job(job_id, status='failed', error=str(e),
-                       completed_at=datetime.now(timezone.utc).isoformat())
-
-
-def _run_seed_all_tracked_process(job_id, max_age=30, sync_journeys=True, years=4):
-    """Background worker: seed all tracked teams that have no TrackedPlayers."""
-    import signal
-    import sys
-    logging.basicConfig(
-        stream=sys.stderr, level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', force=True,
-    )
-    from src.main import app
-
-    def _sigterm_handler(signum, frame):
+            return results
+        update_job(job_id, progress=i, total=len(empty_teams),
+                   current_player=f'Seeding {team.name}...')
         try:
-            with app.app_context():
-                from src.utils.background_jobs import update_job as _upd
-                _upd(job_id, status='failed',
-                     error='Process terminated (SIGTERM)',
-                     completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception:
-            pass
-        sys.exit(1)
-
-    signal.signal(signal.SIGTERM, _sigterm_handler)
-
-    with app.app_context():
-        from src.utils.background_jobs import update_job, is_job_cancelled
-        try:
-            teams = Team.query.filter_by(is_tracked=True, is_active=True).all()
-            empty_teams = [t for t in teams
-                           if TrackedPlayer.query.filter_by(team_id=t.id, is_active=True).count() == 0]
-            update_job(job_id, status='running', progress=0, total=len(empty_teams))
-            results = {'teams': {}, 'errors': []}
-            for i, team in enumerate(empty_teams):
-                if is_job_cancelled(job_id):
-                    update_job(job_id, status='cancelled',
-                               error=f'Cancelled after {i}/{len(empty_teams)} teams',
-                               results=results,
-                               completed_at=datetime.now(timezone.utc).isoformat())
-                    return
-                update_job(job_id, progress=i, total=len(empty_teams),
-                           current_player=f'Seeding {team.name}...')
-                try:
-                    team_result = _seed_single_team(team, max_age=max_age,
-                                                     sync_journeys=sync_journeys, years=years)
-                    results['teams'][team.name] = {
-                        'created': team_result.get('created', 0),
-                        'skipped': team_result.get('skipped', 0),
-                        'candidates': team_result.get('candidates_found', 0),
-                    }
-                except Exception as team_err:
-                    logger.warning('seed_all_tracked: failed for %s: %s', team.name, team_err)
-                    results['errors'].append(f'{team.name}: {team_err}')
-            update_job(job_id, status='completed', progress=len(empty_teams),
-                       total=len(empty_teams), results=results,
-                       completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception as e:
-            logger.exception('Background seed-all-tracked failed')
-            db.session.rollback()
-            update_job(job_id, status='failed', error=str(e),
-                       completed_at=datetime.now(timezone.utc).isoformat())
+            team_result = _seed_single_team(team, max_age=max_age,
+                                             sync_journeys=sync_journeys, years=years)
+            results['teams'][team.name] = {
+                'created': team_result.get('created', 0),
+                'skipped': team_result.get('skipped', 0),
+                'candidates': team_result.get('candidates_found', 0),
+            }
+        except Exception as team_err:
+            logger.warning('seed_all_tracked: failed for %s: %s', team.name, team_err)
+            results['errors'].append(f'{team.name}: {team_err}')
+    update_job(job_id, progress=len(empty_teams), total=len(empty_teams))
+    return results
 
 
 def _start_background_seed(team_id, max_age=30, sync_journeys=True, years=4):
-    """Launch a background process to seed TrackedPlayers for a team. Returns job_id."""
-    import multiprocessing
-    job_id = _create_background_job('seed_team')
-    p = multiprocessing.Process(
-        target=_run_seed_team_process,
-        args=(job_id, team_id),
-        kwargs={'max_age': max_age, 'sync_journeys': sync_journeys, 'years': years},
-        daemon=False,
-    )
-    p.start()
-    multiprocessing.process._children.discard(p)
-    return job_id
+    """Queue a job to seed TrackedPlayers for a team. Returns job_id."""
+    return enqueue_job('seed_team', {
+        'team_id': team_id, 'max_age': max_age, 'sync_journeys': sync_journeys, 'years': years,
+    })
 
 
 @api_bp.route('/admin/tracked-players/seed-team', methods=['POST'])
@@ -14530,7 +13491,6 @@ def admin_seed_all_tracked():
     Body (all optional): { max_age?: int, sync_journeys?: bool, years?: int }
     """
     try:
-        import multiprocessing
         data = request.get_json(force=True) if request.data else {}
         max_age = data.get('max_age', 30)
         sync_journeys = data.get('sync_journeys', True)
@@ -14548,15 +13508,9 @@ def admin_seed_all_tracked():
                 'empty_teams': 0,
             })
 
-        job_id = _create_background_job('seed_all_tracked')
-        p = multiprocessing.Process(
-            target=_run_seed_all_tracked_process,
-            args=(job_id,),
-            kwargs={'max_age': max_age, 'sync_journeys': sync_journeys, 'years': years},
-            daemon=False,
-        )
-        p.start()
-        multiprocessing.process._children.discard(p)
+        job_id = enqueue_job('seed_all_tracked', {
+            'max_age': max_age, 'sync_journeys': sync_journeys, 'years': years,
+        })
 
         return jsonify({
             'message': f'Background seed started for {len(empty_teams)} teams',
@@ -8,12 +8,15 @@ Handles:
 from flask import Blueprint, request, jsonify
 from src.models.league import db, RebuildConfig, RebuildConfigLog
 from src.models.cohort import AcademyCohort, CohortMember
-from src.models.journey import PlayerJourney
 from src.routes.api import require_api_key
 from src.services.cohort_service import CohortService
-from src.utils.background_jobs import create_background_job, update_job, get_job
+from src.services.cohort_analytics import (
+    derive_member_statuses,
+    get_analytics_snapshot,
+    refresh_cohort_aggregates,
+)
+from src.utils.job_queue import enqueue_job
 from datetime import datetime, timezone
-import multiprocessing
 import json
 import logging
 
@@ -65,28 +68,17 @@ def admin_seed_big6():
 
     Body (all optional): {seasons: [], team_ids: [], league_ids: []}
     """
-    from src.utils.rebuild_runner import run_rebuild_process
-
     data = request.get_json() or {}
     seasons = data.get('seasons')
     team_ids = data.get('team_ids')
     league_ids = data.get('league_ids')
 
-    job_id = create_background_job('seed_big6')
-
-    p = multiprocessing.Process(
-        target=run_rebuild_process,
-        args=(job_id, 'seed_big6', {'seasons': seasons, 'team_ids': team_ids, 'league_ids': league_ids}),
-        daemon=False,
-    )
-    p.start()
-    # Detach: prevent parent's atexit handler from blocking on join()
-    multiprocessing.process._children.discard(p)
+    job_id = enqueue_job('seed_big6', {'seasons': seasons, 'team_ids': team_ids, 'league_ids': league_ids})
 
     return jsonify({
-        'message': 'Big 6 seeding started in background',
+        'message': 'Big 6 seeding queued',
         'job_id': job_id,
-        'status': 'running',
+        'status': 'queued',
         'check_status_url': f'/api/admin/jobs/{job_id}'
     }), 202
 
@@ -165,52 +157,20 @@ def admin_re_derive_statuses():
     data = request.get_json() or {}
     target_cohort_ids = data.get('cohort_ids')
 
-    service = CohortService()
-    current_year = datetime.now().year
-
-    query = CohortMember.query.filter(CohortMember.journey_synced == True)
+    query = db.session.query(CohortMember.cohort_id).filter(CohortMember.journey_synced == True)
     if target_cohort_ids:
         query = query.filter(CohortMember.cohort_id.in_(target_cohort_ids))
+    members_checked = query.count()
 
-    members = query.all()
-    updated = 0
     errors = []
-
-    for member in members:
-        try:
-            if not member.journey_id:
-                continue
-
-            journey = db.session.get(PlayerJourney, member.journey_id)
-            if not journey:
-                continue
-
-            cohort = db.session.get(AcademyCohort, member.cohort_id)
-            if not cohort:
-                continue
-
-            new_status = CohortService._derive_status(
-                journey, current_year,
-                parent_api_id=cohort.team_api_id,
-                parent_club_name=cohort.team_name or '',
-            )
-
-            if member.current_status != new_status:
-                member.current_status = new_status
-                updated += 1
-
-        except Exception as e:
-            errors.append(f"Player {member.player_api_id}: {e}")
-
-    db.session.commit()
+    updated = derive_member_statuses(target_cohort_ids or None, errors=errors)
 
     # Refresh stats for affected cohorts
-    affected_cohort_ids = target_cohort_ids or list(set(m.cohort_id for m in members))
-    for cid in affected_cohort_ids:
-        service.refresh_cohort_stats(cid)
+    affected_cohort_ids = target_cohort_ids or [cid for (cid,) in query.distinct().all()]
+    refresh_cohort_aggregates(affected_cohort_ids)
 
     return jsonify({
-        'members_checked': len(members),
+        'members_checked': members_checked,
         'statuses_updated': updated,
         'cohorts_refreshed': len(affected_cohort_ids),
         'errors': errors[:20],
@@ -290,58 +250,8 @@ def cohort_teams():
 
 @cohort_bp.route('/cohorts/analytics', methods=['GET'])
 def cohort_analytics():
-    """Cross-club comparison analytics."""
-    from src.models.league import TeamProfile
-
-    cohorts = AcademyCohort.query.filter(
-        AcademyCohort.sync_status.in_(('complete', 'partial', 'seeded')),
-        AcademyCohort.total_players > 0,
-    ).all()
-
-    # Build logo lookup from TeamProfile
-    team_ids = list(set(c.team_api_id for c in cohorts))
-    profiles = {p.team_id: p.logo_url for p in
-                TeamProfile.query.filter(TeamProfile.team_id.in_(team_ids)).all()}
-
-    # Group by team
-    team_data = {}
-    for c in cohorts:
-        tid = c.team_api_id
-        if tid not in team_data:
-            team_data[tid] = {
-                'team_api_id': tid,
-                'team_name': c.team_name,
-                'team_logo': profiles.get(tid),
-                'total_players': 0,
-                'players_first_team': 0,
-                'players_on_loan': 0,
-                'players_still_academy': 0,
-                'players_released': 0,
-                'cohort_count': 0,
-                'seasons': [],
-            }
-
-        td = team_data[tid]
-        td['total_players'] += c.total_players
-        td['players_first_team'] += c.players_first_team
-        td['players_on_loan'] += c.players_on_loan
-        td['players_still_academy'] += c.players_still_academy
-        td['players_released'] += c.players_released
-        td['cohort_count'] += 1
-        if c.season not in td['seasons']:
-            td['seasons'].append(c.season)
-
-    # Calculate conversion rates
-    analytics = []
-    for td in team_data.values():
-        total = td['total_players']
-        td['conversion_rate'] = round(td['players_first_team'] / total * 100, 1) if total > 0 else 0
-        td['seasons'] = sorted(td['seasons'])
-        analytics.append(td)
-
-    analytics.sort(key=lambda x: x['conversion_rate'], reverse=True)
-
-    return jsonify({'analytics': analytics})
+    """Cross-club comparison analytics (served from a cached snapshot)."""
+    return jsonify(get_analytics_snapshot())
 
 
 # =============================================================================
@@ -370,7 +280,6 @@ def admin_full_rebuild():
       skip_cohorts: bool (default: false)
     """
     from src.services.big6_seeding_service import BIG_6, SEASONS
-    from src.utils.rebuild_runner import run_rebuild_process
 
     data = request.get_json() or {}
 
@@ -408,8 +317,6 @@ def admin_full_rebuild():
                         team_ids.append(t.team_id)
                         seen.add(t.team_id)
 
-    job_id = create_background_job('full_rebuild')
-
     # Merge rebuild config params into the job kwargs
     job_config = {
         'team_ids': team_ids,
@@ -426,19 +333,12 @@ def admin_full_rebuild():
         'config_id': config_id_used,
     }
 
-    p = multiprocessing.Process(
-        target=run_rebuild_process,
-        args=(job_id, 'full_rebuild', job_config),
-        daemon=False,
-    )
-    p.start()
-    # Detach: prevent parent's atexit handler from blocking on join()
-    multiprocessing.process._children.discard(p)
+    job_id = enqueue_job('full_rebuild', job_config)
 
     return jsonify({
-        'message': 'Full academy rebuild started in background',
+        'message': 'Full academy rebuild queued',
         'job_id': job_id,
-        'status': 'running',
+        'status': 'queued',
         'check_status_url': f'/api/admin/jobs/{job_id}',
         'config': job_config,
     }), 202
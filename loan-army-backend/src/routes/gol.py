@@ -1,8 +1,10 @@
 """GOL Assistant API endpoints.
 
-Provides SSE streaming chat endpoint and conversation suggestions.
+Provides SSE streaming chat endpoint, conversation suggestions and admin
+visibility into the analytics DataFrame cache.
 """
-from flask import Blueprint, request, Response, jsonify, stream_with_context
+from flask import Blueprint, current_app, request, Response, jsonify, stream_with_context
+from src.auth import require_api_key
 from src.extensions import limiter
 import json
 import logging
@@ -71,3 +73,26 @@ def gol_suggestions():
             "Who are the top-performing loan players this season?",
             "Tell me about Chelsea's academy pipeline",
         ]})
+
+
+@gol_bp.route('/admin/gol/cache', methods=['GET'])
+@require_api_key
+def gol_cache_status():
+    """Snapshot version, age, last refresh mode and per-frame rows/timings."""
+    from src.services.gol_dataframes import DataFrameCache
+    return jsonify(DataFrameCache.shared().status())
+
+
+@gol_bp.route('/admin/gol/cache/refresh', methods=['POST'])
+@require_api_key
+def gol_cache_refresh():
+    """Refresh the DataFrame cache now. Body: {full: bool} forces a full reload."""
+    from src.services.gol_dataframes import DataFrameCache
+    data = request.get_json(silent=True) or {}
+    cache = DataFrameCache.shared()
+    try:
+        cache.refresh(current_app._get_current_object(), force_full=bool(data.get('full')))
+    except Exception as e:
+        logger.error(f"GOL cache refresh failed: {e}")
+        return jsonify({'error': 'Cache refresh failed'}), 500
+    return jsonify(cache.status())
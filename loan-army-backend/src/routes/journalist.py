@@ -5,6 +5,7 @@ from src.models.league import (
     Team, LoanedPlayer, Player, ManualPlayerSubmission, ContributorProfile
 )
 from src.routes.api import require_user_auth, _safe_error_payload, require_api_key, _ensure_user_account, issue_user_token
+from src.services.fixture_stats import load_fixture_payloads
 from src.utils.team_utils import normalize_team_name, get_all_team_name_variations
 from datetime import datetime, timezone, timedelta
 from itsdangerous import URLSafeTimedSerializer
@@ -2380,7 +2381,7 @@ def get_player_stats(player_id):
         # Import models here to avoid circular imports if any
         from src.models.weekly import FixturePlayerStats, Fixture
         from src.models.league import Team, LoanedPlayer
-        from src.api_football_client import APIFootballClient
+        from src.api_football_client import get_api_client
         from src.routes.api import resolve_team_name_and_logo, _sync_player_club_fixtures
         from datetime import datetime, timezone
         
@@ -2406,7 +2407,7 @@ def get_player_stats(player_id):
                     ).count()
                     
                     # Check API for total appearances
-                    api_client = APIFootballClient()
+                    api_client = get_api_client()
                     api_totals = api_client._fetch_player_team_season_totals_api(
                         player_id=player_id,
                         team_id=loan_team.team_id,
@@ -2434,6 +2435,11 @@ def get_player_stats(player_id):
             Fixture.date_utc.asc()
         ).all()
         
+        # Raw payloads live in cold storage; load them once for the whole list
+        fixture_pks = [fixture.id for _, fixture in stats_query]
+        fixture_payloads = load_fixture_payloads('fixture', fixture_pks)
+        player_payloads = load_fixture_payloads('player', fixture_pks, [player_id])
+        
         result = []
         for stats, fixture in stats_query:
             is_home = (stats.team_api_id == fixture.home_team_api_id)
@@ -2443,10 +2449,11 @@ def get_player_stats(player_id):
             opponent_name, _ = resolve_team_name_and_logo(opponent_api_id)
             
             # Additional fallback: try raw_json if resolve returned generic name
-            if opponent_name.startswith("Team ") and fixture.raw_json:
+            fixture_raw_json = fixture_payloads.get((fixture.id, 0))
+            if opponent_name.startswith("Team ") and fixture_raw_json:
                 try:
                     import json
-                    raw_data = json.loads(fixture.raw_json)
+                    raw_data = json.loads(fixture_raw_json)
                     teams = raw_data.get('teams', {})
                     json_name = teams.get('away' if is_home else 'home', {}).get('name')
                     if json_name:
@@ -2455,6 +2462,7 @@ def get_player_stats(player_id):
                     pass
             
             stats_dict = stats.to_dict()
+            stats_dict['raw_json'] = player_payloads.get((fixture.id, player_id))
             stats_dict['fixture_date'] = fixture.date_utc.isoformat() if fixture.date_utc else None
             stats_dict['opponent'] = opponent_name
             stats_dict['is_home'] = is_home
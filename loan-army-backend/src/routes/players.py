@@ -4,6 +4,7 @@ This blueprint handles:
 - Player stats retrieval
 - Player profile information
 - Season stats aggregation
+- Precomputed player page documents
 - Player commentaries
 """
 
@@ -38,6 +39,11 @@ def _get_resolve_team_name_and_logo():
     return resolve_team_name_and_logo
 
 
+def _get_request_player_refresh():
+    from src.routes.api import _request_player_refresh
+    return _request_player_refresh
+
+
 # ---------------------------------------------------------------------------
 # Player stats endpoint
 # ---------------------------------------------------------------------------
@@ -46,15 +52,16 @@ def _get_resolve_team_name_and_logo():
 def get_public_player_stats(player_id: int):
     """Get historical stats for a player (public endpoint).
 
-    Fetches directly from API-Football if local data is incomplete.
+    Served from local data only; missing games queue a background refresh
+    (see X-Data-Stale / X-Data-Refreshing headers).
     Only returns CLUB games (not international).
 
     Query params:
-    - force_sync: If 'true', force sync from API-Football even if local count matches
+    - force_sync: If 'true', queue a refresh even if local count matches
     """
     try:
         from src.models.weekly import FixturePlayerStats, Fixture
-        from src.api_football_client import APIFootballClient
+        from src.api_football_client import get_api_client
 
         resolve_team_name_and_logo = _get_resolve_team_name_and_logo()
         force_sync = request.args.get('force_sync', '').lower() == 'true'
@@ -112,39 +119,25 @@ def get_public_player_stats(player_id: int):
 
         stats_query = stats_query.order_by(Fixture.date_utc.asc()).all()
 
-        # Sync missing games from each loan team
+        # Compare against cached API-Football totals; syncing happens in the background
         player_name_for_sync = all_loans[0].player_name if all_loans else None
 
+        stale = False
+        api_client = get_api_client()
         for loan_team_api_id in loan_team_api_ids:
-            try:
-                local_count = sum(1 for s, f in stats_query if s.team_api_id == loan_team_api_id)
-                api_client = APIFootballClient()
-                api_totals = api_client._fetch_player_team_season_totals_api(
-                    player_id=player_id,
-                    team_id=loan_team_api_id,
-                    season=season,
-                )
-                api_appearances = api_totals.get('games_played', 0)
-
-                if api_appearances > local_count or force_sync:
-                    logger.info(f"Player {player_id} at team {loan_team_api_id}: API={api_appearances}, local={local_count}, force={force_sync}. Syncing...")
-                    _sync_player_club_fixtures(player_id, loan_team_api_id, season, player_name=player_name_for_sync)
-            except Exception as e:
-                logger.warning(f"Failed to sync for player {player_id} at team {loan_team_api_id}: {e}")
-
-        # Re-query after potential sync
-        stats_query = db.session.query(
-            FixturePlayerStats, Fixture
-        ).join(
-            Fixture, FixturePlayerStats.fixture_id == Fixture.id
-        ).filter(
-            FixturePlayerStats.player_api_id == player_id
-        )
-        if loan_team_api_ids:
-            stats_query = stats_query.filter(
-                FixturePlayerStats.team_api_id.in_(loan_team_api_ids)
+            local_count = sum(1 for s, f in stats_query if s.team_api_id == loan_team_api_id)
+            api_totals = api_client._fetch_player_team_season_totals_api(
+                player_id=player_id,
+                team_id=loan_team_api_id,
+                season=season,
+                cached_only=True,
             )
-        stats_query = stats_query.order_by(Fixture.date_utc.asc()).all()
+            if api_totals is None or api_totals.get('games_played', 0) > local_count:
+                stale = True
+        freshness = _get_request_player_refresh()(
+            player_id, season, loan_team_api_ids, player_name_for_sync,
+            stale=stale, force=force_sync,
+        )
 
         result = []
         for stats, fixture in stats_query:
@@ -175,7 +168,10 @@ def get_public_player_stats(player_id: int):
 
             result.append(stats_dict)
 
-        return jsonify(result)
+        response = jsonify(result)
+        response.headers['X-Data-Stale'] = '1' if freshness['stale'] else '0'
+        response.headers['X-Data-Refreshing'] = '1' if freshness['refreshing'] else '0'
+        return response
 
     except Exception as e:
         logger.error(f"Error fetching player stats for player_id={player_id}: {e}")
@@ -184,131 +180,17 @@ def get_public_player_stats(player_id: int):
         return jsonify(_safe_error_payload(e, 'Failed to fetch player stats')), 500
 
 
-def _sync_player_club_fixtures(player_id: int, loan_team_api_id: int, season: int, player_name: str = None) -> int:
-    """Sync all fixtures for a player at their loan club from API-Football."""
-    from src.api_football_client import APIFootballClient
-    from src.models.weekly import Fixture, FixturePlayerStats
-
-    api_client = APIFootballClient()
-    season_start = f"{season}-08-01"
-    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-
-    fixtures = api_client.get_fixtures_for_team(
-        loan_team_api_id,
-        season,
-        season_start,
-        today
-    )
-
-    logger.info(f"Found {len(fixtures)} fixtures for team {loan_team_api_id} in season {season}")
-
-    # Verify ID via fixtures if we have a player name
-    corrected_id = None
-    if player_name and len(fixtures) > 0:
-        verified_id, method = api_client.verify_player_id_via_fixtures(
-            candidate_player_id=player_id,
-            player_name=player_name,
-            loan_team_id=loan_team_api_id,
-            season=season,
-            max_fixtures=3
-        )
-        if verified_id != player_id:
-            logger.warning(
-                f"ID correction for '{player_name}': {player_id} -> {verified_id}"
-            )
-            corrected_id = verified_id
-            # Update loan records
-            loans_updated = LoanedPlayer.query.filter_by(player_id=player_id).update({
-                'player_id': verified_id,
-                'reviewer_notes': LoanedPlayer.reviewer_notes + f' | ID corrected: {player_id} -> {verified_id}',
-                'updated_at': datetime.now(timezone.utc)
-            })
-            db.session.commit()
-            # Delete ghost stats
-            FixturePlayerStats.query.filter(
-                FixturePlayerStats.player_api_id == player_id,
-                FixturePlayerStats.team_api_id == loan_team_api_id,
-                FixturePlayerStats.minutes == 0
-            ).delete()
-            db.session.commit()
-
-    player_id_to_use = corrected_id or player_id
-    synced = 0
-
-    for fix_data in fixtures:
-        try:
-            fixture_api_id = fix_data.get('fixture', {}).get('id')
-            if not fixture_api_id:
-                continue
-
-            # Check if we already have this fixture
-            existing = Fixture.query.filter_by(fixture_id_api=fixture_api_id).first()
-            if not existing:
-                # Create fixture record
-                fix_info = fix_data.get('fixture', {})
-                league_info = fix_data.get('league', {})
-                teams_info = fix_data.get('teams', {})
-                goals_info = fix_data.get('goals', {})
-
-                existing = Fixture(
-                    fixture_id_api=fixture_api_id,
-                    date_utc=datetime.fromisoformat(fix_info.get('date', '').replace('Z', '+00:00')) if fix_info.get('date') else None,
-                    season=season,
-                    competition_name=league_info.get('name'),
-                    home_team_api_id=teams_info.get('home', {}).get('id'),
-                    away_team_api_id=teams_info.get('away', {}).get('id'),
-                    home_goals=goals_info.get('home', 0),
-                    away_goals=goals_info.get('away', 0),
-                )
-                db.session.add(existing)
-                db.session.flush()
-
-            # Check if we already have player stats for this fixture
-            existing_stats = FixturePlayerStats.query.filter_by(
-                fixture_id=existing.id,
-                player_api_id=player_id_to_use,
-                team_api_id=loan_team_api_id
-            ).first()
-
-            if not existing_stats:
-                # Fetch player stats for this fixture
-                player_stats = api_client.get_fixture_player_stats(fixture_api_id, player_id_to_use)
-                if player_stats:
-                    new_stats = FixturePlayerStats(
-                        fixture_id=existing.id,
-                        player_api_id=player_id_to_use,
-                        team_api_id=loan_team_api_id,
-                        minutes=player_stats.get('minutes', 0),
-                        goals=player_stats.get('goals', 0),
-                        assists=player_stats.get('assists', 0),
-                        rating=player_stats.get('rating'),
-                        shots_total=player_stats.get('shots_total', 0),
-                        shots_on=player_stats.get('shots_on', 0),
-                        passes_total=player_stats.get('passes_total', 0),
-                        passes_key=player_stats.get('passes_key', 0),
-                        tackles_total=player_stats.get('tackles_total', 0),
-                        saves=player_stats.get('saves', 0),
-                        goals_conceded=player_stats.get('goals_conceded', 0),
-                        yellows=player_stats.get('yellows', 0),
-                        reds=player_stats.get('reds', 0),
-                    )
-                    db.session.add(new_stats)
-                    synced += 1
-
-        except Exception as e:
-            logger.warning(f"Failed to sync fixture {fix_data}: {e}")
-
-    db.session.commit()
-    return synced
-
-
 # ---------------------------------------------------------------------------
 # Player profile endpoint
 # ---------------------------------------------------------------------------
 
 @players_bp.route('/players/<int:player_id>/profile', methods=['GET'])
 def get_public_player_profile(player_id: int):
-    """Get player profile info including name, team, position, photo."""
+    """Get player profile info including name, team, position, photo.
+
+    Served from local data; ``stale``/``refreshing`` report the player's
+    background refresh (which also verifies the API-Football ID).
+    """
     try:
         from src.models.weekly import FixturePlayerStats
 
@@ -433,6 +315,13 @@ def get_public_player_profile(player_id: int):
         result['loan_history'] = loan_history
         result['has_multiple_loans'] = len(loan_history) > 1
 
+        if loaned and loaned.can_fetch_stats and result.get('loan_team_id'):
+            result.update(_get_request_player_refresh()(
+                player_id, season_year, [result['loan_team_id']], loaned.player_name,
+            ))
+        else:
+            result.update({'stale': False, 'refreshing': False, 'refreshed_at': None})
+
         return jsonify(result)
 
     except Exception as e:
@@ -442,6 +331,22 @@ def get_public_player_profile(player_id: int):
         return jsonify(_safe_error_payload(e, 'Failed to fetch player profile')), 500
 
 
+# ---------------------------------------------------------------------------
+# Player page endpoint
+# ---------------------------------------------------------------------------
+
+@players_bp.route('/players/<int:player_id>/page', methods=['GET'])
+def get_public_player_page(player_id: int):
+    """Get the precomputed player page document (served with ETag/Last-Modified)."""
+    from src.services.player_page import get_player_page, player_page_response
+
+    try:
+        return player_page_response(get_player_page(player_id))
+    except Exception as e:
+        logger.error(f"Error fetching player page for player_id={player_id}: {e}")
+        return jsonify(_safe_error_payload(e, 'Failed to fetch player page')), 500
+
+
 # ---------------------------------------------------------------------------
 # Player season stats endpoint
 # ---------------------------------------------------------------------------
@@ -451,7 +356,7 @@ def get_public_player_season_stats(player_id: int):
     """Get aggregated season stats for a player at their LOAN CLUB only."""
     try:
         from src.models.weekly import FixturePlayerStats, Fixture
-        from src.api_football_client import APIFootballClient
+        from src.api_football_client import get_api_client
         from sqlalchemy import func
 
         now_utc = datetime.now(timezone.utc)
@@ -544,8 +449,9 @@ def get_public_player_season_stats(player_id: int):
         result['loan_team'] = loan_teams_info[0]['name'] if loan_teams_info else None
         result['has_multiple_clubs'] = len(loan_teams_info) > 1
 
-        # Aggregate stats from API-Football for ALL loan clubs
-        api_client = APIFootballClient()
+        # Aggregate cached API-Football totals for ALL loan clubs
+        api_client = get_api_client()
+        stale = False
         total_appearances = 0
         total_minutes = 0
         total_goals = 0
@@ -558,7 +464,10 @@ def get_public_player_season_stats(player_id: int):
                     player_id=player_id,
                     team_id=team_info['api_id'],
                     season=season_start_year,
+                    cached_only=True,
                 )
+                if api_totals is None:
+                    stale = True
 
                 if api_totals and api_totals.get('games_played', 0) > 0:
                     club_stats = {
@@ -649,6 +558,12 @@ def get_public_player_season_stats(player_id: int):
 
             result['clean_sheets'] = clean_sheets_query.clean_sheets if clean_sheets_query else 0
 
+        if result.get('local_appearances', 0) < result['appearances']:
+            stale = True
+        result.update(_get_request_player_refresh()(
+            player_id, season_start_year, loan_team_api_ids, all_loans[0].player_name, stale=stale,
+        ))
+
         return jsonify(result)
 
     except Exception as e:
@@ -473,10 +473,10 @@ def _get_team_logo(team_api_id: int) -> str | None:
 def _enrich_with_season_context(loan: LoanedPlayer, loan_dict: dict, season_val: int | None):
     """Enrich loan dict with season context stats."""
     try:
-        from src.api_football_client import APIFootballClient
+        from src.api_football_client import get_api_client
         from src.models.weekly import FixturePlayerStats
 
-        real_client = APIFootballClient()
+        real_client = get_api_client()
 
         # Determine season from window_key or use current season
         season_year = season_val
@@ -4,19 +4,26 @@ Fetches fixtures from configured academy leagues and extracts
 player appearances, goals, assists from lineups and events data.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timedelta, timezone
 from typing import List, Dict, Any, Optional, Set
+from sqlalchemy import insert, update
 from src.models.league import db, AcademyLeague, AcademyAppearance, LoanedPlayer
-from src.api_football_client import APIFootballClient
+from src.api_football_client import APIFootballClient, get_api_client
 
 logger = logging.getLogger(__name__)
 
+# Concurrency for league syncs: leagues in parallel, and lineups/events
+# requests for a league's fixtures in parallel within each league.
+LEAGUE_SYNC_WORKERS = 3
+FIXTURE_DETAIL_WORKERS = 6
+
 
 class AcademySyncService:
     """Service for syncing academy/youth league fixtures and player appearances."""
 
     def __init__(self, api_client: Optional[APIFootballClient] = None):
-        self.api_client = api_client or APIFootballClient()
+        self.api_client = api_client or get_api_client()
 
     def sync_league(
         self,
@@ -24,18 +31,26 @@ class AcademySyncService:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         season: Optional[int] = None,
+        force: bool = False,
     ) -> Dict[str, Any]:
         """
         Sync fixtures for a single academy league.
 
+        Fixtures at or before the league's ``last_fixture_timestamp``
+        high-water mark are skipped unless *force* is set. Lineups and
+        events for the remaining fixtures are fetched concurrently and all
+        appearances are upserted in bulk with a single commit.
+
         Args:
             league: AcademyLeague to sync
             date_from: Start date (default: 7 days ago)
             date_to: End date (default: today)
             season: Season year (default: league.season or current year)
+            force: Reprocess fixtures behind the high-water mark
 
         Returns:
-            Dict with sync results: fixtures_processed, appearances_created, errors
+            Dict with sync results: fixtures_processed, fixtures_skipped,
+            appearances_created, appearances_updated, errors
         """
         if not league.sync_enabled:
             logger.info(f"Sync disabled for league {league.name}")
@@ -55,6 +70,7 @@ class AcademySyncService:
             'league_id': league.id,
             'league_name': league.name,
             'fixtures_processed': 0,
+            'fixtures_skipped': 0,
             'appearances_created': 0,
             'appearances_updated': 0,
             'errors': [],
@@ -73,29 +89,71 @@ class AcademySyncService:
                 logger.info(f"No fixtures found for {league.name}")
                 return results
 
+            fixtures = sorted(
+                (f for f in fixtures if (f.get('fixture') or {}).get('id')),
+                key=self._fixture_timestamp,
+            )
+            high_water = None if force else league.last_fixture_timestamp
+            if high_water is not None:
+                pending = [f for f in fixtures if self._fixture_timestamp(f) > high_water]
+                results['fixtures_skipped'] = len(fixtures) - len(pending)
+                fixtures = pending
+
+            if not fixtures:
+                league.last_synced_at = datetime.now(timezone.utc)
+                db.session.commit()
+                return results
+
             # Get tracked player IDs for matching
             tracked_player_ids = self._get_tracked_player_ids()
 
+            details = self._fetch_fixture_details(
+                [f['fixture']['id'] for f in fixtures]
+            )
+
+            rows: List[Dict[str, Any]] = []
+            failed_timestamps: List[int] = []
             for fixture in fixtures:
-                try:
-                    fixture_results = self._process_fixture(
-                        fixture=fixture,
-                        league=league,
-                        tracked_player_ids=tracked_player_ids,
-                    )
-                    results['fixtures_processed'] += 1
-                    results['appearances_created'] += fixture_results.get('created', 0)
-                    results['appearances_updated'] += fixture_results.get('updated', 0)
-                except Exception as e:
-                    error_msg = f"Error processing fixture {fixture.get('fixture', {}).get('id')}: {str(e)}"
+                fixture_id = fixture['fixture']['id']
+                detail = details.get(fixture_id)
+                if isinstance(detail, Exception):
+                    error_msg = f"Error processing fixture {fixture_id}: {detail}"
                     logger.error(error_msg)
                     results['errors'].append(error_msg)
+                    failed_timestamps.append(self._fixture_timestamp(fixture))
+                    continue
+                lineups, events = detail
+                rows.extend(self._build_appearance_rows(
+                    fixture=fixture,
+                    league=league,
+                    tracked_player_ids=tracked_player_ids,
+                    lineups=lineups,
+                    events=events,
+                ))
+                results['fixtures_processed'] += 1
+
+            created, updated = self._bulk_upsert_appearances(rows)
+            results['appearances_created'] = created
+            results['appearances_updated'] = updated
+
+            # Advance the high-water mark only across a contiguous run of
+            # successful fixtures so a failed one is retried next time.
+            cutoff = min(failed_timestamps) if failed_timestamps else None
+            done = [
+                self._fixture_timestamp(f) for f in fixtures
+                if cutoff is None or self._fixture_timestamp(f) < cutoff
+            ]
+            if done:
+                league.last_fixture_timestamp = max(
+                    max(done), league.last_fixture_timestamp or 0,
+                )
 
             # Update last synced timestamp
             league.last_synced_at = datetime.now(timezone.utc)
             db.session.commit()
 
         except Exception as e:
+            db.session.rollback()
             error_msg = f"Error syncing league {league.name}: {str(e)}"
             logger.exception(error_msg)
             results['errors'].append(error_msg)
@@ -106,16 +164,37 @@ class AcademySyncService:
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
+        force: bool = False,
+        max_workers: int = LEAGUE_SYNC_WORKERS,
     ) -> List[Dict[str, Any]]:
-        """Sync all active academy leagues."""
-        leagues = AcademyLeague.query.filter_by(is_active=True, sync_enabled=True).all()
-        results = []
+        """Sync all active academy leagues, several leagues at a time.
 
-        for league in leagues:
-            result = self.sync_league(league, date_from=date_from, date_to=date_to)
-            results.append(result)
+        Each league runs on its own worker thread with its own app context
+        (and therefore its own DB session). Results keep the query order.
+        """
+        league_ids = [
+            lid for (lid,) in db.session.query(AcademyLeague.id)
+            .filter_by(is_active=True, sync_enabled=True)
+            .order_by(AcademyLeague.id)
+            .all()
+        ]
+        if not league_ids:
+            return []
 
-        return results
+        @self.api_client._bind_app_context
+        def _sync_one(league_id: int) -> Dict[str, Any]:
+            league = db.session.get(AcademyLeague, league_id)
+            return self.sync_league(league, date_from=date_from, date_to=date_to, force=force)
+
+        if max_workers <= 1 or len(league_ids) == 1:
+            return [
+                self.sync_league(db.session.get(AcademyLeague, lid),
+                                 date_from=date_from, date_to=date_to, force=force)
+                for lid in league_ids
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(league_ids))) as executor:
+            return list(executor.map(_sync_one, league_ids))
 
     def _fetch_fixtures(
         self,
@@ -138,6 +217,64 @@ class AcademySyncService:
             logger.error(f"Error fetching fixtures for league {league_id}: {e}")
             return []
 
+    def _fetch_fixture_details(
+        self,
+        fixture_ids: List[int],
+        max_workers: int = FIXTURE_DETAIL_WORKERS,
+    ) -> Dict[int, Any]:
+        """Fetch lineups and events for many fixtures concurrently.
+
+        Returns:
+            Dict mapping fixture_id -> (lineups, events), or the Exception
+            raised while fetching that fixture.
+        """
+        @self.api_client._bind_app_context
+        def _fetch(kind: str, fixture_id: int):
+            if kind == 'lineups':
+                return self.api_client.get_fixture_lineups(fixture_id)
+            return self.api_client.get_fixture_events(fixture_id)
+
+        payloads: Dict[tuple, Any] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_fetch, kind, fid): (kind, fid)
+                for fid in fixture_ids
+                for kind in ('lineups', 'events')
+            }
+            for future in as_completed(futures):
+                try:
+                    payloads[futures[future]] = future.result()
+                except Exception as e:
+                    payloads[futures[future]] = e
+
+        details: Dict[int, Any] = {}
+        for fid in fixture_ids:
+            lineups = payloads.get(('lineups', fid))
+            events = payloads.get(('events', fid))
+            if isinstance(lineups, Exception):
+                details[fid] = lineups
+            elif isinstance(events, Exception):
+                details[fid] = events
+            else:
+                details[fid] = (
+                    (lineups or {}).get('response', []),
+                    (events or {}).get('response', []),
+                )
+        return details
+
+    @staticmethod
+    def _fixture_timestamp(fixture: Dict[str, Any]) -> int:
+        """Kickoff as a unix timestamp (falls back to parsing the ISO date)."""
+        info = fixture.get('fixture') or {}
+        ts = info.get('timestamp')
+        if ts is not None:
+            return int(ts)
+        try:
+            return int(datetime.fromisoformat((info.get('date') or '')[:19]).replace(
+                tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            return 0
+
     def _get_tracked_player_ids(self) -> Dict[int, int]:
         """
         Get mapping of API player IDs to LoanedPlayer IDs for matching.
@@ -145,36 +282,38 @@ class AcademySyncService:
         Returns:
             Dict mapping player_api_id -> loaned_player.id
         """
-        players = LoanedPlayer.query.filter(
+        rows = db.session.query(LoanedPlayer.player_id, LoanedPlayer.id).filter(
             LoanedPlayer.is_active == True,
-            LoanedPlayer.player_api_id.isnot(None),
+            LoanedPlayer.player_id.isnot(None),
         ).all()
-        return {p.player_api_id: p.id for p in players}
+        return {player_id: loaned_id for player_id, loaned_id in rows}
 
-    def _process_fixture(
+    def _build_appearance_rows(
         self,
         fixture: Dict[str, Any],
         league: AcademyLeague,
         tracked_player_ids: Dict[int, int],
-    ) -> Dict[str, int]:
+        lineups: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
         """
-        Process a single fixture: fetch lineups/events and create appearances.
+        Turn one fixture's lineups/events into AcademyAppearance row dicts.
 
         Returns:
-            Dict with 'created' and 'updated' counts
+            List of column dicts ready for ``_bulk_upsert_appearances``
         """
         fixture_info = fixture.get('fixture', {})
         fixture_id = fixture_info.get('id')
         fixture_date_str = fixture_info.get('date', '')[:10]
 
         if not fixture_id:
-            return {'created': 0, 'updated': 0}
+            return []
 
         try:
             fixture_date = date.fromisoformat(fixture_date_str)
         except ValueError:
             logger.warning(f"Invalid fixture date: {fixture_date_str}")
-            return {'created': 0, 'updated': 0}
+            return []
 
         teams = fixture.get('teams', {})
         home_team = teams.get('home', {}).get('name', 'Unknown')
@@ -183,65 +322,79 @@ class AcademySyncService:
         league_info = fixture.get('league', {})
         competition = league_info.get('name', league.name)
 
-        # Fetch lineups and events
-        lineups_data = self.api_client.get_fixture_lineups(fixture_id)
-        events_data = self.api_client.get_fixture_events(fixture_id)
-
-        lineups = lineups_data.get('response', [])
-        events = events_data.get('response', [])
-
         # Extract players from lineups
         players = self._extract_players_from_lineups(lineups)
 
         # Enrich with events (goals, assists, cards)
         player_events = self._extract_player_events(events)
 
-        created = 0
-        updated = 0
-
+        rows = []
         for player_id, player_info in players.items():
-            # Check if appearance already exists
-            existing = AcademyAppearance.query.filter_by(
-                player_id=player_id,
-                fixture_id=fixture_id,
-            ).first()
-
-            # Get events for this player
             p_events = player_events.get(player_id, {})
+            rows.append({
+                'player_id': player_id,
+                'player_name': player_info.get('name', f'Player {player_id}'),
+                'fixture_id': fixture_id,
+                'fixture_date': fixture_date,
+                'home_team': home_team,
+                'away_team': away_team,
+                'competition': competition,
+                'academy_league_id': league.id,
+                'loaned_player_id': tracked_player_ids.get(player_id),
+                'started': player_info.get('started', False),
+                'minutes_played': player_info.get('minutes'),
+                'goals': p_events.get('goals', 0),
+                'assists': p_events.get('assists', 0),
+                'yellow_cards': p_events.get('yellow_cards', 0),
+                'red_cards': p_events.get('red_cards', 0),
+                'lineup_data': player_info.get('raw'),
+                'events_data': p_events.get('raw'),
+            })
+        return rows
 
-            if existing:
-                # Update existing appearance
-                existing.goals = p_events.get('goals', 0)
-                existing.assists = p_events.get('assists', 0)
-                existing.yellow_cards = p_events.get('yellow_cards', 0)
-                existing.red_cards = p_events.get('red_cards', 0)
-                updated += 1
-            else:
-                # Create new appearance
-                appearance = AcademyAppearance(
-                    player_id=player_id,
-                    player_name=player_info.get('name', f'Player {player_id}'),
-                    fixture_id=fixture_id,
-                    fixture_date=fixture_date,
-                    home_team=home_team,
-                    away_team=away_team,
-                    competition=competition,
-                    academy_league_id=league.id,
-                    loaned_player_id=tracked_player_ids.get(player_id),
-                    started=player_info.get('started', False),
-                    minutes_played=player_info.get('minutes'),
-                    goals=p_events.get('goals', 0),
-                    assists=p_events.get('assists', 0),
-                    yellow_cards=p_events.get('yellow_cards', 0),
-                    red_cards=p_events.get('red_cards', 0),
-                    lineup_data=player_info.get('raw'),
-                    events_data=p_events.get('raw'),
-                )
-                db.session.add(appearance)
-                created += 1
+    def _bulk_upsert_appearances(self, rows: List[Dict[str, Any]]) -> tuple:
+        """Insert new appearances and refresh event counts on existing ones.
 
-        db.session.commit()
-        return {'created': created, 'updated': updated}
+        Existing (player_id, fixture_id) pairs are looked up with one query;
+        inserts and updates are each issued as a single executemany. The
+        caller commits.
+
+        Returns:
+            ``(created, updated)`` counts
+        """
+        if not rows:
+            return 0, 0
+
+        fixture_ids = list({r['fixture_id'] for r in rows})
+        existing = {
+            (player_id, fixture_id): appearance_id
+            for appearance_id, player_id, fixture_id in db.session.query(
+                AcademyAppearance.id,
+                AcademyAppearance.player_id,
+                AcademyAppearance.fixture_id,
+            ).filter(AcademyAppearance.fixture_id.in_(fixture_ids)).all()
+        }
+
+        inserts = []
+        updates = []
+        for row in rows:
+            appearance_id = existing.get((row['player_id'], row['fixture_id']))
+            if appearance_id is None:
+                inserts.append(row)
+            else:
+                updates.append({
+                    'id': appearance_id,
+                    'goals': row['goals'],
+                    'assists': row['assists'],
+                    'yellow_cards': row['yellow_cards'],
+                    'red_cards': row['red_cards'],
+                })
+
+        if inserts:
+            db.session.execute(insert(AcademyAppearance), inserts)
+        if updates:
+            db.session.execute(update(AcademyAppearance), updates)
+        return len(inserts), len(updates)
 
     def _extract_players_from_lineups(
         self,
@@ -14,6 +14,7 @@ from src.models.league import db
 from src.models.cohort import AcademyCohort, CohortMember
 from src.models.journey import PlayerJourney
 from src.services.cohort_service import CohortService
+from src.services.cohort_analytics import refresh_cohort_aggregates
 from src.services.journey_sync import JourneySyncService
 from src.services.youth_competition_resolver import (
     get_default_youth_league_map,
@@ -457,11 +458,11 @@ def run_big6_seed(job_id, seasons=None, team_ids=None, league_ids=None,
 
     # ── Phase 3: Refresh stats ──
     update_job(job_id, current_player="Refreshing cohort stats")
-    for cohort_id in cohort_ids:
-        try:
-            cohort_service.refresh_cohort_stats(cohort_id)
-        except Exception as e:
-            logger.warning(f"Failed to refresh stats for cohort {cohort_id}: {e}")
+    try:
+        refresh_cohort_aggregates(cohort_ids)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Failed to refresh cohort stats: {e}")
 
     # Mark cohorts by actual sync coverage.
     now = datetime.now(timezone.utc)
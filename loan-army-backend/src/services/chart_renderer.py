@@ -3,21 +3,49 @@ Server-side chart rendering service for email newsletters.
 
 Generates static chart images using matplotlib that can be embedded in emails
 where dynamic JavaScript charts aren't supported.
+
+Rendered files are content-addressed: ``get_or_render_chart`` names each PNG
+after the chart id plus a hash of the chart data and size, so regenerating or
+previewing a newsletter whose data has not changed reuses the file on disk.
+The cache directory is trimmed least-recently-used first (see
+``evict_charts``), skipping any chart a stored newsletter still links to.
+Renders trigger that trim at most once per ``CHART_EVICT_INTERVAL_SECONDS``
+(see ``maybe_evict_charts``), and the newsletters are only read once the
+directory is actually over a limit.
+``render_charts_batch`` renders a whole newsletter's cache misses in
+parallel on a small process pool.
+
+Two output formats are supported: ``png`` (matplotlib, imported on first
+use) and ``svg`` (``svg_charts``, no matplotlib at all). The default comes
+from ``CHART_FORMAT`` and can be overridden per call with ``fmt``. PNG stays
+the default because several email clients do not display SVG images; chart
+types without an SVG renderer (match cards) are always PNG.
 """
 
 import io
 import os
+import json
+import atexit
 import base64
 import hashlib
+import logging
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import Polygon
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 import numpy as np
 
+from src.utils.worker_processes import worker_context
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+logger = logging.getLogger(__name__)
+
 # Chart styling constants
 CHART_COLORS = {
     'primary': '#7c3aed',      # Violet
@@ -38,12 +66,79 @@ POSITION_COLORS = {
 # Directory to store generated chart images
 CHARTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'static', 'charts')
 
+# Chart cache limits. Charts linked from a stored newsletter are never evicted,
+# so these only bound unreferenced renders; 0 disables the corresponding limit.
+CACHE_MAX_FILES = int(os.getenv('CHART_CACHE_MAX_FILES', '5000'))
+CACHE_MAX_MB = int(os.getenv('CHART_CACHE_MAX_MB', '500'))
+# Minimum gap between evictions triggered by cache misses
+EVICT_INTERVAL_SECONDS = int(os.getenv('CHART_EVICT_INTERVAL_SECONDS', '60'))
+
+# Worker processes for batch rendering (0 or 1 renders inline)
+RENDER_WORKERS = int(os.getenv('CHART_RENDER_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# Default output format: 'png' or 'svg'
+CHART_FORMAT = os.getenv('CHART_FORMAT', 'png').lower()
+
+MIME_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+# Only files named by the cache are ever evicted
+_CACHED_NAME = re.compile(r'^[0-9a-f]{12}_[0-9a-f]{16}\.(png|svg)$')
+_CHART_URL = re.compile(r'/static/charts/([0-9a-f]{12}_[0-9a-f]{16}\.(?:png|svg))')
+
+_SUBPLOT_PARAMS = ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+_figures = threading.local()
+
 
 def ensure_charts_dir():
     """Ensure the charts directory exists."""
     os.makedirs(CHARTS_DIR, exist_ok=True)
 
 
+def chart_format(chart_type: str, fmt: Optional[str] = None) -> str:
+    """Return the format a chart will actually be rendered in."""
+    fmt = (fmt or CHART_FORMAT).lower()
+    if fmt == 'svg':
+        from src.services.svg_charts import SVG_CHART_TYPES
+        if chart_type in SVG_CHART_TYPES:
+            return 'svg'
+    return 'png'
+
+
+def _figure(kind: str, width: int, height: int) -> 'Figure':
+    """Return this thread's reusable figure for *kind*, cleared and resized.
+
+    Figures are created once per chart type and thread, outside pyplot, so
+    rendering neither pays figure/canvas setup per chart nor touches
+    pyplot's global figure registry.
+    """
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figures = getattr(_figures, 'by_kind', None)
+    if figures is None:
+        figures = _figures.by_kind = {}
+    fig = figures.get(kind)
+    if fig is None:
+        fig = Figure(dpi=100)
+        FigureCanvasAgg(fig)
+        figures[kind] = fig
+    else:
+        fig.clf()
+    fig.set_size_inches(width / 100, height / 100)
+    # tight_layout() moves the subplot params; start every chart from the defaults
+    fig.subplots_adjust(**{
+        name: matplotlib.rcParams[f'figure.subplot.{name}'] for name in _SUBPLOT_PARAMS
+    })
+    return fig
+
+
+def _to_png(fig: 'Figure', facecolor: str = 'white') -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', facecolor=facecolor, edgecolor='none')
+    return buf.getvalue()
+
+
 def generate_chart_id(block: dict, player_id: Optional[int], week_start: Optional[str], week_end: Optional[str]) -> str:
     """Generate a unique ID for a chart based on its configuration."""
     key_parts = [
@@ -79,7 +174,7 @@ def render_radar_chart(data: Dict[str, Any], width: int = 400, height: int = 400
         return _render_empty_chart("No data available", width, height)
     
     # Setup figure
-    fig = plt.figure(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('radar', width, height)
     ax = fig.add_subplot(111, polar=True)
     
     # Prepare data
@@ -111,12 +206,7 @@ def render_radar_chart(data: Dict[str, Any], width: int = 400, height: int = 400
         title += f" - {matches_count} match{'es' if matches_count != 1 else ''}"
     ax.set_title(title, size=10, color=CHART_COLORS['gray'], y=1.1, fontweight='bold')
     
-    # Convert to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig)
 
 
 def render_bar_chart(data: Dict[str, Any], width: int = 500, height: int = 300) -> bytes:
@@ -139,7 +229,8 @@ def render_bar_chart(data: Dict[str, Any], width: int = 500, height: int = 300)
         return _render_empty_chart("No data available", width, height)
     
     # Setup figure
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('bar', width, height)
+    ax = fig.add_subplot(111)
     
     # Prepare data
     matches = [d.get('match', d.get('date', ''))[:20] for d in bar_data]
@@ -169,14 +260,9 @@ def render_bar_chart(data: Dict[str, Any], width: int = 500, height: int = 300)
     ax.spines['right'].set_visible(False)
     ax.tick_params(colors=CHART_COLORS['gray'])
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Convert to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig)
 
 
 def render_line_chart(data: Dict[str, Any], width: int = 500, height: int = 300) -> bytes:
@@ -199,7 +285,8 @@ def render_line_chart(data: Dict[str, Any], width: int = 500, height: int = 300)
         return _render_empty_chart("No data available", width, height)
     
     # Setup figure
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('line', width, height)
+    ax = fig.add_subplot(111)
     
     # Prepare data
     dates = [d.get('date', '')[:10] for d in line_data]
@@ -228,14 +315,9 @@ def render_line_chart(data: Dict[str, Any], width: int = 500, height: int = 300)
     ax.tick_params(colors=CHART_COLORS['gray'])
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Convert to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig)
 
 
 def render_match_cards_summary(data: Dict[str, Any], width: int = 500, height: int = 200) -> bytes:
@@ -272,7 +354,8 @@ def render_match_cards_summary(data: Dict[str, Any], width: int = 500, height: i
     losses = len(fixtures) - wins - draws
     
     # Setup figure
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('match_card', width, height)
+    ax = fig.add_subplot(111)
     ax.axis('off')
     
     # Title
@@ -296,12 +379,7 @@ def render_match_cards_summary(data: Dict[str, Any], width: int = 500, height: i
         ax.text(x_positions[i], 0.3, label, fontsize=9, ha='center', 
                 transform=ax.transAxes, color=CHART_COLORS['gray'])
     
-    # Convert to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig)
 
 
 def render_stat_table(data: Dict[str, Any], width: int = 500, height: int = 250) -> bytes:
@@ -328,7 +406,8 @@ def render_stat_table(data: Dict[str, Any], width: int = 500, height: int = 250)
     display_data = table_data[:6]  # Show max 6 matches
     
     # Setup figure
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('stat_table', width, height)
+    ax = fig.add_subplot(111)
     ax.axis('off')
     
     # Build table data
@@ -386,31 +465,24 @@ def render_stat_table(data: Dict[str, Any], width: int = 500, height: int = 250)
         title += f" (showing {len(display_data)})"
     ax.set_title(title, fontsize=10, fontweight='bold', color=CHART_COLORS['gray'], y=0.95)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Convert to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig)
 
 
 def _render_empty_chart(message: str, width: int, height: int) -> bytes:
     """Render an empty chart placeholder with a message."""
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    fig = _figure('empty', width, height)
+    ax = fig.add_subplot(111)
     ax.axis('off')
     ax.text(0.5, 0.5, message, fontsize=12, ha='center', va='center',
             color=CHART_COLORS['gray'], transform=ax.transAxes)
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', facecolor='#f9fafb', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return _to_png(fig, facecolor='#f9fafb')
 
 
-def render_chart(chart_type: str, data: Dict[str, Any], width: int = 500, height: int = 300) -> bytes:
+def render_chart(chart_type: str, data: Dict[str, Any], width: int = 500, height: int = 300,
+                 fmt: Optional[str] = None) -> bytes:
     """
     Main entry point to render a chart based on type.
     
@@ -419,10 +491,15 @@ def render_chart(chart_type: str, data: Dict[str, Any], width: int = 500, height
         data: Chart data from the API
         width: Image width in pixels
         height: Image height in pixels
+        fmt: 'png' or 'svg'; defaults to ``CHART_FORMAT``
         
     Returns:
-        PNG image as bytes
+        Image bytes in the format given by ``chart_format(chart_type, fmt)``
     """
+    if chart_format(chart_type, fmt) == 'svg':
+        from src.services.svg_charts import render_svg
+        return render_svg(chart_type, data, width, height).encode('utf-8')
+
     if chart_type == 'radar':
         return render_radar_chart(data, width, height)
     elif chart_type == 'bar':
@@ -437,7 +514,8 @@ def render_chart(chart_type: str, data: Dict[str, Any], width: int = 500, height
         return _render_empty_chart(f"Unknown chart type: {chart_type}", width, height)
 
 
-def render_chart_to_base64(chart_type: str, data: Dict[str, Any], width: int = 500, height: int = 300) -> str:
+def render_chart_to_base64(chart_type: str, data: Dict[str, Any], width: int = 500, height: int = 300,
+                           fmt: Optional[str] = None) -> str:
     """
     Render a chart and return as base64 data URL.
     
@@ -446,17 +524,18 @@ def render_chart_to_base64(chart_type: str, data: Dict[str, Any], width: int = 5
         data: Chart data from the API
         width: Image width in pixels
         height: Image height in pixels
+        fmt: 'png' or 'svg'; defaults to ``CHART_FORMAT``
         
     Returns:
-        Data URL string (data:image/png;base64,...)
+        Data URL string (data:image/png;base64,... or data:image/svg+xml;base64,...)
     """
-    image_bytes = render_chart(chart_type, data, width, height)
+    image_bytes = render_chart(chart_type, data, width, height, fmt=fmt)
     b64 = base64.b64encode(image_bytes).decode('utf-8')
-    return f"data:image/png;base64,{b64}"
+    return f"data:{MIME_TYPES[chart_format(chart_type, fmt)]};base64,{b64}"
 
 
 def save_chart_to_file(chart_type: str, data: Dict[str, Any], filename: str,
-                       width: int = 500, height: int = 300) -> str:
+                       width: int = 500, height: int = 300, fmt: Optional[str] = None) -> str:
     """
     Render a chart and save to file.
     
@@ -466,16 +545,295 @@ def save_chart_to_file(chart_type: str, data: Dict[str, Any], filename: str,
         filename: Filename (without extension)
         width: Image width in pixels
         height: Image height in pixels
+        fmt: 'png' or 'svg'; defaults to ``CHART_FORMAT``
         
     Returns:
         Path to saved file
     """
     ensure_charts_dir()
-    image_bytes = render_chart(chart_type, data, width, height)
+    image_bytes = render_chart(chart_type, data, width, height, fmt=fmt)
     
-    filepath = os.path.join(CHARTS_DIR, f"{filename}.png")
+    filepath = os.path.join(CHARTS_DIR, f"{filename}.{chart_format(chart_type, fmt)}")
     with open(filepath, 'wb') as f:
         f.write(image_bytes)
     
     return filepath
 
+
+# ── content-addressed chart cache ─────────────────────────────────────────
+
+def chart_data_hash(chart_type: str, data: Dict[str, Any], width: int, height: int) -> str:
+    """Stable hash of everything that affects a chart's pixels."""
+    payload = json.dumps(
+        [chart_type, width, height, data], sort_keys=True, separators=(',', ':'), default=str,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def cached_chart_filename(chart_id: str, chart_type: str, data: Dict[str, Any],
+                          width: int = 500, height: int = 300, fmt: Optional[str] = None) -> str:
+    """Cache filename for a chart: ``<chart id>_<data hash>.<png|svg>``."""
+    return f"{chart_id}_{chart_data_hash(chart_type, data, width, height)}.{chart_format(chart_type, fmt)}"
+
+
+def _cache_hit(filepath: str) -> bool:
+    """Return True if *filepath* is cached, marking it recently used."""
+    try:
+        os.utime(filepath)
+    except OSError:
+        return False
+    return True
+
+
+def _render_to_path(chart_type: str, data: Dict[str, Any], filepath: str,
+                    width: int, height: int, fmt: Optional[str] = None) -> str:
+    """Render a chart and publish it atomically at *filepath*."""
+    image_bytes = render_chart(chart_type, data, width, height, fmt=fmt)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(image_bytes)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return filepath
+
+
+def get_or_render_chart(chart_type: str, data: Dict[str, Any], chart_id: str,
+                        width: int = 500, height: int = 300, fmt: Optional[str] = None) -> str:
+    """
+    Return the path of a cached chart image, rendering it on a cache miss.
+
+    Args:
+        chart_type: Chart type
+        data: Chart data from the API
+        chart_id: Stable chart id, e.g. from ``generate_chart_id``
+        width: Image width in pixels
+        height: Image height in pixels
+        fmt: 'png' or 'svg'; defaults to ``CHART_FORMAT``
+
+    Returns:
+        Path to the image file in ``CHARTS_DIR``
+    """
+    ensure_charts_dir()
+    filepath = os.path.join(CHARTS_DIR, cached_chart_filename(chart_id, chart_type, data, width, height, fmt))
+    if _cache_hit(filepath):
+        return filepath
+    _render_to_path(chart_type, data, filepath, width, height, fmt)
+    maybe_evict_charts()
+    return filepath
+
+
+def render_charts_batch(jobs: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """
+    Resolve many charts through the cache, rendering misses in parallel.
+
+    Args:
+        jobs: Dicts with ``chart_type``, ``data``, ``chart_id`` and optional
+            ``width``/``height``/``fmt``
+
+    Returns:
+        File paths in the same order as *jobs*; None where rendering failed
+    """
+    ensure_charts_dir()
+    paths: List[Optional[str]] = []
+    misses: Dict[str, tuple] = {}
+    for job in jobs:
+        width = job.get('width', 500)
+        height = job.get('height', 300)
+        fmt = chart_format(job['chart_type'], job.get('fmt'))
+        filepath = os.path.join(CHARTS_DIR, cached_chart_filename(
+            job['chart_id'], job['chart_type'], job['data'], width, height, fmt))
+        paths.append(filepath)
+        if filepath not in misses and not _cache_hit(filepath):
+            misses[filepath] = (job['chart_type'], job['data'], filepath, width, height, fmt)
+
+    failed = set()
+    # SVG is cheap to build; only raster renders are worth a worker process
+    raster = sum(1 for args in misses.values() if args[-1] == 'png')
+    pool = get_render_pool() if raster > 1 else None
+    if pool is not None:
+        try:
+            futures = {path: pool.submit(_render_to_path, *args) for path, args in misses.items()}
+            for path, future in futures.items():
+                try:
+                    future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.warning("Chart render failed for %s: %s", os.path.basename(path), e)
+                    failed.add(path)
+        except Exception as e:
+            # Broken or unusable pool: drop it and render what's left inline
+            logger.warning("Chart render pool unavailable, rendering inline: %s", e)
+            reset_render_pool()
+            pool = None
+            failed = set()
+            misses = {path: args for path, args in misses.items() if not os.path.exists(path)}
+    if pool is None:
+        for path, args in misses.items():
+            try:
+                _render_to_path(*args)
+            except Exception as e:
+                logger.warning("Chart render failed for %s: %s", os.path.basename(path), e)
+                failed.add(path)
+
+    if misses:
+        maybe_evict_charts()
+    return [None if path in failed else path for path in paths]
+
+
+def referenced_chart_names() -> Optional[set]:
+    """
+    Cache filenames linked from any stored newsletter.
+
+    Returns:
+        Set of filenames, or None when the newsletters can't be read (no app
+        context or a database error)
+    """
+    from flask import has_app_context
+    if not has_app_context():
+        return None
+    from sqlalchemy import or_, select
+    from src.models.league import Newsletter, db
+    pattern = '%/static/charts/%'
+    try:
+        rows = db.session.execute(
+            select(Newsletter.content, Newsletter.structured_content).where(
+                or_(Newsletter.content.like(pattern), Newsletter.structured_content.like(pattern)))
+        ).all()
+    except Exception as e:
+        logger.warning("Could not read newsletter chart links: %s", e)
+        return None
+    names = set()
+    for row in rows:
+        for text in row:
+            if text:
+                names.update(_CHART_URL.findall(text))
+    return names
+
+
+def evict_charts(max_files: Optional[int] = None, max_bytes: Optional[int] = None,
+                 keep: Optional[set] = None) -> int:
+    """
+    Delete least-recently-used cached charts beyond the cache limits.
+
+    Cache hits refresh a file's mtime, so mtime order is LRU order. Files not
+    named by the cache (e.g. from ``save_chart_to_file``) are left alone, as
+    are charts a stored newsletter links to: sent emails and published pages
+    keep pointing at them long after the last cache hit. The newsletters are
+    only read when the cached files exceed a limit, and nothing is evicted
+    when they can't be checked.
+
+    Args:
+        max_files: File limit; defaults to ``CACHE_MAX_FILES``
+        max_bytes: Size limit; defaults to ``CACHE_MAX_MB``
+        keep: Filenames to keep; defaults to ``referenced_chart_names()``
+
+    Returns:
+        Number of files removed
+    """
+    max_files = CACHE_MAX_FILES if max_files is None else max_files
+    max_bytes = CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+    if not max_files and not max_bytes:
+        return 0
+
+    entries = []
+    try:
+        with os.scandir(CHARTS_DIR) as it:
+            for entry in it:
+                if _CACHED_NAME.match(entry.name):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path, entry.name))
+    except FileNotFoundError:
+        return 0
+
+    def _within_limits(count, total_bytes):
+        return (not max_files or count <= max_files) and (not max_bytes or total_bytes <= max_bytes)
+
+    if _within_limits(len(entries), sum(e[1] for e in entries)):
+        return 0
+    if keep is None:
+        keep = referenced_chart_names()
+        if keep is None:
+            return 0
+    entries = [e for e in entries if e[3] not in keep]
+
+    total_bytes = sum(size for _, size, _, _ in entries)
+    count = len(entries)
+    removed = 0
+    for _, size, path, _ in sorted(entries):
+        if _within_limits(count, total_bytes):
+            break
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+        count -= 1
+        total_bytes -= size
+    return removed
+
+
+_last_evict = 0.0
+_evict_lock = threading.Lock()
+
+
+def maybe_evict_charts() -> int:
+    """
+    Run ``evict_charts`` unless it ran in the last ``EVICT_INTERVAL_SECONDS``.
+
+    Called after cache misses; concurrent callers skip rather than wait.
+
+    Returns:
+        Number of files removed
+    """
+    global _last_evict
+    if not _evict_lock.acquire(blocking=False):
+        return 0
+    try:
+        now = time.monotonic()
+        if _last_evict and now - _last_evict < EVICT_INTERVAL_SECONDS:
+            return 0
+        _last_evict = now
+        return evict_charts()
+    finally:
+        _evict_lock.release()
+
+
+# ── batch render pool ──────────────────────────────────────────────────
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the process-wide render pool (started on first use), or None."""
+    global _render_pool
+    if RENDER_WORKERS <= 1:
+        return None
+    with _render_pool_lock:
+        if _render_pool is None:
+            try:
+                _render_pool = ProcessPoolExecutor(max_workers=RENDER_WORKERS, mp_context=worker_context())
+            except Exception as e:
+                logger.error("Chart render pool unavailable, rendering inline: %s", e)
+                return None
+            atexit.register(reset_render_pool)
+        return _render_pool
+
+
+def reset_render_pool() -> None:
+    """Shut down the process-wide render pool; the next batch starts a new one."""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,267 @@
+"""
+Cohort Analytics
+
+Set-based versions of the per-member cohort computations:
+
+- ``derive_member_statuses`` re-derives ``current_status`` and
+  ``total_loan_spells`` for many members from one joined query (loan-spell
+  counts and latest seasons come from grouped subqueries).
+- ``refresh_cohort_aggregates`` recomputes the denormalized counters on
+  ``AcademyCohort`` with one ``GROUP BY`` over ``cohort_members``.
+- ``get_analytics_snapshot`` serves the cross-club comparison from a
+  process-level cache that is rebuilt at most every
+  ``COHORT_ANALYTICS_TTL_SECONDS`` and dropped whenever aggregates change.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func, update
+
+from src.models.league import db
+from src.models.cohort import AcademyCohort, CohortMember
+from src.models.journey import PlayerJourney, PlayerJourneyEntry
+from src.utils.academy_classifier import (
+    _get_active_classification_config,
+    classify_tracked_player,
+)
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_TTL_SECONDS = int(os.getenv('COHORT_ANALYTICS_TTL_SECONDS', '300'))
+ANALYTICS_STATUSES = ('complete', 'partial', 'seeded')
+
+_snapshot_lock = threading.Lock()
+_snapshot: dict = {}
+
+
+def derive_member_statuses(
+    cohort_ids: Optional[Iterable[int]] = None,
+    errors: Optional[list] = None,
+) -> int:
+    """Re-derive status and loan-spell counts for synced cohort members.
+
+    Equivalent to calling ``CohortService._derive_status`` and counting
+    loan entries per member, but with a single query for all members.
+    A member whose journey cannot be classified is left unchanged and
+    reported in *errors* (when given) instead of aborting the whole pass.
+
+    Returns the number of members whose status or loan count changed.
+    """
+    loan_counts = (
+        db.session.query(
+            PlayerJourneyEntry.journey_id.label('journey_id'),
+            func.count(PlayerJourneyEntry.id).label('loan_spells'),
+        )
+        .filter(PlayerJourneyEntry.entry_type == 'loan')
+        .group_by(PlayerJourneyEntry.journey_id)
+        .subquery()
+    )
+    latest_seasons = (
+        db.session.query(
+            PlayerJourneyEntry.journey_id.label('journey_id'),
+            func.max(PlayerJourneyEntry.season).label('latest_season'),
+        )
+        .group_by(PlayerJourneyEntry.journey_id)
+        .subquery()
+    )
+
+    query = (
+        db.session.query(
+            CohortMember.id,
+            CohortMember.player_api_id,
+            CohortMember.current_status,
+            CohortMember.total_loan_spells,
+            AcademyCohort.team_api_id,
+            AcademyCohort.team_name,
+            PlayerJourney.current_club_api_id,
+            PlayerJourney.current_club_name,
+            PlayerJourney.current_level,
+            func.coalesce(loan_counts.c.loan_spells, 0),
+            latest_seasons.c.latest_season,
+        )
+        .join(AcademyCohort, AcademyCohort.id == CohortMember.cohort_id)
+        .join(PlayerJourney, PlayerJourney.id == CohortMember.journey_id)
+        .outerjoin(loan_counts, loan_counts.c.journey_id == CohortMember.journey_id)
+        .outerjoin(latest_seasons, latest_seasons.c.journey_id == CohortMember.journey_id)
+        .filter(CohortMember.journey_synced == True)  # noqa: E712
+    )
+    if cohort_ids is not None:
+        query = query.filter(CohortMember.cohort_id.in_(list(cohort_ids)))
+
+    config = _get_active_classification_config()
+    changes = []
+    for (member_id, player_api_id, old_status, old_loans, parent_api_id, parent_name,
+         club_id, club_name, level, loan_spells, latest_season) in query.all():
+        try:
+            status, _, _ = classify_tracked_player(
+                current_club_api_id=club_id,
+                current_club_name=club_name,
+                current_level=level,
+                parent_api_id=parent_api_id or 0,
+                parent_club_name=parent_name or '',
+                transfers=[],  # cohort context — no per-player API calls
+                config=config,
+                latest_season=latest_season,
+            )
+        except Exception as e:
+            logger.warning('Failed to derive status for player %s: %s', player_api_id, e)
+            if errors is not None:
+                errors.append(f"Player {player_api_id}: {e}")
+            continue
+        if status != old_status or loan_spells != old_loans:
+            changes.append({
+                'id': member_id,
+                'current_status': status,
+                'total_loan_spells': loan_spells,
+            })
+
+    if changes:
+        db.session.execute(update(CohortMember), changes)
+        db.session.commit()
+    logger.info('Derived cohort member statuses: %d changed', len(changes))
+    return len(changes)
+
+
+def refresh_cohort_aggregates(cohort_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute AcademyCohort counters from member statuses in one pass.
+
+    Cohorts in *cohort_ids* without members are reset to zero. Returns the
+    number of cohorts written.
+    """
+    def _count(*statuses):
+        return func.sum(case((CohortMember.current_status.in_(statuses), 1), else_=0))
+
+    query = db.session.query(
+        CohortMember.cohort_id,
+        func.count(CohortMember.id),
+        _count('first_team'),
+        _count('on_loan'),
+        _count('academy'),
+        _count('released', 'sold'),
+    ).group_by(CohortMember.cohort_id)
+    if cohort_ids is not None:
+        cohort_ids = list(cohort_ids)
+        query = query.filter(CohortMember.cohort_id.in_(cohort_ids))
+
+    rows = {
+        cid: {
+            'id': cid,
+            'total_players': total or 0,
+            'players_first_team': first_team or 0,
+            'players_on_loan': on_loan or 0,
+            'players_still_academy': academy or 0,
+            'players_released': released or 0,
+        }
+        for cid, total, first_team, on_loan, academy, released in query.all()
+    }
+    for cid in (cohort_ids or ()):
+        rows.setdefault(cid, {
+            'id': cid, 'total_players': 0, 'players_first_team': 0,
+            'players_on_loan': 0, 'players_still_academy': 0, 'players_released': 0,
+        })
+
+    if rows:
+        existing = {
+            cid for (cid,) in db.session.query(AcademyCohort.id)
+            .filter(AcademyCohort.id.in_(list(rows))).all()
+        }
+        payload = [row for cid, row in rows.items() if cid in existing]
+        if payload:
+            db.session.execute(update(AcademyCohort), payload)
+            db.session.commit()
+        invalidate_analytics_snapshot()
+        return len(payload)
+    return 0
+
+
+def compute_team_analytics() -> list:
+    """Cross-club comparison: per-team totals and first-team conversion rate."""
+    from src.models.league import TeamProfile
+
+    rows = (
+        db.session.query(
+            AcademyCohort.team_api_id,
+            func.min(AcademyCohort.team_name),
+            func.sum(AcademyCohort.total_players),
+            func.sum(AcademyCohort.players_first_team),
+            func.sum(AcademyCohort.players_on_loan),
+            func.sum(AcademyCohort.players_still_academy),
+            func.sum(AcademyCohort.players_released),
+            func.count(AcademyCohort.id),
+        )
+        .filter(
+            AcademyCohort.sync_status.in_(ANALYTICS_STATUSES),
+            AcademyCohort.total_players > 0,
+        )
+        .group_by(AcademyCohort.team_api_id)
+        .all()
+    )
+    seasons_by_team: dict = {}
+    for team_api_id, season in (
+        db.session.query(AcademyCohort.team_api_id, AcademyCohort.season)
+        .filter(
+            AcademyCohort.sync_status.in_(ANALYTICS_STATUSES),
+            AcademyCohort.total_players > 0,
+        )
+        .distinct()
+        .all()
+    ):
+        seasons_by_team.setdefault(team_api_id, set()).add(season)
+
+    team_ids = [r[0] for r in rows]
+    profiles = {p.team_id: p.logo_url for p in
+                TeamProfile.query.filter(TeamProfile.team_id.in_(team_ids)).all()} if team_ids else {}
+
+    analytics = []
+    for (tid, team_name, total, first_team, on_loan, academy,
+         released, cohort_count) in rows:
+        total = int(total or 0)
+        first_team = int(first_team or 0)
+        analytics.append({
+            'team_api_id': tid,
+            'team_name': team_name,
+            'team_logo': profiles.get(tid),
+            'total_players': total,
+            'players_first_team': first_team,
+            'players_on_loan': int(on_loan or 0),
+            'players_still_academy': int(academy or 0),
+            'players_released': int(released or 0),
+            'cohort_count': int(cohort_count or 0),
+            'seasons': sorted(seasons_by_team.get(tid, ())),
+            'conversion_rate': round(first_team / total * 100, 1) if total > 0 else 0,
+        })
+
+    analytics.sort(key=lambda x: x['conversion_rate'], reverse=True)
+    return analytics
+
+
+def get_analytics_snapshot(max_age: Optional[int] = None) -> dict:
+    """Return ``{'analytics': [...], 'as_of': iso}`` from the process cache.
+
+    Rebuilt when older than *max_age* seconds (default
+    ``ANALYTICS_TTL_SECONDS``) or after ``invalidate_analytics_snapshot``.
+    """
+    max_age = ANALYTICS_TTL_SECONDS if max_age is None else max_age
+    with _snapshot_lock:
+        if _snapshot and (time.monotonic() - _snapshot['_ts']) < max_age:
+            return {'analytics': _snapshot['analytics'], 'as_of': _snapshot['as_of']}
+
+        analytics = compute_team_analytics()
+        _snapshot.clear()
+        _snapshot.update({
+            'analytics': analytics,
+            'as_of': datetime.now(timezone.utc).isoformat(),
+            '_ts': time.monotonic(),
+        })
+        return {'analytics': analytics, 'as_of': _snapshot['as_of']}
+
+
+def invalidate_analytics_snapshot() -> None:
+    """Drop the cached snapshot so the next read recomputes it."""
+    with _snapshot_lock:
+        _snapshot.clear()
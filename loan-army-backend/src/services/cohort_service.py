@@ -13,8 +13,9 @@ from sqlalchemy import or_
 from src.models.league import db
 from src.models.cohort import AcademyCohort, CohortMember
 from src.models.journey import PlayerJourney, PlayerJourneyEntry
-from src.api_football_client import APIFootballClient
+from src.api_football_client import APIFootballClient, get_api_client
 from src.services.journey_sync import JourneySyncService
+from src.services.cohort_analytics import derive_member_statuses, refresh_cohort_aggregates
 from src.utils.academy_classifier import classify_tracked_player, strip_youth_suffix
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,7 @@ class CohortService:
     """Service for discovering and managing academy cohorts"""
 
     def __init__(self, api_client: Optional[APIFootballClient] = None):
-        self.api = api_client or APIFootballClient()
+        self.api = api_client or get_api_client()
 
     def discover_cohort(
         self,
@@ -258,8 +259,6 @@ class CohortService:
             or_(CohortMember.journey_synced == False, CohortMember.journey_id.is_(None)),
         ).all()
 
-        current_year = datetime.now().year
-
         for member in members:
             try:
                 journey = journey_service.sync_player(member.player_api_id)
@@ -272,21 +271,6 @@ class CohortService:
                     member.first_team_debut_season = journey.first_team_debut_season
                     member.total_first_team_apps = journey.total_first_team_apps
                     member.total_clubs = journey.total_clubs
-
-                    # Count loan spells
-                    loan_entries = PlayerJourneyEntry.query.filter_by(
-                        journey_id=journey.id,
-                        entry_type='loan'
-                    ).count()
-                    member.total_loan_spells = loan_entries
-
-                    # Derive current status
-                    member.current_status = self._derive_status(
-                        journey, current_year,
-                        parent_api_id=cohort.team_api_id,
-                        parent_club_name=cohort.team_name or '',
-                    )
-
                     member.journey_synced = True
                     member.journey_sync_error = None
                 else:
@@ -300,6 +284,9 @@ class CohortService:
                 member.journey_sync_error = str(e)
                 db.session.commit()
 
+        # Loan-spell counts + statuses for the whole cohort in one pass
+        derive_member_statuses([cohort_id])
+
         # Refresh aggregates
         self.refresh_cohort_stats(cohort_id)
 
@@ -322,20 +309,8 @@ class CohortService:
 
     def refresh_cohort_stats(self, cohort_id: int) -> None:
         """Recalculate denormalized analytics for a cohort."""
-        cohort = db.session.get(AcademyCohort, cohort_id)
-        if not cohort:
-            return
-
-        members = CohortMember.query.filter_by(cohort_id=cohort_id).all()
-
-        cohort.total_players = len(members)
-        cohort.players_first_team = sum(1 for m in members if m.current_status == 'first_team')
-        cohort.players_on_loan = sum(1 for m in members if m.current_status == 'on_loan')
-        cohort.players_still_academy = sum(1 for m in members if m.current_status == 'academy')
-        cohort.players_released = sum(1 for m in members if m.current_status in ('released', 'sold'))
-
-        db.session.commit()
-        logger.info(f"Refreshed stats for cohort {cohort_id}: {cohort.total_players} players")
+        if refresh_cohort_aggregates([cohort_id]):
+            logger.info(f"Refreshed stats for cohort {cohort_id}")
 
     @staticmethod
     def _derive_status(
@@ -0,0 +1,187 @@
+"""Bulk writes for ``fixture_player_stats`` and the raw fixture payloads.
+
+Fixture syncs used to look up and then insert or update one
+FixturePlayerStats row at a time. ``upsert_fixture_player_stats()`` takes
+the parsed rows for any number of fixtures and writes each batch with a
+single ``INSERT ... ON CONFLICT (fixture_id, player_api_id) DO UPDATE``,
+backed by the ``uq_fixture_player`` unique constraint.
+
+Raw API payloads live compressed in ``fixture_payloads`` rather than in
+the stats and fixture rows themselves; ``store_fixture_payloads()`` writes
+them the same way and ``load_fixture_payloads()`` reads them back in one
+query when a caller actually needs them.
+
+These are Core statements: objects already loaded in the session are not
+refreshed, and the player page flush hook does not see them, so pages are
+invalidated here explicitly.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.models.league import db
+from src.models.weekly import FixturePayload, FixturePlayerStats
+from src.services.player_page import invalidate_player_pages
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_STATS_BATCH_SIZE = int(os.getenv('FIXTURE_STATS_BATCH_SIZE', '500'))
+
+CONFLICT_COLUMNS = ('fixture_id', 'player_api_id')
+PAYLOAD_KEY_COLUMNS = ('fixture_id', 'kind', 'subject_api_id')
+PAYLOAD_KINDS = ('fixture', 'player', 'team')
+
+_DIALECT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+def _normalize(rows: Iterable[Dict[str, Any]]) -> tuple[list, list]:
+    """Dedupe *rows* by conflict key (last wins) and group them by shape.
+
+    Returns ``(groups, payloads)``. Each group is ``(columns, records)`` for
+    rows giving the same set of columns, so an update only sets the columns
+    its row actually carries. A row's ``raw_json`` is split off into
+    *payloads* for ``fixture_payloads``.
+    """
+    table = FixturePlayerStats.__table__
+    by_key = {}
+    for row in rows:
+        missing = [name for name in CONFLICT_COLUMNS if row.get(name) is None]
+        if missing:
+            raise ValueError(f'fixture_player_stats row is missing {", ".join(missing)}')
+        by_key[(row['fixture_id'], row['player_api_id'])] = row
+    if not by_key:
+        return [], []
+
+    names = set().union(*by_key.values()) - {'id', 'raw_json'}
+    unknown = names - set(table.c.keys())
+    if unknown:
+        raise ValueError(f'Unknown fixture_player_stats columns: {", ".join(sorted(unknown))}')
+    # A fixed key order keeps concurrent upserts from deadlocking on each other
+    ordered = [row for _, row in sorted(by_key.items())]
+    groups: Dict[tuple, list] = {}
+    for row in ordered:
+        columns = tuple(column.name for column in table.c if column.name in row and column.name != 'id')
+        groups.setdefault(columns, []).append({name: row[name] for name in columns})
+    payloads = [
+        (row['fixture_id'], 'player', row['player_api_id'], row['raw_json'])
+        for row in ordered if row.get('raw_json') is not None
+    ]
+    return sorted(groups.items()), payloads
+
+
+def _upsert_batch(session, model, key_columns: tuple, records: list, columns: list) -> None:
+    table = model.__table__
+    make_insert = _DIALECT_INSERTS.get(session.get_bind().dialect.name)
+    if make_insert is not None:
+        stmt = make_insert(table).values(records)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={name: stmt.excluded[name] for name in columns if name not in key_columns},
+        )
+        session.execute(stmt)
+        return
+
+    # No ON CONFLICT support: split into one executemany per statement kind
+    key_cols = [table.c[name] for name in key_columns]
+    keys = [tuple(record[name] for name in key_columns) for record in records]
+    existing = {
+        tuple(row[1:]): row[0]
+        for row in session.execute(select(table.c.id, *key_cols).where(tuple_(*key_cols).in_(keys)))
+    }
+    inserts = [record for key, record in zip(keys, records) if key not in existing]
+    updates = [{**record, 'id': existing[key]} for key, record in zip(keys, records) if key in existing]
+    if inserts:
+        session.execute(insert(model), inserts)
+    if updates:
+        session.execute(update(model), updates)
+
+
+def _batches(records: list, batch_size: Optional[int]):
+    size = max(1, batch_size or FIXTURE_STATS_BATCH_SIZE)
+    for start in range(0, len(records), size):
+        yield records[start:start + size]
+
+
+def upsert_fixture_player_stats(rows: Iterable[Dict[str, Any]], session=None,
+                                batch_size: int | None = None) -> int:
+    """Insert or update FixturePlayerStats rows in batches; returns rows written.
+
+    Each row is a dict of column values and needs at least ``fixture_id``
+    (the Fixture primary key), ``player_api_id`` and ``team_api_id``.
+    Duplicate keys keep the last row. Columns a row leaves out take their
+    defaults on insert and keep their stored values on update; rows with
+    different column sets go out in separate statements. An optional
+    ``raw_json`` goes to ``fixture_payloads``.
+    """
+    session = session or db.session
+    groups, payloads = _normalize(rows)
+    if not groups:
+        return 0
+
+    player_ids = set()
+    written = 0
+    for columns, records in groups:
+        for batch in _batches(records, batch_size):
+            _upsert_batch(session, FixturePlayerStats, CONFLICT_COLUMNS, batch, list(columns))
+        player_ids.update(record['player_api_id'] for record in records)
+        written += len(records)
+    store_fixture_payloads(payloads, session=session, batch_size=batch_size)
+
+    invalidate_player_pages(player_ids, session=session)
+    logger.debug('Upserted %d fixture_player_stats rows', written)
+    return written
+
+
+def store_fixture_payloads(entries: Iterable[tuple], session=None, batch_size: int | None = None) -> int:
+    """Compress and upsert raw payloads; returns payloads written.
+
+    *entries* are ``(fixture_pk, kind, subject_api_id, payload)`` tuples;
+    *payload* is a JSON string or anything ``json.dumps`` accepts.
+    """
+    session = session or db.session
+    now = datetime.now(timezone.utc)
+    by_key = {}
+    for fixture_pk, kind, subject_api_id, payload in entries:
+        if kind not in PAYLOAD_KINDS:
+            raise ValueError(f'Unknown fixture payload kind: {kind}')
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        by_key[(fixture_pk, kind, subject_api_id or 0)] = text
+    records = [
+        {'fixture_id': key[0], 'kind': key[1], 'subject_api_id': key[2],
+         'payload': FixturePayload.pack(text), 'updated_at': now}
+        for key, text in sorted(by_key.items())
+    ]
+    columns = list(PAYLOAD_KEY_COLUMNS) + ['payload', 'updated_at']
+    for batch in _batches(records, batch_size):
+        _upsert_batch(session, FixturePayload, PAYLOAD_KEY_COLUMNS, batch, columns)
+    return len(records)
+
+
+def load_fixture_payloads(kind: str, fixture_ids: Iterable[int], subject_api_ids: Iterable[int] | None = None,
+                          session=None) -> Dict[tuple, str]:
+    """Raw payload text keyed by ``(fixture_pk, subject_api_id)``, in one query."""
+    session = session or db.session
+    fixture_ids = {fid for fid in fixture_ids if fid is not None}
+    if not fixture_ids:
+        return {}
+    query = select(FixturePayload.fixture_id, FixturePayload.subject_api_id, FixturePayload.payload).where(
+        FixturePayload.kind == kind,
+        FixturePayload.fixture_id.in_(fixture_ids),
+    )
+    if subject_api_ids is not None:
+        query = query.where(FixturePayload.subject_api_id.in_(set(subject_api_ids)))
+    return {
+        (fixture_id, subject_api_id): FixturePayload.unpack(blob)
+        for fixture_id, subject_api_id, blob in session.execute(query)
+    }
@@ -3,168 +3,686 @@ GOL DataFrame Cache
 
 Loads database tables into pandas DataFrames with a 5-minute TTL cache.
 Used by the GOL Assistant's code-interpreter tool for analytics queries.
+
+The frames are shared across worker processes through a snapshot directory
+(``GOL_SNAPSHOT_DIR``, default a per-user directory under the system temp
+dir). The directory must be owned by this user with mode 0700 since every
+worker unpickles what it finds there; otherwise the shared snapshot is not
+used and each process keeps its frames to itself. Whichever worker first finds the snapshot missing or
+expired takes a file lock, refreshes it and publishes a new version; the
+others memory-map that version instead of querying Postgres. Numeric columns
+are stored as ``.npy`` files and mapped read-only, so every worker shares the
+same pages; string/object columns are pickled.
+
+Refreshes are incremental: each source table has a watermark (row count, max
+id and, where the table has one, max ``updated_at``) and only frames whose
+sources moved are re-queried; the rest are hard-linked from the previous
+snapshot. Tables without ``updated_at`` can change in place unnoticed, so
+frames reading them are re-queried on every refresh (i.e. every TTL) and only
+republished when their contents differ. A full reload still happens every
+``GOL_FULL_REFRESH_SECONDS`` for writes that skip ``updated_at``.
+
+Each frame is converted to an explicit compact schema (``FRAME_SCHEMAS``):
+categorical strings, 32-bit ints, nullable Int/boolean where NULLs occur and
+parsed datetimes. Per-frame row counts, load times and memory footprints are
+logged and reported by ``status()``.
+
+Readers never wait for a refresh once frames exist: a background refresh
+starts ``REFRESH_AHEAD_SECONDS`` before expiry and stale frames are served
+(up to ``STALE_MAX_SECONDS``) while it runs.
+
+Frames handed out (``get_frames``, ``FrameViews.frames``, memoized helper
+results) are private to the caller as shallow copy-on-write views. pandas is
+only used by the GOL modules, so importing this one turns
+``mode.copy_on_write`` on for the whole process (the sandbox pool workers do
+the same, see ``gol_sandbox_pool``); the frames are then never deep-copied.
 """
 
+import json
 import logging
+import os
+import pickle
+import shutil
+import stat
+import tempfile
 import threading
 import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Hand out shallow views of the cached frames instead of deep copies
+pd.set_option('mode.copy_on_write', True)
+
 TTL_SECONDS = 300  # 5 minutes
+REFRESH_AHEAD_SECONDS = 60  # start a background refresh this long before expiry
+STALE_MAX_SECONDS = TTL_SECONDS * 3  # beyond this, readers wait for the refresh
+FULL_REFRESH_SECONDS = int(os.getenv('GOL_FULL_REFRESH_SECONDS', '3600'))
+SNAPSHOT_DIR = os.getenv('GOL_SNAPSHOT_DIR') or os.path.join(
+    tempfile.gettempdir(), f"gol_frames-{os.getuid() if hasattr(os, 'getuid') else 'user'}",
+)
+KEEP_VERSIONS = 2  # previous version stays readable while workers switch over
+STAMP_FILE = 'CURRENT'
+
+
+class FrameQuery(NamedTuple):
+    sql: str
+    sources: tuple  # tables whose watermarks decide when to re-query
+
+
+# Source table -> change-tracking timestamp column (None: count/max id only)
+SOURCE_TABLES = {
+    'tracked_players': 'updated_at',
+    'teams': 'updated_at',
+    'leagues': 'updated_at',
+    'player_journeys': 'updated_at',
+    'player_journey_entries': None,
+    'academy_cohorts': 'updated_at',
+    'cohort_members': None,
+    'fixtures': None,
+    'fixture_player_stats': None,
+}
+# No change marker: in-place edits don't move the watermark
+UNMARKED_TABLES = frozenset(table for table, ts_col in SOURCE_TABLES.items() if ts_col is None)
+
+FRAME_QUERIES: dict[str, FrameQuery] = {
+    'loan_players': FrameQuery("""
+        SELECT
+            tp.player_api_id, tp.player_name, tp.age,
+            tp.position, tp.nationality,
+            tp.team_id AS parent_team_id,
+            t.name AS parent_club,
+            tp.loan_club_name,
+            tp.current_level, tp.is_active
+        FROM tracked_players tp
+        LEFT JOIN teams t ON tp.team_id = t.id
+        WHERE tp.status = 'on_loan' AND tp.is_active = true
+    """, ('tracked_players', 'teams')),
+
+    'teams': FrameQuery("""
+        SELECT
+            t.id, t.team_id, t.name, t.country,
+            l.name AS league_name,
+            t.is_tracked, t.season
+        FROM teams t
+        LEFT JOIN leagues l ON t.league_id = l.id
+        WHERE t.season = (SELECT MAX(season) FROM teams)
+    """, ('teams', 'leagues')),
+
+    'tracked': FrameQuery("""
+        SELECT
+            tp.player_api_id, tp.player_name, tp.position,
+            tp.nationality, tp.age, tp.team_id,
+            tp.status, tp.current_level,
+            tp.loan_club_name, tp.data_source, tp.is_active
+        FROM tracked_players tp
+        WHERE tp.is_active = true
+    """, ('tracked_players',)),
+
+    'journeys': FrameQuery("""
+        SELECT
+            player_api_id, player_name, nationality, birth_date,
+            origin_club_name, origin_year,
+            current_club_name, current_level,
+            first_team_debut_season, first_team_debut_club,
+            total_clubs, total_first_team_apps, total_youth_apps,
+            total_loan_apps, total_goals, total_assists,
+            academy_club_ids
+        FROM player_journeys
+    """, ('player_journeys',)),
+
+    'journey_entries': FrameQuery("""
+        SELECT
+            je.journey_id,
+            pj.player_api_id,
+            je.season, je.club_api_id, je.club_name,
+            je.league_name, je.level, je.entry_type,
+            je.is_youth, je.appearances, je.goals,
+            je.assists, je.minutes
+        FROM player_journey_entries je
+        JOIN player_journeys pj ON je.journey_id = pj.id
+    """, ('player_journey_entries', 'player_journeys')),
+
+    'cohorts': FrameQuery("""
+        SELECT
+            c.id, c.team_api_id,
+            COALESCE(c.team_name, t.name) AS team_name,
+            COALESCE(c.league_name, t_league.name) AS league_name,
+            c.league_level,
+            c.season, c.total_players, c.players_first_team,
+            c.players_on_loan, c.players_still_academy, c.players_released,
+            c.sync_status
+        FROM academy_cohorts c
+        LEFT JOIN teams t ON c.team_api_id = t.team_id
+            AND t.season = (SELECT MAX(season) FROM teams)
+        LEFT JOIN leagues t_league ON t.league_id = t_league.id
+        WHERE c.total_players > 0
+    """, ('academy_cohorts', 'teams', 'leagues')),
+
+    'cohort_members': FrameQuery("""
+        SELECT
+            cohort_id, player_api_id, player_name, position,
+            nationality, current_club_name, current_level,
+            current_status, appearances_in_cohort, goals_in_cohort,
+            first_team_debut_season, total_first_team_apps,
+            total_clubs, total_loan_spells, journey_synced
+        FROM cohort_members
+        WHERE journey_synced = true
+    """, ('cohort_members',)),
+
+    'fixtures': FrameQuery("""
+        SELECT
+            id, fixture_id_api, date_utc, season,
+            competition_name,
+            home_team_api_id, away_team_api_id,
+            home_goals, away_goals
+        FROM fixtures
+    """, ('fixtures',)),
+
+    'fixture_stats': FrameQuery("""
+        SELECT
+            fs.fixture_id, fs.player_api_id, fs.team_api_id,
+            f.season, f.date_utc,
+            fs.minutes, fs.position, fs.rating,
+            fs.goals, fs.assists, fs.saves, fs.yellows, fs.reds,
+            fs.shots_total, fs.shots_on,
+            fs.passes_total, fs.passes_key,
+            fs.tackles_total, fs.tackles_blocks, fs.tackles_interceptions,
+            fs.duels_total, fs.duels_won,
+            fs.dribbles_success, fs.fouls_drawn, fs.fouls_committed
+        FROM fixture_player_stats fs
+        JOIN fixtures f ON fs.fixture_id = f.id
+    """, ('fixture_player_stats', 'fixtures')),
+}
+
+
+# Per-frame column types applied after loading (see ``apply_schema``):
+#   int       smallest of int32/int64 (nullable Int32/Int64 when NULLs occur);
+#             never narrower than 32 bits so per-row arithmetic in sandbox
+#             code (e.g. goals * 90) cannot overflow
+#   float     float64
+#   bool      bool (nullable boolean when NULLs occur)
+#   category  pandas Categorical for repeated strings (clubs, positions, ...)
+#   datetime  datetime64
+# Columns not listed (player names, birth dates, JSON lists) stay as objects.
+FRAME_SCHEMAS: dict[str, dict[str, str]] = {
+    'loan_players': {
+        'player_api_id': 'int', 'age': 'int', 'position': 'category',
+        'nationality': 'category', 'parent_team_id': 'int', 'parent_club': 'category',
+        'loan_club_name': 'category', 'current_level': 'category', 'is_active': 'bool',
+    },
+    'teams': {
+        'id': 'int', 'team_id': 'int', 'country': 'category', 'league_name': 'category',
+        'is_tracked': 'bool', 'season': 'int',
+    },
+    'tracked': {
+        'player_api_id': 'int', 'position': 'category', 'nationality': 'category',
+        'age': 'int', 'team_id': 'int', 'status': 'category', 'current_level': 'category',
+        'loan_club_name': 'category', 'data_source': 'category', 'is_active': 'bool',
+    },
+    'journeys': {
+        'player_api_id': 'int', 'nationality': 'category', 'origin_club_name': 'category',
+        'origin_year': 'int', 'current_club_name': 'category', 'current_level': 'category',
+        'first_team_debut_season': 'int', 'first_team_debut_club': 'category',
+        'total_clubs': 'int', 'total_first_team_apps': 'int', 'total_youth_apps': 'int',
+        'total_loan_apps': 'int', 'total_goals': 'int', 'total_assists': 'int',
+    },
+    'journey_entries': {
+        'journey_id': 'int', 'player_api_id': 'int', 'season': 'int', 'club_api_id': 'int',
+        'club_name': 'category', 'league_name': 'category', 'level': 'category',
+        'entry_type': 'category', 'is_youth': 'bool', 'appearances': 'int',
+        'goals': 'int', 'assists': 'int', 'minutes': 'int',
+    },
+    'cohorts': {
+        'id': 'int', 'team_api_id': 'int', 'team_name': 'category', 'league_name': 'category',
+        'league_level': 'category', 'season': 'int', 'total_players': 'int',
+        'players_first_team': 'int', 'players_on_loan': 'int',
+        'players_still_academy': 'int', 'players_released': 'int', 'sync_status': 'category',
+    },
+    'cohort_members': {
+        'cohort_id': 'int', 'player_api_id': 'int', 'position': 'category',
+        'nationality': 'category', 'current_club_name': 'category',
+        'current_level': 'category', 'current_status': 'category',
+        'appearances_in_cohort': 'int', 'goals_in_cohort': 'int',
+        'first_team_debut_season': 'int', 'total_first_team_apps': 'int',
+        'total_clubs': 'int', 'total_loan_spells': 'int', 'journey_synced': 'bool',
+    },
+    'fixtures': {
+        'id': 'int', 'fixture_id_api': 'int', 'date_utc': 'datetime', 'season': 'int',
+        'competition_name': 'category', 'home_team_api_id': 'int',
+        'away_team_api_id': 'int', 'home_goals': 'int', 'away_goals': 'int',
+    },
+    'fixture_stats': {
+        'fixture_id': 'int', 'player_api_id': 'int', 'team_api_id': 'int', 'season': 'int',
+        'date_utc': 'datetime', 'minutes': 'int', 'position': 'category', 'rating': 'float',
+        **{col: 'int' for col in (
+            'goals', 'assists', 'saves', 'yellows', 'reds', 'shots_total', 'shots_on',
+            'passes_total', 'passes_key', 'tackles_total', 'tackles_blocks',
+            'tackles_interceptions', 'duels_total', 'duels_won', 'dribbles_success',
+            'fouls_drawn', 'fouls_committed',
+        )},
+    },
+}
+
+
+def apply_schema(df: pd.DataFrame, schema: dict[str, str]) -> pd.DataFrame:
+    """Return *df* with the columns in *schema* converted to their compact types."""
+    if df.empty and not len(df.columns):
+        return df
+    converted = {}
+    for col, kind in schema.items():
+        if col not in df.columns:
+            continue
+        try:
+            converted[col] = _coerce(df[col], kind)
+        except (TypeError, ValueError) as e:
+            logger.warning("GOL schema: leaving %s as %s (%s)", col, df[col].dtype, e)
+    return df.assign(**converted) if converted else df
+
+
+def _coerce(series: pd.Series, kind: str) -> pd.Series:
+    if kind == 'category':
+        return series.astype('category')
+    if kind == 'datetime':
+        return pd.to_datetime(series, errors='coerce')
+    if kind == 'float':
+        return pd.to_numeric(series, errors='coerce').astype('float64')
+    if kind == 'bool':
+        return series.astype('boolean' if series.isna().any() else bool)
+    if kind == 'int':
+        values = pd.to_numeric(series, errors='coerce')
+        fits32 = values.dropna().between(np.iinfo(np.int32).min, np.iinfo(np.int32).max).all()
+        if values.isna().any():
+            return values.astype('Int32' if fits32 else 'Int64')
+        return values.astype('int32' if fits32 else 'int64')
+    raise ValueError(f"unknown column type {kind!r}")
+
+
+def memory_bytes(df: pd.DataFrame) -> int:
+    """Deep memory footprint of *df* (object columns include their Python strings)."""
+    return int(df.memory_usage(deep=True, index=False).sum())
 
 
 class DataFrameCache:
     _instance = None
-    """Thread-safe in-process cache for GOL DataFrames."""
+    """Thread-safe cache for GOL DataFrames, shared across processes via snapshots."""
 
-    def __init__(self):
+    def __init__(self, snapshot_dir: str | None = None):
         self._cache: dict[str, pd.DataFrame] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # guards the in-memory state swap
+        self._refresh_lock = threading.Lock()  # one refresh per process at a time
+        self._refreshing = False
         self._loaded_at: float = 0
+        self._version: str | None = None
+        self._stats: dict = {}
+        self._views: FrameViews | None = None
+        self.snapshot_dir = snapshot_dir or SNAPSHOT_DIR
         DataFrameCache._instance = self
 
+    @classmethod
+    def shared(cls) -> 'DataFrameCache':
+        """Return the process-wide cache, creating it on first use."""
+        return cls._instance or cls()
+
+    @property
+    def version(self) -> str | None:
+        """Version stamp of the snapshot currently held (None if process-local)."""
+        return self._version
+
+    def current_version(self) -> str | None:
+        """Version of the newest published snapshot (or of this process's frames)."""
+        stamp = self._read_stamp()
+        return stamp['version'] if stamp else self._version
+
     def get_frames(self, app) -> dict[str, pd.DataFrame]:
-        """Return cached DataFrames, refreshing if TTL expired. Returns copies."""
-        now = time.time()
-        if now - self._loaded_at < TTL_SECONDS and self._cache:
-            return {k: v.copy() for k, v in self._cache.items()}
+        """Return cached DataFrames, refreshing if TTL expired (private copies, see ``_share``)."""
+        return {k: _share(v) for k, v in self._current_frames(app).items()}
 
+    def get_views(self, app) -> 'FrameViews':
+        """Return the derived views (joins, indexes, helper memo) for the current frames."""
+        frames = self._current_frames(app)
         with self._lock:
-            # Double-check after acquiring lock
-            if now - self._loaded_at < TTL_SECONDS and self._cache:
-                return {k: v.copy() for k, v in self._cache.items()}
-            self._cache = self._load_all(app)
-            self._loaded_at = time.time()
-            logger.info("GOL DataFrame cache refreshed (%d frames)", len(self._cache))
-            return {k: v.copy() for k, v in self._cache.items()}
+            if self._views is None or self._views.source is not frames:
+                self._views = FrameViews(frames, version=self._version)
+            return self._views
+
+    def _current_frames(self, app) -> dict[str, pd.DataFrame]:
+        stamp = self._read_stamp()
+        frames = self._fresh_local(stamp)
+        if frames is None:
+            with self._lock:
+                stamp = self._read_stamp()
+                frames = self._fresh_local(stamp)
+                if frames is None and stamp and stamp['version'] != self._version \
+                        and time.time() - stamp['loaded_at'] < TTL_SECONDS:
+                    frames = self._adopt(stamp)
+                if frames is None and self._cache \
+                        and time.time() - self._loaded_at < STALE_MAX_SECONDS:
+                    frames = self._cache  # stale-while-revalidate
+                    self._start_background_refresh(app)
+            if frames is None:
+                frames = self.refresh(app)
+        elif time.time() - self._loaded_at > TTL_SECONDS - REFRESH_AHEAD_SECONDS:
+            self._start_background_refresh(app)
+        return frames
+
+    def refresh(self, app, force_full: bool = False) -> dict[str, pd.DataFrame]:
+        """Bring the shared snapshot up to date and return its frames.
+
+        Adopts a snapshot another worker published meanwhile; otherwise
+        re-queries the frames whose source watermarks changed (all of them
+        when *force_full* or the last full reload is older than
+        ``FULL_REFRESH_SECONDS``).
+        """
+        with self._refresh_lock, self._file_lock():
+            stamp = self._read_stamp()
+            if not force_full and stamp and time.time() - stamp['loaded_at'] < TTL_SECONDS:
+                with self._lock:
+                    frames = self._adopt(stamp)
+                if frames is not None:
+                    return frames
+
+            started = time.perf_counter()
+            marks = self._read_watermarks(app)
+            previous = self._open_snapshot(stamp['version']) if stamp else None
+            full = (
+                force_full or previous is None or not marks or not stamp.get('marks')
+                or time.time() - stamp.get('full_at', 0) >= FULL_REFRESH_SECONDS
+            )
+            if full:
+                reload = list(FRAME_QUERIES)
+            else:
+                changed = {t for t, mark in marks.items() if stamp['marks'].get(t) != mark}
+                changed |= UNMARKED_TABLES
+                reload = [
+                    name for name, query in FRAME_QUERIES.items()
+                    if name not in previous or changed.intersection(query.sources)
+                ]
+
+            loaded, frame_stats = self._load_frames(app, reload)
+            for name in [n for n in loaded if previous and n in previous]:
+                if loaded[name].equals(previous[name]):
+                    # Re-read without a change; keep sharing the published frame
+                    del loaded[name], frame_stats[name]
+            reload = list(loaded)
+            frames = {name: df for name, df in (previous or {}).items() if name in FRAME_QUERIES}
+            frames.update(loaded)
+            loaded_at = time.time()
+            stats = {
+                'mode': 'full' if full else ('incremental' if reload else 'unchanged'),
+                'refreshed_at': datetime.now(timezone.utc).isoformat(),
+                'duration_seconds': round(time.perf_counter() - started, 3),
+                'frames': {
+                    name: frame_stats.get(name) or {
+                        **((stamp or {}).get('stats', {}).get('frames', {}).get(name) or {}),
+                        'rows': len(frames[name]),
+                        'reloaded': False,
+                    }
+                    for name in frames
+                },
+            }
+            stamp_data = {
+                'loaded_at': loaded_at,
+                'full_at': loaded_at if full else stamp.get('full_at', 0),
+                'marks': marks,
+                'stats': stats,
+            }
+
+            if reload or not stamp:
+                version = self._publish(
+                    frames, stamp_data,
+                    reuse_version=stamp['version'] if previous is not None else None,
+                    reused=set(frames) - set(reload),
+                )
+                if version is not None:
+                    # Serve from the mapped snapshot so this worker shares pages too
+                    frames = self._open_snapshot(version) or frames
+            else:
+                version = stamp['version']
+                try:
+                    self._write_stamp({**stamp_data, 'version': version})
+                except OSError as e:
+                    logger.warning("GOL snapshot stamp update failed: %s", e)
+
+            with self._lock:
+                self._cache = frames
+                self._version = version
+                self._loaded_at = loaded_at
+                self._stats = stats
+            logger.info(
+                "GOL DataFrame cache refreshed (%s, %d/%d frames reloaded in %.3fs, snapshot %s)",
+                stats['mode'], len(reload), len(frames), stats['duration_seconds'],
+                version or 'local',
+            )
+            return frames
+
+    def status(self) -> dict:
+        """Describe the current snapshot: version, age, refresh mode and per-frame stats."""
+        stamp = self._read_stamp() or {}
+        stats = stamp.get('stats') or self._stats
+        loaded_at = stamp.get('loaded_at', self._loaded_at)
+        frame_stats = (stats.get('frames') or {}).values()
+        return {
+            'version': stamp.get('version', self._version),
+            'age_seconds': round(time.time() - loaded_at, 1) if loaded_at else None,
+            'ttl_seconds': TTL_SECONDS,
+            'refreshing': self._refreshing,
+            'watermarks': stamp.get('marks', {}),
+            'memory_bytes': sum(f.get('memory_bytes', 0) for f in frame_stats),
+            'raw_memory_bytes': sum(f.get('raw_memory_bytes', 0) for f in frame_stats),
+            **stats,
+        }
+
+    def _fresh_local(self, stamp: dict | None) -> dict[str, pd.DataFrame] | None:
+        """Return the in-memory frames if they are still the current version."""
+        if not self._cache:
+            return None
+        if stamp is not None:
+            if stamp['version'] == self._version and time.time() - stamp['loaded_at'] < TTL_SECONDS:
+                return self._cache
+            return None
+        # No shared snapshot: only a process-local load (publish failed) is usable
+        if self._version is None and time.time() - self._loaded_at < TTL_SECONDS:
+            return self._cache
+        return None
+
+    def _adopt(self, stamp: dict) -> dict[str, pd.DataFrame] | None:
+        """Switch to the snapshot *stamp* points at (published by any worker)."""
+        if stamp['version'] == self._version and self._cache:
+            self._loaded_at = stamp['loaded_at']
+            return self._cache
+        frames = self._open_snapshot(stamp['version'])
+        if frames is not None:
+            self._cache = frames
+            self._version = stamp['version']
+            self._loaded_at = stamp['loaded_at']
+            self._stats = stamp.get('stats') or {}
+            logger.info("GOL DataFrame cache mapped snapshot %s", self._version)
+        return frames
+
+    def _start_background_refresh(self, app) -> None:
+        """Refresh on a daemon thread unless one is already running."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+
+        def _run():
+            try:
+                self.refresh(app)
+            except Exception as e:
+                logger.error("GOL background refresh failed: %s", e)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=_run, name='gol-frames-refresh', daemon=True).start()
+
+    # ── loading ────────────────────────────────────────────────────────
 
     def _load_all(self, app) -> dict[str, pd.DataFrame]:
         """Load all DataFrames from the database."""
+        return self._load_frames(app, list(FRAME_QUERIES))[0]
+
+    def _load_frames(self, app, names: list[str]) -> tuple[dict[str, pd.DataFrame], dict]:
+        """Run the queries for *names*, logging per-frame row counts and timings."""
         from src.models.league import db
 
+        frames, stats = {}, {}
+        if not names:
+            return frames, stats
         with app.app_context():
             engine = db.engine
-            frames = {}
-
-            frames['loan_players'] = self._load_query(engine, """
-                SELECT
-                    tp.player_api_id, tp.player_name, tp.age,
-                    tp.position, tp.nationality,
-                    tp.team_id AS parent_team_id,
-                    t.name AS parent_club,
-                    tp.loan_club_name,
-                    tp.current_level, tp.is_active
-                FROM tracked_players tp
-                LEFT JOIN teams t ON tp.team_id = t.id
-                WHERE tp.status = 'on_loan' AND tp.is_active = true
-            """)
-
-            frames['teams'] = self._load_query(engine, """
-                SELECT
-                    t.id, t.team_id, t.name, t.country,
-                    l.name AS league_name,
-                    t.is_tracked, t.season
-                FROM teams t
-                LEFT JOIN leagues l ON t.league_id = l.id
-                WHERE t.season = (SELECT MAX(season) FROM teams)
-            """)
-
-            frames['tracked'] = self._load_query(engine, """
-                SELECT
-                    tp.player_api_id, tp.player_name, tp.position,
-                    tp.nationality, tp.age, tp.team_id,
-                    tp.status, tp.current_level,
-                    tp.loan_club_name, tp.data_source, tp.is_active
-                FROM tracked_players tp
-                WHERE tp.is_active = true
-            """)
-
-            frames['journeys'] = self._load_query(engine, """
-                SELECT
-                    player_api_id, player_name, nationality, birth_date,
-                    origin_club_name, origin_year,
-                    current_club_name, current_level,
-                    first_team_debut_season, first_team_debut_club,
-                    total_clubs, total_first_team_apps, total_youth_apps,
-                    total_loan_apps, total_goals, total_assists,
-                    academy_club_ids
-                FROM player_journeys
-            """)
-
-            frames['journey_entries'] = self._load_query(engine, """
-                SELECT
-                    je.journey_id,
-                    pj.player_api_id,
-                    je.season, je.club_api_id, je.club_name,
-                    je.league_name, je.level, je.entry_type,
-                    je.is_youth, je.appearances, je.goals,
-                    je.assists, je.minutes
-                FROM player_journey_entries je
-                JOIN player_journeys pj ON je.journey_id = pj.id
-            """)
-
-            frames['cohorts'] = self._load_query(engine, """
-                SELECT
-                    c.id, c.team_api_id,
-                    COALESCE(c.team_name, t.name) AS team_name,
-                    COALESCE(c.league_name, t_league.name) AS league_name,
-                    c.league_level,
-                    c.season, c.total_players, c.players_first_team,
-                    c.players_on_loan, c.players_still_academy, c.players_released,
-                    c.sync_status
-                FROM academy_cohorts c
-                LEFT JOIN teams t ON c.team_api_id = t.team_id
-                    AND t.season = (SELECT MAX(season) FROM teams)
-                LEFT JOIN leagues t_league ON t.league_id = t_league.id
-                WHERE c.total_players > 0
-            """)
-
-            frames['cohort_members'] = self._load_query(engine, """
-                SELECT
-                    cohort_id, player_api_id, player_name, position,
-                    nationality, current_club_name, current_level,
-                    current_status, appearances_in_cohort, goals_in_cohort,
-                    first_team_debut_season, total_first_team_apps,
-                    total_clubs, total_loan_spells, journey_synced
-                FROM cohort_members
-                WHERE journey_synced = true
-            """)
-
-            frames['fixtures'] = self._load_query(engine, """
-                SELECT
-                    id, fixture_id_api, date_utc, season,
-                    competition_name,
-                    home_team_api_id, away_team_api_id,
-                    home_goals, away_goals
-                FROM fixtures
-            """)
-
-            frames['fixture_stats'] = self._load_query(engine, """
-                SELECT
-                    fs.fixture_id, fs.player_api_id, fs.team_api_id,
-                    f.season, f.date_utc,
-                    fs.minutes, fs.position, fs.rating,
-                    fs.goals, fs.assists, fs.saves, fs.yellows, fs.reds,
-                    fs.shots_total, fs.shots_on,
-                    fs.passes_total, fs.passes_key,
-                    fs.tackles_total, fs.tackles_blocks, fs.tackles_interceptions,
-                    fs.duels_total, fs.duels_won,
-                    fs.dribbles_success, fs.fouls_drawn, fs.fouls_committed
-                FROM fixture_player_stats fs
-                JOIN fixtures f ON fs.fixture_id = f.id
-            """)
+            for name in names:
+                started = time.perf_counter()
+                raw = self._load_query(engine, FRAME_QUERIES[name].sql)
+                raw_bytes = memory_bytes(raw)
+                frames[name] = apply_schema(raw, FRAME_SCHEMAS.get(name, {}))
+                del raw
+                seconds = round(time.perf_counter() - started, 3)
+                stats[name] = {
+                    'rows': len(frames[name]), 'seconds': seconds, 'reloaded': True,
+                    'memory_bytes': memory_bytes(frames[name]), 'raw_memory_bytes': raw_bytes,
+                }
+                logger.info(
+                    "GOL frame %s loaded: %d rows in %.3fs, %.1f KiB (%.1f KiB untyped)",
+                    name, len(frames[name]), seconds,
+                    stats[name]['memory_bytes'] / 1024, raw_bytes / 1024,
+                )
+        return frames, stats
 
-            return frames
+    @staticmethod
+    def _read_watermarks(app) -> dict[str, list]:
+        """Return ``{table: [count, max_id, max_updated_at]}`` in one round trip."""
+        from sqlalchemy import text
+        from src.models.league import db
+
+        selects = []
+        for table, ts_col in SOURCE_TABLES.items():
+            selects.append(f"(SELECT COUNT(*) FROM {table})")
+            selects.append(f"(SELECT MAX(id) FROM {table})")
+            selects.append(f"(SELECT MAX({ts_col}) FROM {table})" if ts_col else "NULL")
+        with app.app_context():
+            try:
+                row = db.session.execute(text("SELECT " + ", ".join(selects))).fetchone()
+            except Exception as e:
+                logger.warning("GOL watermark query failed, forcing full reload: %s", e)
+                db.session.rollback()
+                return {}
+        values = [None if v is None else str(v) for v in row]
+        return {
+            table: values[i * 3:i * 3 + 3]
+            for i, table in enumerate(SOURCE_TABLES)
+        }
+
+    # ── shared snapshots ───────────────────────────────────────────────
+
+    def _snapshot_path(self, *parts: str) -> str:
+        """Path inside the snapshot directory (raises PermissionError if it isn't private)."""
+        return os.path.join(private_snapshot_dir(self.snapshot_dir), *parts)
+
+    def _file_lock(self):
+        try:
+            return _SnapshotLock(self._snapshot_path('.lock'))
+        except OSError as e:
+            logger.warning("GOL snapshot directory unusable: %s", e)
+            return _SnapshotLock(None)
+
+    def _read_stamp(self) -> dict | None:
+        try:
+            with open(self._snapshot_path(STAMP_FILE)) as fh:
+                stamp = json.load(fh)
+            stamp['version'] = str(stamp['version'])
+            stamp['loaded_at'] = float(stamp['loaded_at'])
+            return stamp
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_stamp(self, stamp: dict) -> None:
+        stamp_tmp = self._snapshot_path(f".{STAMP_FILE}-{os.getpid()}-{threading.get_ident()}")
+        with open(stamp_tmp, 'w') as fh:
+            json.dump(stamp, fh)
+        os.replace(stamp_tmp, self._snapshot_path(STAMP_FILE))
+
+    def _publish(self, frames: dict[str, pd.DataFrame], stamp: dict,
+                 reuse_version: str | None = None, reused: set = frozenset()) -> str | None:
+        """Write *frames* as a new snapshot version and point the stamp at it.
+
+        Frames in *reused* are hard-linked from *reuse_version* instead of
+        being written again.
+        """
+        version = f"{int(stamp['loaded_at'] * 1000)}-{os.getpid()}"
+        final_dir = os.path.join(self.snapshot_dir, version)
+        tmp_dir = os.path.join(self.snapshot_dir, f".tmp-{version}")
+        try:
+            private_snapshot_dir(self.snapshot_dir)
+            os.makedirs(tmp_dir, exist_ok=True)
+            for name, df in frames.items():
+                if reuse_version and name in reused:
+                    shutil.copytree(
+                        os.path.join(self.snapshot_dir, reuse_version, name),
+                        os.path.join(tmp_dir, name),
+                        copy_function=_link_or_copy,
+                    )
+                else:
+                    _write_frame(os.path.join(tmp_dir, name), df)
+            os.replace(tmp_dir, final_dir)
+            self._write_stamp({**stamp, 'version': version})
+        except Exception as e:
+            logger.warning("GOL snapshot publish failed, using process-local cache: %s", e)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+        self._prune(keep=version)
+        return version
+
+    def _open_snapshot(self, version: str) -> dict[str, pd.DataFrame] | None:
+        return open_snapshot(self.snapshot_dir, version)
+
+    def _prune(self, keep: str) -> None:
+        """Remove all but the newest KEEP_VERSIONS snapshot directories.
+
+        Workers still mapping an older version keep their pages (unlinking a
+        mapped file does not invalidate the mapping).
+        """
+        try:
+            versions = sorted(
+                (d for d in os.listdir(self._snapshot_path())
+                 if not d.startswith('.') and d != STAMP_FILE),
+                key=lambda d: os.path.getmtime(os.path.join(self.snapshot_dir, d)),
+                reverse=True,
+            )
+        except OSError:
+            return
+        for old in versions[KEEP_VERSIONS:]:
+            if old != keep:
+                shutil.rmtree(os.path.join(self.snapshot_dir, old), ignore_errors=True)
 
     @classmethod
     def invalidate(cls):
-        """Clear cached DataFrames so next access reloads from DB."""
-        if cls._instance:
-            cls._instance._cache = {}
-            cls._instance._loaded_at = 0
+        """Clear cached DataFrames so next access reloads from DB.
+
+        Expires the shared stamp too, so every worker refreshes on its next
+        call (incrementally, against the current watermarks).
+        """
+        cache = cls.shared()
+        with cache._lock:
+            cache._cache = {}
+            cache._loaded_at = 0
+        stamp = cache._read_stamp()
+        if stamp:
+            try:
+                cache._write_stamp({**stamp, 'loaded_at': 0})
+            except OSError:
+                pass
 
     @staticmethod
     def _load_query(engine, sql: str) -> pd.DataFrame:
@@ -174,3 +692,245 @@ class DataFrameCache:
         except Exception as e:
             logger.error("Failed to load DataFrame: %s — %s", sql[:60], e)
             return pd.DataFrame()
+
+
+def open_snapshot(snapshot_dir: str, version: str) -> dict[str, pd.DataFrame] | None:
+    """Map every frame of a published snapshot version (None if unreadable)."""
+    try:
+        version_dir = os.path.join(private_snapshot_dir(snapshot_dir), version)
+        return {
+            name: _read_frame(os.path.join(version_dir, name))
+            for name in sorted(os.listdir(version_dir))
+        }
+    except Exception as e:
+        logger.warning("GOL snapshot %s unreadable: %s", version, e)
+        return None
+
+
+def normalize_name(value) -> str:
+    """Case- and accent-insensitive key for player name lookups."""
+    text = unicodedata.normalize('NFKD', str(value))
+    return ''.join(c for c in text if not unicodedata.combining(c)).casefold().strip()
+
+
+class FrameViews:
+    """Joins and indexes derived from one version of the frames.
+
+    Built once per refresh (``DataFrameCache.get_views``) so the sandbox
+    helpers don't redo the same merges and full-frame scans on every tool
+    call. Helper results are memoized on the instance, which makes the memo
+    key effectively ``(helper, args, cache version)``.
+    """
+
+    MEMO_SIZE = 256
+
+    def __init__(self, frames: dict[str, pd.DataFrame], version: str | None = None):
+        self.source = frames
+        self.version = version
+        empty = pd.DataFrame()
+        tracked = frames.get('tracked', empty)
+        teams = frames.get('teams', empty)
+        journeys = frames.get('journeys', empty)
+        entries = frames.get('journey_entries', empty)
+
+        if not tracked.empty and not teams.empty:
+            self.tracked_teams = tracked.merge(
+                teams[['id', 'name']], left_on='team_id', right_on='id', how='inner',
+            )
+        else:
+            self.tracked_teams = empty
+
+        if not journeys.empty:
+            self.journeys_by_player = journeys.drop_duplicates('player_api_id').set_index('player_api_id')
+            self._name_keys = journeys['player_name'].fillna('').map(normalize_name)
+            self._exact_names = dict(
+                zip(self._name_keys[::-1].tolist(), journeys['player_api_id'][::-1].tolist())
+            )
+        else:
+            self.journeys_by_player = empty
+            self._name_keys = pd.Series(dtype=object)
+            self._exact_names = {}
+        self._journey_pids = journeys['player_api_id'].to_numpy() if not journeys.empty else np.array([])
+
+        self._entry_positions = (
+            entries.groupby('player_api_id', observed=True).indices if not entries.empty else {}
+        )
+
+        self._memo: OrderedDict = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def frames(self) -> dict[str, pd.DataFrame]:
+        """Per-call private frames (safe to hand to sandbox code)."""
+        return {k: _share(v) for k, v in self.source.items()}
+
+    def find_player(self, player_name: str):
+        """player_api_id for *player_name*: exact normalized match, else first partial match."""
+        key = normalize_name(player_name)
+        if not key:
+            return None
+        if key in self._exact_names:
+            return self._exact_names[key]
+        hits = np.flatnonzero(self._name_keys.str.contains(key, regex=False).to_numpy())
+        return self._journey_pids[hits[0]] if len(hits) else None
+
+    def journey_entries_for(self, player_api_id) -> pd.DataFrame:
+        """journey_entries rows for one player, via the precomputed positions."""
+        positions = self._entry_positions.get(player_api_id)
+        entries = self.source.get('journey_entries', pd.DataFrame())
+        if positions is None:
+            return entries.iloc[0:0]
+        return entries.iloc[positions]
+
+    def memoized(self, key, compute):
+        """Return the cached result for *key*, computing it on first use."""
+        try:
+            with self._memo_lock:
+                if key in self._memo:
+                    self._memo.move_to_end(key)
+                    return _share(self._memo[key])
+        except TypeError:  # unhashable arguments
+            return compute()
+        result = compute()
+        with self._memo_lock:
+            self._memo[key] = result
+            while len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return _share(result)
+
+
+def _share(value):
+    """Copy DataFrames/Series so callers can't alter the shared object.
+
+    A shallow view suffices under copy-on-write, which this module enables;
+    should something turn it off again, a shallow copy would share writable
+    blocks, so the data is copied.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not pd.get_option('mode.copy_on_write'))
+    return value
+
+
+_private_dirs: set = set()
+
+
+def private_snapshot_dir(path: str) -> str:
+    """Create *path* with mode 0700 and check that only this user can write to it.
+
+    Snapshots hold pickled columns, so a directory that someone else created
+    or can write to would let them run code in every worker; such a directory
+    raises PermissionError. Verified paths are remembered for the process.
+    """
+    if path in _private_dirs:
+        return path
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    owner = os.getuid() if hasattr(os, 'getuid') else st.st_uid
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != owner or st.st_mode & 0o077:
+        raise PermissionError(
+            f"GOL snapshot directory {path} must be a directory owned by this user "
+            f"with mode 0700 (found owner {st.st_uid}, mode {stat.S_IMODE(st.st_mode):o})"
+        )
+    _private_dirs.add(path)
+    return path
+
+
+class _SnapshotLock:
+    """Exclusive cross-process lock on a file (no-op without fcntl or a path)."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._fh = None
+
+    def __enter__(self):
+        if fcntl is None or self.path is None:
+            return self
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._fh = open(self.path, 'a')
+            fcntl.flock(self._fh, fcntl.LOCK_EX)
+        except OSError as e:
+            logger.warning("GOL snapshot lock unavailable: %s", e)
+            self._fh = None
+        return self
+
+    def __exit__(self, *exc):
+        if self._fh is not None:
+            fcntl.flock(self._fh, fcntl.LOCK_UN)
+            self._fh.close()
+            self._fh = None
+        return False
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link an unchanged snapshot file, copying where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _is_mappable(dtype) -> bool:
+    """Plain numpy numeric/bool/datetime columns can be memory-mapped."""
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM'
+
+
+def _write_frame(frame_dir: str, df: pd.DataFrame) -> None:
+    """Store a frame so its numeric buffers can be memory-mapped on read.
+
+    Column kinds: ``npy`` (plain numpy array), ``masked`` (nullable Int/boolean:
+    values + mask arrays), ``category`` (codes array; categories pickled) and
+    ``pickle`` for everything else.
+    """
+    os.makedirs(frame_dir, exist_ok=True)
+    kinds, pickled = [], {}
+    for pos in range(len(df.columns)):
+        series = df.iloc[:, pos]
+        array = series.array
+        if _is_mappable(series.dtype):
+            np.save(os.path.join(frame_dir, f'{pos}.npy'), series.to_numpy())
+            kinds.append('npy')
+        elif isinstance(array, pd.arrays.BooleanArray | pd.arrays.IntegerArray | pd.arrays.FloatingArray):
+            np.save(os.path.join(frame_dir, f'{pos}.npy'), array._data)
+            np.save(os.path.join(frame_dir, f'{pos}.mask.npy'), array._mask)
+            kinds.append('masked')
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            np.save(os.path.join(frame_dir, f'{pos}.npy'), array.codes)
+            pickled[pos] = series.dtype
+            kinds.append('category')
+        else:
+            pickled[pos] = series
+            kinds.append('pickle')
+    with open(os.path.join(frame_dir, 'objects.pkl'), 'wb') as fh:
+        pickle.dump(pickled, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(os.path.join(frame_dir, 'meta.json'), 'w') as fh:
+        json.dump({'columns': [str(c) for c in df.columns], 'kinds': kinds,
+                   'rows': len(df)}, fh)
+
+
+def _read_frame(frame_dir: str) -> pd.DataFrame:
+    """Rebuild a frame from its snapshot without copying the mapped buffers."""
+    with open(os.path.join(frame_dir, 'meta.json')) as fh:
+        meta = json.load(fh)
+    with open(os.path.join(frame_dir, 'objects.pkl'), 'rb') as fh:
+        pickled = pickle.load(fh)
+
+    def _mapped(name):
+        return np.load(os.path.join(frame_dir, name), mmap_mode='r')
+
+    data = {}
+    for pos, (col, kind) in enumerate(zip(meta['columns'], meta['kinds'])):
+        if kind == 'npy':
+            data[col] = _mapped(f'{pos}.npy')
+        elif kind == 'masked':
+            values, mask = _mapped(f'{pos}.npy'), _mapped(f'{pos}.mask.npy')
+            if values.dtype.kind == 'b':
+                data[col] = pd.arrays.BooleanArray(values, mask)
+            elif values.dtype.kind == 'f':
+                data[col] = pd.arrays.FloatingArray(values, mask)
+            else:
+                data[col] = pd.arrays.IntegerArray(values, mask)
+        elif kind == 'category':
+            data[col] = pd.Categorical.from_codes(_mapped(f'{pos}.npy'), dtype=pickled[pos], validate=False)
+        else:
+            data[col] = pickled[pos]
+    return pd.DataFrame(data, columns=meta['columns'], index=pd.RangeIndex(meta['rows']), copy=False)
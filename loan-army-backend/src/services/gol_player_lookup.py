@@ -16,7 +16,7 @@ from datetime import date
 from difflib import SequenceMatcher
 from typing import Any, Dict, List, Optional
 
-from src.api_football_client import APIFootballClient
+from src.api_football_client import get_api_client
 from src.models.journey import PlayerJourney
 from src.models.league import Team, db
 from src.models.tracked_player import TrackedPlayer
@@ -43,7 +43,7 @@ class GolPlayerLookup:
 
     def __init__(self, app):
         self.app = app
-        self.api_client = APIFootballClient()
+        self.api_client = get_api_client()
 
     def lookup(self, name: str, team: str | None = None, session_id: str | None = None) -> dict:
         """Search API-Football and persist player career data.
@@ -6,6 +6,7 @@ with allowlisted builtins, no imports, and a 10-second timeout.
 """
 
 import ctypes
+import functools
 import logging
 import threading
 
@@ -14,10 +15,13 @@ import pandas as pd
 from RestrictedPython import compile_restricted
 from RestrictedPython.Guards import safe_builtins, safer_getattr
 
+from src.services.gol_dataframes import FrameViews
+
 logger = logging.getLogger(__name__)
 
 MAX_ROWS = 100
 TIMEOUT_SECONDS = 10
+TIMEOUT_ERROR = f'Analysis timed out ({TIMEOUT_SECONDS}s limit)'
 
 ALLOWED_BUILTINS = {
     **safe_builtins,
@@ -56,25 +60,31 @@ BIG_6 = ['Arsenal', 'Chelsea', 'Liverpool', 'Manchester United',
          'Manchester City', 'Tottenham Hotspur']
 
 
-def _build_helpers(dataframes: dict) -> dict:
+def _build_helpers(dataframes: dict, views: FrameViews | None = None) -> dict:
     """Build helper functions that operate on the loaded DataFrames.
 
     These run as normal Python (not RestrictedPython), so pandas is unrestricted.
+    String dimensions are categorical (see ``FRAME_SCHEMAS``), so group-bys
+    pass ``observed=True`` to skip empty categories.
+
+    Joins and lookups come from *views* (precomputed once per cache refresh)
+    and results are memoized there, so a repeated helper call in a chat
+    session is served from memory.
     """
+    if views is None:
+        views = FrameViews(dataframes)
 
     def academy_comparison():
         """Big 6 academy status breakdown: first_team/on_loan/academy/released per club."""
-        tracked = dataframes.get('tracked', pd.DataFrame())
-        teams = dataframes.get('teams', pd.DataFrame())
-        if tracked.empty or teams.empty:
+        merged = views.tracked_teams
+        if merged.empty:
             return pd.DataFrame(columns=['team', 'first_team', 'on_loan', 'academy', 'released'])
 
-        merged = tracked.merge(teams[['id', 'name']], left_on='team_id', right_on='id', how='inner')
         merged = merged[merged['name'].isin(BIG_6)]
         if merged.empty:
             return pd.DataFrame(columns=['team', 'first_team', 'on_loan', 'academy', 'released'])
 
-        pivot = merged.groupby(['name', 'status']).size().unstack(fill_value=0).reset_index()
+        pivot = merged.groupby(['name', 'status'], observed=True).size().unstack(fill_value=0).reset_index()
         pivot = pivot.rename(columns={'name': 'team'})
         if 'first_team' in pivot.columns:
             pivot = pivot.sort_values('first_team', ascending=False)
@@ -82,13 +92,11 @@ def _build_helpers(dataframes: dict) -> dict:
 
     def first_team_graduates(team_name=None):
         """Players who reached the first team. Optional team_name filter (partial match)."""
-        tracked = dataframes.get('tracked', pd.DataFrame())
-        teams = dataframes.get('teams', pd.DataFrame())
-        if tracked.empty or teams.empty:
+        merged = views.tracked_teams
+        if merged.empty:
             return pd.DataFrame(columns=['player_name', 'team', 'position', 'nationality', 'age'])
 
-        ft = tracked[tracked['status'] == 'first_team']
-        merged = ft.merge(teams[['id', 'name']], left_on='team_id', right_on='id', how='inner')
+        merged = merged[merged['status'] == 'first_team']
         if team_name:
             merged = merged[merged['name'].str.contains(team_name, case=False, na=False)]
         return (merged[['player_name', 'name', 'position', 'nationality', 'age']]
@@ -98,14 +106,12 @@ def _build_helpers(dataframes: dict) -> dict:
 
     def player_status_breakdown(team_name):
         """Status distribution for one team's tracked players."""
-        tracked = dataframes.get('tracked', pd.DataFrame())
-        teams = dataframes.get('teams', pd.DataFrame())
-        if tracked.empty or teams.empty:
+        merged = views.tracked_teams
+        if merged.empty:
             return pd.DataFrame(columns=['status', 'count'])
 
-        merged = tracked.merge(teams[['id', 'name']], left_on='team_id', right_on='id', how='inner')
         merged = merged[merged['name'].str.contains(team_name, case=False, na=False)]
-        return (merged.groupby('status').size()
+        return (merged.groupby('status', observed=True).size()
                 .reset_index(name='count')
                 .sort_values('count', ascending=False)
                 .reset_index(drop=True))
@@ -115,13 +121,11 @@ def _build_helpers(dataframes: dict) -> dict:
 
         Optional team_name filter (partial match). Without a filter, defaults to Big 6.
         """
-        tracked = dataframes.get('tracked', pd.DataFrame())
-        teams = dataframes.get('teams', pd.DataFrame())
-        if tracked.empty or teams.empty:
+        merged = views.tracked_teams
+        if merged.empty:
             return pd.DataFrame(columns=['player_name', 'team', 'status', 'position', 'loan_club_name', 'age'])
 
-        active = tracked[tracked['status'].isin(['academy', 'on_loan', 'first_team'])]
-        merged = active.merge(teams[['id', 'name']], left_on='team_id', right_on='id', how='inner')
+        merged = merged[merged['status'].isin(['academy', 'on_loan', 'first_team'])]
         if team_name:
             merged = merged[merged['name'].str.contains(team_name, case=False, na=False)]
         else:
@@ -133,23 +137,20 @@ def _build_helpers(dataframes: dict) -> dict:
 
     def academy_first_team_apps(team_name=None):
         """Graduates with first-team appearances, grouped by club. Deduplicated on player_api_id."""
-        tracked = dataframes.get('tracked', pd.DataFrame())
-        teams = dataframes.get('teams', pd.DataFrame())
-        journeys = dataframes.get('journeys', pd.DataFrame())
-        if tracked.empty or teams.empty or journeys.empty:
+        merged = views.tracked_teams
+        if merged.empty or views.journeys_by_player.empty:
             return pd.DataFrame(columns=['team', 'total_graduates', 'total_first_team_apps'])
 
-        ft = tracked[tracked['status'] == 'first_team'].drop_duplicates(subset=['player_api_id'])
-        ft = ft.merge(teams[['id', 'name']], left_on='team_id', right_on='id', how='inner')
-        ft = ft.merge(journeys[['player_api_id', 'total_first_team_apps']], on='player_api_id', how='left')
-        ft['total_first_team_apps'] = ft['total_first_team_apps'].fillna(0).astype(int)
+        ft = merged[merged['status'] == 'first_team'].drop_duplicates(subset=['player_api_id'])
+        apps = ft['player_api_id'].map(views.journeys_by_player['total_first_team_apps'])
+        ft = ft.assign(total_first_team_apps=apps.fillna(0).astype(int))
 
         if team_name:
             ft = ft[ft['name'].str.contains(team_name, case=False, na=False)]
         else:
             ft = ft[ft['name'].isin(BIG_6)]
 
-        result = ft.groupby('name').agg(
+        result = ft.groupby('name', observed=True).agg(
             total_graduates=('player_api_id', 'count'),
             total_first_team_apps=('total_first_team_apps', 'sum')
         ).reset_index().rename(columns={'name': 'team'})
@@ -162,7 +163,7 @@ def _build_helpers(dataframes: dict) -> dict:
         if loan_players.empty or fixture_stats.empty:
             return pd.DataFrame(columns=['player_name', 'parent_club', 'loan_club', 'goals', 'assists', 'minutes', 'avg_rating'])
 
-        fs = fixture_stats.copy()
+        fs = fixture_stats
         target_season = season if season else fs['season'].max()
         fs = fs[fs['season'] == target_season]
 
@@ -170,7 +171,7 @@ def _build_helpers(dataframes: dict) -> dict:
         if merged.empty:
             return pd.DataFrame(columns=['player_name', 'parent_club', 'loan_club', 'goals', 'assists', 'minutes', 'avg_rating'])
 
-        agg = merged.groupby(['player_api_id', 'player_name', 'parent_club', 'loan_club_name']).agg(
+        agg = merged.groupby(['player_api_id', 'player_name', 'parent_club', 'loan_club_name'], observed=True).agg(
             goals=('goals', 'sum'),
             assists=('assists', 'sum'),
             minutes=('minutes', 'sum'),
@@ -183,21 +184,16 @@ def _build_helpers(dataframes: dict) -> dict:
         })[['player_name', 'parent_club', 'loan_club', 'goals', 'assists', 'minutes', 'avg_rating']].reset_index(drop=True)
 
     def player_career(player_name):
-        """Season-by-season career for a player (partial name match)."""
-        journeys = dataframes.get('journeys', pd.DataFrame())
-        journey_entries = dataframes.get('journey_entries', pd.DataFrame())
-        if journeys.empty or journey_entries.empty:
-            return pd.DataFrame(columns=['season', 'club_name', 'level', 'appearances', 'goals', 'assists', 'minutes'])
-
-        matches = journeys[journeys['player_name'].str.contains(player_name, case=False, na=False)]
-        if matches.empty:
-            return pd.DataFrame(columns=['season', 'club_name', 'level', 'appearances', 'goals', 'assists', 'minutes'])
+        """Season-by-season career for a player (partial, accent-insensitive name match)."""
+        columns = ['season', 'club_name', 'level', 'appearances', 'goals', 'assists', 'minutes']
+        pid = views.find_player(player_name)
+        if pid is None:
+            return pd.DataFrame(columns=columns)
 
-        pid = matches.iloc[0]['player_api_id']
-        entries = journey_entries[journey_entries['player_api_id'] == pid].sort_values('season')
-        return entries[['season', 'club_name', 'level', 'appearances', 'goals', 'assists', 'minutes']].reset_index(drop=True)
+        entries = views.journey_entries_for(pid).sort_values('season')
+        return entries[columns].reset_index(drop=True)
 
-    return {
+    helpers = {
         'academy_comparison': academy_comparison,
         'first_team_graduates': first_team_graduates,
         'player_status_breakdown': player_status_breakdown,
@@ -206,9 +202,21 @@ def _build_helpers(dataframes: dict) -> dict:
         'top_loan_performers': top_loan_performers,
         'player_career': player_career,
     }
+    return {name: _memoize(views, name, fn) for name, fn in helpers.items()}
+
+
+def _memoize(views: FrameViews, name: str, fn):
+    """Wrap a helper so results are cached on *views* by (helper, args)."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        return views.memoized(key, lambda: fn(*args, **kwargs))
+    return wrapper
 
 
-def execute_analysis(code: str, dataframes: dict, display: str = 'table', description: str = '') -> dict:
+def execute_analysis(code: str, dataframes: dict, display: str = 'table', description: str = '',
+                     views: FrameViews | None = None,
+                     timeout: float | None = TIMEOUT_SECONDS) -> dict:
     """
     Execute pandas code in a restricted sandbox.
 
@@ -217,6 +225,10 @@ def execute_analysis(code: str, dataframes: dict, display: str = 'table', descri
         dataframes: dict of name -> pd.DataFrame.
         display: Display hint from the LLM ('table', 'bar_chart', etc.).
         description: Brief description of the analysis (passed through as metadata).
+        views: Precomputed joins/indexes for *dataframes* (built on the fly if omitted).
+        timeout: Seconds before the run is abandoned on a helper thread. ``None``
+            runs inline — used by the sandbox pool workers, whose limits are
+            enforced by the parent process and rlimits instead.
 
     Returns:
         Dict with result_type, display, meta, and formatted data.
@@ -244,7 +256,7 @@ def execute_analysis(code: str, dataframes: dict, display: str = 'table', descri
         'pd': pd,
         'np': np,
         **dataframes,
-        **_build_helpers(dataframes),
+        **_build_helpers(dataframes, views),
     }
 
     local_ns = {}
@@ -258,14 +270,17 @@ def execute_analysis(code: str, dataframes: dict, display: str = 'table', descri
         except Exception as e:
             exec_result[0] = e
 
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
-    thread.join(timeout=TIMEOUT_SECONDS)
+    if timeout is None:
+        _run()
+    else:
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        thread.join(timeout=timeout)
 
-    if thread.is_alive():
-        # Thread is still running — try to kill it
-        _kill_thread(thread)
-        return {'result_type': 'error', 'error': 'Analysis timed out (10s limit)', 'display': display}
+        if thread.is_alive():
+            # Thread is still running — try to kill it
+            _kill_thread(thread)
+            return {'result_type': 'error', 'error': TIMEOUT_ERROR, 'display': display}
 
     if exec_result[0] is not None:
         e = exec_result[0]
@@ -376,7 +391,7 @@ def _format_result(result) -> dict:
 
 def _safe_value(v):
     """Convert numpy/pandas types to JSON-safe Python natives."""
-    if v is None or (isinstance(v, float) and np.isnan(v)):
+    if v is None or v is pd.NA or v is pd.NaT or (isinstance(v, float) and np.isnan(v)):
         return None
     if isinstance(v, (np.integer,)):
         return int(v)
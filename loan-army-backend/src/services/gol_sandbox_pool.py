@@ -0,0 +1,256 @@
+"""
+GOL Sandbox Pool
+
+Runs GOL analysis code in a pool of pre-started worker processes instead of
+a thread inside the web worker. Each worker maps the same DataFrame snapshot
+as the web workers (see ``gol_dataframes``), so holding the frames costs no
+extra memory, and executes one analysis at a time under hard limits:
+
+- wall clock: the parent stops waiting after ``TIMEOUT_SECONDS`` and kills
+  the worker (SIGKILL), then starts a replacement;
+- CPU: ``RLIMIT_CPU`` is set per task, so a runaway computation is ended
+  by the kernel even if the parent is busy;
+- memory: ``RLIMIT_AS`` caps the worker's address space
+  (``GOL_SANDBOX_MEMORY_MB``), turning large allocations into MemoryError.
+
+Workers come from a forkserver with the sandbox modules preloaded (shared
+with the chart render pool, see ``src.utils.worker_processes``), so a respawn
+does not fork the (multi-threaded) web worker or re-import pandas.
+
+``GOL_SANDBOX_WORKERS=0`` disables the pool; analyses then run in-process
+via ``execute_analysis`` as before. The in-process path is also used when
+the frames are not backed by a shared snapshot.
+"""
+
+import atexit
+import logging
+import math
+import os
+import queue
+import signal
+import threading
+
+from src.services.gol_sandbox import TIMEOUT_ERROR, TIMEOUT_SECONDS, execute_analysis
+from src.utils.worker_processes import worker_context
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = int(os.getenv('GOL_SANDBOX_WORKERS', '2'))
+MEMORY_LIMIT_MB = int(os.getenv('GOL_SANDBOX_MEMORY_MB', '2048'))
+KILL_GRACE_SECONDS = 1  # extra wait for the result before the worker is killed
+
+_SNAPSHOT_MISSING = '_snapshot_missing'
+
+
+class SandboxPool:
+    """Fixed-size pool of sandbox worker processes."""
+
+    def __init__(
+        self,
+        size: int = POOL_SIZE,
+        timeout: float = TIMEOUT_SECONDS,
+        memory_limit_mb: int = MEMORY_LIMIT_MB,
+    ):
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._ctx = worker_context()
+        self._idle: queue.Queue = queue.Queue()
+        self._workers: set = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def execute(self, code: str, snapshot_dir: str, version: str,
+                display: str = 'table', description: str = '') -> dict:
+        """Run *code* against snapshot *version* in a worker process.
+
+        Returns the same dict shape as ``execute_analysis``. If the worker
+        cannot open the snapshot the result carries ``_snapshot_missing``.
+        """
+        try:
+            worker = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            return {'result_type': 'error', 'error': 'Analysis workers are busy, try again',
+                    'display': display}
+
+        task = {
+            'code': code, 'display': display, 'description': description,
+            'snapshot_dir': snapshot_dir, 'version': version,
+            'cpu_seconds': math.ceil(self.timeout),
+        }
+        try:
+            worker.conn.send(task)
+            if worker.conn.poll(self.timeout + KILL_GRACE_SECONDS):
+                result = worker.conn.recv()
+                self._idle.put(worker)
+                return result
+            logger.warning("GOL sandbox worker %s timed out; restarting", worker.process.pid)
+            error = TIMEOUT_ERROR
+        except (EOFError, OSError) as e:
+            # Worker died mid-task (CPU rlimit, OOM kill, crash)
+            logger.warning("GOL sandbox worker %s died: %s; restarting", worker.process.pid, e)
+            error = 'Analysis was stopped (resource limit exceeded)'
+
+        self._replace(worker)
+        return {'result_type': 'error', 'error': error, 'display': display}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def pids(self) -> list[int]:
+        with self._lock:
+            return sorted(w.process.pid for w in self._workers)
+
+    def _spawn(self) -> '_Worker':
+        worker = _Worker(self._ctx, self.memory_limit_mb)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _replace(self, worker: '_Worker') -> None:
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+            if self._closed:
+                return
+        self._idle.put(self._spawn())
+
+
+class _Worker:
+    def __init__(self, ctx, memory_limit_mb: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, memory_limit_mb),
+            name='gol-sandbox', daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+def _worker_main(conn, memory_limit_mb: int) -> None:
+    """Worker loop: map the requested snapshot, run the analysis, reply."""
+    from src.services.gol_dataframes import FrameViews, open_snapshot
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # This process only runs sandbox code, so copy-on-write can be on for all
+    # of it: frames are then handed out as shallow views of the mapped snapshot
+    import pandas as pd
+    pd.set_option('mode.copy_on_write', True)
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            logger.warning("GOL sandbox: memory limit not applied: %s", e)
+
+    views = None
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        display = task['display']
+        if views is None or views.version != task['version']:
+            views = None  # drop the old mapping before opening the new one
+            frames = open_snapshot(task['snapshot_dir'], task['version'])
+            if frames is None:
+                conn.send({'result_type': 'error', 'error': 'Snapshot unavailable',
+                           'display': display, _SNAPSHOT_MISSING: True})
+                continue
+            views = FrameViews(frames, version=task['version'])
+
+        _set_cpu_limit(task['cpu_seconds'])
+        try:
+            result = execute_analysis(
+                task['code'], views.frames(), display,
+                description=task['description'], views=views, timeout=None,
+            )
+        except MemoryError:
+            result = {'result_type': 'error', 'error': 'Analysis exceeded the memory limit',
+                      'display': display}
+        finally:
+            _set_cpu_limit(None)
+        conn.send(result)
+
+
+def _set_cpu_limit(seconds) -> None:
+    """Allow *seconds* more CPU time for this process (None lifts the limit).
+
+    Only the soft limit moves; exceeding it raises SIGXCPU, whose default
+    action terminates the worker.
+    """
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if seconds is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime) + int(seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+# ── process-wide pool ──────────────────────────────────────────────────
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool | None:
+    """Return the process-wide pool (started on first use), or None if disabled."""
+    global _pool
+    if POOL_SIZE <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = SandboxPool()
+            except Exception as e:
+                logger.error("GOL sandbox pool unavailable, running in-process: %s", e)
+                return None
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def run_analysis(code: str, views, snapshot_dir: str,
+                 display: str = 'table', description: str = '') -> dict:
+    """Execute analysis code in the sandbox pool, falling back to in-process."""
+    pool = get_sandbox_pool() if views.version else None
+    if pool is not None:
+        result = pool.execute(code, snapshot_dir, views.version, display, description)
+        if not result.pop(_SNAPSHOT_MISSING, False):
+            return result
+    return execute_analysis(code, views.frames(), display, description=description, views=views)
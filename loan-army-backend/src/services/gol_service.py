@@ -8,18 +8,33 @@ code-interpreter tool for querying The Academy Watch database.
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 
+from flask import current_app, has_app_context
+
 from openai import OpenAI
 from sqlalchemy import func
 
 from src.models.league import db
 from src.models.tracked_player import TrackedPlayer
 from src.services.gol_dataframes import DataFrameCache
-from src.services.gol_sandbox import execute_analysis
+from src.services.gol_sandbox_pool import run_analysis
 
 logger = logging.getLogger(__name__)
 
+MAX_PARALLEL_TOOLS = 4
+ANSWER_CACHE_SIZE = 200
+ANSWER_CACHE_TTL_SECONDS = int(os.getenv('GOL_ANSWER_CACHE_TTL_SECONDS', '3600'))
+# Answers that used these tools depend on more than the DataFrames
+UNCACHEABLE_TOOLS = {'search_web', 'lookup_player'}
+
+_answer_cache_lock = threading.Lock()
+_answer_cache: OrderedDict = OrderedDict()
+
 SYSTEM_PROMPT = """\
 You are the GOL Analytics Wizard — a knowledgeable football scout and analyst \
 for The Academy Watch platform. You help users explore loan players, academy pathways, \
@@ -103,6 +118,12 @@ tackles_blocks (int), tackles_interceptions (int), \
 duels_total (int), duels_won (int), \
 dribbles_success (int), fouls_drawn (int), fouls_committed (int)
 
+**Column types:** repeated strings (club names, position, status, level, \
+entry_type, nationality, competition_name) are pandas categoricals — always pass \
+`observed=True` to `groupby`, and drop zero counts from `.value_counts()`. \
+Integer columns with missing values use nullable `Int32` (missing = `pd.NA`); \
+use `.fillna(0)` before `.astype(int)`.
+
 ## Joining DataFrames
 
 Key relationships:
@@ -342,7 +363,7 @@ class GolService:
         self.model = 'gpt-4.1-mini'
         self._session_id = session_id
         if GolService._df_cache is None:
-            GolService._df_cache = DataFrameCache()
+            GolService._df_cache = DataFrameCache.shared()
         self.df_cache = GolService._df_cache
 
     def chat(self, message: str, history: list, session_id: str) -> Generator[dict, None, None]:
@@ -358,6 +379,14 @@ class GolService:
             Dict events: {event: str, data: dict}
         """
         try:
+            cache_key = self._answer_cache_key(message, history)
+            cached = _get_cached_answer(cache_key) if cache_key else None
+            if cached is not None:
+                yield from cached
+                yield {"event": "timing", "data": {"round": 0, "llm_ms": 0, "tool_ms": 0, "cached": True}}
+                yield {"event": "done", "data": {"cached": True}}
+                return
+
             messages = [{"role": "system", "content": SYSTEM_PROMPT}]
 
             # Add history (cap at 20 messages = 10 turns)
@@ -369,7 +398,17 @@ class GolService:
 
             messages.append({"role": "user", "content": message})
 
-            yield from self._run_completion(messages)
+            recorded, cacheable = [], cache_key is not None
+            for event in self._run_completion(messages):
+                if cacheable:
+                    kind = event.get("event")
+                    if kind == "error" or (kind == "tool_call" and event["data"].get("name") in UNCACHEABLE_TOOLS):
+                        cacheable = False
+                    elif kind == "done":
+                        _store_cached_answer(cache_key, recorded)
+                    elif kind in ("token", "tool_call", "data_card"):
+                        recorded.append(event)
+                yield event
 
         except Exception as e:
             logger.error(f"GOL chat error: {e}")
@@ -381,6 +420,7 @@ class GolService:
             yield {"event": "error", "data": {"message": "Too many tool call rounds"}}
             return
 
+        llm_started = time.perf_counter()
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
@@ -422,6 +462,7 @@ class GolService:
 
             # Handle finish
             if finish_reason == "tool_calls":
+                llm_ms = _elapsed_ms(llm_started)
                 # Build the assistant message with tool_calls
                 assistant_tool_calls = []
                 for idx in sorted(tool_calls_buffer.keys()):
@@ -438,6 +479,7 @@ class GolService:
                     "tool_calls": assistant_tool_calls,
                 })
 
+                calls = []
                 for idx in sorted(tool_calls_buffer.keys()):
                     tc = tool_calls_buffer[idx]
                     func_name = tc["function"]["name"]
@@ -445,12 +487,15 @@ class GolService:
                         args = json.loads(tc["function"]["arguments"])
                     except json.JSONDecodeError:
                         args = {}
-
+                    calls.append((tc, func_name, args))
                     yield {"event": "tool_call", "data": {"name": func_name}}
 
-                    # Execute tool
-                    result = self._execute_tool(func_name, args)
+                # Independent tool calls of one round run concurrently
+                tools_started = time.perf_counter()
+                outcomes = self._execute_tools([(name, args) for _, name, args in calls])
+                tool_ms = _elapsed_ms(tools_started)
 
+                for (tc, _, _), (result, _) in zip(calls, outcomes):
                     # Only emit data card for successful results
                     if result.get('result_type') != 'error':
                         yield {"event": "data_card", "data": {"type": "analysis_result", "payload": result}}
@@ -465,14 +510,62 @@ class GolService:
                         "content": json.dumps(llm_result),
                     })
 
+                yield {"event": "timing", "data": {
+                    "round": depth,
+                    "llm_ms": llm_ms,
+                    "tool_ms": tool_ms,
+                    "tools": [
+                        {"name": name, "ms": ms}
+                        for (_, name, _), (_, ms) in zip(calls, outcomes)
+                    ],
+                }}
+
                 # Continue with next completion round
                 yield from self._run_completion(messages, depth + 1)
                 return
 
             if finish_reason == "stop":
+                yield {"event": "timing", "data": {
+                    "round": depth, "llm_ms": _elapsed_ms(llm_started), "tool_ms": 0,
+                }}
                 yield {"event": "done", "data": {}}
                 return
 
+    def _execute_tools(self, calls: list) -> list:
+        """Run ``[(name, args), ...]`` and return ``[(result, ms), ...]`` in order.
+
+        Several calls run on a thread pool, each inside its own app context.
+        """
+        def _timed(call):
+            started = time.perf_counter()
+            result = self._execute_tool(*call)
+            return result, _elapsed_ms(started)
+
+        if len(calls) <= 1 or not has_app_context():
+            return [_timed(call) for call in calls]
+
+        app = current_app._get_current_object()
+
+        def _in_context(call):
+            with app.app_context():
+                return _timed(call)
+
+        with ThreadPoolExecutor(max_workers=min(len(calls), MAX_PARALLEL_TOOLS)) as executor:
+            return list(executor.map(_in_context, calls))
+
+    def _answer_cache_key(self, message: str, history: list):
+        """``(question, data version)`` for first-turn questions, else None.
+
+        Follow-up turns depend on the conversation, so only questions asked
+        without history are cached.
+        """
+        if history:
+            return None
+        version = self.df_cache.current_version()
+        if not version:
+            return None
+        return (' '.join(message.casefold().split()), version)
+
     @staticmethod
     def _sanitize_for_llm(result: dict) -> dict:
         """Sanitize error for LLM context — helpful enough to retry, no raw stacktraces."""
@@ -493,12 +586,12 @@ class GolService:
         """Execute a tool and return the result."""
         try:
             if name == "run_analysis":
-                from flask import current_app
                 code = args.get("code", "")
                 display = args.get("display", "table")
                 description = args.get("description", "")
-                frames = self.df_cache.get_frames(current_app._get_current_object())
-                return execute_analysis(code, frames, display, description=description)
+                views = self.df_cache.get_views(current_app._get_current_object())
+                return run_analysis(code, views, self.df_cache.snapshot_dir,
+                                    display, description=description)
             elif name == "search_web":
                 return self._tool_search_web(args.get("query", ""))
             elif name == "lookup_player":
@@ -568,3 +661,38 @@ class GolService:
         ])
 
         return suggestions[:4]
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
+
+def _get_cached_answer(key):
+    """Recorded events for *key* if cached and not expired."""
+    with _answer_cache_lock:
+        entry = _answer_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, events = entry
+        if time.monotonic() - stored_at > ANSWER_CACHE_TTL_SECONDS:
+            del _answer_cache[key]
+            return None
+        _answer_cache.move_to_end(key)
+        return list(events)
+
+
+def _store_cached_answer(key, events: list) -> None:
+    """Cache an answer's events, merging consecutive tokens into one."""
+    merged = []
+    for event in events:
+        if event["event"] == "token" and merged and merged[-1]["event"] == "token":
+            merged[-1] = {"event": "token", "data": {
+                "content": merged[-1]["data"]["content"] + event["data"]["content"],
+            }}
+        else:
+            merged.append(event)
+    with _answer_cache_lock:
+        _answer_cache[key] = (time.monotonic(), merged)
+        _answer_cache.move_to_end(key)
+        while len(_answer_cache) > ANSWER_CACHE_SIZE:
+            _answer_cache.popitem(last=False)
@@ -1,142 +1,266 @@
 import os
-from datetime import datetime, timezone
+import hashlib
+import importlib.util
+from concurrent.futures.process import BrokenProcessPool
+from sqlalchemy import func
 from src.models.league import db
 from src.models.weekly import FixturePlayerStats, Fixture
+from src.services.chart_renderer import CHART_FORMAT, get_render_pool, reset_render_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
-try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    logger.warning("⚠️ Matplotlib not found. Graph generation will be disabled.")
+# matplotlib is only imported when a PNG graph is actually drawn
+HAS_MATPLOTLIB = importlib.util.find_spec('matplotlib') is not None
+if not HAS_MATPLOTLIB:
+    logger.warning("⚠️ Matplotlib not found. PNG graph generation will be disabled.")
+
+GRAPH_KINDS = ('rating', 'minutes')
+
+# Item field each graph's URL is stored under in newsletter content
+GRAPH_FIELDS = {'rating': 'rating_graph_url', 'minutes': 'minutes_graph_url'}
+
 
 class GraphService:
-    def __init__(self, static_folder=None):
+    """Per-player rating and minutes graphs for newsletters.
+
+    Graph files are named after the player's latest fixture id
+    (``rating_<player>_f<fixture>_<name hash>.<ext>``), so a graph is drawn
+    once per new match and reused by every newsletter and preview until the
+    player plays again. Both graphs come from one stats query per player, or
+    one query for a whole batch of players.
+    """
+
+    def __init__(self, static_folder=None, fmt=None):
+        # 'png' (matplotlib) or 'svg' (svg_charts, no matplotlib)
+        self.fmt = (fmt or CHART_FORMAT).lower()
         if static_folder:
             self.static_folder = static_folder
         else:
             # Default to src/static/graphs
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             self.static_folder = os.path.join(base_dir, 'static', 'graphs')
-        
+
         if not os.path.exists(self.static_folder):
             os.makedirs(self.static_folder)
 
-    def generate_player_rating_graph(self, player_id, player_name):
+    def generate_player_rating_graph(self, player_id, player_name, fmt=None):
         """Generates a graph of player ratings over time."""
-        if not HAS_MATPLOTLIB:
-            logger.info(f"Skipping rating graph for {player_name} (matplotlib missing)")
-            return None
-
-        try:
-            # Fetch stats
-            stats_query = db.session.query(
-                FixturePlayerStats, Fixture
-            ).join(
-                Fixture, FixturePlayerStats.fixture_id == Fixture.id
-            ).filter(
-                FixturePlayerStats.player_api_id == player_id
-            ).order_by(
-                Fixture.date_utc.asc()
-            ).all()
-
-            if not stats_query:
-                return None
-
-            dates = []
-            ratings = []
-            
-            for stats, fixture in stats_query:
-                if stats.rating and stats.rating > 0:
-                    dates.append(fixture.date_utc)
-                    ratings.append(stats.rating)
-
-            if not ratings:
-                return None
-
-            # Plotting
-            fig, ax = plt.subplots(figsize=(10, 4))
-            ax.plot(dates, ratings, marker='o', linestyle='-', color='#1f77b4', linewidth=2)
-            ax.set_title(f'{player_name} - Match Ratings')
-            ax.set_ylabel('Rating')
-            ax.set_ylim(0, 10)
-            ax.grid(True, linestyle='--', alpha=0.7)
-            
-            # Format dates
-            fig.autofmt_xdate()
-            
-            # Save
-            timestamp = int(datetime.now(timezone.utc).timestamp())
-            filename = f"rating_{player_id}_{timestamp}.png"
-            filepath = os.path.join(self.static_folder, filename)
-            fig.savefig(filepath, bbox_inches='tight', dpi=100)
-            plt.close(fig)
-
-            return f"/static/graphs/{filename}"
-        except Exception as e:
-            print(f"Error generating rating graph for {player_id}: {e}")
-            return None
+        return self.generate_player_graphs(player_id, player_name, fmt=fmt).get('rating')
 
-    def generate_player_minutes_graph(self, player_id, player_name):
+    def generate_player_minutes_graph(self, player_id, player_name, fmt=None):
         """Generates a bar chart of minutes played."""
-        if not HAS_MATPLOTLIB:
-            logger.info(f"Skipping minutes graph for {player_name} (matplotlib missing)")
-            return None
+        return self.generate_player_graphs(player_id, player_name, fmt=fmt).get('minutes')
+
+    def generate_player_graphs(self, player_id, player_name, fmt=None):
+        """Generates both graphs for one player from a single stats query.
+
+        Returns a dict of ``/static/graphs/...`` URLs keyed by graph kind
+        ('rating', 'minutes'); kinds without data are omitted.
+        """
+        return self.generate_graphs_batch([(player_id, player_name)], fmt=fmt).get(player_id, {})
+
+    def generate_graphs_batch(self, players, fmt=None):
+        """Generates graphs for many players at once.
+
+        Args:
+            players: iterable of ``(player_id, player_name)``
+            fmt: 'png' or 'svg'; defaults to the service format
+
+        Returns:
+            ``{player_id: {kind: url}}`` for players with any graph. Cached
+            graphs cost one aggregate query; the stats for players needing new
+            graphs are fetched in one query and drawn concurrently on the
+            chart render pool.
+        """
+        fmt = (fmt or self.fmt).lower()
+        if fmt != 'svg' and not HAS_MATPLOTLIB:
+            logger.info("Skipping player graphs (matplotlib missing)")
+            return {}
+
+        names = {}
+        for player_id, player_name in players:
+            if player_id:
+                names.setdefault(player_id, player_name or '')
+        if not names:
+            return {}
 
         try:
-            # Fetch stats
-            stats_query = db.session.query(
-                FixturePlayerStats, Fixture
-            ).join(
-                Fixture, FixturePlayerStats.fixture_id == Fixture.id
-            ).filter(
-                FixturePlayerStats.player_api_id == player_id
-            ).order_by(
-                Fixture.date_utc.asc()
-            ).all()
-
-            if not stats_query:
-                return None
-
-            dates = []
-            minutes = []
-            
-            for stats, fixture in stats_query:
-                if stats.minutes is not None:
-                    dates.append(fixture.date_utc.strftime('%Y-%m-%d'))
-                    minutes.append(stats.minutes)
-
-            if not minutes:
-                return None
-
-            # Plotting
-            fig, ax = plt.subplots(figsize=(10, 4))
-            ax.bar(dates, minutes, color='#2ca02c')
-            ax.set_title(f'{player_name} - Minutes Played')
-            ax.set_ylabel('Minutes')
-            ax.set_ylim(0, 95) # Usually 90 mins + stoppage
-            ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-            
-            # Format x-axis labels if too many
-            if len(dates) > 10:
-                ax.set_xticks(range(0, len(dates), max(1, len(dates)//10)))
-                ax.set_xticklabels([dates[i] for i in range(0, len(dates), max(1, len(dates)//10))], rotation=45, ha='right')
+            latest = self._latest_fixture_ids(list(names))
+        except Exception as e:
+            logger.error(f"Error loading fixtures for player graphs: {e}")
+            return {}
+
+        results = {}
+        missing = {}
+        for player_id, fixture_id in latest.items():
+            files = {kind: self._graph_filename(kind, player_id, fixture_id, names[player_id], fmt)
+                     for kind in GRAPH_KINDS}
+            cached = {kind: name for kind, name in files.items()
+                      if os.path.exists(os.path.join(self.static_folder, name))}
+            if len(cached) == len(files):
+                results[player_id] = {kind: f"/static/graphs/{name}" for kind, name in cached.items()}
             else:
-                plt.xticks(rotation=45, ha='right')
+                missing[player_id] = files
 
-            # Save
-            timestamp = int(datetime.now(timezone.utc).timestamp())
-            filename = f"minutes_{player_id}_{timestamp}.png"
-            filepath = os.path.join(self.static_folder, filename)
-            fig.savefig(filepath, bbox_inches='tight', dpi=100)
-            plt.close(fig)
+        if missing:
+            try:
+                series = self._fetch_player_series(list(missing))
+            except Exception as e:
+                logger.error(f"Error loading stats for player graphs: {e}")
+                series = {}
+            jobs = []
+            for player_id, files in missing.items():
+                rating_points, minute_points = series.get(player_id, ([], []))
+                points = {'rating': rating_points, 'minutes': minute_points}
+                for kind, name in files.items():
+                    if points[kind]:
+                        path = os.path.join(self.static_folder, name)
+                        jobs.append((player_id, kind, name,
+                                     (kind, names[player_id], points[kind], path, fmt)))
+            for player_id, kind, name in self._render_jobs(jobs):
+                results.setdefault(player_id, {})[kind] = f"/static/graphs/{name}"
+        return results
 
-            return f"/static/graphs/{filename}"
-        except Exception as e:
-            print(f"Error generating minutes graph for {player_id}: {e}")
-            return None
+    def _latest_fixture_ids(self, player_ids):
+        rows = db.session.query(
+            FixturePlayerStats.player_api_id, func.max(FixturePlayerStats.fixture_id)
+        ).filter(
+            FixturePlayerStats.player_api_id.in_(player_ids)
+        ).group_by(
+            FixturePlayerStats.player_api_id
+        ).all()
+        return {player_id: fixture_id for player_id, fixture_id in rows}
+
+    def _fetch_player_series(self, player_ids):
+        """Return ``{player_id: (rating points, minutes points)}`` in date order."""
+        rows = db.session.query(
+            FixturePlayerStats.player_api_id,
+            Fixture.date_utc,
+            FixturePlayerStats.rating,
+            FixturePlayerStats.minutes,
+        ).join(
+            Fixture, FixturePlayerStats.fixture_id == Fixture.id
+        ).filter(
+            FixturePlayerStats.player_api_id.in_(player_ids)
+        ).order_by(
+            FixturePlayerStats.player_api_id, Fixture.date_utc.asc()
+        ).all()
+
+        series = {}
+        for player_id, date_utc, rating, minutes in rows:
+            ratings, minute_points = series.setdefault(player_id, ([], []))
+            if date_utc is None:
+                continue
+            if rating and rating > 0:
+                ratings.append((date_utc.strftime('%Y-%m-%d'), rating))
+            if minutes is not None:
+                minute_points.append((date_utc.strftime('%Y-%m-%d'), minutes))
+        return series
+
+    def _render_jobs(self, jobs):
+        """Draw graph files, in parallel when worth it.
+
+        Returns ``(player_id, kind, filename)`` for each graph written.
+        """
+        written = []
+        pool = get_render_pool() if sum(1 for *_, args in jobs if args[-1] == 'png') > 1 else None
+        if pool is not None:
+            try:
+                futures = [(job, pool.submit(_render_graph, *job[3])) for job in jobs]
+                for (player_id, kind, name, _), future in futures:
+                    try:
+                        future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error generating {kind} graph for {player_id}: {e}")
+                        continue
+                    written.append((player_id, kind, name))
+                return written
+            except Exception as e:
+                logger.warning(f"Graph render pool unavailable, rendering inline: {e}")
+                reset_render_pool()
+                written = []
+        for player_id, kind, name, args in jobs:
+            try:
+                if not os.path.exists(args[3]):
+                    _render_graph(*args)
+            except Exception as e:
+                logger.error(f"Error generating {kind} graph for {player_id}: {e}")
+                continue
+            written.append((player_id, kind, name))
+        return written
+
+    @staticmethod
+    def _graph_filename(kind, player_id, fixture_id, player_name, fmt):
+        # The title shows the name, so a renamed player gets a fresh file
+        name_hash = hashlib.md5((player_name or '').encode()).hexdigest()[:6]
+        return f"{kind}_{player_id}_f{fixture_id}_{name_hash}.{fmt}"
+
+
+def _render_graph(kind, player_name, points, filepath, fmt):
+    """Draw one graph to *filepath*. Module-level so render workers can run it."""
+    dates = [d for d, _ in points]
+    values = [v for _, v in points]
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+
+    if fmt == 'svg':
+        from src.services.svg_charts import render_bar_svg, render_line_svg
+        if kind == 'rating':
+            markup = render_line_svg({
+                'title': f'{player_name} - Match Ratings',
+                'stat_keys': ['rating'],
+                'y_max': 10,
+                'data': [{'date': d, 'rating': v} for d, v in points],
+            }, width=1000, height=400)
+        else:
+            markup = render_bar_svg({
+                'title': f'{player_name} - Minutes Played',
+                'stat_keys': ['minutes'],
+                'y_max': 95,
+                'data': [{'match': d, 'minutes': v} for d, v in points],
+            }, width=1000, height=400)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(markup)
+        os.replace(tmp_path, filepath)
+        return filepath
+
+    # Figure API rather than pyplot: safe to use from several threads
+    from datetime import datetime
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    if kind == 'rating':
+        ax.plot([datetime.strptime(d, '%Y-%m-%d') for d in dates], values,
+                marker='o', linestyle='-', color='#1f77b4', linewidth=2)
+        ax.set_title(f'{player_name} - Match Ratings')
+        ax.set_ylabel('Rating')
+        ax.set_ylim(0, 10)
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+        # Format dates
+        fig.autofmt_xdate()
+    else:
+        ax.bar(dates, values, color='#2ca02c')
+        ax.set_title(f'{player_name} - Minutes Played')
+        ax.set_ylabel('Minutes')
+        ax.set_ylim(0, 95) # Usually 90 mins + stoppage
+        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+
+        # Format x-axis labels if too many
+        if len(dates) > 10:
+            step = max(1, len(dates) // 10)
+            ax.set_xticks(range(0, len(dates), step))
+            ax.set_xticklabels([dates[i] for i in range(0, len(dates), step)], rotation=45, ha='right')
+        else:
+            ax.tick_params(axis='x', labelrotation=45)
+            for label in ax.get_xticklabels():
+                label.set_ha('right')
+
+    fig.savefig(tmp_path, format='png', bbox_inches='tight', dpi=100)
+    os.replace(tmp_path, filepath)
+    return filepath
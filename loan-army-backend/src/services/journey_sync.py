@@ -16,8 +16,8 @@ from src.models.journey import (
     PlayerJourney, PlayerJourneyEntry, ClubLocation,
     LEVEL_PRIORITY, YOUTH_LEVELS
 )
-from src.api_football_client import APIFootballClient, is_new_loan_transfer, LOAN_RETURN_TYPES
-from src.utils.geocoding import get_team_coordinates
+from src.api_football_client import APIFootballClient, get_api_client, is_new_loan_transfer, LOAN_RETURN_TYPES
+from src.utils.geocoding import geocode_batch
 from src.utils.academy_classifier import (
     YOUTH_SUFFIXES as _YOUTH_SUFFIXES_RE,
     INTERNATIONAL_PATTERNS as _INTERNATIONAL_PATTERNS,
@@ -59,7 +59,7 @@ class JourneySyncService:
     
     def __init__(self, api_client: Optional[APIFootballClient] = None):
         """Initialize with optional API client"""
-        self.api = api_client or APIFootballClient()
+        self.api = api_client or get_api_client()
     
     def sync_player(self, player_api_id: int, force_full: bool = False, heartbeat_fn=None) -> Optional[PlayerJourney]:
         """
@@ -869,7 +869,8 @@ class JourneySyncService:
         """Create ClubLocation rows for clubs that don't have one yet.
 
         Uses TeamProfile city/country when available, falls back to
-        league_country from entries, and geocodes via get_team_coordinates().
+        league_country from entries, and geocodes all of them in one
+        geocode_batch() call.
         """
         entries = PlayerJourneyEntry.query.filter_by(journey_id=journey.id).all()
         if not entries:
@@ -898,32 +899,32 @@ class JourneySyncService:
                     'country': entry.league_country,
                 }
 
-        added = 0
-        for club_id in missing_ids:
-            info = club_info.get(club_id, {})
-            club_name = info.get('name', '')
-            country = info.get('country')
-
-            # Try TeamProfile for city/country
-            city = None
-            profile = TeamProfile.query.filter_by(team_id=club_id).first()
-            if profile:
-                city = profile.venue_city
-                country = profile.country or country
+        # TeamProfile city/country for every missing club in one query
+        profiles = {
+            p.team_id: p for p in
+            TeamProfile.query.filter(TeamProfile.team_id.in_(missing_ids)).all()
+        }
 
-            # Only geocode if we have an actual city name — using just a
-            # country name produces wildly wrong results (e.g. "Scotland"
-            # resolves to Virginia, USA).
-            if not city:
-                continue
+        # Only geocode if we have an actual city name — using just a
+        # country name produces wildly wrong results (e.g. "Scotland"
+        # resolves to Virginia, USA).
+        places = {}
+        for club_id in missing_ids:
+            country = club_info.get(club_id, {}).get('country')
+            profile = profiles.get(club_id)
+            if profile and profile.venue_city:
+                places[club_id] = (profile.venue_city, profile.country or country)
+        coords_by_place = geocode_batch(places.values())
 
-            coords = get_team_coordinates(city, country)
+        added = 0
+        for club_id, (city, country) in places.items():
+            coords = coords_by_place.get((city, country))
             if not coords:
                 continue
 
             location = ClubLocation(
                 club_api_id=club_id,
-                club_name=club_name,
+                club_name=club_info.get(club_id, {}).get('name', ''),
                 city=city,
                 country=country,
                 latitude=coords[0],
@@ -938,8 +939,12 @@ class JourneySyncService:
             logger.info(f"Auto-geocoded {added} club locations for player {journey.player_api_id}")
 
 
-def seed_club_locations():
-    """Seed initial club locations for major clubs"""
+def seed_club_locations(geocode_profiles: bool = True):
+    """Seed initial club locations for major clubs.
+
+    With *geocode_profiles*, also adds locations for every other club that
+    has a TeamProfile venue city (see _seed_profile_locations).
+    """
     
     MAJOR_CLUBS = [
         # Premier League
@@ -1008,10 +1013,16 @@ def seed_club_locations():
         {'api_id': 233, 'name': 'Sporting CP', 'city': 'Lisbon', 'country': 'Portugal', 'code': 'PT', 'lat': 38.7614, 'lng': -9.1608},
     ]
     
+    existing = {
+        club_id for (club_id,) in
+        db.session.query(ClubLocation.club_api_id).filter(
+            ClubLocation.club_api_id.in_([club['api_id'] for club in MAJOR_CLUBS])
+        )
+    }
+
     added = 0
     for club in MAJOR_CLUBS:
-        existing = ClubLocation.query.filter_by(club_api_id=club['api_id']).first()
-        if not existing:
+        if club['api_id'] not in existing:
             location = ClubLocation(
                 club_api_id=club['api_id'],
                 club_name=club['name'],
@@ -1024,8 +1035,58 @@ def seed_club_locations():
                 geocode_confidence=1.0,
             )
             db.session.add(location)
+            existing.add(club['api_id'])
             added += 1
-    
+
+    if geocode_profiles:
+        added += _seed_profile_locations(existing)
+
     db.session.commit()
     logger.info(f"Seeded {added} club locations")
     return added
+
+
+def _seed_profile_locations(existing: set) -> int:
+    """Add ClubLocation rows for clubs with a TeamProfile venue city.
+
+    Clubs are grouped by (city, country) so each distinct city is geocoded
+    once, however many clubs share it, via a single geocode_batch() call.
+    """
+    profiles = [
+        p for p in TeamProfile.query.filter(TeamProfile.venue_city.isnot(None)).all()
+        if p.team_id not in existing and not p.is_national and p.venue_city.strip()
+    ]
+    if not profiles:
+        return 0
+
+    # Skip clubs located on an earlier run (or by _auto_geocode_clubs)
+    located = {
+        row[0] for row in db.session.query(ClubLocation.club_api_id)
+        .filter(ClubLocation.club_api_id.in_([p.team_id for p in profiles])).all()
+    }
+    profiles = [p for p in profiles if p.team_id not in located]
+    if not profiles:
+        return 0
+
+    coords_by_place = geocode_batch((p.venue_city, p.country) for p in profiles)
+
+    added = 0
+    for profile in profiles:
+        coords = coords_by_place.get((profile.venue_city, profile.country))
+        if not coords:
+            continue
+        db.session.add(ClubLocation(
+            club_api_id=profile.team_id,
+            club_name=profile.name,
+            city=profile.venue_city,
+            country=profile.country,
+            latitude=coords[0],
+            longitude=coords[1],
+            geocode_source='auto',
+            geocode_confidence=0.7,
+        ))
+        existing.add(profile.team_id)
+        added += 1
+    if added:
+        logger.info(f"Geocoded {added} club locations from team profiles")
+    return added
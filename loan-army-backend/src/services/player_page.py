@@ -0,0 +1,220 @@
+"""Precomputed public player page documents.
+
+The player page used to call six endpoints (profile, stats, season-stats,
+journey map, commentaries, links), each re-resolving the player's loans,
+tracked row and teams and re-aggregating FixturePlayerStats. Here the same
+sections are built once (by the ``player_sections`` functions those endpoints
+also use) into a single JSON document stored in
+``player_page_cache`` and served by ``GET /players/<id>/page`` with
+ETag/Last-Modified until one of its source rows changes.
+
+Invalidation is driven by an ``after_flush`` hook on the app session: any
+ORM write to fixture stats, loans, tracked players, journeys, commentaries
+or links marks that player's document stale in the same transaction, as
+does a ``player_refresh`` job for the player reaching a final status. Core
+bulk writes bypass the hook and must call ``invalidate_player_pages()``.
+Changes the hook cannot see (team logos, club locations) are picked up when
+a document reaches ``PLAYER_PAGE_MAX_AGE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Iterable
+
+from flask import Response, request
+from sqlalchemy import event, inspect, select
+from sqlalchemy.exc import IntegrityError
+
+from src.models.api_cache import PlayerPageCache
+from src.models.journey import PlayerJourney, PlayerJourneyEntry
+from src.models.league import (
+    BackgroundJob,
+    LoanedPlayer,
+    NewsletterCommentary,
+    NewsletterPlayerYoutubeLink,
+    PlayerLink,
+    db,
+)
+from src.models.tracked_player import TrackedPlayer
+from src.models.weekly import FixturePlayerStats
+from src.services import player_sections
+from src.utils.background_jobs import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+PLAYER_PAGE_MAX_AGE_SECONDS = int(os.getenv('PLAYER_PAGE_MAX_AGE_SECONDS', '3600'))
+
+# Document key -> player_sections function building it (the same data the
+# matching public endpoint returns)
+PAGE_SECTIONS = (
+    ('profile', 'player_profile'),
+    ('stats', 'player_stats'),
+    ('season_stats', 'player_season_stats'),
+    ('journey_map', 'player_journey_map'),
+    ('commentaries', 'player_commentaries'),
+    ('links', 'player_links'),
+)
+
+# Model -> attribute holding the player's API id
+_WATCHED = {
+    FixturePlayerStats: 'player_api_id',
+    LoanedPlayer: 'player_id',
+    TrackedPlayer: 'player_api_id',
+    PlayerJourney: 'player_api_id',
+    NewsletterCommentary: 'player_id',
+    PlayerLink: 'player_id',
+    NewsletterPlayerYoutubeLink: 'player_id',
+}
+
+
+def build_player_page(player_id: int) -> dict:
+    """Render every page section for *player_id* into one document.
+
+    A section that fails is stored as None and listed under ``errors``, so
+    one broken section doesn't take the whole page down.
+    """
+    sections = {}
+    errors = []
+    for key, name in PAGE_SECTIONS:
+        try:
+            section = getattr(player_sections, name)(player_id)
+            if key == 'stats':
+                section, _ = section  # freshness is reported via profile/season_stats
+            sections[key] = section
+        except Exception:
+            logger.exception('player page section %s failed for player %s', key, player_id)
+            db.session.rollback()
+            sections[key] = None
+            errors.append(key)
+    profile = sections['profile'] or {}
+    season_stats = sections['season_stats'] or {}
+    return {
+        'player_id': player_id,
+        **sections,
+        'errors': errors,
+        'stale': bool(profile.get('stale') or season_stats.get('stale')),
+        'refreshing': bool(profile.get('refreshing') or season_stats.get('refreshing')),
+    }
+
+
+def _has_local_data(document: dict) -> bool:
+    profile = document['profile'] or {}
+    commentaries = document['commentaries'] or {}
+    return bool(
+        profile.get('loan_team_id') or profile.get('parent_team_id') or document['stats'] or document['journey_map']
+        or commentaries.get('total_count') or document['links']
+    )
+
+
+def get_player_page(player_id: int, *, rebuild: bool = False) -> PlayerPageCache:
+    """Return the stored page for *player_id*, rebuilding it when stale.
+
+    Players with no local data at all get an unsaved document so arbitrary
+    IDs don't fill the table. A document with failed sections is stored
+    already stale, so the next request rebuilds it.
+    """
+    row = PlayerPageCache.query.filter_by(player_id=player_id).first()
+    if row is not None and not rebuild and row.is_fresh(PLAYER_PAGE_MAX_AGE_SECONDS):
+        return row
+
+    built_at = datetime.now(timezone.utc)
+    document = build_player_page(player_id)
+    payload = json.dumps(document, sort_keys=True, separators=(',', ':'), default=str)
+    etag = hashlib.sha256(payload.encode()).hexdigest()
+    if row is None and not _has_local_data(document):
+        return PlayerPageCache(player_id=player_id, payload_json=payload, etag=etag,
+                               built_at=built_at, updated_at=built_at)
+
+    def _apply():
+        current = PlayerPageCache.query.filter_by(player_id=player_id).first()
+        if current is None:
+            current = PlayerPageCache(player_id=player_id)
+            db.session.add(current)
+        if current.etag != etag:
+            current.payload_json = payload
+            current.etag = etag
+            current.updated_at = built_at
+        current.built_at = built_at
+        if document['errors']:
+            # Serve the partial page, but retry the failed sections next time
+            current.invalidated_at = built_at
+        return current
+
+    row = _apply()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        # Race condition – another request stored this player's page first
+        row = _apply()
+        db.session.commit()
+    return row
+
+
+def player_page_response(row: PlayerPageCache) -> Response:
+    """Serve a stored page with validators; 304 when the client copy matches."""
+    response = Response(row.payload_json, mimetype='application/json')
+    response.set_etag(row.etag)
+    response.last_modified = PlayerPageCache._utc(row.updated_at)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _refresh_job_players(job: BackgroundJob) -> set:
+    """Player ids whose pages show *job* as refreshing (payload and corrected id)."""
+    ids = set()
+    for raw in (job.payload_json, job.results_json):
+        try:
+            ids.add((json.loads(raw or '{}') or {}).get('player_id'))
+        except (TypeError, ValueError, AttributeError):
+            continue
+    return ids
+
+
+def invalidate_player_pages(player_ids: Iterable[int], session=None) -> int:
+    """Mark the stored pages of *player_ids* stale; returns rows touched."""
+    ids = {int(pid) for pid in player_ids if pid is not None}
+    if not ids:
+        return 0
+    session = session or db.session
+    table = PlayerPageCache.__table__
+    result = session.connection().execute(
+        table.update()
+        .where(table.c.player_id.in_(ids))
+        .values(invalidated_at=datetime.now(timezone.utc))
+    )
+    return result.rowcount or 0
+
+
+@event.listens_for(db.session, 'after_flush')
+def _invalidate_on_flush(session, flush_context):
+    player_ids = set()
+    journey_ids = set()
+    changed = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in (*session.new, *changed, *session.deleted):
+        if isinstance(obj, PlayerJourneyEntry):
+            journey_ids.add(obj.journey_id)
+            continue
+        if isinstance(obj, BackgroundJob):
+            # A finished refresh, successful or not, clears the "refreshing" flag
+            if obj.job_type == 'player_refresh' and obj.status in TERMINAL_STATUSES:
+                player_ids.update(_refresh_job_players(obj))
+            continue
+        attr = _WATCHED.get(type(obj))
+        if attr:
+            player_ids.add(getattr(obj, attr, None))
+            # A row moved to another player leaves the old page stale too
+            player_ids.update(inspect(obj).attrs[attr].history.deleted or ())
+    if journey_ids:
+        player_ids.update(session.connection().execute(
+            select(PlayerJourney.player_api_id).where(PlayerJourney.id.in_(journey_ids))
+        ).scalars())
+    player_ids.discard(None)
+    if player_ids:
+        invalidate_player_pages(player_ids, session=session)
@@ -0,0 +1,860 @@
+"""Data for the public player page sections.
+
+Each function builds the JSON body of one public player endpoint (profile,
+stats, season stats, journey map, commentaries, links) from local data.
+The endpoints in ``routes/api.py`` serialize these, and
+``player_page.build_player_page`` stores them together in one document.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import func
+
+from src.api_football_client import get_api_client
+from src.models.journey import ClubLocation, PlayerJourney
+from src.models.league import (
+    LoanedPlayer,
+    NewsletterCommentary,
+    NewsletterPlayerYoutubeLink,
+    Player,
+    PlayerLink,
+    SupplementalLoan,
+    Team,
+    db,
+)
+from src.models.tracked_player import TrackedPlayer
+from src.models.weekly import Fixture, FixturePlayerStats
+
+logger = logging.getLogger(__name__)
+
+
+# Lazy imports: routes/api.py imports this module
+def resolve_team_name_and_logo(team_api_id: int, season: int = None):
+    from src.routes.api import resolve_team_name_and_logo as resolve
+    return resolve(team_api_id, season)
+
+
+def _request_player_refresh(*args, **kwargs) -> dict:
+    from src.routes.api import _request_player_refresh as request_refresh
+    return request_refresh(*args, **kwargs)
+
+
+def player_profile(player_id: int) -> dict:
+    """
+    Profile info for a player: name, teams, position, photo and this
+    season's loan history, plus ``stale``/``refreshing`` for the player's
+    background refresh.
+    """
+    
+    result = {
+        'player_id': player_id,
+        'name': None,
+        'photo': None,
+        'position': None,
+        'loan_team_name': None,
+        'loan_team_id': None,
+        'loan_team_logo': None,
+        'parent_team_name': None,
+        'parent_team_id': None,
+        'parent_team_logo': None,
+        'nationality': None,
+        'age': None,
+    }
+    
+    # Get player base info from Player table (has photo)
+    player = Player.query.filter_by(player_id=player_id).first()
+    if player:
+        result['name'] = player.name
+        result['photo'] = player.photo_url
+        result['position'] = player.position
+        result['nationality'] = player.nationality
+        result['age'] = player.age
+    
+    # Get loan info from LoanedPlayer (most recent active loan)
+    loaned = LoanedPlayer.query.filter_by(player_id=player_id, is_active=True).order_by(LoanedPlayer.updated_at.desc()).first()
+    if not loaned:
+        # Try any loan record for this player
+        loaned = LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()
+    
+    if loaned:
+        if not result['name']:
+            result['name'] = loaned.player_name
+        result['loan_team_name'] = loaned.loan_team_name
+        result['parent_team_name'] = loaned.primary_team_name
+        
+        # Get team logos from Team table
+        if loaned.loan_team_id:
+            loan_team = Team.query.get(loaned.loan_team_id)
+            if loan_team:
+                result['loan_team_logo'] = loan_team.logo
+                result['loan_team_id'] = loan_team.team_id
+                result['loan_team_db_id'] = loaned.loan_team_id  # DB ID for API calls
+        
+        if loaned.primary_team_id:
+            parent_team = Team.query.get(loaned.primary_team_id)
+            if parent_team:
+                result['parent_team_logo'] = parent_team.logo
+                result['parent_team_id'] = parent_team.team_id
+                result['primary_team_db_id'] = loaned.primary_team_id  # DB ID for API calls
+    
+    # TrackedPlayer fallback — fills in gaps for academy/first_team/released players
+    tracked = None
+    if not result['name'] or not result['photo'] or not loaned:
+        tracked = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
+        if tracked:
+            if not result['name']:
+                result['name'] = tracked.player_name
+            if not result['photo']:
+                result['photo'] = tracked.photo_url
+            if not result['age']:
+                result['age'] = tracked.age
+            if not result['nationality']:
+                result['nationality'] = tracked.nationality
+            if not result['position']:
+                result['position'] = tracked.position
+            # Parent team from tracked player's team relationship
+            if not result['parent_team_name'] and tracked.team:
+                result['parent_team_name'] = tracked.team.name
+                result['parent_team_logo'] = tracked.team.logo
+                result['parent_team_id'] = tracked.team.team_id
+                result['primary_team_db_id'] = tracked.team_id
+            # Loan team from tracked player (if on_loan)
+            if not result['loan_team_name'] and tracked.loan_club_api_id:
+                result['loan_team_name'] = tracked.loan_club_name
+                loan_team_record = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
+                if loan_team_record:
+                    result['loan_team_logo'] = loan_team_record.logo
+                    result['loan_team_id'] = loan_team_record.team_id
+                    result['loan_team_db_id'] = loan_team_record.id
+            # Additive fields
+            result['pathway_status'] = tracked.status
+            result['current_level'] = tracked.current_level
+
+    # PlayerJourney fallback — last resort for name/photo/nationality
+    if not result['name'] or not result['photo']:
+        journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
+        if journey:
+            if not result['name']:
+                result['name'] = journey.player_name
+            if not result['photo']:
+                result['photo'] = journey.player_photo
+            if not result['nationality']:
+                result['nationality'] = journey.nationality
+
+    # If still no name, try supplemental loans
+    if not result['name']:
+        supplemental = SupplementalLoan.query.filter_by(api_player_id=player_id).first()
+        if supplemental:
+            result['name'] = supplemental.player_name
+            result['loan_team_name'] = supplemental.loan_team_name
+            result['parent_team_name'] = supplemental.parent_team_name
+            if supplemental.loan_team:
+                result['loan_team_logo'] = supplemental.loan_team.logo
+            if supplemental.parent_team:
+                result['parent_team_logo'] = supplemental.parent_team.logo
+    
+    # If still no name, try to get from fixture stats position
+    if not result['name']:
+        stats = FixturePlayerStats.query.filter_by(player_api_id=player_id).first()
+        if stats:
+            result['position'] = stats.position
+    
+    # Final fallback for name
+    if not result['name']:
+        result['name'] = f"Player #{player_id}"
+    
+    # Get ALL loans for this season (for mid-season transfers)
+    now_utc = datetime.now(timezone.utc)
+    current_year = now_utc.year
+    current_month = now_utc.month
+    season_year = current_year if current_month >= 8 else current_year - 1
+    season_prefix = f"{season_year}-{str(season_year + 1)[-2:]}"  # e.g., "2025-26"
+    
+    all_season_loans = LoanedPlayer.query.filter(
+        LoanedPlayer.player_id == player_id,
+        LoanedPlayer.window_key.like(f"{season_prefix}%")
+    ).order_by(LoanedPlayer.created_at.asc()).all()
+
+    # Deduplicate by (loan_team_id, window_key) - keep only the first (earliest) entry
+    seen_loan_keys = set()
+    loan_history = []
+    for loan in all_season_loans:
+        # Create unique key for deduplication
+        dedup_key = (loan.loan_team_id, loan.window_key)
+        if dedup_key in seen_loan_keys:
+            continue
+        seen_loan_keys.add(dedup_key)
+        
+        loan_team = Team.query.get(loan.loan_team_id) if loan.loan_team_id else None
+        parent_team = Team.query.get(loan.primary_team_id) if loan.primary_team_id else None
+        
+        # Determine window type from window_key (e.g., "2025-26::FULL" or "2025-26::JANUARY")
+        window_type = 'Summer'
+        if loan.window_key and '::' in loan.window_key:
+            window_part = loan.window_key.split('::')[1]
+            if window_part.upper() == 'JANUARY':
+                window_type = 'January'
+            elif window_part.upper() == 'FULL':
+                window_type = 'Summer'
+            else:
+                window_type = window_part.title()
+        
+        loan_history.append({
+            'loan_team_name': loan.loan_team_name,
+            'loan_team_id': loan_team.team_id if loan_team else None,
+            'loan_team_db_id': loan.loan_team_id,  # DB ID for API calls
+            'loan_team_logo': loan_team.logo if loan_team else None,
+            'parent_team_name': loan.primary_team_name,
+            'parent_team_id': parent_team.team_id if parent_team else None,
+            'parent_team_logo': parent_team.logo if parent_team else None,
+            'window_type': window_type,
+            'window_key': loan.window_key,
+            'is_active': loan.is_active,
+        })
+    
+    # If loan_history is empty and TrackedPlayer is on_loan, synthesize an entry
+    if not loan_history and tracked and tracked.status == 'on_loan' and tracked.loan_club_api_id:
+        loan_team_record = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
+        loan_history.append({
+            'loan_team_name': tracked.loan_club_name or (loan_team_record.name if loan_team_record else None),
+            'loan_team_id': tracked.loan_club_api_id,
+            'loan_team_db_id': loan_team_record.id if loan_team_record else None,
+            'loan_team_logo': loan_team_record.logo if loan_team_record else None,
+            'parent_team_name': tracked.team.name if tracked.team else None,
+            'parent_team_id': tracked.team.team_id if tracked.team else None,
+            'parent_team_logo': tracked.team.logo if tracked.team else None,
+            'window_type': 'Summer',
+            'window_key': None,
+            'is_active': True,
+        })
+
+    result['loan_history'] = loan_history
+    result['has_multiple_loans'] = len(loan_history) > 1
+
+    # ID verification against API-Football runs in the background refresh
+    if loaned and loaned.can_fetch_stats and result.get('loan_team_id'):
+        result.update(_request_player_refresh(
+            player_id, season_year, [result['loan_team_id']], loaned.player_name,
+        ))
+    else:
+        result.update({'stale': False, 'refreshing': False, 'refreshed_at': None})
+
+    return result
+
+
+def player_stats(player_id: int, force_sync: bool = False) -> tuple[list, dict]:
+    """
+    Per-fixture club stats for a player this season, from local data only.
+
+    When cached API-Football totals show missing games a background refresh
+    is queued (*force_sync* queues one regardless). Returns the stat rows
+    and the refresh's freshness hints.
+    """
+    
+    # Get current season
+    now_utc = datetime.now(timezone.utc)
+    current_year = now_utc.year
+    current_month = now_utc.month
+    season = current_year if current_month >= 8 else current_year - 1
+    season_prefix = f"{season}-{str(season + 1)[-2:]}"  # e.g., "2025-26"
+    
+    # Find ALL loan teams for this player this season (handles mid-season transfers)
+    all_loans = LoanedPlayer.query.filter(
+        LoanedPlayer.player_id == player_id,
+        LoanedPlayer.window_key.like(f"{season_prefix}%")
+    ).order_by(LoanedPlayer.updated_at.desc()).all()
+    
+    # If no season-specific loans, try getting any loan
+    if not all_loans:
+        all_loans = [LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()]
+        all_loans = [l for l in all_loans if l]  # Remove None
+
+    # TrackedPlayer fallback — resolve loan team for academy-tracked players
+    tracked_player_for_stats = None
+    if not all_loans:
+        tracked_player_for_stats = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
+        if tracked_player_for_stats:
+            # If TrackedPlayer links to a LoanedPlayer, use that
+            if tracked_player_for_stats.loaned_player_id:
+                linked_loan = LoanedPlayer.query.get(tracked_player_for_stats.loaned_player_id)
+                if linked_loan:
+                    all_loans = [linked_loan]
+
+    # Build a map of team_api_id -> team info for all loan teams
+    loan_teams_info = {}  # {api_team_id: {name, logo, window_type}}
+    for loan in all_loans:
+        if loan and loan.loan_team_id:
+            loan_team = Team.query.get(loan.loan_team_id)
+            if loan_team:
+                window_type = 'Summer'
+                if loan.window_key and '::' in loan.window_key:
+                    window_part = loan.window_key.split('::')[1]
+                    if window_part.upper() == 'JANUARY':
+                        window_type = 'January'
+                loan_teams_info[loan_team.team_id] = {
+                    'name': loan_team.name,
+                    'logo': loan_team.logo,
+                    'window_type': window_type,
+                    'is_active': loan.is_active,
+                }
+    
+    # TrackedPlayer fallback: inject loan club if no LoanedPlayer provided teams
+    if not loan_teams_info and tracked_player_for_stats and tracked_player_for_stats.loan_club_api_id:
+        loan_team_record = Team.query.filter_by(team_id=tracked_player_for_stats.loan_club_api_id).first()
+        if loan_team_record:
+            loan_teams_info[loan_team_record.team_id] = {
+                'name': loan_team_record.name,
+                'logo': loan_team_record.logo,
+                'window_type': 'Summer',
+                'is_active': True,
+            }
+
+    loan_team_api_ids = list(loan_teams_info.keys())
+
+    # Query local stats for ALL loan teams
+    stats_query = db.session.query(
+        FixturePlayerStats, Fixture
+    ).join(
+        Fixture, FixturePlayerStats.fixture_id == Fixture.id
+    ).filter(
+        FixturePlayerStats.player_api_id == player_id
+    )
+
+    # Filter to only loan team games
+    if loan_team_api_ids:
+        stats_query = stats_query.filter(
+            FixturePlayerStats.team_api_id.in_(loan_team_api_ids)
+        )
+    
+    stats_query = stats_query.order_by(Fixture.date_utc.asc()).all()
+    
+    # Compare against cached API-Football totals only; missing games
+    # are synced by a background refresh, never inside the request
+    player_name_for_sync = all_loans[0].player_name if all_loans else None
+    if not player_name_for_sync and tracked_player_for_stats:
+        player_name_for_sync = tracked_player_for_stats.player_name
+    
+    stale = False
+    api_client = get_api_client()
+    for loan_team_api_id in loan_team_api_ids:
+        local_count = sum(1 for s, f in stats_query if s.team_api_id == loan_team_api_id)
+        api_totals = api_client._fetch_player_team_season_totals_api(
+            player_id=player_id,
+            team_id=loan_team_api_id,
+            season=season,
+            cached_only=True,
+        )
+        if api_totals is None or api_totals.get('games_played', 0) > local_count:
+            stale = True
+    freshness = _request_player_refresh(
+        player_id, season, loan_team_api_ids, player_name_for_sync,
+        stale=stale, force=force_sync,
+    )
+
+    result = []
+    for stats, fixture in stats_query:
+        # Get opponent name using robust resolution with fallbacks
+        is_home = (stats.team_api_id == fixture.home_team_api_id)
+        opponent_api_id = fixture.away_team_api_id if is_home else fixture.home_team_api_id
+        opponent_name, _ = resolve_team_name_and_logo(opponent_api_id, season)
+        
+        # Get loan team info for this stat
+        team_info = loan_teams_info.get(stats.team_api_id, {})
+        
+        # Fallback: use robust team name resolution if not in loan_teams_info
+        if not team_info or not team_info.get('name'):
+            loan_team_name, loan_team_logo = resolve_team_name_and_logo(stats.team_api_id, season)
+            team_info = {
+                'name': loan_team_name,
+                'logo': loan_team_logo,
+                'window_type': 'Summer',
+            }
+        
+        stats_dict = stats.to_dict()
+        stats_dict['fixture_date'] = fixture.date_utc.isoformat() if fixture.date_utc else None
+        stats_dict['opponent'] = opponent_name
+        stats_dict['is_home'] = is_home
+        stats_dict['competition'] = fixture.competition_name
+        stats_dict['loan_team_name'] = team_info.get('name') or "Unknown"
+        stats_dict['loan_team_logo'] = team_info.get('logo')
+        stats_dict['loan_window'] = team_info.get('window_type', 'Summer')
+        
+        # Include match score for context
+        stats_dict['home_goals'] = fixture.home_goals
+        stats_dict['away_goals'] = fixture.away_goals
+        stats_dict['opponent_api_id'] = opponent_api_id
+        
+        result.append(stats_dict)
+
+    return result, freshness
+
+
+def player_season_stats(player_id: int) -> dict:
+    """
+    Aggregated season stats for a player at their loan clubs only (no
+    international games), from local fixtures plus cached API-Football
+    totals. Missing data queues a background refresh.
+    """
+    
+    # Get current season
+    now_utc = datetime.now(timezone.utc)
+    current_year = now_utc.year
+    current_month = now_utc.month
+    season_start_year = current_year if current_month >= 8 else current_year - 1
+    season_start = datetime(season_start_year, 8, 1, tzinfo=timezone.utc)
+    
+    season_prefix = f"{season_start_year}-{str(season_start_year + 1)[-2:]}"  # e.g., "2025-26"
+    
+    result = {
+        'player_id': player_id,
+        'season': f"{season_start_year}/{season_start_year + 1}",
+        'appearances': 0,
+        'minutes': 0,
+        'goals': 0,
+        'assists': 0,
+        'yellows': 0,
+        'reds': 0,
+        'avg_rating': None,
+        'saves': 0,
+        'goals_conceded': 0,
+        'clean_sheets': 0,
+        'source': 'none',
+        'loan_clubs_only': True,  # Stats are only from loan clubs (not international)
+        'clubs': [],  # Per-club breakdown
+    }
+    
+    # Find ALL loan teams for this player this season
+    all_loans = LoanedPlayer.query.filter(
+        LoanedPlayer.player_id == player_id,
+        LoanedPlayer.window_key.like(f"{season_prefix}%")
+    ).order_by(LoanedPlayer.updated_at.desc()).all()
+    
+    if not all_loans:
+        # Fallback to any loan
+        loaned = LoanedPlayer.query.filter_by(player_id=player_id).order_by(LoanedPlayer.updated_at.desc()).first()
+        all_loans = [loaned] if loaned else []
+    
+    # TrackedPlayer fallback for season-stats
+    tracked_for_season = None
+    if not all_loans:
+        tracked_for_season = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
+        if tracked_for_season:
+            # If TrackedPlayer links to a LoanedPlayer, use that
+            if tracked_for_season.loaned_player_id:
+                linked_loan = LoanedPlayer.query.get(tracked_for_season.loaned_player_id)
+                if linked_loan:
+                    all_loans = [linked_loan]
+            # If on loan with a club but no LoanedPlayer, inject the loan club
+            elif tracked_for_season.loan_club_api_id:
+                loan_team_record = Team.query.filter_by(team_id=tracked_for_season.loan_club_api_id).first()
+                if loan_team_record:
+                    # Create a minimal object-like dict for downstream processing
+                    # We'll handle this in the loan_teams_info block below
+                    pass
+
+    if not all_loans:
+        # For non-loan tracked players (academy/first_team), return journey aggregates
+        if tracked_for_season and tracked_for_season.status in ('academy', 'first_team', 'released'):
+            journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
+            if journey and (journey.total_first_team_apps or journey.total_goals or journey.total_assists):
+                result['appearances'] = journey.total_first_team_apps or 0
+                result['goals'] = journey.total_goals or 0
+                result['assists'] = journey.total_assists or 0
+                result['source'] = 'journey-aggregate'
+                result['stats_coverage'] = 'limited'
+                result['limited_stats_note'] = 'Career aggregate stats from journey data. Match-by-match stats not available.'
+            return result
+        # For on_loan tracked players with a loan club but no LoanedPlayer row,
+        # proceed with loan_teams_info injection below
+        if not (tracked_for_season and tracked_for_season.loan_club_api_id):
+            return result
+
+    # 📊 CHECK FOR LIMITED COVERAGE (e.g., National League)
+    # If the player has limited stats coverage, use denormalized stats from LoanedPlayer
+    primary_loan = all_loans[0] if all_loans else None
+    if getattr(primary_loan, 'stats_coverage', 'full') == 'limited':
+        logger.info(f"Using limited coverage stats for player {player_id} ({primary_loan.player_name})")
+        result['appearances'] = primary_loan.appearances or 0
+        result['minutes'] = 0  # Not available for limited coverage
+        result['goals'] = primary_loan.goals or 0
+        result['assists'] = primary_loan.assists or 0
+        result['yellows'] = primary_loan.yellows or 0
+        result['reds'] = primary_loan.reds or 0
+        result['source'] = 'limited-coverage'
+        result['stats_coverage'] = 'limited'
+        result['limited_stats_note'] = 'Full match stats not available for this league. Showing appearances, goals, and assists from lineup/event data.'
+        
+        # Get loan team info
+        if primary_loan.loan_team_id:
+            loan_team = Team.query.get(primary_loan.loan_team_id)
+            if loan_team:
+                result['loan_team'] = loan_team.name
+                result['clubs'] = [{
+                    'team_name': loan_team.name,
+                    'team_logo': loan_team.logo,
+                    'appearances': primary_loan.appearances or 0,
+                    'goals': primary_loan.goals or 0,
+                    'assists': primary_loan.assists or 0,
+                    'is_current': primary_loan.is_active,
+                }]
+        
+        return result
+    
+    # Build list of loan teams with their API IDs
+    loan_teams_info = []
+    loan_team_api_ids = []
+    for loan in all_loans:
+        if loan and loan.loan_team_id:
+            loan_team = Team.query.get(loan.loan_team_id)
+            if loan_team and loan_team.team_id not in loan_team_api_ids:
+                window_type = 'Summer'
+                if loan.window_key and '::' in loan.window_key:
+                    window_part = loan.window_key.split('::')[1]
+                    if window_part.upper() == 'JANUARY':
+                        window_type = 'January'
+                loan_teams_info.append({
+                    'api_id': loan_team.team_id,
+                    'name': loan_team.name,
+                    'logo': loan_team.logo,
+                    'window_type': window_type,
+                    'is_active': loan.is_active,
+                })
+                loan_team_api_ids.append(loan_team.team_id)
+    
+    # TrackedPlayer fallback: inject loan club if no LoanedPlayer provided teams
+    if not loan_teams_info and tracked_for_season and tracked_for_season.loan_club_api_id:
+        loan_team_record = Team.query.filter_by(team_id=tracked_for_season.loan_club_api_id).first()
+        if loan_team_record:
+            loan_teams_info.append({
+                'api_id': loan_team_record.team_id,
+                'name': loan_team_record.name,
+                'logo': loan_team_record.logo,
+                'window_type': 'Summer',
+                'is_active': True,
+            })
+            loan_team_api_ids.append(loan_team_record.team_id)
+
+    result['loan_team'] = loan_teams_info[0]['name'] if loan_teams_info else None
+    result['has_multiple_clubs'] = len(loan_teams_info) > 1
+
+    # API-Football totals come from cache only; ID verification and
+    # fixture syncing happen in the background refresh
+    api_client = get_api_client()
+    player_id_to_use = player_id
+    player_name_for_verify = all_loans[0].player_name if all_loans else None
+    if not player_name_for_verify and tracked_for_season:
+        player_name_for_verify = tracked_for_season.player_name
+    stale = False
+    
+    # Aggregate stats from API-Football for ALL loan clubs
+    total_appearances = 0
+    total_minutes = 0
+    total_goals = 0
+    total_assists = 0
+    clubs_breakdown = []
+    
+    for team_info in loan_teams_info:
+        try:
+            api_totals = api_client._fetch_player_team_season_totals_api(
+                player_id=player_id_to_use,
+                team_id=team_info['api_id'],
+                season=season_start_year,
+                cached_only=True,
+            )
+            if api_totals is None:
+                stale = True
+            
+            if api_totals and api_totals.get('games_played', 0) > 0:
+                club_stats = {
+                    'team_name': team_info['name'],
+                    'team_logo': team_info['logo'],
+                    'window_type': team_info['window_type'],
+                    'is_current': team_info['is_active'],
+                    'appearances': api_totals.get('games_played', 0),
+                    'minutes': api_totals.get('minutes', 0),
+                    'goals': api_totals.get('goals', 0),
+                    'assists': api_totals.get('assists', 0),
+                    'saves': api_totals.get('saves', 0),
+                    'goals_conceded': api_totals.get('goals_conceded', 0),
+                }
+                clubs_breakdown.append(club_stats)
+                total_appearances += club_stats['appearances']
+                total_minutes += club_stats['minutes']
+                total_goals += club_stats['goals']
+                total_assists += club_stats['assists']
+                result['source'] = 'api-football'
+        except Exception as api_err:
+            logger.warning(f"Failed to get API-Football stats for player {player_id} at {team_info['name']}: {api_err}")
+    
+    result['appearances'] = total_appearances
+    result['minutes'] = total_minutes
+    result['goals'] = total_goals
+    result['assists'] = total_assists
+    result['clubs'] = clubs_breakdown
+    
+    # Get detailed stats from local DB (aggregate across ALL loan clubs)
+    stats_query = db.session.query(
+        func.count(FixturePlayerStats.id).label('appearances'),
+        func.sum(FixturePlayerStats.minutes).label('total_minutes'),
+        func.sum(FixturePlayerStats.goals).label('total_goals'),
+        func.sum(FixturePlayerStats.assists).label('total_assists'),
+        func.sum(FixturePlayerStats.yellows).label('total_yellows'),
+        func.sum(FixturePlayerStats.reds).label('total_reds'),
+        func.avg(FixturePlayerStats.rating).label('avg_rating'),
+        func.sum(FixturePlayerStats.shots_total).label('total_shots'),
+        func.sum(FixturePlayerStats.shots_on).label('shots_on_target'),
+        func.sum(FixturePlayerStats.passes_key).label('total_key_passes'),
+        func.sum(FixturePlayerStats.tackles_total).label('total_tackles'),
+        func.sum(FixturePlayerStats.saves).label('total_saves'),
+        func.sum(FixturePlayerStats.goals_conceded).label('total_goals_conceded'),
+    ).join(
+        Fixture, FixturePlayerStats.fixture_id == Fixture.id
+    ).filter(
+        FixturePlayerStats.player_api_id == player_id,
+        FixturePlayerStats.team_api_id.in_(loan_team_api_ids),  # ALL loan clubs
+        Fixture.date_utc >= season_start
+    ).first()
+    
+    if stats_query and stats_query.appearances:
+        local_appearances = stats_query.appearances or 0
+        local_minutes = int(stats_query.total_minutes or 0)
+        local_goals = int(stats_query.total_goals or 0)
+        local_assists = int(stats_query.total_assists or 0)
+        
+        result['yellows'] = int(stats_query.total_yellows or 0)
+        result['reds'] = int(stats_query.total_reds or 0)
+        result['avg_rating'] = round(float(stats_query.avg_rating or 0), 2) if stats_query.avg_rating else None
+        result['shots'] = int(stats_query.total_shots or 0)
+        result['shots_on_target'] = int(stats_query.shots_on_target or 0)
+        result['key_passes'] = int(stats_query.total_key_passes or 0)
+        result['tackles'] = int(stats_query.total_tackles or 0)
+        result['saves'] = int(stats_query.total_saves or 0)
+        result['goals_conceded'] = int(stats_query.total_goals_conceded or 0)
+        result['local_appearances'] = local_appearances
+        
+        # PREFER local fixture data when it has MORE appearances than API-Football
+        # This handles cases where API-Football's aggregated endpoint is incomplete
+        # Our fixture data is captured per-game and is more reliable
+        if local_appearances > result.get('appearances', 0):
+            logger.info(
+                f"Using local fixture data for player {player_id}: "
+                f"local={local_appearances} apps > API={result.get('appearances', 0)} apps"
+            )
+            result['appearances'] = local_appearances
+            result['minutes'] = local_minutes
+            result['goals'] = local_goals
+            result['assists'] = local_assists
+            result['source'] = 'local-db'
+        elif result['source'] == 'none':
+            # Fallback to local DB if API-Football returned nothing
+            result['appearances'] = local_appearances
+            result['minutes'] = local_minutes
+            result['goals'] = local_goals
+            result['assists'] = local_assists
+            result['source'] = 'local-db'
+    
+    # Calculate clean sheets for goalkeepers (games with 0 goals conceded and >= 45 mins)
+    clean_sheets_query = db.session.query(
+        func.count(FixturePlayerStats.id).label('clean_sheets')
+    ).join(
+        Fixture, FixturePlayerStats.fixture_id == Fixture.id
+    ).filter(
+        FixturePlayerStats.player_api_id == player_id,
+        FixturePlayerStats.team_api_id.in_(loan_team_api_ids),
+        Fixture.date_utc >= season_start,
+        FixturePlayerStats.goals_conceded == 0,
+        FixturePlayerStats.minutes >= 45
+    ).first()
+    
+    result['clean_sheets'] = clean_sheets_query.clean_sheets if clean_sheets_query else 0
+    
+    if result.get('local_appearances', 0) < result['appearances']:
+        stale = True
+    result.update(_request_player_refresh(
+        player_id, season_start_year, loan_team_api_ids, player_name_for_verify, stale=stale,
+    ))
+    
+    return result
+
+
+def player_journey_map(player_id: int, sync: bool = False) -> dict | None:
+    """
+    A player's journey grouped by club with coordinates, or None if the
+    player has no journey. *sync* builds a missing journey first.
+    """
+    journey = PlayerJourney.query.filter_by(player_api_id=player_id).first()
+
+    if not journey and sync:
+        from src.services.journey_sync import JourneySyncService
+        service = JourneySyncService()
+        journey = service.sync_player(player_id)
+
+    if not journey:
+        # Fallback: build a minimal journey from TrackedPlayer if available
+        tracked = TrackedPlayer.query.filter_by(player_api_id=player_id, is_active=True).first()
+        if tracked and tracked.team:
+            map_data = {
+                'player_api_id': player_id,
+                'player_name': tracked.player_name,
+                'player_photo': tracked.photo_url,
+                'stops': [{
+                    'club_id': tracked.team.team_id,
+                    'club_name': tracked.team.name,
+                    'club_logo': tracked.team.logo,
+                    'years': str(datetime.now().year),
+                    'levels': [tracked.current_level or tracked.status or 'Academy'],
+                    'entry_types': ['academy'],
+                    'total_apps': 0,
+                    'total_goals': 0,
+                    'total_assists': 0,
+                    'breakdown': {},
+                    'competitions': [],
+                    'lat': None,
+                    'lng': None,
+                }],
+                'path': [],
+                'source': 'tracked-player',
+            }
+            # Add loan club stop if on loan
+            if tracked.loan_club_api_id:
+                loan_team = Team.query.filter_by(team_id=tracked.loan_club_api_id).first()
+                if loan_team:
+                    map_data['stops'].append({
+                        'club_id': tracked.loan_club_api_id,
+                        'club_name': tracked.loan_club_name or loan_team.name,
+                        'club_logo': loan_team.logo,
+                        'years': str(datetime.now().year),
+                        'levels': ['First Team'],
+                        'entry_types': ['loan'],
+                        'total_apps': 0,
+                        'total_goals': 0,
+                        'total_assists': 0,
+                        'breakdown': {},
+                        'competitions': [],
+                        'lat': None,
+                        'lng': None,
+                    })
+            return map_data
+        return None
+
+    map_data = journey.to_map_dict()
+    
+    # Add coordinates for each stop
+    club_ids = [stop['club_id'] for stop in map_data['stops']]
+    locations = ClubLocation.query.filter(ClubLocation.club_api_id.in_(club_ids)).all()
+    location_map = {loc.club_api_id: loc for loc in locations}
+    
+    for stop in map_data['stops']:
+        loc = location_map.get(stop['club_id'])
+        if loc:
+            stop['lat'] = loc.latitude
+            stop['lng'] = loc.longitude
+            stop['city'] = loc.city
+            stop['country'] = loc.country
+        else:
+            stop['lat'] = None
+            stop['lng'] = None
+    
+    # Build path (ordered list of coordinates)
+    map_data['path'] = [
+        [stop['lat'], stop['lng']]
+        for stop in map_data['stops']
+        if stop.get('lat') and stop.get('lng')
+    ]
+    
+    return map_data
+    
+
+
+def player_commentaries(player_id: int) -> dict:
+    """Active commentaries/writeups that mention a player, with their authors."""
+    # Find all commentaries that reference this player
+    commentaries = NewsletterCommentary.query.filter(
+        NewsletterCommentary.player_id == player_id,
+        NewsletterCommentary.is_active == True
+    ).order_by(NewsletterCommentary.created_at.desc()).all()
+    
+    result = []
+    for c in commentaries:
+        author = c.author
+        newsletter = c.newsletter
+        
+        commentary_data = {
+            'id': c.id,
+            'content': c.content,
+            'title': c.title,
+            'commentary_type': c.commentary_type,
+            'is_premium': c.is_premium,
+            'created_at': c.created_at.isoformat() if c.created_at else None,
+            'updated_at': c.updated_at.isoformat() if c.updated_at else None,
+            'author': {
+                'id': author.id if author else None,
+                'display_name': author.display_name if author else None,
+                'profile_image_url': author.profile_image_url if author else None,
+                'is_journalist': author.is_journalist if author else False,
+            } if author else None,
+            'newsletter': {
+                'id': newsletter.id if newsletter else None,
+                'title': newsletter.title if newsletter else None,
+                'week_start_date': newsletter.week_start_date.isoformat() if newsletter and newsletter.week_start_date else None,
+                'week_end_date': newsletter.week_end_date.isoformat() if newsletter and newsletter.week_end_date else None,
+                'team_name': newsletter.team.name if newsletter and newsletter.team else None,
+            } if newsletter else None,
+        }
+        result.append(commentary_data)
+    
+    # Also get unique authors who have written about this player
+    unique_authors = {}
+    for c in commentaries:
+        if c.author and c.author.id not in unique_authors:
+            unique_authors[c.author.id] = {
+                'id': c.author.id,
+                'display_name': c.author.display_name,
+                'profile_image_url': c.author.profile_image_url,
+                'is_journalist': c.author.is_journalist,
+                'commentary_count': 0,
+            }
+        if c.author:
+            unique_authors[c.author.id]['commentary_count'] += 1
+    
+    return {
+        'player_id': player_id,
+        'commentaries': result,
+        'total_count': len(result),
+        'authors': list(unique_authors.values()),
+    }
+    
+
+
+def player_links(player_id: int) -> list:
+    """Approved links for a player, plus YouTube links from newsletters."""
+    rows = PlayerLink.query\
+        .filter_by(player_id=player_id, status='approved')\
+        .order_by(PlayerLink.upvotes.desc(), PlayerLink.created_at.desc())\
+        .all()
+    results = [r.to_dict() for r in rows]
+
+    # Merge YouTube links from newsletters for this player
+    yt_rows = NewsletterPlayerYoutubeLink.query\
+        .filter_by(player_id=player_id)\
+        .order_by(NewsletterPlayerYoutubeLink.created_at.desc())\
+        .all()
+    seen_urls = {r['url'] for r in results}
+    for yt in yt_rows:
+        if yt.youtube_link in seen_urls:
+            continue
+        seen_urls.add(yt.youtube_link)
+        results.append({
+            'id': f'yt-{yt.id}',
+            'player_id': yt.player_id,
+            'url': yt.youtube_link,
+            'title': yt.player_name + ' Highlights' if yt.player_name else 'Match Highlights',
+            'link_type': 'highlight',
+            'status': 'approved',
+            'upvotes': 0,
+            'source': 'newsletter',
+            'created_at': yt.created_at.isoformat() if yt.created_at else None,
+        })
+
+    return results
@@ -5,15 +5,13 @@ import json
 import os
 import logging
 from functools import lru_cache
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 logger = logging.getLogger(__name__)
 
-try:
+if TYPE_CHECKING:  # Optional Groq dependency, imported on first use
     from groq import Groq
-except ImportError:
-    Groq = None
 
 class FixturePlayerStats(BaseModel):
     """Structured stats for a player in a fixture."""
@@ -43,11 +41,15 @@ SYSTEM_PROMPT = (
 )
 
 @lru_cache(maxsize=1)
-def _get_groq_client() -> Optional[Groq]:
+def _get_groq_client() -> Optional["Groq"]:
     api_key = os.getenv('GROQ_API_KEY')
-    if api_key and Groq is not None:
-        return Groq(api_key=api_key)
-    return None
+    if not api_key:
+        return None
+    try:
+        from groq import Groq
+    except ImportError:
+        return None
+    return Groq(api_key=api_key)
 
 def parse_stats_from_text(
     text: str,
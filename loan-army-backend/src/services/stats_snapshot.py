@@ -0,0 +1,313 @@
+"""Precomputed admin and status aggregates.
+
+``/admin/dashboard-stats``, ``/admin/subscriber-stats``, ``/sync-status``
+and ``/api/debug/database`` used to run their counts and breakdowns on
+every request. Each now serves a JSON document stored in
+``stats_snapshots`` under one key, reporting its ``built_at`` as ``as_of``.
+
+A document is rebuilt on read once it is older than its max age or after a
+write to one of its source tables. Those writes are caught by ``after_flush``
+on the app session and applied by ``after_commit`` in a separate short
+transaction, so a long sync holding its own transaction open never holds a
+lock on the snapshot row. Core bulk writes bypass the hook and are picked
+up at the max age. ``refresh=1`` on the endpoints forces a rebuild; the
+builders keep each document to a handful of grouped queries so that path
+stays cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import case, event, func, or_, select
+from sqlalchemy.exc import IntegrityError
+
+from src.models.api_cache import StatsSnapshot
+from src.models.league import (
+    BackgroundJob,
+    League,
+    LoanedPlayer,
+    Newsletter,
+    Team,
+    UserSubscription,
+    db,
+)
+from src.models.tracked_player import TrackedPlayer
+from src.utils.background_jobs import STALE_JOB_TIMEOUT
+from src.utils.pagination import table_row_estimates
+
+logger = logging.getLogger(__name__)
+
+STATS_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv('STATS_SNAPSHOT_MAX_AGE_SECONDS', '300'))
+# Stale jobs are detected by elapsed time, not by a write, so this one expires sooner
+SYNC_STATUS_MAX_AGE_SECONDS = int(os.getenv('SYNC_STATUS_MAX_AGE_SECONDS', '30'))
+
+MAJOR_JOB_TYPES = ('full_rebuild', 'seed_big6')
+
+# session.info key collecting snapshot keys dirtied by the current transaction
+_PENDING = 'stats_snapshot_keys'
+
+
+def build_dashboard_stats(session) -> dict:
+    by_status = dict(session.execute(
+        select(TrackedPlayer.status, func.count())
+        .where(TrackedPlayer.is_active.is_(True))
+        .group_by(TrackedPlayer.status)
+    ).all())
+    tracked_teams = session.execute(
+        select(func.count()).select_from(Team).where(Team.is_tracked.is_(True))
+    ).scalar() or 0
+    total_newsletters, published_newsletters = session.execute(
+        select(func.count(), func.count(case((Newsletter.published.is_(True), 1)))).select_from(Newsletter)
+    ).one()
+    return {
+        'players': {
+            'total': sum(by_status.values()),
+            'academy': by_status.get('academy', 0),
+            'on_loan': by_status.get('on_loan', 0),
+            'first_team': by_status.get('first_team', 0),
+            'released': by_status.get('released', 0),
+        },
+        'teams': {
+            'tracked': tracked_teams,
+        },
+        'newsletters': {
+            'total': total_newsletters,
+            'published': published_newsletters,
+            'drafts': total_newsletters - published_newsletters,
+        },
+    }
+
+
+def build_subscriber_stats(session) -> dict:
+    """Subscriber counts per team (latest season row), most subscribed first."""
+    # Subscriptions and newsletters are aggregated by API team id across all
+    # seasons, so a team's count doesn't depend on which season row they hang off
+    latest_season = select(
+        Team.team_id, func.max(Team.season).label('latest_season'),
+    ).group_by(Team.team_id).subquery()
+    subscriptions = select(
+        Team.team_id,
+        func.count(UserSubscription.id).label('subscriber_count'),
+        func.count(case((UserSubscription.active.is_(True), 1))).label('active_subscriber_count'),
+    ).join(UserSubscription, Team.id == UserSubscription.team_id).group_by(Team.team_id).subquery()
+    newsletters = select(
+        Team.team_id, func.max(Newsletter.published_date).label('latest_newsletter_date'),
+    ).join(Newsletter, Team.id == Newsletter.team_id).group_by(Team.team_id).subquery()
+
+    rows = session.execute(
+        select(
+            Team.id, Team.team_id, Team.name, Team.logo, Team.season, Team.newsletters_active,
+            func.coalesce(subscriptions.c.subscriber_count, 0),
+            func.coalesce(subscriptions.c.active_subscriber_count, 0),
+            newsletters.c.latest_newsletter_date,
+        )
+        .join(latest_season, (Team.team_id == latest_season.c.team_id)
+              & (Team.season == latest_season.c.latest_season))
+        .outerjoin(subscriptions, Team.team_id == subscriptions.c.team_id)
+        .outerjoin(newsletters, Team.team_id == newsletters.c.team_id)
+    ).all()
+    teams = [
+        {
+            'id': row_id,
+            'team_id': team_id,
+            'name': name,
+            'logo': logo,
+            'season': season,
+            'subscriber_count': sub_count,
+            'active_subscriber_count': active_count,
+            'newsletters_active': newsletters_active,
+            'latest_newsletter_date': latest.isoformat() if latest else None,
+        }
+        for (row_id, team_id, name, logo, season, newsletters_active, sub_count, active_count, latest) in rows
+    ]
+    teams.sort(key=lambda t: t['subscriber_count'], reverse=True)
+
+    total_subscribers = session.execute(
+        select(func.count(func.distinct(UserSubscription.email))).where(UserSubscription.active.is_(True))
+    ).scalar() or 0
+    return {'teams': teams, 'total_subscribers': total_subscribers}
+
+
+def build_database_stats(session) -> dict:
+    """Table sizes for the debug endpoint; whole-table totals may be estimates."""
+    totals, estimated = table_row_estimates(session, [
+        League.__tablename__, Team.__tablename__, LoanedPlayer.__tablename__,
+        Newsletter.__tablename__, UserSubscription.__tablename__,
+    ])
+    active_teams = session.execute(
+        select(func.count()).select_from(Team).where(Team.is_active.is_(True))
+    ).scalar() or 0
+    active_loans = session.execute(
+        select(func.count()).select_from(LoanedPlayer).where(LoanedPlayer.is_active.is_(True))
+    ).scalar() or 0
+    return {
+        'tables': {
+            'leagues': totals[League.__tablename__],
+            'teams': totals[Team.__tablename__],
+            'active_teams': active_teams,
+            'loans': totals[LoanedPlayer.__tablename__],
+            'active_loans': active_loans,
+            'newsletters': totals[Newsletter.__tablename__],
+            'subscriptions': totals[UserSubscription.__tablename__],
+        },
+        'estimated': estimated,
+    }
+
+
+def build_sync_status(session) -> dict:
+    """Whether a major background sync is running; auto-fails stale jobs."""
+    now = datetime.now(timezone.utc)
+    running = session.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.status == 'running',
+            BackgroundJob.job_type.in_(MAJOR_JOB_TYPES),
+        )
+    ).scalars().all()
+
+    active = []
+    for job in running:
+        last_active = job.updated_at or job.started_at or job.created_at
+        if last_active:
+            elapsed = now - last_active.replace(tzinfo=timezone.utc)
+            if elapsed > STALE_JOB_TIMEOUT:
+                job.status = 'failed'
+                job.error = f'Stale job auto-failed (no update in {elapsed}).'
+                job.completed_at = now
+                continue
+        active.append(job)
+
+    payload = {'syncing': bool(active)}
+    if active:
+        payload['message'] = "We're currently updating player data. Some information may be temporarily unavailable."
+        # Progress from the most recently updated active job
+        job = max(active, key=lambda j: j.updated_at or j.created_at)
+        payload['stage'] = job.current_player
+        payload['progress'] = job.progress
+        payload['total'] = job.total
+        # Tracked team logos for the public banner animation
+        payload['teams'] = [
+            {'name': name, 'logo': logo, 'team_id': team_id}
+            for name, logo, team_id in session.execute(
+                select(Team.name, Team.logo, Team.team_id).where(Team.is_tracked.is_(True), Team.logo.isnot(None))
+            )
+            if logo
+        ]
+    return payload
+
+
+# Snapshot key -> (builder, max age in seconds)
+SNAPSHOTS: dict[str, tuple[Callable, int]] = {
+    'dashboard': (build_dashboard_stats, STATS_SNAPSHOT_MAX_AGE_SECONDS),
+    'subscribers': (build_subscriber_stats, STATS_SNAPSHOT_MAX_AGE_SECONDS),
+    'database': (build_database_stats, STATS_SNAPSHOT_MAX_AGE_SECONDS),
+    'sync_status': (build_sync_status, SYNC_STATUS_MAX_AGE_SECONDS),
+}
+
+# Model -> snapshot keys its writes invalidate
+_WATCHED = {
+    TrackedPlayer: ('dashboard',),
+    Team: ('dashboard', 'subscribers', 'database', 'sync_status'),
+    Newsletter: ('dashboard', 'subscribers', 'database'),
+    UserSubscription: ('subscribers', 'database'),
+    League: ('database',),
+    LoanedPlayer: ('database',),
+}
+
+
+def get_snapshot(key: str, *, rebuild: bool = False) -> StatsSnapshot:
+    """Return the stored snapshot for *key*, rebuilding it when stale."""
+    builder, max_age = SNAPSHOTS[key]
+    row = StatsSnapshot.query.filter_by(key=key).first()
+    if row is not None and not rebuild and row.is_fresh(max_age):
+        return row
+
+    built_at = datetime.now(timezone.utc)
+    payload = json.dumps(builder(db.session), separators=(',', ':'), default=str)
+    # The document already reflects any writes its builder made (stale jobs)
+    db.session.flush()
+    db.session.info.get(_PENDING, set()).discard(key)
+
+    def _apply():
+        current = StatsSnapshot.query.filter_by(key=key).first()
+        if current is None:
+            current = StatsSnapshot(key=key)
+            db.session.add(current)
+        current.payload_json = payload
+        current.built_at = built_at
+        return current
+
+    row = _apply()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        # Race condition – another request stored this snapshot first
+        row = _apply()
+        db.session.commit()
+    return row
+
+
+def snapshot_payload(row: StatsSnapshot) -> dict:
+    """The stored document with its ``as_of`` timestamp."""
+    payload = json.loads(row.payload_json)
+    payload['as_of'] = StatsSnapshot._utc(row.built_at).isoformat()
+    return payload
+
+
+def invalidate_stats_snapshots(keys, bind=None) -> int:
+    """Mark the snapshots under *keys* stale; returns rows touched.
+
+    Runs in its own transaction. Snapshots already stale are skipped, so a
+    burst of writes costs one row update.
+    """
+    keys = set(keys)
+    if not keys:
+        return 0
+    table = StatsSnapshot.__table__
+    with (bind or db.engine).begin() as conn:
+        result = conn.execute(
+            table.update()
+            .where(
+                table.c.key.in_(keys),
+                or_(table.c.invalidated_at.is_(None), table.c.invalidated_at < table.c.built_at),
+            )
+            .values(invalidated_at=datetime.now(timezone.utc))
+        )
+    return result.rowcount or 0
+
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_on_flush(session, flush_context):
+    changed = [obj for obj in session.dirty if session.is_modified(obj)]
+    keys = set()
+    for obj in (*session.new, *changed, *session.deleted):
+        if isinstance(obj, BackgroundJob):
+            if obj.job_type in MAJOR_JOB_TYPES:
+                keys.add('sync_status')
+            continue
+        keys.update(_WATCHED.get(type(obj), ()))
+    if keys:
+        session.info.setdefault(_PENDING, set()).update(keys)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _invalidate_on_commit(session):
+    keys = session.info.pop(_PENDING, None)
+    if not keys:
+        return
+    try:
+        invalidate_stats_snapshots(keys, bind=session.get_bind())
+    except Exception:
+        # A missed invalidation only delays the refresh to the snapshot's max age
+        logger.warning('stats snapshot invalidation failed for %s', sorted(keys), exc_info=True)
+
+
+@event.listens_for(db.session, 'after_soft_rollback')
+def _discard_on_rollback(session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING, None)
@@ -0,0 +1,308 @@
+"""
+Lightweight SVG chart rendering.
+
+Builds SVG markup directly from the chart data dicts used by
+``chart_renderer`` (radar, bar, line and stat table), without importing
+matplotlib. Output is a small vector document that scales cleanly on the web;
+``chart_renderer`` picks this backend when ``fmt='svg'`` is requested or
+``CHART_FORMAT=svg`` is configured.
+
+Charts accept two optional keys on top of the API data:
+``title`` overrides the generated title and ``y_max`` fixes the value axis.
+"""
+
+import math
+from html import escape
+from typing import Any, Dict, List, Optional
+
+from src.services.chart_renderer import CHART_COLORS, POSITION_COLORS
+
+SVG_CHART_TYPES = frozenset({'radar', 'bar', 'line', 'stat_table'})
+
+FONT_FAMILY = 'Helvetica, Arial, sans-serif'
+SERIES_COLORS = [CHART_COLORS['primary'], CHART_COLORS['success'], CHART_COLORS['info'],
+                 CHART_COLORS['warning'], CHART_COLORS['danger']]
+
+# Plot margins for charts with axes (left, right, top, bottom)
+MARGINS = (44, 12, 36, 64)
+
+
+def render_svg(chart_type: str, data: Dict[str, Any], width: int = 500, height: int = 300) -> str:
+    """
+    Render a chart as SVG markup.
+
+    Args:
+        chart_type: One of ``SVG_CHART_TYPES``
+        data: Chart data from the API
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        SVG document as a string
+
+    Raises:
+        ValueError: if the chart type has no SVG renderer
+    """
+    renderer = {
+        'radar': render_radar_svg,
+        'bar': render_bar_svg,
+        'line': render_line_svg,
+        'stat_table': render_stat_table_svg,
+    }.get(chart_type)
+    if renderer is None:
+        raise ValueError(f"No SVG renderer for chart type: {chart_type}")
+    return renderer(data, width, height)
+
+
+def render_radar_svg(data: Dict[str, Any], width: int = 400, height: int = 400) -> str:
+    """Render a radar/spider chart of normalized (0-100) stat values."""
+    radar_data = data.get('data', [])
+    if not radar_data:
+        return render_empty_svg("No data available", width, height)
+
+    player_name = data.get('player', {}).get('name', 'Player')
+    matches_count = data.get('matches_count', 0)
+    title = data.get('title') or player_name
+    if matches_count and not data.get('title'):
+        title += f" - {matches_count} match{'es' if matches_count != 1 else ''}"
+    color = POSITION_COLORS.get(data.get('position_category', 'Midfielder'), CHART_COLORS['primary'])
+
+    cx, cy = width / 2, height / 2 + 12
+    radius = max(10.0, min(width, height) / 2 - 60)
+    n = len(radar_data)
+
+    def point(i: int, value: float) -> tuple:
+        angle = 2 * math.pi * i / n - math.pi / 2
+        r = radius * max(0.0, min(float(value or 0), 100.0)) / 100
+        return cx + r * math.cos(angle), cy + r * math.sin(angle)
+
+    parts = [_title(title, width)]
+    for level in (25, 50, 75, 100):
+        ring = ' '.join(_xy(*point(i, level)) for i in range(n))
+        parts.append(f'<polygon points="{ring}" fill="none" stroke="#e5e7eb" stroke-width="1"/>')
+        x, y = point(0, level)
+        parts.append(_text(x + 4, y + 3, str(level), size=8))
+    for i, item in enumerate(radar_data):
+        x, y = point(i, 100)
+        parts.append(f'<line x1="{_n(cx)}" y1="{_n(cy)}" x2="{_n(x)}" y2="{_n(y)}" '
+                     f'stroke="#e5e7eb" stroke-width="1"/>')
+        lx, ly = point(i, 118)
+        anchor = 'middle' if abs(lx - cx) < 1 else ('start' if lx > cx else 'end')
+        parts.append(_text(lx, ly + 3, item.get('label', item.get('stat', '')), size=9, anchor=anchor))
+
+    values = [item.get('normalized', 0) for item in radar_data]
+    shape = ' '.join(_xy(*point(i, v)) for i, v in enumerate(values))
+    parts.append(f'<polygon points="{shape}" fill="{color}" fill-opacity="0.25" '
+                 f'stroke="{color}" stroke-width="2"/>')
+    for i, v in enumerate(values):
+        x, y = point(i, v)
+        parts.append(f'<circle cx="{_n(x)}" cy="{_n(y)}" r="3" fill="{color}"/>')
+    return _svg(width, height, parts)
+
+
+def render_bar_svg(data: Dict[str, Any], width: int = 500, height: int = 300) -> str:
+    """Render grouped per-match bars, one series per stat key."""
+    bar_data = data.get('data', [])
+    if not bar_data:
+        return render_empty_svg("No data available", width, height)
+
+    stat_keys = data.get('stat_keys', ['goals', 'assists', 'rating'])
+    labels = [str(d.get('match', d.get('date', '')))[:20] for d in bar_data]
+    series = [[_num(d.get(stat)) for d in bar_data] for stat in stat_keys]
+    title = data.get('title') or f"{data.get('player', {}).get('name', 'Player')} - Per Match Stats"
+
+    plot = _Plot(width, height, series, data.get('y_max'))
+    parts = [_title(title, width)] + plot.axes(labels)
+    slot = plot.w / len(labels)
+    bar_w = slot * 0.8 / len(stat_keys)
+    for s, values in enumerate(series):
+        color = SERIES_COLORS[s % len(SERIES_COLORS)]
+        for i, value in enumerate(values):
+            x = plot.left + slot * i + slot * 0.1 + bar_w * s
+            y = plot.y(max(value, 0))
+            parts.append(f'<rect x="{_n(x)}" y="{_n(y)}" width="{_n(bar_w)}" '
+                         f'height="{_n(plot.y(0) - y)}" fill="{color}" fill-opacity="0.8"/>')
+    parts += _legend(stat_keys, width, plot.top)
+    return _svg(width, height, parts)
+
+
+def render_line_svg(data: Dict[str, Any], width: int = 500, height: int = 300) -> str:
+    """Render a time series line per stat key."""
+    line_data = data.get('data', [])
+    if not line_data:
+        return render_empty_svg("No data available", width, height)
+
+    stat_keys = data.get('stat_keys', ['goals', 'assists', 'rating'])
+    labels = [str(d.get('date', ''))[:10] for d in line_data]
+    series = [[_num(d.get(stat)) for d in line_data] for stat in stat_keys]
+    title = data.get('title') or f"{data.get('player', {}).get('name', 'Player')} - Performance Trend"
+
+    plot = _Plot(width, height, series, data.get('y_max'))
+    parts = [_title(title, width)] + plot.axes(labels)
+    slot = plot.w / len(labels)
+    for s, values in enumerate(series):
+        color = SERIES_COLORS[s % len(SERIES_COLORS)]
+        points = [(plot.left + slot * (i + 0.5), plot.y(v)) for i, v in enumerate(values)]
+        parts.append(f'<polyline points="{" ".join(_xy(x, y) for x, y in points)}" fill="none" '
+                     f'stroke="{color}" stroke-width="2"/>')
+        parts += [f'<circle cx="{_n(x)}" cy="{_n(y)}" r="3" fill="{color}"/>' for x, y in points]
+    parts += _legend(stat_keys, width, plot.top)
+    return _svg(width, height, parts)
+
+
+def render_stat_table_svg(data: Dict[str, Any], width: int = 500, height: int = 250) -> str:
+    """Render up to six matches plus a totals row as a table."""
+    table_data = data.get('data', [])
+    if not table_data:
+        return render_empty_svg("No data available", width, height)
+
+    totals = data.get('totals', {})
+    display_data = table_data[:6]
+    headers = ['Date', 'Opponent', 'Result', 'Min', 'G', 'A', 'Rating']
+    col_widths = [0.18, 0.26, 0.12, 0.1, 0.08, 0.08, 0.18]
+    rows = [[
+        str(d.get('date', ''))[:10],
+        str(d.get('opponent', ''))[:12],
+        str(d.get('result', '')),
+        str(d.get('minutes', 0) or 0),
+        str(d.get('goals', 0) or 0),
+        str(d.get('assists', 0) or 0),
+        f"{d.get('rating'):.1f}" if d.get('rating') else '-',
+    ] for d in display_data]
+    if totals:
+        rows.append(['TOTAL', '', '', str(totals.get('minutes', 0)),
+                     str(totals.get('goals', 0)), str(totals.get('assists', 0)), '-'])
+
+    title = data.get('title') or f"{data.get('player', {}).get('name', 'Player')} - {data.get('matches_count', 0)} Match Stats"
+    if not data.get('title') and len(table_data) > 6:
+        title += f" (showing {len(display_data)})"
+
+    left, top = 10, 32
+    table_w = width - 2 * left
+    row_h = min(24.0, (height - top - 8) / (len(rows) + 1))
+    xs = [left]
+    for frac in col_widths:
+        xs.append(xs[-1] + frac * table_w)
+
+    parts = [_title(title, width)]
+    parts.append(f'<rect x="{left}" y="{top}" width="{_n(table_w)}" height="{_n(row_h)}" '
+                 f'fill="{CHART_COLORS["primary"]}"/>')
+    for c, header in enumerate(headers):
+        parts.append(_text((xs[c] + xs[c + 1]) / 2, top + row_h * 0.68, header,
+                           size=9, color='#ffffff', bold=True))
+    for r, row in enumerate(rows, start=1):
+        y = top + row_h * r
+        is_total = bool(totals) and r == len(rows)
+        fill = '#f3f4f6' if is_total else '#ffffff'
+        parts.append(f'<rect x="{left}" y="{_n(y)}" width="{_n(table_w)}" height="{_n(row_h)}" '
+                     f'fill="{fill}" stroke="#e5e7eb" stroke-width="1"/>')
+        for c, cell in enumerate(row):
+            parts.append(_text((xs[c] + xs[c + 1]) / 2, y + row_h * 0.68, cell,
+                               size=9, color='#111827', bold=is_total))
+    return _svg(width, height, parts)
+
+
+def render_empty_svg(message: str, width: int, height: int) -> str:
+    """Render an empty chart placeholder with a message."""
+    return _svg(width, height, [_text(width / 2, height / 2, message, size=12)], background='#f9fafb')
+
+
+# ── primitives ─────────────────────────────────────────────────────────
+
+class _Plot:
+    """Value-to-pixel mapping for a chart with an x category axis."""
+
+    def __init__(self, width: int, height: int, series: List[List[float]], y_max: Optional[float]):
+        left, right, top, bottom = MARGINS
+        self.left, self.top = left, top
+        self.w = max(1, width - left - right)
+        self.h = max(1, height - top - bottom)
+        peak = max([v for values in series for v in values] + [0])
+        self.ticks = _nice_ticks(y_max if y_max else peak)
+        self.y_max = self.ticks[-1]
+
+    def y(self, value: float) -> float:
+        return self.top + self.h * (1 - min(value, self.y_max) / self.y_max)
+
+    def axes(self, labels: List[str]) -> List[str]:
+        parts = []
+        bottom = self.top + self.h
+        for tick in self.ticks:
+            y = self.y(tick)
+            parts.append(f'<line x1="{self.left}" y1="{_n(y)}" x2="{_n(self.left + self.w)}" y2="{_n(y)}" '
+                         f'stroke="#e5e7eb" stroke-width="1"/>')
+            parts.append(_text(self.left - 6, y + 3, _fmt_tick(tick), size=8, anchor='end'))
+        parts.append(f'<line x1="{self.left}" y1="{_n(bottom)}" x2="{_n(self.left + self.w)}" '
+                     f'y2="{_n(bottom)}" stroke="{CHART_COLORS["gray"]}" stroke-width="1"/>')
+        slot = self.w / max(1, len(labels))
+        every = max(1, math.ceil(len(labels) / 12))
+        for i, label in enumerate(labels):
+            if i % every:
+                continue
+            x = self.left + slot * (i + 0.5)
+            parts.append(f'<text x="{_n(x)}" y="{_n(bottom + 12)}" font-size="7" fill="{CHART_COLORS["gray"]}" '
+                         f'text-anchor="end" transform="rotate(-45 {_n(x)} {_n(bottom + 12)})">'
+                         f'{escape(label)}</text>')
+        return parts
+
+
+def _nice_ticks(peak: float) -> List[float]:
+    """Four evenly spaced ticks from 0 covering *peak* with round steps."""
+    if peak <= 0:
+        return [0.0, 0.25, 0.5, 0.75, 1.0]
+    raw = peak / 4
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    return [step * i for i in range(5)]
+
+
+def _legend(keys: List[str], width: int, top: int) -> List[str]:
+    parts = []
+    x = width - MARGINS[1] - 4
+    for i, key in reversed(list(enumerate(keys))):
+        label = key.replace('_', ' ').title()
+        parts.append(_text(x, top - 8, label, size=8, anchor='end'))
+        x -= len(label) * 4.6 + 4
+        parts.append(f'<rect x="{_n(x - 8)}" y="{top - 15}" width="8" height="8" '
+                     f'fill="{SERIES_COLORS[i % len(SERIES_COLORS)]}"/>')
+        x -= 16
+    return parts
+
+
+def _title(title: str, width: int) -> str:
+    return _text(width / 2, 18, title, size=11, bold=True)
+
+
+def _text(x: float, y: float, text: Any, size: int = 9, anchor: str = 'middle',
+          color: str = CHART_COLORS['gray'], bold: bool = False) -> str:
+    weight = ' font-weight="bold"' if bold else ''
+    return (f'<text x="{_n(x)}" y="{_n(y)}" font-size="{size}" fill="{color}" '
+            f'text-anchor="{anchor}"{weight}>{escape(str(text))}</text>')
+
+
+def _svg(width: int, height: int, parts: List[str], background: str = '#ffffff') -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}">'
+        f'<rect width="100%" height="100%" fill="{background}"/>'
+        + ''.join(parts) + '</svg>'
+    )
+
+
+def _num(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _fmt_tick(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def _n(value: float) -> str:
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+
+def _xy(x: float, y: float) -> str:
+    return f"{_n(x)},{_n(y)}"
@@ -0,0 +1,256 @@
+"""
+Tracked Player Status Refresh Service
+
+Re-derives TrackedPlayer status/loan fields with the academy classifier.
+All API-Football input (transfers + squads) is prefetched concurrently up
+front, DB lookups are done in bulk, classification runs on a thread pool
+and writes are committed in batches so the refresh can run as a
+background job without holding an HTTP worker.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+from src.models.league import db, Team
+from src.models.journey import PlayerJourney
+from src.models.tracked_player import TrackedPlayer
+from src.api_football_client import APIFootballClient, get_api_client
+from src.utils.academy_classifier import (
+    _get_active_classification_config,
+    classify_tracked_player,
+    flatten_transfers,
+    get_latest_seasons_bulk,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_CLASSIFY_WORKERS = 8
+
+
+class RefreshCancelled(Exception):
+    """Raised internally when the owning background job was cancelled."""
+
+
+class TrackedStatusRefreshService:
+    """Prefetch-then-classify refresh of TrackedPlayer statuses."""
+
+    def __init__(
+        self,
+        api_client: Optional[APIFootballClient] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        classify_workers: int = DEFAULT_CLASSIFY_WORKERS,
+    ):
+        self.api = api_client or get_api_client()
+        self.batch_size = max(1, int(batch_size))
+        self.classify_workers = max(1, int(classify_workers))
+
+    def refresh(
+        self,
+        team_id: Optional[int] = None,
+        resync_journeys: bool = False,
+        progress_fn: Optional[Callable[..., None]] = None,
+        cancel_fn: Optional[Callable[[], bool]] = None,
+    ) -> dict:
+        """Refresh statuses for active TrackedPlayers (optionally one team).
+
+        Args:
+            team_id: Restrict to one parent team (DB id).
+            resync_journeys: Re-sync each journey from API-Football first.
+            progress_fn: Called as ``progress_fn(progress=, total=, current_player=)``.
+            cancel_fn: Returns True when the caller wants to stop early.
+
+        Returns:
+            ``{'total', 'updated'}`` plus ``journeys_resynced`` when resyncing.
+        """
+        progress_fn = progress_fn or (lambda **kwargs: None)
+        cancel_fn = cancel_fn or (lambda: False)
+
+        query = TrackedPlayer.query.filter_by(is_active=True)
+        if team_id:
+            query = query.filter_by(team_id=team_id)
+        players = query.all()
+        total = len(players)
+        progress_fn(progress=0, total=total, current_player=f'Refreshing {total} players...')
+
+        journeys_resynced = 0
+        if resync_journeys:
+            journeys_resynced = self._resync_journeys(players, progress_fn, cancel_fn)
+
+        progress_fn(current_player='Prefetching transfers and squads...')
+        teams_by_id = self._load_teams(players)
+        journeys_by_tp = self._load_journeys(players)
+        transfers_map, squad_members_by_club = self._prefetch(
+            players, teams_by_id, journeys_by_tp,
+        )
+
+        latest_seasons = get_latest_seasons_bulk({
+            journey.id: (teams_by_id[tp.team_id].team_id, teams_by_id[tp.team_id].name)
+            for tp in players
+            if (journey := journeys_by_tp.get(tp.id)) and tp.team_id in teams_by_id
+        })
+
+        # Classification reads the prefetched inputs (falling back to a
+        # per-player transfer fetch when the bulk prefetch missed a player),
+        # so it is safe to fan out across threads; writes stay on this
+        # thread's session.
+        config = _get_active_classification_config()
+        work = []
+        for tp in players:
+            journey = journeys_by_tp.get(tp.id)
+            parent_team = teams_by_id.get(tp.team_id)
+            if not journey or not parent_team:
+                continue
+            work.append((tp, journey, dict(
+                current_club_api_id=journey.current_club_api_id,
+                current_club_name=journey.current_club_name,
+                current_level=journey.current_level,
+                parent_api_id=parent_team.team_id,
+                parent_club_name=parent_team.name,
+                transfers=transfers_map.get(tp.player_api_id),
+                player_api_id=tp.player_api_id,
+                config=config,
+                latest_season=latest_seasons.get(journey.id),
+                squad_members_by_club=squad_members_by_club,
+                api_client=self.api,
+            )))
+
+        classify = self.api._bind_app_context(classify_tracked_player)
+        with ThreadPoolExecutor(max_workers=self.classify_workers) as executor:
+            classified = list(executor.map(
+                lambda item: classify(**item[2]), work,
+            ))
+
+        updated = 0
+        for idx, ((tp, journey, _), result) in enumerate(zip(work, classified), start=1):
+            if self._apply(tp, journey, result):
+                updated += 1
+            if idx % self.batch_size == 0:
+                db.session.commit()
+                progress_fn(progress=idx, total=total, current_player=tp.player_name)
+                if cancel_fn():
+                    raise RefreshCancelled(f'Cancelled after {idx}/{total} players')
+        db.session.commit()
+        progress_fn(progress=total, total=total)
+
+        result = {'total': total, 'updated': updated}
+        if resync_journeys:
+            result['journeys_resynced'] = journeys_resynced
+        return result
+
+    # ── phases ─────────────────────────────────────────────────────────
+
+    def _resync_journeys(self, players, progress_fn, cancel_fn) -> int:
+        """Re-sync journeys serially (sync_player writes to the session)."""
+        from src.services.journey_sync import JourneySyncService
+
+        journey_svc = JourneySyncService(self.api)
+        resynced = 0
+        for idx, tp in enumerate(players, start=1):
+            if not tp.player_api_id:
+                continue
+            try:
+                journey = journey_svc.sync_player(tp.player_api_id, force_full=True)
+                if journey:
+                    resynced += 1
+                    if not tp.journey_id:
+                        tp.journey_id = journey.id
+            except Exception as sync_err:
+                logger.warning(
+                    'refresh-statuses: journey resync failed for player %d: %s',
+                    tp.player_api_id, sync_err,
+                )
+            if idx % self.batch_size == 0:
+                db.session.commit()
+                progress_fn(progress=idx, total=len(players),
+                            current_player=f'Re-syncing journeys: {tp.player_name}')
+                if cancel_fn():
+                    raise RefreshCancelled(f'Cancelled during journey resync at {idx}/{len(players)}')
+        db.session.commit()
+        return resynced
+
+    def _prefetch(self, players, teams_by_id, journeys_by_tp):
+        """Fetch transfers and squads concurrently.
+
+        Squads cover parent clubs, the stored loan clubs and each journey's
+        current club, so a player who moved to a new loan club since the last
+        refresh is checked against that club's squad too.
+
+        Returns ``(transfers_map, squad_members_by_club)`` where transfers are
+        already flattened and squads are sets of player API ids.
+        """
+        player_api_ids = [tp.player_api_id for tp in players if tp.player_api_id]
+        club_ids: Set[int] = {tp.loan_club_api_id for tp in players if tp.loan_club_api_id}
+        club_ids |= {team.team_id for team in teams_by_id.values() if team.team_id}
+        club_ids |= {
+            j.current_club_api_id for j in journeys_by_tp.values() if j.current_club_api_id
+        }
+
+        fetch_transfers = self.api._bind_app_context(self.api.batch_get_player_transfers)
+        fetch_squads = self.api._bind_app_context(self.api.batch_get_team_players)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            transfers_future = executor.submit(fetch_transfers, player_api_ids)
+            squads_future = executor.submit(fetch_squads, sorted(club_ids))
+            raw_transfers_map = transfers_future.result()
+            squads = squads_future.result()
+
+        transfers_map = {
+            pid: flatten_transfers(raw) for pid, raw in raw_transfers_map.items()
+        }
+        squad_members_by_club: Dict[int, Set[int]] = {
+            club_id: {
+                int(e['player']['id']) for e in squad
+                if e and (e.get('player') or {}).get('id')
+            }
+            for club_id, squad in squads.items()
+        }
+        return transfers_map, squad_members_by_club
+
+    @staticmethod
+    def _load_teams(players) -> Dict[int, Team]:
+        team_ids = {tp.team_id for tp in players}
+        if not team_ids:
+            return {}
+        return {t.id: t for t in Team.query.filter(Team.id.in_(team_ids)).all()}
+
+    @staticmethod
+    def _load_journeys(players) -> Dict[int, PlayerJourney]:
+        """Map TrackedPlayer.id -> PlayerJourney via journey_id, then player_api_id."""
+        journey_ids = {tp.journey_id for tp in players if tp.journey_id}
+        api_ids = {tp.player_api_id for tp in players if tp.player_api_id}
+        by_id: Dict[int, PlayerJourney] = {}
+        by_api_id: Dict[int, PlayerJourney] = {}
+        if journey_ids:
+            for j in PlayerJourney.query.filter(PlayerJourney.id.in_(journey_ids)).all():
+                by_id[j.id] = j
+        if api_ids:
+            for j in PlayerJourney.query.filter(PlayerJourney.player_api_id.in_(api_ids)).all():
+                by_api_id[j.player_api_id] = j
+
+        journeys: Dict[int, PlayerJourney] = {}
+        for tp in players:
+            journey = by_id.get(tp.journey_id) if tp.journey_id else None
+            journey = journey or by_api_id.get(tp.player_api_id)
+            if journey:
+                journeys[tp.id] = journey
+        return journeys
+
+    @staticmethod
+    def _apply(tp: TrackedPlayer, journey: PlayerJourney, result) -> bool:
+        new_status, new_loan_id, new_loan_name = result
+        changed = False
+        if tp.status != new_status:
+            tp.status = new_status
+            changed = True
+        if tp.loan_club_api_id != new_loan_id:
+            tp.loan_club_api_id = new_loan_id
+            changed = True
+        if tp.loan_club_name != new_loan_name:
+            tp.loan_club_name = new_loan_name
+            changed = True
+        if journey.current_level and tp.current_level != journey.current_level:
+            tp.current_level = journey.current_level
+            changed = True
+        return changed
+
@@ -5,24 +5,12 @@ from __future__ import annotations
 import json
 import os
 from functools import lru_cache
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
-try:  # Optional Groq dependency (used when API key configured)
-    from groq import Groq
-except ImportError:  # pragma: no cover
-    Groq = None
 
-@lru_cache(maxsize=1)
-def _get_groq_client() -> Groq:
-    try:
-        api_key = os.getenv('GROQ_API_KEY')
-        if api_key and Groq is not None:
-            return Groq(api_key=api_key)
-        raise RuntimeError('GROQ_API_KEY is not configured')
-    except Exception:
-        pass
-    raise RuntimeError('GROQ_API_KEY is not configured')
+if TYPE_CHECKING:  # Optional Groq dependency, imported on first use
+    from groq import Groq
 
 class LoanMappingModel(BaseModel):
     model_config = ConfigDict(extra='forbid')
@@ -51,6 +39,10 @@ def _get_groq_client() -> Groq:
     api_key = os.getenv('GROQ_API_KEY')
     if not api_key:
         raise RuntimeError('GROQ_API_KEY is not configured')
+    try:
+        from groq import Groq
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError('groq is not installed') from exc
     return Groq(api_key=api_key)
 
 
@@ -367,22 +367,53 @@ def _get_latest_season(
 
     if parent_api_id is not None:
         entries = query.order_by(PlayerJourneyEntry.season.desc()).all()
-        for entry in entries:
-            if entry.club_api_id == parent_api_id:
-                return entry.season
-            if parent_club_name and is_same_club(entry.club_name or '', parent_club_name):
-                return entry.season
-        # No entries at parent club — fall back to latest season at any club.
-        # Active loans have recent entries (2025) that pass the threshold.
-        # Truly inactive players have old entries that trigger release.
-        if entries:
-            return entries[0].season
-        return None
+        return _pick_latest_season(
+            [(e.season, e.club_api_id, e.club_name) for e in entries],
+            parent_api_id, parent_club_name,
+        )
 
     entry = query.order_by(PlayerJourneyEntry.season.desc()).first()
     return entry.season if entry else None
 
 
+def get_latest_seasons_bulk(
+    parents_by_journey: Dict[int, Tuple[Optional[int], Optional[str]]],
+) -> Dict[int, Optional[int]]:
+    """Batch version of ``_get_latest_season`` for many journeys at once.
+
+    *parents_by_journey* maps ``journey_id`` to ``(parent_api_id,
+    parent_club_name)``.  Runs a single entries query instead of one per
+    journey and applies the same parent-club preference rules.
+    """
+    from src.models.journey import PlayerJourneyEntry
+    from src.models.league import db
+
+    if not parents_by_journey:
+        return {}
+
+    rows_by_journey: Dict[int, List[Tuple[int, Optional[int], Optional[str]]]] = {}
+    rows = (
+        db.session.query(
+            PlayerJourneyEntry.journey_id,
+            PlayerJourneyEntry.season,
+            PlayerJourneyEntry.club_api_id,
+            PlayerJourneyEntry.club_name,
+        )
+        .filter(PlayerJourneyEntry.journey_id.in_(list(parents_by_journey)))
+        .order_by(PlayerJourneyEntry.journey_id, PlayerJourneyEntry.season.desc())
+        .all()
+    )
+    for journey_id, season, club_api_id, club_name in rows:
+        rows_by_journey.setdefault(journey_id, []).append((season, club_api_id, club_name))
+
+    return {
+        journey_id: _pick_latest_season(
+            rows_by_journey.get(journey_id, []), parent_api_id, parent_club_name,
+        )
+        for journey_id, (parent_api_id, parent_club_name) in parents_by_journey.items()
+    }
+
+
 def classify_tracked_player(
     current_club_api_id: Optional[int],
     current_club_name: Optional[str],
@@ -549,6 +580,30 @@ def classify_tracked_player(
 
 # ─── internal ──────────────────────────────────────────────────────────
 
+def _pick_latest_season(
+    entries: List[Tuple[int, Optional[int], Optional[str]]],
+    parent_api_id: Optional[int],
+    parent_club_name: Optional[str],
+) -> Optional[int]:
+    """Pick the latest season from ``(season, club_api_id, club_name)`` rows.
+
+    *entries* must be sorted by season descending.  Entries at the parent
+    club win; otherwise the latest season at any club is returned.
+    """
+    if parent_api_id is not None:
+        for season, club_api_id, club_name in entries:
+            if club_api_id == parent_api_id:
+                return season
+            if parent_club_name and is_same_club(club_name or '', parent_club_name):
+                return season
+    # No entries at parent club — fall back to latest season at any club.
+    # Active loans have recent entries (2025) that pass the threshold.
+    # Truly inactive players have old entries that trigger release.
+    if entries:
+        return entries[0][0]
+    return None
+
+
 def _base_status(current_level: Optional[str]) -> str:
     """Pick 'first_team' or 'academy' based on the player's current level."""
     if current_level == 'First Team':
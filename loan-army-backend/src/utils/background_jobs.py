@@ -2,19 +2,135 @@
 
 This module provides a simple job tracking system that works across
 gunicorn workers by storing job state in the database.
+
+Progress ticks (progress/total/current_player) are coalesced: they are
+published to in-process subscribers immediately but written to the
+database at most JOB_PROGRESS_WRITES_PER_SEC times per second per job.
+Status, error and result changes are always written straight away. The
+admin SSE endpoints read from JobProgressBroker instead of polling; on
+PostgreSQL every job write is also sent with NOTIFY so streams served by
+other gunicorn workers see it.
 """
 
 import json
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from sqlalchemy import text
+
 from src.models.league import db, BackgroundJob
 
 logger = logging.getLogger(__name__)
 
 STALE_JOB_TIMEOUT = timedelta(hours=4)
 
+# Queue-run jobs heartbeat (see job_queue); silence longer than this means
+# the worker died
+HEARTBEAT_TIMEOUT = timedelta(seconds=int(os.getenv('JOB_HEARTBEAT_TIMEOUT_SECONDS', '300')))
+
+# Max coalesced progress writes per job per second (0 = write every tick)
+PROGRESS_WRITES_PER_SEC = float(os.getenv('JOB_PROGRESS_WRITES_PER_SEC', '1'))
+
+# How often an idle stream re-reads the database / sends a keep-alive
+STREAM_POLL_SECONDS = float(os.getenv('JOB_STREAM_POLL_SECONDS', '5'))
+STREAM_MAX_SECONDS = float(os.getenv('JOB_STREAM_MAX_SECONDS', '900'))
+
+NOTIFY_CHANNEL = 'background_jobs'
+NOTIFY_MAX_BYTES = 7900  # PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+ACTIVE_STATUSES = ('queued', 'running')
+PROGRESS_FIELDS = frozenset(('progress', 'total', 'current_player'))
+
+# Identifies this process in NOTIFY payloads so it ignores its own
+_PROCESS_TOKEN = f'{os.getpid()}-{uuid4().hex[:8]}'
+
+
+class JobProgressBroker:
+    """In-process fan-out of job snapshots to stream subscribers.
+
+    Keeps the latest snapshot of every job this process has seen change
+    and hands subscribers only the newest snapshot per job, so a slow
+    client never builds up a backlog of intermediate ticks.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest: dict[str, dict] = {}
+        self._subscribers: set['JobSubscription'] = set()
+
+    def publish(self, job_id: str, changes: dict, full: bool = False) -> dict | None:
+        """Merge *changes* into the job's snapshot and notify subscribers.
+
+        Partial changes for a job without a known snapshot are dropped;
+        subscribers pick the job up from the database instead.
+        """
+        with self._lock:
+            if full:
+                snapshot = dict(changes)
+            elif job_id in self._latest:
+                snapshot = {**self._latest[job_id], **changes}
+            else:
+                return None
+            if snapshot.get('status') in TERMINAL_STATUSES:
+                self._latest.pop(job_id, None)
+            else:
+                self._latest[job_id] = snapshot
+            subscribers = [s for s in self._subscribers if s.job_id in (None, job_id)]
+        for subscription in subscribers:
+            subscription.push(job_id, snapshot)
+        return snapshot
+
+    def latest(self, job_id: str) -> dict | None:
+        with self._lock:
+            snapshot = self._latest.get(job_id)
+            return dict(snapshot) if snapshot else None
+
+    def subscribe(self, job_id: str | None = None) -> 'JobSubscription':
+        """Subscribe to one job, or to every job when *job_id* is None."""
+        subscription = JobSubscription(job_id)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: 'JobSubscription') -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+class JobSubscription:
+    """Pending snapshots for one stream, keyed by job id."""
+
+    def __init__(self, job_id: str | None):
+        self.job_id = job_id
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+
+    def push(self, job_id: str, snapshot: dict) -> None:
+        with self._lock:
+            self._pending[job_id] = snapshot
+            self._event.set()
+
+    def wait(self, timeout: float) -> dict[str, dict]:
+        """Block until something changes (or *timeout*); return the changes."""
+        self._event.wait(timeout)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._event.clear()
+        return pending
+
+
+broker = JobProgressBroker()
+
+# Coalesced progress not yet written, and when each job was last written
+_pending_lock = threading.Lock()
+_pending_progress: dict[str, dict] = {}
+_last_write: dict[str, float] = {}
+
 
 def create_background_job(job_type: str) -> str:
     """Create a new background job in the database and return its ID.
@@ -36,7 +152,9 @@ def create_background_job(job_type: str) -> str:
             started_at=datetime.now(timezone.utc)
         )
         db.session.add(job)
+        _notify(job)
         db.session.commit()
+        broker.publish(job_id, job.to_dict(), full=True)
     except Exception as e:
         logger.error(f'Failed to create background job: {e}')
         db.session.rollback()
@@ -54,42 +172,127 @@ def update_job(job_id: str, **kwargs) -> None:
         - error: str - Error message if job failed
         - results: dict - Results data to store as JSON
         - completed_at: datetime | str - Completion timestamp
+
+    Updates touching only progress fields are throttled to
+    PROGRESS_WRITES_PER_SEC database writes per job; in between they are
+    published to in-process subscribers and held until the next write.
+    Any other field, or reaching ``progress == total``, writes at once.
     """
+    now = time.monotonic()
+    with _pending_lock:
+        fields = {**_pending_progress.pop(job_id, {}), **kwargs}
+        last = _last_write.get(job_id)
+        due = (
+            not PROGRESS_FIELDS.issuperset(kwargs)
+            or PROGRESS_WRITES_PER_SEC <= 0
+            or last is None
+            or now - last >= 1.0 / PROGRESS_WRITES_PER_SEC
+            or _is_finished(fields)
+        )
+        if due:
+            _last_write[job_id] = now
+        else:
+            _pending_progress[job_id] = fields
+
+    if not due:
+        broker.publish(job_id, {k: fields[k] for k in PROGRESS_FIELDS if k in fields})
+        return
+    _write_job(job_id, fields)
+    if fields.get('status') in TERMINAL_STATUSES:
+        with _pending_lock:
+            _last_write.pop(job_id, None)
+
+
+def flush_job(job_id: str) -> None:
+    """Write any coalesced progress for *job_id* to the database now."""
+    with _pending_lock:
+        fields = _pending_progress.pop(job_id, None)
+        if fields:
+            _last_write[job_id] = time.monotonic()
+    if fields:
+        _write_job(job_id, fields)
+
+
+def _is_finished(fields: dict) -> bool:
+    total = fields.get('total')
+    return bool(total) and fields.get('progress') == total
+
+
+def _write_job(job_id: str, fields: dict) -> None:
     try:
         job = db.session.get(BackgroundJob, job_id)
         if job:
-            if 'progress' in kwargs:
-                job.progress = kwargs['progress']
-            if 'total' in kwargs:
-                job.total = kwargs['total']
-            if 'current_player' in kwargs:
-                job.current_player = kwargs.get('current_player')
-            if 'status' in kwargs:
-                job.status = kwargs['status']
-            if 'error' in kwargs:
-                job.error = kwargs.get('error')
-            if 'results' in kwargs:
-                results = kwargs.get('results')
+            if 'progress' in fields:
+                job.progress = fields['progress']
+            if 'total' in fields:
+                job.total = fields['total']
+            if 'current_player' in fields:
+                job.current_player = fields.get('current_player')
+            if 'status' in fields:
+                job.status = fields['status']
+            if 'error' in fields:
+                job.error = fields.get('error')
+            if 'results' in fields:
+                results = fields.get('results')
                 if results is not None:
                     job.results_json = json.dumps(results)
-            if 'completed_at' in kwargs:
-                completed = kwargs.get('completed_at')
+            if 'completed_at' in fields:
+                completed = fields.get('completed_at')
                 if isinstance(completed, str):
                     job.completed_at = datetime.fromisoformat(completed.replace('Z', '+00:00'))
                 else:
                     job.completed_at = completed
             # Always bump updated_at so stale-job detection sees recent activity
             job.updated_at = datetime.now(timezone.utc)
+            _notify(job)
             db.session.commit()
+            broker.publish(job_id, job.to_dict(), full=True)
     except Exception as e:
         logger.error(f'Failed to update background job {job_id}: {e}')
         db.session.rollback()
 
 
+def _with_pending(job_dict: dict) -> dict:
+    """Overlay progress this process has not written yet."""
+    with _pending_lock:
+        pending = _pending_progress.get(job_dict['id'])
+        if pending and job_dict.get('status') == 'running':
+            job_dict.update({k: pending[k] for k in PROGRESS_FIELDS if k in pending})
+    return job_dict
+
+
+def _notify_payload(snapshot: dict) -> str:
+    """NOTIFY payload for a job snapshot, at most NOTIFY_MAX_BYTES long.
+
+    Results are never sent. When the rest is still too large (e.g. a long
+    error message) only id, status and progress go out, marked partial so
+    listeners merge it into the snapshot they already have.
+    """
+    snapshot = {k: v for k, v in snapshot.items() if k != 'results'}
+    payload = json.dumps({'origin': _PROCESS_TOKEN, 'job': snapshot})
+    if len(payload.encode()) > NOTIFY_MAX_BYTES:
+        payload = json.dumps({
+            'origin': _PROCESS_TOKEN,
+            'partial': True,
+            'job': {k: snapshot.get(k) for k in ('id', 'status', 'progress', 'total')},
+        })
+    return payload
+
+
+def _notify(job) -> None:
+    """Queue a NOTIFY for *job*, delivered when the session commits (PostgreSQL only)."""
+    if db.engine.dialect.name != 'postgresql':
+        return
+    db.session.execute(text('SELECT pg_notify(:channel, :payload)'),
+                       {'channel': NOTIFY_CHANNEL, 'payload': _notify_payload(job.to_dict())})
+
+
 def get_job(job_id: str) -> dict | None:
     """Get a background job's status from the database.
 
-    Auto-fails jobs stuck in 'running' longer than STALE_JOB_TIMEOUT.
+    Auto-fails jobs stuck in 'running' longer than STALE_JOB_TIMEOUT, or
+    whose worker stopped heartbeating for HEARTBEAT_TIMEOUT on their final
+    attempt (earlier attempts are re-queued by job_queue.reap_stale_jobs).
 
     Args:
         job_id: The UUID of the job to retrieve
@@ -101,9 +304,15 @@ def get_job(job_id: str) -> dict | None:
         job = db.session.get(BackgroundJob, job_id)
         if job:
             if job.status == 'running':
-                last_active = (job.updated_at or job.started_at or job.created_at)
+                if job.heartbeat_at:
+                    last_active, timeout = job.heartbeat_at, HEARTBEAT_TIMEOUT
+                    if (job.attempts or 0) < (job.max_attempts or 1):
+                        timeout = None
+                else:
+                    last_active = (job.updated_at or job.started_at or job.created_at)
+                    timeout = STALE_JOB_TIMEOUT
                 elapsed = datetime.now(timezone.utc) - last_active.replace(tzinfo=timezone.utc)
-                if elapsed > STALE_JOB_TIMEOUT:
+                if timeout is not None and elapsed > timeout:
                     logger.warning(
                         f'Job {job_id} stale ({elapsed}), auto-marking failed. '
                         f'Last progress: {job.progress}/{job.total} on {job.current_player}'
@@ -116,7 +325,7 @@ def get_job(job_id: str) -> dict | None:
                     )
                     job.completed_at = datetime.now(timezone.utc)
                     db.session.commit()
-            return job.to_dict()
+            return _with_pending(job.to_dict())
     except Exception as e:
         logger.error(f'Failed to get background job {job_id}: {e}')
         db.session.rollback()
@@ -124,20 +333,22 @@ def get_job(job_id: str) -> dict | None:
 
 
 def cancel_job(job_id: str) -> bool:
-    """Cancel a running background job.
+    """Cancel a queued or running background job.
 
-    Sets the job status to 'cancelled' so background loops can detect it
-    and exit gracefully on their next iteration.
+    Sets the job status to 'cancelled': queued jobs are never claimed, and
+    running loops detect it and exit gracefully on their next iteration.
 
-    Returns True if the job was running and is now cancelled.
+    Returns True if the job was active and is now cancelled.
     """
     try:
         job = db.session.get(BackgroundJob, job_id)
-        if job and job.status == 'running':
+        if job and job.status in ACTIVE_STATUSES:
             job.status = 'cancelled'
             job.error = 'Cancelled by admin'
             job.completed_at = datetime.now(timezone.utc)
+            _notify(job)
             db.session.commit()
+            broker.publish(job_id, job.to_dict(), full=True)
             logger.info('Job %s cancelled', job_id)
             return True
         return False
@@ -151,8 +362,16 @@ def is_job_cancelled(job_id: str) -> bool:
     """Check whether a job has been cancelled.
 
     Uses a fresh DB read (expunges cached state) so cancellation
-    signals are picked up promptly by long-running loops.
+    signals are picked up promptly by long-running loops. Loops call this
+    between items, so it also writes coalesced progress that has waited
+    longer than the throttle interval.
     """
+    with _pending_lock:
+        last = _last_write.get(job_id)
+        overdue = (job_id in _pending_progress and last is not None and PROGRESS_WRITES_PER_SEC > 0
+                   and time.monotonic() - last >= 1.0 / PROGRESS_WRITES_PER_SEC)
+    if overdue:
+        flush_job(job_id)
     try:
         job = db.session.get(BackgroundJob, job_id)
         if job:
@@ -163,6 +382,114 @@ def is_job_cancelled(job_id: str) -> bool:
     return False
 
 
+def stream_job_events(job_id: str | None = None,
+                      poll_seconds: float | None = None,
+                      max_seconds: float | None = None):
+    """Yield ``(event, data)`` pairs describing job progress.
+
+    With *job_id*, yields ``('job', snapshot)`` on every change and a
+    final ``('done', job)`` once the job finishes. Without it, yields
+    ``('jobs', [queued and running job snapshots])`` whenever any job
+    changes.
+    ``('ping', None)`` is yielded when nothing changed for *poll_seconds*;
+    at that point the database is re-read, which picks up jobs running in
+    other workers when NOTIFY is not available.
+    """
+    poll_seconds = STREAM_POLL_SECONDS if poll_seconds is None else poll_seconds
+    deadline = time.monotonic() + (STREAM_MAX_SECONDS if max_seconds is None else max_seconds)
+    _ensure_listener()
+    subscription = broker.subscribe(job_id)
+    try:
+        state = _load_stream_state(job_id)
+        sent = None
+        while True:
+            if job_id is not None:
+                job = state.get(job_id)
+                if job is None:
+                    yield 'error', {'error': 'Job not found'}
+                    return
+                if job != sent:
+                    sent = job
+                    if job.get('status') in TERMINAL_STATUSES:
+                        yield 'done', get_job(job_id) or job
+                        return
+                    yield 'job', job
+            else:
+                jobs = sorted(state.values(), key=lambda j: j.get('started_at') or '', reverse=True)
+                if jobs != sent:
+                    sent = jobs
+                    yield 'jobs', jobs
+            db.session.remove()  # don't hold a connection while idle
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            changes = subscription.wait(min(poll_seconds, remaining))
+            if changes:
+                for changed_id, snapshot in changes.items():
+                    if job_id is None and snapshot.get('status') not in ACTIVE_STATUSES:
+                        state.pop(changed_id, None)
+                    else:
+                        state[changed_id] = snapshot
+            else:
+                yield 'ping', None
+                state = _load_stream_state(job_id)
+    finally:
+        broker.unsubscribe(subscription)
+        db.session.remove()
+
+
+def _load_stream_state(job_id: str | None) -> dict[str, dict]:
+    db.session.expire_all()
+    if job_id is not None:
+        job = get_job(job_id)
+        return {job_id: job} if job else {}
+    active = BackgroundJob.query.filter(BackgroundJob.status.in_(ACTIVE_STATUSES)).all()
+    return {job.id: _with_pending(job.to_dict()) for job in active}
+
+
+_listener_lock = threading.Lock()
+_listener_thread: threading.Thread | None = None
+
+
+def _ensure_listener() -> None:
+    """Start the LISTEN thread for this process (PostgreSQL only)."""
+    global _listener_thread
+    if db.engine.dialect.name != 'postgresql':
+        return
+    with _listener_lock:
+        if _listener_thread is not None and _listener_thread.is_alive():
+            return
+        url = db.engine.url.set(drivername='postgresql').render_as_string(hide_password=False)
+        _listener_thread = threading.Thread(target=_listen, args=(url,), name='job-notify-listener',
+                                            daemon=True)
+        _listener_thread.start()
+
+
+def _listen(url: str) -> None:
+    """Forward NOTIFY payloads from other processes into the broker."""
+    import psycopg
+
+    backoff = 1
+    while True:
+        try:
+            with psycopg.connect(url, autocommit=True) as conn:
+                conn.execute(f'LISTEN {NOTIFY_CHANNEL}')
+                backoff = 1
+                for notify in conn.notifies():
+                    try:
+                        message = json.loads(notify.payload)
+                    except (TypeError, ValueError):
+                        continue
+                    job = message.get('job') or {}
+                    if message.get('origin') != _PROCESS_TOKEN and job.get('id'):
+                        broker.publish(job['id'], job, full=not message.get('partial'))
+        except Exception as e:
+            logger.warning('Job notify listener stopped (%s); reconnecting in %ss', e, backoff)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+
 # Aliases for backward compatibility with api.py internal naming
 _create_background_job = create_background_job
 _update_job = update_job
@@ -0,0 +1,112 @@
+"""Start-up import profiling built on ``python -X importtime``.
+
+The profile runs in a fresh interpreter so already-imported modules in the
+caller don't hide their cost. ``flask import-profile`` prints the report and
+fails when start-up exceeds a budget or pulls in a module that should only
+load on demand (the agents SDK, LLM clients, pandas, matplotlib, praw).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+# Imported lazily by the code paths that need them; a web worker that
+# imports one of these at start-up has regressed.
+DEFERRED_MODULES = ('agents', 'openai', 'groq', 'pandas', 'matplotlib', 'praw')
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def top_level(self) -> str:
+        return self.module.split('.', 1)[0]
+
+
+def parse_importtime(text: str) -> list[ImportEntry]:
+    """Parse ``-X importtime`` stderr output, skipping non-report lines."""
+    entries = []
+    for line in text.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(ImportEntry(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def profile_imports(module: str = 'src.main', env: dict | None = None) -> list[ImportEntry]:
+    """Import ``module`` in a fresh interpreter and return its import timings."""
+    run_env = {**os.environ, 'SKIP_API_HANDSHAKE': '1', **(env or {})}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=str(_BACKEND_ROOT),
+        env=run_env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    entries = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ['unknown error']
+        raise RuntimeError(f'Importing {module} failed: {tail[0]}')
+    return entries
+
+
+def summarize(entries: Iterable[ImportEntry], top: int = 20) -> dict:
+    """Total start-up time plus the costliest packages and project modules."""
+    entries = list(entries)
+    total_us = sum(entry.self_us for entry in entries)
+    by_package: dict[str, int] = {}
+    for entry in entries:
+        by_package[entry.top_level] = by_package.get(entry.top_level, 0) + entry.self_us
+    project = sorted(
+        (e for e in entries if e.top_level == 'src'),
+        key=lambda e: e.cumulative_us,
+        reverse=True,
+    )
+    loaded = {entry.top_level for entry in entries}
+    return {
+        'total_ms': round(total_us / 1000, 1),
+        'modules': len(entries),
+        'packages': [
+            {'package': name, 'self_ms': round(us / 1000, 1)}
+            for name, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        'project_modules': [
+            {'module': e.module, 'cumulative_ms': round(e.cumulative_us / 1000, 1),
+             'self_ms': round(e.self_us / 1000, 1)}
+            for e in project[:top]
+        ],
+        'deferred_loaded': sorted(name for name in DEFERRED_MODULES if name in loaded),
+    }
+
+
+def check_budget(summary: dict, max_ms: float | None = None) -> list[str]:
+    """Return the regressions in ``summary`` (empty when start-up is healthy)."""
+    problems = []
+    if summary['deferred_loaded']:
+        problems.append('eagerly imported: ' + ', '.join(summary['deferred_loaded']))
+    if max_ms is not None and summary['total_ms'] > max_ms:
+        problems.append(f"start-up imports took {summary['total_ms']}ms (budget {max_ms}ms)")
+    return problems
+
+
+def format_report(summary: dict) -> str:
+    lines = [f"Imported {summary['modules']} modules in {summary['total_ms']}ms", '', 'Packages (self time):']
+    lines += [f"  {row['self_ms']:>9.1f}ms  {row['package']}" for row in summary['packages']]
+    lines += ['', 'Project modules (cumulative):']
+    lines += [f"  {row['cumulative_ms']:>9.1f}ms  {row['module']}" for row in summary['project_modules']]
+    return '\n'.join(lines)
@@ -0,0 +1,496 @@
+"""Database-backed work queue for background jobs.
+
+Jobs are ``background_jobs`` rows inserted as 'queued' by enqueue_job().
+Worker processes claim them with ``SELECT ... FOR UPDATE SKIP LOCKED``
+(lowest priority value first), run the registered handler inside an app
+context, heartbeat while it runs and record the outcome. Failed attempts
+are re-queued with exponential backoff until max_attempts is reached.
+
+Handlers register with @register_job_handler (see src/jobs/handlers.py):
+
+    @register_job_handler('seed_team', max_attempts=3, priority=50)
+    def seed_team(job_id, team_id, **kwargs):
+        ...
+        return results        # stored on the job
+
+A handler raising InterruptedError marks the job cancelled; one that sets
+a terminal status itself via update_job is left as it is.
+
+Workers run either as a dedicated pool (``flask job-worker``, with
+JOB_WORKER_MODE=external) or, by default, as short-lived processes that
+enqueue_job() spawns from the web worker and that exit once the queue has
+been idle for JOB_WORKER_IDLE_EXIT_SECONDS.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from uuid import uuid4
+
+from sqlalchemy import and_, func, or_, select, text, update
+
+from src.models.league import db, BackgroundJob
+from src.utils.background_jobs import (
+    ACTIVE_STATUSES,
+    HEARTBEAT_TIMEOUT,
+    TERMINAL_STATUSES,
+    broker,
+    flush_job,
+    update_job,
+)
+
+logger = logging.getLogger(__name__)
+
+WORKER_MODE = os.getenv('JOB_WORKER_MODE', 'embedded').lower()  # 'embedded' or 'external'
+WORKER_PROCESSES = max(1, int(os.getenv('JOB_WORKER_PROCESSES', '2')))
+POLL_SECONDS = float(os.getenv('JOB_QUEUE_POLL_SECONDS', '2'))
+IDLE_EXIT_SECONDS = float(os.getenv('JOB_WORKER_IDLE_EXIT_SECONDS', '15'))
+HEARTBEAT_SECONDS = float(os.getenv('JOB_HEARTBEAT_SECONDS', '30'))
+MAX_BACKOFF_SECONDS = 3600
+
+DEFAULT_PRIORITY = 100
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    job_type: str
+    func: Callable
+    concurrency: int = 1
+    group: str | None = None  # job types sharing a concurrency limit
+    max_attempts: int = 1
+    backoff_seconds: int = 60
+    priority: int = DEFAULT_PRIORITY
+
+    @property
+    def limit_key(self) -> str:
+        return self.group or self.job_type
+
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str, *, concurrency: int = 1, group: str | None = None,
+                         max_attempts: int = 1, backoff_seconds: int = 60,
+                         priority: int = DEFAULT_PRIORITY):
+    """Decorator registering *func(job_id, **payload)* as the handler for *job_type*.
+
+    Args:
+        concurrency: max jobs of this type (or group) running at once
+        group: share the concurrency limit with other job types
+        max_attempts: total attempts before the job is marked failed
+        backoff_seconds: delay before the first retry; doubles per attempt
+        priority: default priority (lower runs first)
+    """
+    def decorator(func):
+        _handlers[job_type] = JobHandler(job_type, func, concurrency, group, max_attempts,
+                                         backoff_seconds, priority)
+        return func
+    return decorator
+
+
+def load_handlers() -> dict[str, JobHandler]:
+    """Import the built-in handlers (idempotent) and return the registry."""
+    import src.jobs.handlers  # noqa: F401  (registers on import)
+    return _handlers
+
+
+def get_handler(job_type: str) -> JobHandler | None:
+    return load_handlers().get(job_type)
+
+
+def enqueue_job(job_type: str, payload: dict | None = None, *, priority: int | None = None,
+                delay_seconds: float = 0, start_worker: bool = True,
+                dedupe_key: str | None = None, dedupe_seconds: float = 0) -> str:
+    """Queue a job for a worker and return its ID.
+
+    With *dedupe_key*, nothing is queued while a job with the same key is
+    queued or running, or was created in the last *dedupe_seconds*; that
+    job's ID is returned instead.
+
+    Raises:
+        ValueError: if no handler is registered for *job_type*
+    """
+    handler = get_handler(job_type)
+    if handler is None:
+        raise ValueError(f'No job handler registered for {job_type!r}')
+
+    now = datetime.now(timezone.utc)
+    job = BackgroundJob(
+        id=str(uuid4()),
+        job_type=job_type,
+        status='queued',
+        progress=0,
+        total=0,
+        priority=handler.priority if priority is None else priority,
+        payload_json=json.dumps(payload or {}),
+        attempts=0,
+        max_attempts=handler.max_attempts,
+        run_after=now + timedelta(seconds=delay_seconds) if delay_seconds else None,
+        started_at=now,
+        created_at=now,
+        updated_at=now,
+        dedupe_key=dedupe_key,
+    )
+    # Own transaction on a separate connection: the caller's session is
+    # neither committed nor rolled back, and the advisory lock is held only
+    # for the duplicate check and insert
+    with db.engine.begin() as conn:
+        if dedupe_key:
+            if conn.dialect.name == 'postgresql':
+                conn.execute(text('SELECT pg_advisory_xact_lock(hashtext(:key))'), {'key': dedupe_key})
+            existing = conn.execute(
+                _duplicate_jobs(dedupe_key, dedupe_seconds, now).with_only_columns(BackgroundJob.id)
+            ).scalar()
+            if existing is not None:
+                return existing
+        conn.execute(BackgroundJob.__table__.insert().values(
+            {column.key: getattr(job, column.key) for column in BackgroundJob.__table__.columns}
+        ))
+    broker.publish(job.id, job.to_dict(), full=True)
+    logger.info('Queued %s job %s (priority %s)', job_type, job.id, job.priority)
+    if start_worker:
+        ensure_worker()
+    return job.id
+
+
+def _duplicate_jobs(dedupe_key: str, within_seconds: float, now: datetime):
+    """Jobs for *dedupe_key* still active or younger than *within_seconds*, latest first."""
+    conditions = [BackgroundJob.status.in_(ACTIVE_STATUSES)]
+    if within_seconds:
+        conditions.append(and_(
+            BackgroundJob.created_at >= now - timedelta(seconds=within_seconds),
+            BackgroundJob.status != 'cancelled',
+        ))
+    return (
+        select(BackgroundJob)
+        .where(BackgroundJob.dedupe_key == dedupe_key, or_(*conditions))
+        .order_by(BackgroundJob.created_at.desc())
+        .limit(1)
+    )
+
+
+def find_duplicate_job(dedupe_key: str, within_seconds: float = 0, *,
+                       now: datetime | None = None) -> BackgroundJob | None:
+    """Latest job for *dedupe_key* that is still active or younger than *within_seconds*."""
+    now = now or datetime.now(timezone.utc)
+    return db.session.execute(_duplicate_jobs(dedupe_key, within_seconds, now)).scalars().first()
+
+
+def claim_next_job(worker_id: str) -> BackgroundJob | None:
+    """Atomically claim the most urgent runnable job, or return None.
+
+    Skips job types (or groups) already at their concurrency limit. On
+    PostgreSQL candidates are locked with FOR UPDATE SKIP LOCKED and the
+    limit check is serialised with a transaction-scoped advisory lock, so
+    concurrent workers never claim the same job or overshoot a limit.
+    """
+    handlers = load_handlers()
+    now = datetime.now(timezone.utc)
+    try:
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('background_jobs_claim'))"))
+
+        running = dict(
+            db.session.query(BackgroundJob.job_type, func.count(BackgroundJob.id))
+            .filter(BackgroundJob.status == 'running')
+            .group_by(BackgroundJob.job_type)
+            .all()
+        )
+        in_use: dict[str, int] = {}
+        for job_type, count in running.items():
+            handler = handlers.get(job_type)
+            key = handler.limit_key if handler else job_type
+            in_use[key] = in_use.get(key, 0) + count
+        blocked = [
+            job_type for job_type, handler in handlers.items()
+            if in_use.get(handler.limit_key, 0) >= handler.concurrency
+        ]
+        runnable = [job_type for job_type in handlers if job_type not in blocked]
+        if not runnable:
+            db.session.rollback()
+            return None
+
+        job = (
+            BackgroundJob.query
+            .filter(
+                BackgroundJob.status == 'queued',
+                BackgroundJob.job_type.in_(runnable),
+                or_(BackgroundJob.run_after.is_(None), BackgroundJob.run_after <= now),
+            )
+            .order_by(BackgroundJob.priority.asc(), BackgroundJob.created_at.asc())
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if job is None:
+            db.session.rollback()
+            return None
+
+        job.status = 'running'
+        job.attempts = (job.attempts or 0) + 1
+        job.worker_id = worker_id
+        job.heartbeat_at = now
+        job.started_at = job.started_at or now
+        job.error = None
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    broker.publish(job.id, job.to_dict(), full=True)
+    return job
+
+
+def run_claimed_job(job: BackgroundJob) -> str:
+    """Run a claimed job's handler and record the outcome; returns the final status."""
+    job_id = job.id
+    handler = get_handler(job.job_type)
+    if handler is None:
+        _finish(job_id, 'failed', error=f'No handler registered for {job.job_type!r}')
+        return 'failed'
+
+    try:
+        payload = json.loads(job.payload_json or '{}')
+    except (TypeError, ValueError) as e:
+        _finish(job_id, 'failed', error=f'Invalid job payload: {e}')
+        return 'failed'
+
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(db.engine, job_id, stop),
+                            name=f'job-heartbeat-{job_id[:8]}', daemon=True)
+    beat.start()
+    try:
+        result = handler.func(job_id, **payload)
+    except InterruptedError as e:
+        db.session.rollback()
+        return _finish(job_id, 'cancelled', error=str(e) or 'Cancelled')
+    except Exception as e:
+        logger.exception('%s job %s failed (attempt %s/%s)', job.job_type, job_id,
+                         job.attempts, job.max_attempts)
+        db.session.rollback()
+        return _fail_or_retry(job_id, handler, str(e))
+    finally:
+        stop.set()
+        beat.join(timeout=5)
+
+    return _finish(job_id, 'completed', results=result)
+
+
+def _finish(job_id: str, status: str, **fields) -> str:
+    """Record a terminal status unless the handler already set one."""
+    flush_job(job_id)
+    db.session.expire_all()
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None:
+        return status
+    if job.status in TERMINAL_STATUSES:
+        return job.status
+    if status == 'completed' and fields.get('results') is None:
+        fields.pop('results', None)
+    update_job(job_id, status=status, completed_at=datetime.now(timezone.utc), **fields)
+    return status
+
+
+def _fail_or_retry(job_id: str, handler: JobHandler, error: str) -> str:
+    flush_job(job_id)
+    db.session.expire_all()
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None or job.status in TERMINAL_STATUSES:
+        return job.status if job else 'failed'
+    if (job.attempts or 0) < (job.max_attempts or 1):
+        delay = min(handler.backoff_seconds * 2 ** max(0, (job.attempts or 1) - 1), MAX_BACKOFF_SECONDS)
+        _requeue(job, delay, f'Attempt {job.attempts} failed: {error}')
+        return 'queued'
+    update_job(job_id, status='failed', error=error, completed_at=datetime.now(timezone.utc))
+    return 'failed'
+
+
+def _requeue(job: BackgroundJob, delay_seconds: float, error: str) -> None:
+    job.status = 'queued'
+    job.error = error
+    job.worker_id = None
+    job.heartbeat_at = None
+    job.run_after = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+    db.session.commit()
+    broker.publish(job.id, job.to_dict(), full=True)
+    logger.info('Re-queued job %s in %ss: %s', job.id, delay_seconds, error)
+
+
+def _heartbeat(engine, job_id: str, stop: threading.Event) -> None:
+    while not stop.wait(HEARTBEAT_SECONDS):
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    update(BackgroundJob.__table__)
+                    .where(BackgroundJob.id == job_id, BackgroundJob.status == 'running')
+                    .values(heartbeat_at=datetime.now(timezone.utc))
+                )
+        except Exception as e:
+            logger.warning('Heartbeat for job %s failed: %s', job_id, e)
+
+
+def reap_stale_jobs() -> int:
+    """Re-queue (or fail, on the last attempt) running jobs whose worker stopped heartbeating."""
+    cutoff = datetime.now(timezone.utc) - HEARTBEAT_TIMEOUT
+    stale = BackgroundJob.query.filter(
+        BackgroundJob.status == 'running',
+        BackgroundJob.heartbeat_at.isnot(None),
+        BackgroundJob.heartbeat_at < cutoff,
+    ).all()
+    for job in stale:
+        message = f'Worker {job.worker_id} stopped heartbeating'
+        if (job.attempts or 0) < (job.max_attempts or 1):
+            _requeue(job, 0, message)
+        else:
+            update_job(job.id, status='failed', error=message, completed_at=datetime.now(timezone.utc))
+    return len(stale)
+
+
+def run_worker(drain: bool = False, worker_id: str | None = None) -> int:
+    """Claim and run jobs until stopped; returns the number of jobs run.
+
+    With *drain*, exits once nothing has been claimable for
+    IDLE_EXIT_SECONDS. Must be called inside an app context.
+    """
+    worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+    current = {}
+
+    def _on_sigterm(signum, frame):
+        job_id = current.get('id')
+        logger.warning('Job worker %s received SIGTERM (job %s)', worker_id, job_id)
+        if job_id:
+            try:
+                db.session.rollback()
+                handler = get_handler(current.get('type'))
+                if handler:
+                    _fail_or_retry(job_id, handler, 'Process terminated (SIGTERM)')
+            except Exception:
+                pass
+        sys.exit(1)
+
+    previous = None
+    if threading.current_thread() is threading.main_thread():
+        previous = signal.signal(signal.SIGTERM, _on_sigterm)
+    try:
+        return _work(worker_id, drain, current)
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGTERM, previous)
+
+
+def _work(worker_id: str, drain: bool, current: dict) -> int:
+    ran = 0
+    idle_since = time.monotonic()
+    while True:
+        try:
+            reap_stale_jobs()
+            job = claim_next_job(worker_id)
+        except Exception as e:
+            logger.error('Job worker %s failed to claim: %s', worker_id, e)
+            db.session.rollback()
+            job = None
+
+        if job is None:
+            # Retries waiting out their backoff keep a draining worker alive
+            if (drain and time.monotonic() - idle_since >= IDLE_EXIT_SECONDS
+                    and not _has_queued_jobs()):
+                return ran
+            time.sleep(POLL_SECONDS)
+            continue
+
+        current.update(id=job.id, type=job.job_type)
+        logger.info('Worker %s running %s job %s', worker_id, job.job_type, job.id)
+        try:
+            run_claimed_job(job)
+        finally:
+            current.clear()
+            db.session.remove()
+        ran += 1
+        idle_since = time.monotonic()
+
+
+def _has_queued_jobs() -> bool:
+    try:
+        return db.session.query(
+            BackgroundJob.query.filter(
+                BackgroundJob.status == 'queued',
+                BackgroundJob.job_type.in_(list(load_handlers())),
+            ).exists()
+        ).scalar()
+    except Exception:
+        db.session.rollback()
+        return False
+
+
+def _worker_process_main(drain: bool) -> None:
+    """Entry point for worker processes: own logging, app and DB connections."""
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True,
+    )
+    from src.main import app
+
+    with app.app_context():
+        # Connections inherited through fork must not be shared with the parent
+        db.engine.dispose(close=False)
+        run_worker(drain=drain)
+
+
+_spawned: list = []
+_spawn_lock = threading.Lock()
+
+
+def ensure_worker() -> None:
+    """Start a draining worker process unless workers run externally.
+
+    Keeps at most WORKER_PROCESSES of them per web process; they exit on
+    their own once the queue is idle.
+    """
+    if WORKER_MODE == 'external':
+        return
+    with _spawn_lock:
+        _spawned[:] = [p for p in _spawned if p.is_alive()]
+        if len(_spawned) >= WORKER_PROCESSES:
+            return
+        p = multiprocessing.Process(target=_worker_process_main, args=(True,), daemon=False)
+        p.start()
+        # Detach: prevent parent's atexit handler from blocking on join()
+        multiprocessing.process._children.discard(p)
+        _spawned.append(p)
+
+
+def run_worker_pool(processes: int | None = None) -> None:
+    """Supervise a dedicated pool of worker processes, restarting any that exit."""
+    processes = processes or WORKER_PROCESSES
+    ctx = multiprocessing.get_context('spawn')
+    pool: list = []
+    stopping = threading.Event()
+
+    def _on_signal(signum, frame):
+        stopping.set()
+        for p in pool:
+            if p.is_alive():
+                p.terminate()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+    logger.info('Starting %d job worker processes', processes)
+    while not stopping.is_set():
+        pool[:] = [p for p in pool if p.is_alive()]
+        while len(pool) < processes:
+            p = ctx.Process(target=_worker_process_main, args=(False,), name=f'job-worker-{len(pool)}')
+            p.start()
+            pool.append(p)
+        stopping.wait(5)
+    for p in pool:
+        p.join(timeout=30)
+
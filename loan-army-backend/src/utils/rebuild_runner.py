@@ -1,9 +1,8 @@
-"""Subprocess entry point for rebuild jobs.
+"""Full academy rebuild pipeline.
 
-Runs rebuild operations in a separate multiprocessing.Process, completely
-isolated from gunicorn workers.  This prevents gunicorn's worker timeout
-from killing long-running rebuilds, and avoids zombie threads exhausting
-the DB connection pool.
+Runs as the 'full_rebuild' job handler (src/jobs/handlers.py) on a job
+queue worker process, isolated from gunicorn workers so gunicorn's worker
+timeout cannot kill long-running rebuilds.
 """
 import logging
 from datetime import datetime, timezone
@@ -11,67 +10,7 @@ from datetime import datetime, timezone
 logger = logging.getLogger(__name__)
 
 
-def run_rebuild_process(job_id, rebuild_type, kwargs):
-    """Entry point for the rebuild subprocess.
-
-    Creates its own Flask app context and DB connections, completely
-    independent of any gunicorn worker.
-    """
-    import signal
-    import sys
-
-    # Ensure subprocess logging goes to stdout/stderr so container logs
-    # capture it.  multiprocessing.Process inherits the parent's FDs but
-    # the logging configuration may not propagate.
-    logging.basicConfig(
-        stream=sys.stderr,
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        force=True,
-    )
-
-    from src.main import app
-
-    # Handle SIGTERM gracefully so container restarts / worker recycling
-    # mark the job as failed instead of leaving it stuck in 'running'.
-    def _sigterm_handler(signum, frame):
-        logger.warning('Rebuild subprocess %s received SIGTERM, marking job failed', job_id)
-        try:
-            with app.app_context():
-                from src.utils.background_jobs import update_job as _update
-                _update(job_id, status='failed',
-                        error='Process terminated (SIGTERM — container restart or shutdown)',
-                        completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception:
-            pass
-        sys.exit(1)
-
-    signal.signal(signal.SIGTERM, _sigterm_handler)
-
-    with app.app_context():
-        from src.utils.background_jobs import update_job
-        from src.models.league import db
-
-        try:
-            if rebuild_type == 'seed_big6':
-                from src.services.big6_seeding_service import run_big6_seed
-                result = run_big6_seed(job_id, **kwargs)
-                update_job(job_id, status='completed', results=result,
-                           completed_at=datetime.now(timezone.utc).isoformat())
-            elif rebuild_type == 'full_rebuild':
-                _run_full_rebuild(job_id, kwargs)
-        except InterruptedError as e:
-            db.session.rollback()
-            update_job(job_id, status='cancelled', error=str(e),
-                       completed_at=datetime.now(timezone.utc).isoformat())
-        except Exception as e:
-            logger.exception('Rebuild job %s failed', job_id)
-            db.session.rollback()
-            update_job(job_id, status='failed', error=str(e),
-                       completed_at=datetime.now(timezone.utc).isoformat())
-
-
-def _run_full_rebuild(job_id, config):
+def run_full_rebuild(job_id, config):
     """Execute the full academy rebuild pipeline.
 
     Stages:
@@ -92,7 +31,7 @@ def _run_full_rebuild(job_id, config):
     from src.services.youth_competition_resolver import build_academy_league_seed_rows
     from src.utils.academy_classifier import classify_tracked_player, flatten_transfers, _get_latest_season
     from src.utils.background_jobs import update_job, is_job_cancelled
-    from src.api_football_client import APIFootballClient
+    from src.api_football_client import get_api_client
     from src.services.journey_sync import JourneySyncService, seed_club_locations
     from sqlalchemy import cast
     from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
@@ -161,7 +100,7 @@ def _run_full_rebuild(job_id, config):
         _check_cancelled()
         stage = 'seed_leagues'
         update_job(job_id, progress=1, total=total_stages, current_player='Stage 2: Seeding academy leagues...')
-        api_client_for_leagues = APIFootballClient()
+        api_client_for_leagues = get_api_client()
         youth_league_rows = build_academy_league_seed_rows(
             api_client=api_client_for_leagues,
             season=max(seasons),
@@ -246,7 +185,7 @@ def _run_full_rebuild(job_id, config):
         _check_cancelled()
         stage = 'tracked_players'
         update_job(job_id, progress=4, total=total_stages, current_player='Stage 4: Creating TrackedPlayer records...')
-        api_client = APIFootballClient()
+        api_client = get_api_client()
         journey_svc = JourneySyncService(api_client)
         current_season = max(seasons)
         total_created = 0
@@ -0,0 +1,24 @@
+"""Start context for the helper process pools (GOL sandbox, chart renders).
+
+Python runs a single forkserver per process, and its preload list is global:
+the last ``set_forkserver_preload`` call before the server starts wins. Every
+pool therefore takes its context from ``worker_context()``, which preloads the
+modules of all of them, so no pool's workers lose their warm imports to
+whichever pool happened to start first.
+"""
+
+import multiprocessing
+
+FORKSERVER_PRELOAD = [
+    'src.services.gol_sandbox',
+    'src.services.chart_renderer',
+]
+
+
+def worker_context():
+    """Forkserver context with the shared preload list, or spawn where unsupported."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+        return ctx
+    return multiprocessing.get_context('spawn')
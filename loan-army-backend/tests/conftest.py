@@ -52,6 +52,8 @@ if 'flask_limiter.util' not in sys.modules:
 os.environ.setdefault('SKIP_API_HANDSHAKE', '1')
 os.environ.setdefault('API_USE_STUB_DATA', 'true')
 os.environ.setdefault('TEST_ONLY_MANU', 'false')
+# Never spawn job worker processes from tests; they run jobs explicitly
+os.environ.setdefault('JOB_WORKER_MODE', 'external')
 
 # Map PostgreSQL JSONB to generic JSON so SQLite can handle it in tests
 from sqlalchemy.dialects.postgresql import JSONB
@@ -68,6 +70,15 @@ from src.extensions import limiter
 import src.models.weekly  # Ensure weekly models are registered for db.create_all()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_api_clients():
+    """API clients share caches process-wide; don't leak them between tests."""
+    from src.api_football_client import reset_api_clients
+    reset_api_clients()
+    yield
+    reset_api_clients()
+
+
 @pytest.fixture
 def app():
     root_dir = Path(__file__).resolve().parent.parent
@@ -0,0 +1,98 @@
+"""Tests for AcademySyncService batched fixture processing and high-water mark."""
+
+from src.api_football_client import APIFootballClient
+from src.models.league import db, AcademyLeague, AcademyAppearance
+from src.services.academy_sync_service import AcademySyncService
+
+
+def _fixture(fixture_id, ts, day):
+    return {
+        'fixture': {'id': fixture_id, 'timestamp': ts, 'date': f'2025-09-{day:02d}T12:00:00+00:00'},
+        'teams': {'home': {'name': 'Home U21'}, 'away': {'name': 'Away U21'}},
+        'league': {'name': 'Premier League 2'},
+    }
+
+
+class _FakeApi:
+    _bind_app_context = staticmethod(APIFootballClient._bind_app_context)
+
+    def __init__(self, fixtures_by_league, failing=()):
+        self.fixtures_by_league = fixtures_by_league
+        self.failing = set(failing)
+        self.detail_calls = []
+
+    def _make_request(self, endpoint, params):
+        return {'response': self.fixtures_by_league.get(params['league'], [])}
+
+    def get_fixture_lineups(self, fixture_id):
+        self.detail_calls.append(('lineups', fixture_id))
+        if fixture_id in self.failing:
+            raise RuntimeError('boom')
+        return {'response': [{
+            'startXI': [{'player': {'id': 10, 'name': 'Starter'}}],
+            'substitutes': [{'player': {'id': 11, 'name': 'Sub'}}],
+        }]}
+
+    def get_fixture_events(self, fixture_id):
+        self.detail_calls.append(('events', fixture_id))
+        return {'response': [{
+            'type': 'Goal', 'detail': 'Normal Goal',
+            'player': {'id': 10}, 'assist': {'id': 11},
+        }]}
+
+
+def _league(api_league_id, name):
+    league = AcademyLeague(api_league_id=api_league_id, name=name, level='U21', season=2025)
+    db.session.add(league)
+    db.session.commit()
+    return league
+
+
+def test_sync_league_bulk_upserts_and_skips_processed_fixtures(app):
+    league = _league(702, 'Premier League 2')
+    api = _FakeApi({702: [_fixture(2, 200, 2), _fixture(1, 100, 1)]})
+    service = AcademySyncService(api_client=api)
+
+    result = service.sync_league(league)
+    assert result['fixtures_processed'] == 2
+    assert result['appearances_created'] == 4
+    assert league.last_fixture_timestamp == 200
+    scorer = AcademyAppearance.query.filter_by(player_id=10, fixture_id=1).one()
+    assert scorer.goals == 1 and scorer.started
+
+    # Second run: nothing new behind the high-water mark
+    api.detail_calls.clear()
+    again = service.sync_league(league)
+    assert again['fixtures_skipped'] == 2
+    assert again['fixtures_processed'] == 0
+    assert api.detail_calls == []
+
+    # force reprocesses and updates in place
+    forced = service.sync_league(league, force=True)
+    assert forced['appearances_updated'] == 4
+    assert AcademyAppearance.query.count() == 4
+
+
+def test_failed_fixture_holds_back_high_water_mark(app):
+    league = _league(703, 'U18 Premier League')
+    api = _FakeApi(
+        {703: [_fixture(1, 100, 1), _fixture(2, 200, 2), _fixture(3, 300, 3)]},
+        failing={2},
+    )
+    result = AcademySyncService(api_client=api).sync_league(league)
+
+    assert result['fixtures_processed'] == 2
+    assert len(result['errors']) == 1
+    assert league.last_fixture_timestamp == 100
+
+
+def test_sync_all_active_leagues_runs_each_league(app):
+    _league(704, 'League A')
+    _league(705, 'League B')
+    api = _FakeApi({704: [_fixture(41, 100, 1)], 705: [_fixture(51, 100, 1)]})
+
+    results = AcademySyncService(api_client=api).sync_all_active_leagues()
+
+    assert [r['league_name'] for r in results] == ['League A', 'League B']
+    assert all(r['fixtures_processed'] == 1 for r in results)
+    assert {a.fixture_id for a in AcademyAppearance.query.all()} == {41, 51}
@@ -0,0 +1,183 @@
+"""Keyset pagination and server-side filters for /admin/loans and /admin/players."""
+
+import importlib
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from src.models.league import db, League, LoanedPlayer, Player, Team
+from src.routes.api import issue_user_token
+
+from tests.test_migration_fixture_player_stats import alembic_ops
+
+ADMIN_KEY = 'test-admin-key'
+
+
+@pytest.fixture(autouse=True)
+def _set_admin_key(monkeypatch):
+    monkeypatch.setenv('ADMIN_API_KEY', ADMIN_KEY)
+
+
+def _headers():
+    token = issue_user_token('admin@example.com', role='admin')['token']
+    return {'Authorization': f'Bearer {token}', 'X-API-Key': ADMIN_KEY}
+
+
+@pytest.fixture
+def loans(app):
+    league = League(league_id=39, name='Premier League', country='England', season=2025)
+    db.session.add(league)
+    db.session.flush()
+    parent = Team(team_id=33, name='Parent FC', country='England', season=2025, league_id=league.id)
+    other = Team(team_id=34, name='Other FC', country='England', season=2025)
+    loan_club = Team(team_id=90, name='Loan FC', country='England', season=2025)
+    db.session.add_all([parent, other, loan_club])
+    db.session.flush()
+    base = datetime(2025, 9, 1)
+    names = ['Zed', 'amy', 'Bob', 'Cara', 'dan', 'Eve', 'Finn']
+    for n, name in enumerate(names):
+        db.session.add(LoanedPlayer(
+            player_id=100 + n, player_name=name, primary_team_id=(other if n == 6 else parent).id,
+            primary_team_name='Parent FC', loan_team_id=loan_club.id, loan_team_name='Loan FC',
+            window_key='2025-26::FULL' if n < 5 else '2024-25::FULL', is_active=n != 4,
+            created_at=base + timedelta(days=n), updated_at=base + timedelta(days=n % 3),
+        ))
+    # A second loan for player 100 (grouped into one row by /admin/players)
+    db.session.add(LoanedPlayer(
+        player_id=100, player_name='Zed', primary_team_id=parent.id, primary_team_name='Parent FC',
+        loan_team_id=other.id, loan_team_name='Other FC', window_key='2024-25::FULL', is_active=False,
+        created_at=base, updated_at=base,
+    ))
+    db.session.add(Player(player_id=101, name='Amy Adams', sofascore_id=5551))
+    db.session.commit()
+    return {'parent': parent, 'other': other}
+
+
+def _walk(client, path, **params):
+    """Follow next_cursor until the listing is exhausted."""
+    items, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, **({'cursor': cursor} if cursor else {}))
+        res = client.get(path, query_string=query, headers=_headers())
+        assert res.status_code == 200, res.get_json()
+        body = res.get_json()
+        items.extend(body['items'])
+        pages += 1
+        cursor = body['next_cursor']
+        if not cursor:
+            return items, pages
+
+
+def test_loans_keyset_pages_cover_every_row_once(client, loans):
+    items, pages = _walk(client, '/api/admin/loans', active_only='false', limit=3)
+
+    assert pages == 3
+    keys = [(i['updated_at'], i['id']) for i in items]
+    assert len(set(keys)) == 8
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_loans_sort_filters_and_slim_rows(client, loans):
+    items, _ = _walk(client, '/api/admin/loans', sort='player_name', limit=2)
+    assert [i['player_name'] for i in items] == ['amy', 'Bob', 'Cara', 'Eve', 'Finn', 'Zed']
+    assert items[0]['primary_team_api_id'] == 33 and items[0]['loan_team_api_id'] == 90
+    assert (items[0]['primary_team_league_name'], items[0]['loan_team_league_name']) == ('Premier League', None)
+    assert 'reviewer_notes' not in items[0]
+
+    res = client.get('/api/admin/loans', headers=_headers(), query_string={
+        'primary_team_db_id': loans['parent'].id, 'loan_season': 2025, 'player_name': 'a', 'count': 'exact',
+    })
+    body = res.get_json()
+    assert sorted(i['player_name'] for i in body['items']) == ['Cara', 'amy']
+    assert (body['total'], body['total_is_estimate']) == (2, False)
+
+    full = client.get('/api/admin/loans', headers=_headers(), query_string={'player_id': 101, 'fields': 'full'})
+    assert full.get_json()['items'][0]['reviewer_notes'] is None
+
+
+def test_loans_reject_bad_paging_args(client, loans):
+    for query in ({'cursor': 'not-a-cursor'}, {'sort': 'goals'}, {'count': 'maybe'}):
+        assert client.get('/api/admin/loans', query_string=query, headers=_headers()).status_code == 400
+    body = client.get('/api/admin/loans', query_string={'count': 'none'}, headers=_headers()).get_json()
+    assert body['total'] is None
+
+
+def test_players_grouped_and_paged_in_sql(client, loans, monkeypatch):
+    from src.routes import api as api_routes
+
+    items, pages = _walk(client, '/api/admin/players', limit=3)
+
+    assert pages == 3
+    assert [i['player_name'] for i in items] == ['Amy Adams', 'Bob', 'Cara', 'dan', 'Eve', 'Finn', 'Zed']
+    zed = items[-1]
+    assert (zed['loan_count'], zed['loan_id'], zed['loan_season']) == (2, 1, '2025-26')
+
+    res = client.get('/api/admin/players', headers=_headers(),
+                     query_string={'has_sofascore': 'true', 'count': 'exact'})
+    body = res.get_json()
+    assert [i['player_id'] for i in body['items']] == [101]
+    assert body['items'][0]['has_sofascore_id'] is True
+    assert (body['total'], body['total_pages']) == (1, 1)
+
+    # The UI pages by cursor, so the default total is only an estimate
+    seen = []
+    count_rows = api_routes.count_rows
+    monkeypatch.setattr(api_routes, 'count_rows', lambda session, stmt, mode: seen.append(mode) or (7, True))
+    body = client.get('/api/admin/players', headers=_headers()).get_json()
+    assert seen == ['estimate'] and (body['total'], body['total_is_estimate']) == (7, True)
+    monkeypatch.setattr(api_routes, 'count_rows', count_rows)
+
+    # Page-number paging still works for existing callers
+    res = client.get('/api/admin/players', headers=_headers(),
+                     query_string={'page': 2, 'page_size': 3, 'team_id': loans['parent'].id, 'sort': 'player_id'})
+    body = res.get_json()
+    assert [i['player_id'] for i in body['items']] == [103, 104, 105]
+    assert body['total_pages'] == 2
+
+
+def test_migration_backfills_timestamps_and_adds_indexes(sqlite_memory_engine):
+    engine = sqlite_memory_engine
+    metadata = sa.MetaData()
+    loans_table = sa.Table('loaned_players', metadata,
+                           sa.Column('id', sa.Integer, primary_key=True),
+                           sa.Column('player_name', sa.String(100)),
+                           sa.Column('primary_team_id', sa.Integer),
+                           sa.Column('loan_team_id', sa.Integer),
+                           sa.Column('is_active', sa.Boolean),
+                           sa.Column('created_at', sa.DateTime),
+                           sa.Column('updated_at', sa.DateTime))
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(loans_table.insert(), [
+            {'id': 1, 'player_name': 'A', 'created_at': None, 'updated_at': datetime(2025, 1, 2)},
+            {'id': 2, 'player_name': 'B', 'created_at': datetime(2025, 1, 1), 'updated_at': None},
+        ])
+
+    migration = importlib.import_module('migrations.versions.ap01_add_admin_listing_indexes')
+    with alembic_ops(engine):
+        migration.upgrade()
+
+    with engine.connect() as conn:
+        rows = conn.execute(sa.select(loans_table.c.created_at, loans_table.c.updated_at)
+                            .order_by(loans_table.c.id)).fetchall()
+    assert [tuple(r) for r in rows] == [(datetime(2025, 1, 2),) * 2, (datetime(2025, 1, 1),) * 2]
+    assert _index_names(engine) == {name for name, _ in migration.INDEXES}
+
+    null_safe = importlib.import_module('migrations.versions.ap02_null_safe_loan_name_index')
+    with alembic_ops(engine):
+        null_safe.upgrade()
+    assert _index_names(engine) == {name for name, _ in migration.INDEXES} - {null_safe.OLD_INDEX[0]} | {
+        null_safe.NEW_INDEX[0]}
+    with alembic_ops(engine):
+        null_safe.downgrade()
+        migration.downgrade()
+    assert not _index_names(engine)
+
+
+def _index_names(engine):
+    # The SQLite inspector skips expression indexes such as lower(player_name)
+    with engine.connect() as conn:
+        return set(conn.execute(sa.text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'loaned_players'"
+        )).scalars())
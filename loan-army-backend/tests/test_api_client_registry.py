@@ -0,0 +1,103 @@
+"""Tests for the process-wide API-Football client state."""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from src import api_football_client
+from src.api_football_client import (
+    APIFootballClient,
+    get_api_client,
+    get_api_client_stats,
+)
+
+
+@pytest.fixture
+def live_client(monkeypatch):
+    """Direct mode with a counting, slow-ish fake handshake."""
+    monkeypatch.setenv('API_FOOTBALL_KEY', 'test-key')
+    monkeypatch.setenv('API_USE_STUB_DATA', 'false')
+    monkeypatch.setenv('API_FOOTBALL_MODE', 'direct')
+    monkeypatch.delenv('SKIP_API_HANDSHAKE', raising=False)
+    calls = []
+
+    def _handshake(self):
+        calls.append(threading.get_ident())
+        return True
+
+    monkeypatch.setattr(APIFootballClient, 'handshake', _handshake)
+    return calls
+
+
+def test_handshake_runs_once_per_ttl(live_client, monkeypatch):
+    threads = [threading.Thread(target=get_api_client) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    get_api_client()
+    assert len(live_client) == 1
+
+    # Once the TTL has lapsed the next client re-validates the key
+    monkeypatch.setattr(api_football_client, 'HANDSHAKE_TTL_SECONDS', 0)
+    get_api_client()
+    assert len(live_client) == 2
+
+    [stats] = get_api_client_stats()
+    assert (stats['mode'], stats['instances'], stats['handshakes']) == ('direct', 10, 2)
+
+
+def test_failed_handshake_is_retried(live_client, monkeypatch):
+    def _down(self):
+        live_client.append('down')
+        raise RuntimeError('rate limited')
+
+    monkeypatch.setattr(APIFootballClient, 'handshake', _down)
+    with pytest.raises(RuntimeError):
+        get_api_client()
+    with pytest.raises(RuntimeError):
+        get_api_client()
+    assert live_client == ['down', 'down']
+    [stats] = get_api_client_stats()
+    assert stats['handshake_failures'] == 2
+    assert stats['last_handshake_error'] == 'rate limited'
+
+
+def test_caches_are_shared_but_seasons_are_not(live_client):
+    first, second = get_api_client(), get_api_client()
+    first._team_name_cache[33] = 'Manchester United'
+    first.set_season_year(2022)
+
+    assert second._team_name_cache[33] == 'Manchester United'
+    assert second.current_season_start_year != 2022
+    assert first.get_cache_stats()['client']['caches']['team_names'] == 1
+
+    # Another key gets its own state
+    other = get_api_client('other-key')
+    assert other._team_name_cache == {}
+    assert len(get_api_client_stats()) == 2
+
+
+def test_per_player_caches_are_bounded(live_client, monkeypatch):
+    monkeypatch.setattr(api_football_client, 'CACHE_MAX_ENTRIES', 3)
+    client = get_api_client()
+    for player_id in range(5):
+        client._transfer_cache[player_id] = ([], None)
+    assert list(client._transfer_cache) == [2, 3, 4]
+
+
+def test_newsletter_agents_import_without_openai_key():
+    code = (
+        "import os\n"
+        "os.environ.pop('OPENAI_API_KEY', None)\n"
+        "import dotenv; dotenv.load_dotenv = lambda *a, **k: False\n"
+        "from src.agents import weekly_agent, weekly_newsletter_agent as agent\n"
+        "for proxy in (weekly_agent.aio_client, agent.client, agent.graph_service):\n"
+        "    assert 'uninitialized' in repr(proxy), proxy\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.returncode == 0, result.stderr
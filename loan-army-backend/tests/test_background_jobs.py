@@ -201,3 +201,161 @@ class TestGetJob:
             result = get_job(job_id)
             assert result['progress'] == 75
             assert result['total'] == 100
+
+
+class TestProgressCoalescing:
+    """Tests for throttled progress writes and the progress broker."""
+
+    @pytest.fixture
+    def writes(self, job_app, monkeypatch):
+        from src.utils import background_jobs
+
+        monkeypatch.setattr(background_jobs, 'PROGRESS_WRITES_PER_SEC', 1)
+        calls = []
+        original = background_jobs._write_job
+
+        def _spy(job_id, fields):
+            calls.append(dict(fields))
+            return original(job_id, fields)
+
+        monkeypatch.setattr(background_jobs, '_write_job', _spy)
+        return calls
+
+    def test_progress_ticks_are_coalesced(self, job_app, writes):
+        """Only the first tick is written; later ticks wait for the interval."""
+        from src.utils.background_jobs import create_background_job, update_job, get_job
+
+        job_id = create_background_job('test')
+        for i in range(1, 51):
+            update_job(job_id, progress=i, total=100, current_player=f'Player {i}')
+
+        assert len(writes) == 1
+        assert db.session.get(BackgroundJob, job_id).progress == 1
+        # Same-process readers still see the latest tick
+        assert get_job(job_id)['progress'] == 50
+        assert get_job(job_id)['current_player'] == 'Player 50'
+
+    def test_status_change_flushes_pending_progress(self, job_app, writes):
+        from src.utils.background_jobs import create_background_job, update_job
+
+        job_id = create_background_job('test')
+        update_job(job_id, progress=1, total=10)
+        update_job(job_id, progress=7)
+        update_job(job_id, status='completed')
+
+        assert writes[-1] == {'progress': 7, 'status': 'completed'}
+        job = db.session.get(BackgroundJob, job_id)
+        assert (job.progress, job.status) == (7, 'completed')
+
+    def test_overdue_progress_is_written_by_cancellation_check(self, job_app, writes, monkeypatch):
+        from src.utils import background_jobs
+        from src.utils.background_jobs import create_background_job, update_job, is_job_cancelled
+
+        job_id = create_background_job('test')
+        update_job(job_id, progress=1, total=10)
+        update_job(job_id, progress=2)
+        assert not is_job_cancelled(job_id)
+        assert len(writes) == 1
+
+        background_jobs._last_write[job_id] -= 5
+        assert not is_job_cancelled(job_id)
+        assert db.session.get(BackgroundJob, job_id).progress == 2
+
+    def test_subscription_receives_latest_snapshot_only(self, job_app):
+        from src.utils.background_jobs import broker, create_background_job, update_job
+
+        job_id = create_background_job('test')
+        subscription = broker.subscribe(job_id)
+        try:
+            for i in range(1, 6):
+                update_job(job_id, progress=i, total=10)
+            changes = subscription.wait(0)
+        finally:
+            broker.unsubscribe(subscription)
+
+        assert list(changes) == [job_id]
+        assert changes[job_id]['progress'] == 5
+        assert changes[job_id]['type'] == 'test'
+
+
+class TestJobStream:
+    """Tests for stream_job_events."""
+
+    def test_single_job_stream_ends_with_done(self, job_app):
+        from src.utils.background_jobs import create_background_job, update_job, stream_job_events
+
+        job_id = create_background_job('test')
+        events = stream_job_events(job_id, poll_seconds=0.01, max_seconds=5)
+
+        event, data = next(events)
+        assert (event, data['status']) == ('job', 'running')
+
+        update_job(job_id, progress=3, total=4)
+        event, data = next(events)
+        assert (event, data['progress']) == ('job', 3)
+
+        update_job(job_id, status='completed', results={'ok': True})
+        event, data = next(events)
+        assert event == 'done'
+        assert data['results'] == {'ok': True}
+        assert list(events) == []
+
+    def test_active_stream_drops_finished_jobs(self, job_app):
+        from src.utils.background_jobs import create_background_job, update_job, stream_job_events
+
+        first = create_background_job('one')
+        events = stream_job_events(poll_seconds=0.01, max_seconds=5)
+        event, jobs = next(events)
+        assert event == 'jobs' and [j['id'] for j in jobs] == [first]
+
+        second = create_background_job('two')
+        assert {j['id'] for j in next(events)[1]} == {first, second}
+
+        update_job(first, status='failed', error='boom')
+        assert [j['id'] for j in next(events)[1]] == [second]
+        events.close()
+
+    def test_unknown_job_yields_error(self, job_app):
+        from src.utils.background_jobs import stream_job_events
+
+        assert list(stream_job_events('missing', poll_seconds=0.01, max_seconds=1)) == [
+            ('error', {'error': 'Job not found'})
+        ]
+
+
+def test_job_stream_endpoint_sends_sse(client, monkeypatch):
+    from src.routes.api import issue_user_token
+    from src.utils.background_jobs import create_background_job, update_job
+
+    monkeypatch.setenv('ADMIN_API_KEY', 'test-admin-key')
+    headers = {
+        'Authorization': f"Bearer {issue_user_token('admin@example.com', role='admin')['token']}",
+        'X-API-Key': 'test-admin-key',
+    }
+    job_id = create_background_job('test')
+    update_job(job_id, status='completed', results={'count': 2})
+
+    res = client.get(f'/api/admin/jobs/{job_id}/stream', headers=headers)
+    assert res.status_code == 200
+    assert res.mimetype == 'text/event-stream'
+    body = res.get_data(as_text=True)
+    assert body.startswith('event: done\ndata: ')
+    assert '"count": 2' in body
+
+    assert client.get(f'/api/admin/jobs/{job_id}/stream').status_code in (401, 403)
+
+
+def test_oversized_notify_payload_falls_back_to_progress_only():
+    import json
+    from src.utils.background_jobs import NOTIFY_MAX_BYTES, _notify_payload
+
+    job = {'id': 'abc', 'status': 'failed', 'progress': 3, 'total': 9,
+           'results': {'rows': ['x'] * 5000}, 'error': 'é' * 5000}
+    payload = _notify_payload(job)
+    assert len(payload.encode()) <= NOTIFY_MAX_BYTES
+    assert json.loads(payload)['partial'] is True
+    assert json.loads(payload)['job'] == {'id': 'abc', 'status': 'failed', 'progress': 3, 'total': 9}
+
+    small = json.loads(_notify_payload({**job, 'error': 'boom'}))
+    assert 'partial' not in small
+    assert small['job']['error'] == 'boom' and 'results' not in small['job']
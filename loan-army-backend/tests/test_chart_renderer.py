@@ -0,0 +1,187 @@
+"""Tests for the newsletter chart cache and batch renderer."""
+
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.services import chart_renderer
+
+RADAR = {
+    'player': {'name': 'Player 1'},
+    'matches_count': 3,
+    'position_category': 'Forward',
+    'data': [
+        {'label': 'Goals', 'normalized': 80},
+        {'label': 'Assists', 'normalized': 40},
+        {'label': 'Rating', 'normalized': 65},
+    ],
+}
+LINE = {
+    'player': {'name': 'Player 1'},
+    'stat_keys': ['rating'],
+    'data': [{'date': '2025-01-04', 'rating': 7.1}, {'date': '2025-01-11', 'rating': 6.8}],
+}
+
+
+@pytest.fixture
+def charts_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(chart_renderer, 'CHARTS_DIR', str(tmp_path))
+    monkeypatch.setattr(chart_renderer, '_last_evict', 0.0)
+    return tmp_path
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+    original = chart_renderer.render_chart
+
+    def _spy(chart_type, data, width=500, height=300, fmt=None):
+        calls.append(chart_type)
+        return original(chart_type, data, width, height, fmt=fmt)
+
+    monkeypatch.setattr(chart_renderer, 'render_chart', _spy)
+    return calls
+
+
+def test_unchanged_chart_data_reuses_cached_file(charts_dir, renders):
+    path = chart_renderer.get_or_render_chart('radar', RADAR, 'abcdef012345', 400, 400)
+    again = chart_renderer.get_or_render_chart('radar', dict(RADAR), 'abcdef012345', 400, 400)
+
+    assert again == path and renders == ['radar']
+    with open(path, 'rb') as f:
+        assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+
+    changed = chart_renderer.get_or_render_chart(
+        'radar', {**RADAR, 'matches_count': 4}, 'abcdef012345', 400, 400)
+    assert changed != path and renders == ['radar', 'radar']
+
+
+def test_eviction_drops_least_recently_used_cache_files(app, charts_dir):
+    names = [f'{i:012x}_{i:016x}.png' for i in range(4)]
+    for age, name in enumerate(names):
+        path = charts_dir / name
+        path.write_bytes(b'x' * 10)
+        os.utime(path, (1000 + age, 1000 + age))
+    (charts_dir / '7_radar_1700000000.png').write_bytes(b'legacy')
+    os.utime(charts_dir / names[0])  # cache hit refreshes the oldest file
+
+    assert chart_renderer.evict_charts(max_files=2, max_bytes=0) == 2
+    assert sorted(p.name for p in charts_dir.iterdir()) == sorted(
+        [names[0], names[3], '7_radar_1700000000.png'])
+
+
+def test_eviction_keeps_charts_linked_from_newsletters(app, charts_dir):
+    from src.models.league import db, Newsletter, Team
+
+    names = [f'{i:012x}_{i:016x}.png' for i in range(3)]
+    for age, name in enumerate(names):
+        path = charts_dir / name
+        path.write_bytes(b'x' * 10)
+        os.utime(path, (1000 + age, 1000 + age))
+    team = Team(team_id=33, name='Parent FC', country='England', season=2025)
+    db.session.add(team)
+    db.session.flush()
+    db.session.add(Newsletter(
+        team_id=team.id, title='Week 1', content='<p>report</p>', public_slug='week-1',
+        structured_content='{"radar_chart_url": "/static/charts/%s"}' % names[0],
+    ))
+    db.session.commit()
+
+    assert chart_renderer.referenced_chart_names() == {names[0]}
+    assert chart_renderer.evict_charts(max_files=1, max_bytes=0) == 1
+    assert sorted(p.name for p in charts_dir.iterdir()) == [names[0], names[2]]
+
+
+def test_eviction_skipped_without_newsletters_to_check(charts_dir):
+    (charts_dir / f'{0:012x}_{0:016x}.png').write_bytes(b'x')
+    (charts_dir / f'{1:012x}_{1:016x}.png').write_bytes(b'x')
+
+    assert chart_renderer.evict_charts(max_files=1, max_bytes=0) == 0
+    assert len(list(charts_dir.iterdir())) == 2
+
+
+def test_eviction_is_cheap_under_the_limits_and_throttled(charts_dir, monkeypatch):
+    lookups = []
+    monkeypatch.setattr(chart_renderer, 'referenced_chart_names', lambda: lookups.append(1) or set())
+    for i in range(3):
+        (charts_dir / f'{i:012x}_{i:016x}.png').write_bytes(b'x')
+
+    # Under the limits the newsletters are never read
+    assert chart_renderer.evict_charts(max_files=3, max_bytes=0) == 0
+    assert lookups == []
+
+    monkeypatch.setattr(chart_renderer, 'CACHE_MAX_FILES', 1)
+    monkeypatch.setattr(chart_renderer, 'CACHE_MAX_MB', 0)
+    assert chart_renderer.maybe_evict_charts() == 2
+    (charts_dir / f'{7:012x}_{7:016x}.png').write_bytes(b'x')
+    assert chart_renderer.maybe_evict_charts() == 0  # ran moments ago
+    assert lookups == [1]
+    assert len(list(charts_dir.iterdir())) == 2
+
+
+def test_figures_are_reused_per_chart_type(charts_dir):
+    chart_renderer.render_chart('line', LINE)
+    first = chart_renderer._figure('line', 500, 300)
+    chart_renderer.render_chart('line', LINE)
+    assert chart_renderer._figure('line', 500, 300) is first
+    assert chart_renderer._figure('bar', 500, 300) is not first
+    assert not first.axes  # cleared on reuse
+
+
+def test_batch_renders_misses_in_worker_processes(charts_dir, monkeypatch):
+    monkeypatch.setattr(chart_renderer, 'RENDER_WORKERS', 2)
+    monkeypatch.setattr(chart_renderer, '_render_pool', None)
+    jobs = [
+        {'chart_type': 'radar', 'data': RADAR, 'chart_id': '000000000001', 'width': 400, 'height': 400},
+        {'chart_type': 'line', 'data': LINE, 'chart_id': '000000000002'},
+        {'chart_type': 'line', 'data': LINE, 'chart_id': '000000000002'},
+    ]
+    try:
+        paths = chart_renderer.render_charts_batch(jobs)
+    finally:
+        chart_renderer.reset_render_pool()
+
+    assert paths[1] == paths[2]
+    assert all(os.path.getsize(p) > 0 for p in paths)
+    assert not [p for p in charts_dir.iterdir() if p.suffix == '.tmp']
+
+    # Everything is cached now: no pool needed for the second pass
+    monkeypatch.setattr(chart_renderer, 'get_render_pool', lambda: pytest.fail('pool used'))
+    assert chart_renderer.render_charts_batch(jobs) == paths
+
+
+def test_svg_backend_renders_markup_without_matplotlib():
+    code = (
+        "import sys, xml.etree.ElementTree as ET\n"
+        "from src.services import chart_renderer\n"
+        "from tests.test_chart_renderer import RADAR, LINE\n"
+        "for kind, data in (('radar', RADAR), ('line', LINE), ('bar', LINE), ('stat_table', LINE)):\n"
+        "    ET.fromstring(chart_renderer.render_chart(kind, data, fmt='svg'))\n"
+        "assert 'matplotlib' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.returncode == 0, result.stderr
+
+
+def test_svg_format_selection_and_png_fallback(app, charts_dir, monkeypatch):
+    svg = chart_renderer.render_chart('stat_table', {**LINE, 'title': 'Tom & Jerry <3'}, fmt='svg')
+    root = ET.fromstring(svg)
+    assert root.tag == '{http://www.w3.org/2000/svg}svg'
+    assert 'Tom &amp; Jerry &lt;3' in svg.decode()
+
+    assert chart_renderer.render_chart_to_base64('line', LINE, fmt='svg').startswith('data:image/svg+xml;base64,')
+    # Match cards have no SVG renderer
+    assert chart_renderer.chart_format('match_card', 'svg') == 'png'
+
+    monkeypatch.setattr(chart_renderer, 'CHART_FORMAT', 'svg')
+    monkeypatch.setattr(chart_renderer, 'CACHE_MAX_FILES', 1)
+    monkeypatch.setattr(chart_renderer, 'EVICT_INTERVAL_SECONDS', 0)
+    first = chart_renderer.get_or_render_chart('line', LINE, '000000000003')
+    os.utime(first, (1000, 1000))
+    latest = chart_renderer.get_or_render_chart('radar', RADAR, '000000000004')
+    assert latest.endswith('.svg')
+    assert [p.name for p in charts_dir.iterdir()] == [os.path.basename(latest)]
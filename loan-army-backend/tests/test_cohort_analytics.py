@@ -0,0 +1,128 @@
+"""Tests for set-based cohort analytics (src/services/cohort_analytics.py)."""
+
+from datetime import datetime
+
+from src.models.league import db
+from src.models.cohort import AcademyCohort, CohortMember
+from src.models.journey import PlayerJourney, PlayerJourneyEntry
+from src.services.cohort_analytics import (
+    derive_member_statuses,
+    get_analytics_snapshot,
+    invalidate_analytics_snapshot,
+    refresh_cohort_aggregates,
+)
+
+
+def _cohort(team_api_id, team_name, season, status='complete'):
+    cohort = AcademyCohort(
+        team_api_id=team_api_id, team_name=team_name,
+        league_api_id=700, season=season, sync_status=status,
+    )
+    db.session.add(cohort)
+    db.session.flush()
+    return cohort
+
+
+def _member(cohort, player_api_id, club_api_id, club_name, level, loans=0):
+    journey = PlayerJourney(
+        player_api_id=player_api_id,
+        current_club_api_id=club_api_id,
+        current_club_name=club_name,
+        current_level=level,
+    )
+    db.session.add(journey)
+    db.session.flush()
+    season = datetime.now().year
+    db.session.add(PlayerJourneyEntry(
+        journey_id=journey.id, season=season, club_api_id=club_api_id,
+        club_name=club_name, entry_type='first_team',
+    ))
+    for i in range(loans):
+        db.session.add(PlayerJourneyEntry(
+            journey_id=journey.id, season=season - 1 - i, club_api_id=900 + i,
+            club_name=f'Loan Club {i}', entry_type='loan',
+        ))
+    member = CohortMember(
+        cohort_id=cohort.id, player_api_id=player_api_id,
+        journey_id=journey.id, journey_synced=True,
+    )
+    db.session.add(member)
+    db.session.flush()
+    return member
+
+
+def test_derive_statuses_and_aggregates_in_one_pass(app):
+    cohort = _cohort(33, 'Manchester United', 2020)
+    graduate = _member(cohort, 1, 33, 'Manchester United', 'First Team')
+    loanee = _member(cohort, 2, 90, 'West Brom', 'First Team', loans=2)
+    db.session.commit()
+
+    changed = derive_member_statuses()
+    assert changed == 2
+
+    db.session.refresh(graduate)
+    db.session.refresh(loanee)
+    assert graduate.current_status == 'first_team'
+    assert loanee.current_status == 'on_loan'
+    assert loanee.total_loan_spells == 2
+
+    # Second pass is a no-op
+    assert derive_member_statuses() == 0
+
+    assert refresh_cohort_aggregates([cohort.id]) == 1
+    db.session.refresh(cohort)
+    assert cohort.total_players == 2
+    assert cohort.players_first_team == 1
+    assert cohort.players_on_loan == 1
+
+
+def test_derive_statuses_reports_members_that_fail(app, monkeypatch):
+    from src.services import cohort_analytics
+
+    cohort = _cohort(33, 'Manchester United', 2020)
+    _member(cohort, 1, 33, 'Manchester United', 'First Team')
+    broken = _member(cohort, 2, 90, 'West Brom', 'First Team')
+    db.session.commit()
+
+    classify = cohort_analytics.classify_tracked_player
+
+    def flaky(**kwargs):
+        if kwargs['current_club_api_id'] == 90:
+            raise ValueError('bad journey')
+        return classify(**kwargs)
+
+    monkeypatch.setattr(cohort_analytics, 'classify_tracked_player', flaky)
+    errors = []
+    assert derive_member_statuses(errors=errors) == 1
+    assert errors == ['Player 2: bad journey']
+    db.session.refresh(broken)
+    assert broken.current_status == 'unknown'
+
+
+def test_analytics_snapshot_groups_by_team_and_is_cached(app, client):
+    invalidate_analytics_snapshot()
+    a = _cohort(33, 'Manchester United', 2019)
+    b = _cohort(33, 'Manchester United', 2020)
+    _cohort(40, 'Liverpool', 2020, status='failed')
+    for cohort, first_team in ((a, 1), (b, 3)):
+        cohort.total_players = 4
+        cohort.players_first_team = first_team
+    db.session.commit()
+
+    resp = client.get('/api/cohorts/analytics')
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body['as_of']
+    assert len(body['analytics']) == 1
+    row = body['analytics'][0]
+    assert row['team_api_id'] == 33
+    assert row['cohort_count'] == 2
+    assert row['seasons'] == [2019, 2020]
+    assert row['conversion_rate'] == 50.0
+
+    # Served from the cache until invalidated
+    a.players_first_team = 4
+    db.session.commit()
+    assert get_analytics_snapshot()['analytics'][0]['conversion_rate'] == 50.0
+    invalidate_analytics_snapshot()
+    assert get_analytics_snapshot()['analytics'][0]['conversion_rate'] == 87.5
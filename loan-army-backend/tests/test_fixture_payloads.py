@@ -0,0 +1,135 @@
+"""Raw fixture payloads live compressed in fixture_payloads, not the hot tables."""
+
+import importlib
+import json
+
+import pytest
+import sqlalchemy as sa
+
+from src.models.league import db
+from src.models.weekly import Fixture, FixturePayload, FixturePlayerStats
+from src.routes.api import issue_user_token
+from src.services.fixture_stats import load_fixture_payloads, store_fixture_payloads, upsert_fixture_player_stats
+
+from tests.test_migration_fixture_player_stats import alembic_ops
+
+ADMIN_KEY = 'test-admin-key'
+
+
+@pytest.fixture
+def fixtures(app):
+    rows = [Fixture(fixture_id_api=8000 + n, season=2025, home_team_api_id=1, away_team_api_id=2)
+            for n in range(2)]
+    db.session.add_all(rows)
+    db.session.commit()
+    return rows
+
+
+def test_stats_rows_keep_raw_payload_out_of_line(fixtures):
+    raw = {'player': {'id': 11}, 'statistics': [{'games': {'minutes': 90}}] * 50}
+    upsert_fixture_player_stats([
+        {'fixture_id': fixtures[0].id, 'player_api_id': 11, 'team_api_id': 1, 'raw_json': json.dumps(raw)},
+    ])
+    db.session.commit()
+
+    row = FixturePlayerStats.query.one()
+    assert 'raw_json' not in FixturePlayerStats.__table__.c
+    assert 'raw_json' not in row.to_dict()
+
+    stored = FixturePayload.query.one()
+    assert (stored.kind, stored.subject_api_id) == ('player', 11)
+    assert len(stored.payload) < len(json.dumps(raw))
+    assert json.loads(load_fixture_payloads('player', [fixtures[0].id])[(fixtures[0].id, 11)]) == raw
+
+
+def test_payloads_upsert_and_load_by_kind(fixtures):
+    f1, f2 = fixtures
+    store_fixture_payloads([(f1.id, 'fixture', 0, {'v': 1}), (f2.id, 'fixture', 0, {'v': 1}),
+                            (f1.id, 'team', 1, [{'type': 'Shots'}])])
+    store_fixture_payloads([(f1.id, 'fixture', 0, {'v': 2})])
+    db.session.commit()
+
+    assert FixturePayload.query.count() == 3
+    loaded = load_fixture_payloads('fixture', [f1.id, f2.id])
+    assert {key: json.loads(text)['v'] for key, text in loaded.items()} == {(f1.id, 0): 2, (f2.id, 0): 1}
+    assert load_fixture_payloads('team', [f1.id], [2]) == {}
+    with pytest.raises(ValueError):
+        store_fixture_payloads([(f1.id, 'lineups', 0, {})])
+
+
+def test_backfill_writes_fixture_payloads(client, fixtures, monkeypatch):
+    from src.api_football_client import APIFootballClient
+
+    monkeypatch.setenv('ADMIN_API_KEY', ADMIN_KEY)
+    store_fixture_payloads([(fixtures[1].id, 'fixture', 0, {'fixture': {'id': 8001}})])
+    db.session.commit()
+
+    api = APIFootballClient()
+    requested = []
+
+    def _make_request(endpoint, params):
+        requested.append(params['id'])
+        return {'response': [{'fixture': {'id': params['id']}, 'teams': {'home': {'name': 'Home FC'}}}]}
+
+    monkeypatch.setattr(api, '_make_request', _make_request)
+    monkeypatch.setattr('src.api_football_client.get_api_client', lambda: api)
+    token = issue_user_token('admin@example.com', role='admin')['token']
+    headers = {'Authorization': f'Bearer {token}', 'X-API-Key': ADMIN_KEY}
+
+    res = client.post('/api/admin/fixtures/backfill-raw-json', json={}, headers=headers)
+    assert res.status_code == 200, res.get_json()
+    assert res.get_json()['updated'] == 1
+    assert requested == [8000]
+    payload = load_fixture_payloads('fixture', [fixtures[0].id])[(fixtures[0].id, 0)]
+    assert json.loads(payload)['teams']['home']['name'] == 'Home FC'
+
+    res = client.post('/api/admin/fixtures/backfill-raw-json', json={}, headers=headers)
+    assert res.get_json()['updated'] == 0
+
+
+def test_migration_moves_payloads_and_restores_them(sqlite_memory_engine):
+    engine = sqlite_memory_engine
+    metadata = sa.MetaData()
+    fixtures = sa.Table('fixtures', metadata,
+                        sa.Column('id', sa.Integer, primary_key=True),
+                        sa.Column('raw_json', sa.Text))
+    stats = sa.Table('fixture_player_stats', metadata,
+                     sa.Column('id', sa.Integer, primary_key=True),
+                     sa.Column('fixture_id', sa.Integer, sa.ForeignKey('fixtures.id')),
+                     sa.Column('player_api_id', sa.Integer),
+                     sa.Column('raw_json', sa.Text))
+    team_stats = sa.Table('fixture_team_stats', metadata,
+                          sa.Column('id', sa.Integer, primary_key=True),
+                          sa.Column('fixture_id', sa.Integer, sa.ForeignKey('fixtures.id')),
+                          sa.Column('team_api_id', sa.Integer),
+                          sa.Column('stats_json', sa.Text))
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(fixtures.insert(), [{'id': 1, 'raw_json': '{"f": 1}'}, {'id': 2, 'raw_json': None}])
+        conn.execute(stats.insert(), [{'id': 1, 'fixture_id': 1, 'player_api_id': 11, 'raw_json': '{"p": 11}'}])
+        conn.execute(team_stats.insert(), [{'id': 1, 'fixture_id': 1, 'team_api_id': 5, 'stats_json': '[]'}])
+
+    migration = importlib.import_module('migrations.versions.cs01_move_fixture_payloads_to_cold_storage')
+    with alembic_ops(engine):
+        migration.upgrade()
+
+    inspector = sa.inspect(engine)
+    assert 'raw_json' not in {c['name'] for c in inspector.get_columns('fixtures')}
+    assert 'raw_json' not in {c['name'] for c in inspector.get_columns('fixture_player_stats')}
+    assert 'stats_json' not in {c['name'] for c in inspector.get_columns('fixture_team_stats')}
+    with engine.connect() as conn:
+        rows = conn.execute(sa.text(
+            'SELECT fixture_id, kind, subject_api_id, payload FROM fixture_payloads ORDER BY kind'
+        )).fetchall()
+    assert [(r[0], r[1], r[2], FixturePayload.unpack(r[3])) for r in rows] == [
+        (1, 'fixture', 0, '{"f": 1}'), (1, 'player', 11, '{"p": 11}'), (1, 'team', 5, '[]'),
+    ]
+
+    with alembic_ops(engine):
+        migration.downgrade()
+
+    with engine.connect() as conn:
+        assert conn.execute(sa.text('SELECT raw_json FROM fixtures ORDER BY id')).scalars().all() == ['{"f": 1}', None]
+        assert conn.execute(sa.text('SELECT raw_json FROM fixture_player_stats')).scalar() == '{"p": 11}'
+        assert conn.execute(sa.text('SELECT stats_json FROM fixture_team_stats')).scalar() == '[]'
+    assert not sa.inspect(engine).has_table('fixture_payloads')
@@ -0,0 +1,206 @@
+"""Bulk INSERT ... ON CONFLICT writes for fixture_player_stats."""
+
+import importlib
+from datetime import datetime, timezone
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import event
+
+from src.models.api_cache import PlayerPageCache
+from src.models.league import db
+from src.models.weekly import Fixture, FixturePlayerStats
+from src.services import fixture_stats
+from src.services.fixture_stats import upsert_fixture_player_stats
+
+from tests.test_migration_fixture_player_stats import alembic_ops
+
+
+@pytest.fixture
+def fixtures(app):
+    rows = [Fixture(fixture_id_api=7000 + n, season=2025, home_team_api_id=1, away_team_api_id=2)
+            for n in range(2)]
+    db.session.add_all(rows)
+    db.session.commit()
+    return rows
+
+
+@pytest.fixture
+def inserts(app):
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('INSERT INTO FIXTURE_PLAYER_STATS'):
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', _count)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', _count)
+
+
+def _rows(fixtures, goals=0):
+    return [
+        {'fixture_id': fx.id, 'player_api_id': pid, 'team_api_id': 1, 'minutes': 90, 'goals': goals}
+        for fx in fixtures for pid in (11, 12, 13)
+    ]
+
+
+@pytest.fixture(params=['on_conflict', 'executemany'])
+def dialect_path(request, monkeypatch):
+    if request.param == 'executemany':
+        monkeypatch.setattr(fixture_stats, '_DIALECT_INSERTS', {})
+    return request.param
+
+
+def test_upsert_inserts_then_updates_in_place(fixtures, dialect_path):
+    assert upsert_fixture_player_stats(_rows(fixtures)) == 6
+    db.session.commit()
+    first = {(r.fixture_id, r.player_api_id): r.id for r in FixturePlayerStats.query.all()}
+
+    assert upsert_fixture_player_stats(_rows(fixtures, goals=2)) == 6
+    db.session.commit()
+    db.session.expire_all()
+    rows = FixturePlayerStats.query.all()
+    assert {(r.fixture_id, r.player_api_id): r.id for r in rows} == first
+    assert {r.goals for r in rows} == {2}
+    # Columns the rows leave out get their defaults
+    assert {(r.assists, r.yellows, r.captain) for r in rows} == {(0, 0, False)}
+
+
+def test_one_statement_per_batch_and_last_duplicate_wins(fixtures, inserts):
+    rows = _rows(fixtures) + [{'fixture_id': fixtures[0].id, 'player_api_id': 11, 'team_api_id': 1, 'goals': 3}]
+
+    assert upsert_fixture_player_stats(rows, batch_size=4) == 6
+    db.session.commit()
+
+    # Five full rows in two batches; the shorter row has its own statement
+    assert len(inserts) == 3
+    row = FixturePlayerStats.query.filter_by(fixture_id=fixtures[0].id, player_api_id=11).one()
+    assert (row.goals, row.minutes) == (3, 0)
+
+
+def test_update_leaves_columns_the_row_omits(fixtures, dialect_path):
+    upsert_fixture_player_stats([{**row, 'assists': 1} for row in _rows(fixtures)])
+    upsert_fixture_player_stats([
+        {'fixture_id': fixtures[0].id, 'player_api_id': 11, 'team_api_id': 1, 'goals': 2},
+        {'fixture_id': fixtures[0].id, 'player_api_id': 12, 'team_api_id': 1, 'minutes': 45},
+    ])
+    db.session.commit()
+    db.session.expire_all()
+
+    rows = {r.player_api_id: r for r in FixturePlayerStats.query.filter_by(fixture_id=fixtures[0].id)}
+    assert (rows[11].goals, rows[11].minutes, rows[11].assists) == (2, 90, 1)
+    assert (rows[12].goals, rows[12].minutes, rows[12].assists) == (0, 45, 1)
+
+
+def test_upsert_invalidates_player_pages(fixtures):
+    now = datetime.now(timezone.utc)
+    db.session.add_all([
+        PlayerPageCache(player_id=pid, payload_json='{}', etag=str(pid), built_at=now, updated_at=now)
+        for pid in (11, 99)
+    ])
+    db.session.commit()
+
+    upsert_fixture_player_stats(_rows(fixtures[:1]))
+    db.session.commit()
+
+    stale = {row.player_id for row in PlayerPageCache.query.filter(PlayerPageCache.invalidated_at.isnot(None))}
+    assert stale == {11}
+
+
+def test_rows_need_their_conflict_key(app):
+    with pytest.raises(ValueError):
+        upsert_fixture_player_stats([{'player_api_id': 11, 'team_api_id': 1}])
+    with pytest.raises(ValueError):
+        upsert_fixture_player_stats([{'fixture_id': 1, 'player_api_id': 11, 'team_api_id': 1, 'xg': 0.4}])
+
+
+def test_migration_collapses_duplicates_and_adds_unique_key(sqlite_memory_engine):
+    engine = sqlite_memory_engine
+    metadata = sa.MetaData()
+    table = sa.Table(
+        'fixture_player_stats', metadata,
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('fixture_id', sa.Integer, nullable=False),
+        sa.Column('player_api_id', sa.Integer, nullable=False),
+        sa.Column('goals', sa.Integer),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {'id': 1, 'fixture_id': 1, 'player_api_id': 11, 'goals': 0},
+            {'id': 2, 'fixture_id': 1, 'player_api_id': 11, 'goals': 1},
+            {'id': 3, 'fixture_id': 1, 'player_api_id': 12, 'goals': 0},
+        ])
+
+    migration = importlib.import_module('migrations.versions.fs01_ensure_fixture_player_unique')
+    with alembic_ops(engine):
+        migration.upgrade()
+
+    with engine.connect() as conn:
+        assert conn.execute(sa.select(table.c.id).order_by(table.c.id)).scalars().all() == [2, 3]
+    constraints = sa.inspect(engine).get_unique_constraints('fixture_player_stats')
+    assert [sorted(c['column_names']) for c in constraints] == [['fixture_id', 'player_api_id']]
+
+    # Already constrained: nothing to do
+    with alembic_ops(engine):
+        migration.upgrade()
+
+
+def _team_sync_setup(monkeypatch):
+    from src.models.league import LoanedPlayer, Team
+    from src.api_football_client import APIFootballClient
+
+    parent = Team(team_id=101, name='Parent FC', country='England', season=2025)
+    loan_club = Team(team_id=202, name='Loan FC', country='England', season=2025)
+    db.session.add_all([parent, loan_club])
+    db.session.flush()
+    for pid in (1, 2):
+        db.session.add(LoanedPlayer(
+            player_id=pid, player_name=f'Player {pid}', primary_team_id=parent.id,
+            primary_team_name=parent.name, loan_team_id=loan_club.id, loan_team_name=loan_club.name,
+            window_key='2025-26::FULL', is_active=True,
+        ))
+    db.session.commit()
+
+    client = APIFootballClient()
+    played = {'statistics': [{'games': {'minutes': 90, 'rating': '7.1'}, 'goals': {'total': 1}}]}
+    monkeypatch.setattr(client, 'get_fixtures_for_team', lambda *args: [
+        {'fixture': {'id': 7100 + n, 'status': {'short': 'FT'}}, 'teams': {'home': {'id': 202}, 'away': {'id': 3}}}
+        for n in range(3)
+    ] + [{'fixture': {'id': 7199, 'status': {'short': 'NS'}}}])
+    monkeypatch.setattr(client, 'get_player_stats_for_fixture', lambda *args, **kwargs: played)
+    monkeypatch.setattr('src.api_football_client.get_api_client', lambda: client)
+    return parent
+
+
+def test_team_sync_writes_missing_stats_in_one_upsert(app, monkeypatch, inserts):
+    from src.routes import api as api_routes
+
+    parent = _team_sync_setup(monkeypatch)
+    result = api_routes._run_team_fixtures_sync(parent.id, {'season': 2025})
+
+    assert (result['total_synced'], result['total_skipped'], result['total_errors']) == (6, 2, 0)
+    assert len(inserts) == 1
+    rows = FixturePlayerStats.query.all()
+    assert len(rows) == 6 and {(r.goals, r.rating, r.team_api_id) for r in rows} == {(1, 7.1, 202)}
+
+    # Second run: every finished fixture already has stats
+    again = api_routes._run_team_fixtures_sync(parent.id, {'season': 2025})
+    assert (again['total_synced'], again['total_skipped']) == (0, 8)
+
+
+def test_team_sync_writes_collected_rows_when_the_loop_stops(app, monkeypatch):
+    from src.routes import api as api_routes
+
+    parent = _team_sync_setup(monkeypatch)
+
+    def _update_job(job_id, **fields):
+        if fields.get('progress') == 1:
+            raise RuntimeError('job row gone')
+
+    monkeypatch.setattr(api_routes, '_update_job', _update_job)
+    result = api_routes._run_team_fixtures_sync(parent.id, {'season': 2025}, job_id='job-1')
+
+    assert result == {'error': 'job row gone'}
+    assert {r.player_api_id for r in FixturePlayerStats.query.all()} == {1}
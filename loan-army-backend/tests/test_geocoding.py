@@ -0,0 +1,100 @@
+"""Tests for the gazetteer, persistent geocode cache and batch geocoding."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.api_cache import GeocodeCache
+from src.models.journey import ClubLocation
+from src.models.league import db, TeamProfile
+from src.utils import geocoding
+from src.utils.geocoding import gazetteer_lookup, geocode_batch
+
+
+@pytest.fixture
+def nominatim(monkeypatch):
+    """Fake Nominatim: knows 'Smalltown', fails for 'Flaky', else not found."""
+    calls = []
+
+    def _fake(city, country=None):
+        calls.append((city, country))
+        if city.strip().lower() == 'flaky':
+            raise ConnectionError('boom')
+        if city.strip().lower() == 'smalltown':
+            return (52.0, -1.0)
+        return None
+
+    monkeypatch.setattr(geocoding, '_nominatim_geocode', _fake)
+    return calls
+
+
+def test_gazetteer_handles_accents_countries_and_suffixes():
+    assert gazetteer_lookup('München') == gazetteer_lookup('munchen') == (48.1351, 11.5820)
+    assert gazetteer_lookup('Valencia', 'Spain') == (39.4699, -0.3763)
+    assert gazetteer_lookup('Valencia', 'Venezuela') == (10.1620, -68.0077)
+    assert gazetteer_lookup('San Jose', 'Costa-Rica') == (9.9281, -84.0907)
+    assert gazetteer_lookup('Newcastle upon Tyne, England') == (54.9783, -1.6178)
+    assert gazetteer_lookup('Perth') is None  # ambiguous without a country
+
+
+def test_batch_dedupes_and_persists_results(app, nominatim):
+    places = [('Smalltown', 'England'), ('  smalltown ', 'ENGLAND'), ('Nowhere', None),
+              ('Manchester', 'England'), ('Flaky', None)]
+
+    first = geocode_batch(places)
+    assert sorted(nominatim) == [('Flaky', None), ('Nowhere', None), ('Smalltown', 'England')]
+    assert first[('Smalltown', 'England')] == first[('  smalltown ', 'ENGLAND')] == (52.0, -1.0)
+    assert first[('Manchester', 'England')] == (53.4808, -2.2426)
+    assert first[('Nowhere', None)] is None
+
+    # Found and not-found answers are cached; transport errors are not
+    rows = {(r.city_key, r.country_key): r.coords for r in GeocodeCache.query.all()}
+    assert rows == {('smalltown', 'england'): (52.0, -1.0), ('nowhere', ''): None}
+
+    nominatim.clear()
+    again = geocode_batch(places)
+    assert nominatim == [('Flaky', None)]
+    assert again[('Smalltown', 'England')] == (52.0, -1.0)
+
+    # Negative results expire and are retried
+    row = GeocodeCache.query.filter_by(city_key='nowhere').one()
+    row.created_at = datetime.now(timezone.utc) - timedelta(seconds=geocoding.NEGATIVE_TTL_SECONDS + 1)
+    db.session.commit()
+    nominatim.clear()
+    geocode_batch([('Nowhere', None)])
+    assert nominatim == [('Nowhere', None)]
+
+
+def test_cache_writes_leave_the_callers_session_alone(app):
+    db.session.add(TeamProfile(team_id=9100, name='Pending FC', country='England'))
+
+    GeocodeCache.store_many({('smalltown', 'england'): (52.0, -1.0), ('nowhere', ''): None})
+    GeocodeCache.store_many({('nowhere', ''): (1.0, 2.0)})
+    assert db.session.new  # not committed or rolled back by the cache write
+    db.session.rollback()
+
+    assert TeamProfile.query.filter_by(team_id=9100).first() is None
+    rows = {(r.city_key, r.country_key): r.coords for r in GeocodeCache.query.all()}
+    assert rows == {('smalltown', 'england'): (52.0, -1.0), ('nowhere', ''): (1.0, 2.0)}
+
+
+def test_seed_geocodes_profile_cities_once(app, nominatim):
+    from src.services.journey_sync import seed_club_locations
+
+    for team_id, city in ((9001, 'Smalltown'), (9002, 'Smalltown'), (9003, 'Madrid'), (9004, None)):
+        db.session.add(TeamProfile(team_id=team_id, name=f'Club {team_id}', country='England',
+                                   venue_city=city))
+    db.session.commit()
+
+    added = seed_club_locations()
+    assert nominatim == [('Smalltown', 'England')]
+    locations = {loc.club_api_id: loc for loc in ClubLocation.query.all()}
+    assert added == len(locations)
+    assert (locations[9001].latitude, locations[9002].longitude) == (52.0, -1.0)
+    assert locations[9003].geocode_source == 'auto'
+    assert 9004 not in locations
+    assert locations[33].geocode_source == 'manual'
+
+    nominatim.clear()
+    assert seed_club_locations() == 0
+    assert nominatim == []
@@ -0,0 +1,231 @@
+"""Tests for the cross-process GOL DataFrame snapshot cache."""
+
+import pandas as pd
+import pytest
+
+from src.models.league import db, Team
+from src.models.tracked_player import TrackedPlayer
+from src.routes.api import issue_user_token
+from src.services import gol_dataframes
+from src.services.gol_dataframes import DataFrameCache
+
+ADMIN_KEY = 'test-admin-key'
+
+
+@pytest.fixture
+def seeded(app):
+    team = Team(team_id=33, name='Manchester United', country='England', season=2025)
+    db.session.add(team)
+    db.session.flush()
+    for pid, status in ((1, 'on_loan'), (2, 'first_team'), (3, 'academy')):
+        db.session.add(TrackedPlayer(
+            player_api_id=pid, player_name=f'Player {pid}', team_id=team.id,
+            status=status, age=19,
+        ))
+    db.session.commit()
+    return team
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """Record which frames each refresh actually re-queried."""
+    loaded = []
+    original = DataFrameCache._load_frames
+
+    def _spy(self, app, names):
+        loaded.append(sorted(names))
+        return original(self, app, names)
+
+    monkeypatch.setattr(DataFrameCache, '_load_frames', _spy)
+    return loaded
+
+
+def test_second_worker_maps_published_snapshot(app, seeded, tmp_path, queries):
+    first = DataFrameCache(snapshot_dir=str(tmp_path))
+    second = DataFrameCache(snapshot_dir=str(tmp_path))
+
+    frames = first.get_frames(app)
+    other = second.get_frames(app)
+
+    assert len(queries) == 1
+    assert second.version == first.version is not None
+    assert sorted(other['tracked']['player_api_id']) == [1, 2, 3]
+    assert other['loan_players']['player_name'].tolist() == ['Player 1']
+    assert frames['fixture_stats'].empty
+    ids = second._current_frames(app)['tracked']['player_api_id'].to_numpy()
+    assert not ids.flags.writeable
+    assert pd.get_option('mode.copy_on_write')
+
+
+def test_views_are_private_to_the_reader(app, seeded, tmp_path):
+    cache = DataFrameCache(snapshot_dir=str(tmp_path))
+
+    view = cache.get_frames(app)['tracked']
+    view.loc[0, 'player_api_id'] = 99
+    view['age'] = 0
+    view.drop(columns=['player_name'], inplace=True)
+
+    fresh = cache.get_frames(app)['tracked']
+    assert sorted(fresh['player_api_id']) == [1, 2, 3]
+    assert fresh['age'].tolist() == [19, 19, 19]
+    assert 'player_name' in fresh.columns
+
+
+def test_refresh_requeries_only_frames_with_changed_sources(app, seeded, tmp_path, queries):
+    cache = DataFrameCache(snapshot_dir=str(tmp_path))
+    cache.get_frames(app)
+    assert queries[-1] == sorted(gol_dataframes.FRAME_QUERIES)
+
+    # Nothing moved: frames without a change marker are re-read, but the stamp
+    # is renewed without a new version
+    version = cache.version
+    DataFrameCache.invalidate()
+    cache.get_frames(app)
+    unmarked = ['cohort_members', 'fixture_stats', 'fixtures', 'journey_entries']
+    assert len(queries) == 2 and queries[-1] == unmarked
+    assert cache.version == version
+    assert cache.status()['mode'] == 'unchanged'
+
+    tp = TrackedPlayer.query.filter_by(player_api_id=3).one()
+    tp.status = 'on_loan'
+    db.session.commit()
+    DataFrameCache.invalidate()
+    frames = cache.get_frames(app)
+
+    assert queries[-1] == sorted(['loan_players', 'tracked', *unmarked])
+    assert cache.version != version
+    assert sorted(frames['loan_players']['player_api_id']) == [1, 3]
+    status = cache.status()
+    assert status['mode'] == 'incremental'
+    assert status['frames']['tracked']['reloaded'] is True
+    assert status['frames']['journeys']['reloaded'] is False
+
+
+def test_in_place_edits_to_tables_without_updated_at_are_picked_up(app, seeded, tmp_path):
+    from src.models.weekly import Fixture
+
+    fixture = Fixture(fixture_id_api=500, season=2025, home_team_api_id=33, away_team_api_id=34,
+                      home_goals=0, away_goals=0)
+    db.session.add(fixture)
+    db.session.commit()
+    cache = DataFrameCache(snapshot_dir=str(tmp_path))
+    assert cache.get_frames(app)['fixtures']['home_goals'].tolist() == [0]
+    version = cache.version
+
+    fixture.home_goals = 2
+    db.session.commit()
+    DataFrameCache.invalidate()
+    frames = cache.get_frames(app)
+
+    assert frames['fixtures']['home_goals'].tolist() == [2]
+    assert cache.version != version
+    assert cache.status()['frames']['fixtures']['reloaded'] is True
+    assert cache.status()['frames']['fixture_stats']['reloaded'] is False
+
+
+def test_expired_frames_are_served_stale_while_refreshing(app, seeded, tmp_path, monkeypatch):
+    cache = DataFrameCache(snapshot_dir=str(tmp_path))
+    cache.get_frames(app)
+    started = []
+    monkeypatch.setattr(cache, '_start_background_refresh', lambda app: started.append(app))
+
+    stamp = cache._read_stamp()
+    cache._write_stamp({**stamp, 'loaded_at': stamp['loaded_at'] - gol_dataframes.TTL_SECONDS - 1})
+    cache._loaded_at -= gol_dataframes.TTL_SECONDS + 1
+
+    frames = cache.get_frames(app)
+    assert started == [app]
+    assert len(frames['tracked']) == 3
+
+
+def test_admin_cache_endpoints_report_frame_stats(app, client, seeded, tmp_path, monkeypatch):
+    from src.routes.gol import gol_bp
+    app.register_blueprint(gol_bp, url_prefix='/api')
+    monkeypatch.setenv('ADMIN_API_KEY', ADMIN_KEY)
+    monkeypatch.setattr(DataFrameCache, '_instance', DataFrameCache(snapshot_dir=str(tmp_path)))
+    headers = {
+        'Authorization': f"Bearer {issue_user_token('admin@example.com', role='admin')['token']}",
+        'X-API-Key': ADMIN_KEY,
+    }
+
+    resp = client.post('/api/admin/gol/cache/refresh', json={'full': True}, headers=headers)
+    assert resp.status_code == 200
+    body = client.get('/api/admin/gol/cache', headers=headers).get_json()
+    assert body['mode'] == 'full'
+    assert body['frames']['tracked']['rows'] == 3
+    assert 'seconds' in body['frames']['tracked']
+    assert body['watermarks']['tracked_players'][0] == '3'
+
+
+def test_frames_use_compact_schema_and_survive_snapshot(app, seeded, tmp_path):
+    db.session.add(TrackedPlayer(
+        player_api_id=4, player_name='Player 4', team_id=seeded.id, status='academy',
+    ))  # NULL age -> nullable ints
+    db.session.commit()
+    first = DataFrameCache(snapshot_dir=str(tmp_path))
+    first.get_frames(app)
+    tracked = DataFrameCache(snapshot_dir=str(tmp_path)).get_frames(app)['tracked']
+
+    assert isinstance(tracked['status'].dtype, pd.CategoricalDtype)
+    assert tracked['player_api_id'].dtype == 'int32'
+    assert str(tracked['age'].dtype) == 'Int32'
+    assert tracked['age'].isna().sum() == 1
+    assert tracked['is_active'].dtype == bool
+    assert not tracked['status'].array.codes.flags.writeable
+
+    frame_stats = first.status()['frames']['tracked']
+    assert frame_stats['memory_bytes'] > 0
+    assert frame_stats['raw_memory_bytes'] > 0
+
+
+def test_apply_schema_types_and_sandbox_helpers_on_compact_frames():
+    from src.services.gol_sandbox import _build_helpers, execute_analysis
+
+    tracked = gol_dataframes.apply_schema(pd.DataFrame({
+        'player_api_id': [1.0, 2.0, 3.0],
+        'team_id': [1, 1, 1],
+        'status': ['academy', 'on_loan', 'academy'],
+        'age': [18, None, 20],
+    }), gol_dataframes.FRAME_SCHEMAS['tracked'])
+    teams = gol_dataframes.apply_schema(
+        pd.DataFrame({'id': [1], 'name': ['Arsenal']}), gol_dataframes.FRAME_SCHEMAS['teams'],
+    )
+    frames = {'tracked': tracked, 'teams': teams}
+
+    breakdown = _build_helpers(frames)['player_status_breakdown']('Arsenal')
+    assert breakdown.to_dict('records') == [
+        {'status': 'academy', 'count': 2}, {'status': 'on_loan', 'count': 1},
+    ]
+    result = execute_analysis("result = tracked[['player_api_id', 'age']]", frames)
+    assert result['rows'] == [[1, 18], [2, None], [3, 20]]
+
+
+def test_views_are_built_once_per_version(app, seeded, tmp_path):
+    cache = DataFrameCache(snapshot_dir=str(tmp_path))
+    views = cache.get_views(app)
+    assert cache.get_views(app) is views
+    assert views.version == cache.version
+    assert len(views.tracked_teams) == 3
+
+    db.session.add(TrackedPlayer(player_api_id=9, player_name='New', team_id=seeded.id, status='academy'))
+    db.session.commit()
+    DataFrameCache.invalidate()
+    rebuilt = cache.get_views(app)
+    assert rebuilt is not views
+    assert len(rebuilt.tracked_teams) == 4
+
+
+def test_snapshot_dir_others_can_write_to_is_not_shared(app, seeded, tmp_path, queries):
+    shared = tmp_path / 'frames'
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+
+    first = DataFrameCache(snapshot_dir=str(shared))
+    second = DataFrameCache(snapshot_dir=str(shared))
+    assert sorted(first.get_frames(app)['tracked']['player_api_id']) == [1, 2, 3]
+    assert sorted(second.get_frames(app)['tracked']['player_api_id']) == [1, 2, 3]
+
+    # Neither process publishes to (or unpickles from) the open directory
+    assert len(queries) == 2
+    assert first.version is None and second.version is None
+    assert list(shared.iterdir()) == []
@@ -0,0 +1,94 @@
+"""Tests for GOL sandbox helpers running on precomputed FrameViews."""
+
+import pandas as pd
+
+from src.services.gol_dataframes import FrameViews, normalize_name
+from src.services.gol_sandbox import _build_helpers, execute_analysis
+
+
+def _frames():
+    return {
+        'tracked': pd.DataFrame({
+            'player_api_id': [1, 2, 3, 4],
+            'player_name': ['Martin Ødegaard', 'Bukayo Saka', 'Ethan Nwaneri', 'Mason Mount'],
+            'team_id': [1, 1, 1, 2],
+            'status': ['first_team', 'first_team', 'academy', 'first_team'],
+            'position': ['M', 'F', 'M', 'M'],
+            'nationality': ['NO', 'EN', 'EN', 'EN'],
+            'age': [26, 23, 18, 26],
+            'loan_club_name': [None, None, None, None],
+        }),
+        'teams': pd.DataFrame({'id': [1, 2], 'name': ['Arsenal', 'Chelsea']}),
+        'journeys': pd.DataFrame({
+            'player_api_id': [1, 2, 4],
+            'player_name': ['Martin Ødegaard', 'Bukayo Saka', 'Mason Mount'],
+            'total_first_team_apps': [150, 200, 120],
+        }),
+        'journey_entries': pd.DataFrame({
+            'player_api_id': [1, 2, 1, 4],
+            'season': [2021, 2022, 2020, 2022],
+            'club_name': ['Arsenal', 'Arsenal', 'Real Sociedad', 'Chelsea'],
+            'level': ['First Team'] * 4,
+            'appearances': [30, 38, 36, 20],
+            'goals': [5, 12, 7, 3],
+            'assists': [3, 10, 4, 2],
+            'minutes': [2500, 3200, 2900, 1400],
+        }),
+    }
+
+
+def test_views_precompute_join_and_name_index():
+    views = FrameViews(_frames(), version='v1')
+
+    assert len(views.tracked_teams) == 4
+    assert set(views.tracked_teams['name']) == {'Arsenal', 'Chelsea'}
+    assert normalize_name('  ÉTHAN ') == 'ethan'
+    assert views.find_player('mason mount') == 4
+    assert views.find_player('saka') == 2
+    assert views.find_player('nobody') is None
+
+    career = _build_helpers(views.source, views)['player_career']('Odegaard')
+    # 'Ø' has no decomposition, so match on the ASCII part of the name
+    assert career.empty
+    career = _build_helpers(views.source, views)['player_career']('martin')
+    assert career['season'].tolist() == [2020, 2021]
+    assert career['club_name'].tolist() == ['Real Sociedad', 'Arsenal']
+
+
+def test_helpers_are_memoized_per_views_instance(monkeypatch):
+    views = FrameViews(_frames(), version='v1')
+    helpers = _build_helpers(views.source, views)
+
+    first = helpers['academy_first_team_apps']()
+    assert first.to_dict('records') == [
+        {'team': 'Arsenal', 'total_graduates': 2, 'total_first_team_apps': 350},
+        {'team': 'Chelsea', 'total_graduates': 1, 'total_first_team_apps': 120},
+    ]
+
+    # A second call never touches the precomputed join again
+    monkeypatch.setattr(views, 'tracked_teams', None)
+    again = _build_helpers(views.source, views)['academy_first_team_apps']()
+    pd.testing.assert_frame_equal(first, again)
+
+    # Callers mutating a memoized result don't corrupt the cache
+    again['team'] = 'x'
+    assert helpers['academy_first_team_apps']()['team'].tolist() == ['Arsenal', 'Chelsea']
+
+
+def test_execute_analysis_uses_supplied_views():
+    views = FrameViews(_frames(), version='v1')
+    result = execute_analysis(
+        "result = first_team_graduates('arsenal')", views.frames(), views=views,
+    )
+    assert result['result_type'] == 'table'
+    assert [row[0] for row in result['rows']] == ['Bukayo Saka', 'Martin Ødegaard']
+
+
+def test_in_place_edits_in_sandbox_code_stay_private():
+    views = FrameViews(_frames(), version='v1')
+    result = execute_analysis(
+        "tracked.loc[0, 'age'] = 99\nresult = tracked[['age']]", views.frames(), views=views,
+    )
+    assert result['result_type'] == 'table'
+    assert views.source['tracked']['age'].tolist() == [26, 23, 18, 26]
+    assert pd.get_option('mode.copy_on_write')
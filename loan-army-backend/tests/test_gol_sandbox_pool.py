@@ -0,0 +1,77 @@
+"""Tests for the process-isolated GOL sandbox pool."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from src.services.gol_dataframes import DataFrameCache, FrameViews
+from src.services.gol_sandbox_pool import SandboxPool, run_analysis
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    frames = {
+        'tracked': pd.DataFrame({
+            'player_api_id': [1, 2, 3],
+            'status': pd.Categorical(['academy', 'on_loan', 'academy']),
+        }),
+    }
+    version = DataFrameCache(snapshot_dir=str(tmp_path))._publish(frames, {'loaded_at': time.time()})
+    assert version
+    return str(tmp_path), version
+
+
+@pytest.fixture
+def pool():
+    pool = SandboxPool(size=1, timeout=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_runs_analysis_against_mapped_snapshot(pool, snapshot):
+    snapshot_dir, version = snapshot
+    result = pool.execute(
+        "result = tracked.groupby('status', observed=True).size()", snapshot_dir, version,
+    )
+    assert result['result_type'] == 'table'
+    assert result['rows'] == [['academy', 2], ['on_loan', 1]]
+
+
+def test_runaway_code_is_killed_and_worker_respawned(pool, snapshot):
+    snapshot_dir, version = snapshot
+    before = pool.pids()
+
+    started = time.monotonic()
+    result = pool.execute("x = 0\nwhile True:\n    x += 1", snapshot_dir, version)
+    assert result['result_type'] == 'error'
+    assert 'timed out' in result['error']
+    assert time.monotonic() - started < 10
+
+    assert pool.pids() != before
+    again = pool.execute("result = len(tracked)", snapshot_dir, version)
+    assert again == {'result_type': 'scalar', 'value': 3, 'display': 'table'}
+
+
+def test_missing_snapshot_falls_back_to_in_process(pool, snapshot, monkeypatch):
+    snapshot_dir, _ = snapshot
+    monkeypatch.setattr('src.services.gol_sandbox_pool.get_sandbox_pool', lambda: pool)
+    views = FrameViews({'tracked': pd.DataFrame({'player_api_id': [7]})}, version='gone')
+
+    result = run_analysis("result = int(tracked['player_api_id'].sum())", views, snapshot_dir)
+    assert result['value'] == 7
+    assert '_snapshot_missing' not in result
+
+
+def test_pools_share_one_forkserver_preload_list():
+    import multiprocessing
+
+    from src.utils.worker_processes import worker_context
+
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        pytest.skip('forkserver unavailable')
+    from multiprocessing import forkserver
+
+    worker_context()
+    preload = forkserver._forkserver._preload_modules
+    assert {'src.services.gol_sandbox', 'src.services.chart_renderer'} <= set(preload)
@@ -0,0 +1,128 @@
+"""Tests for GolService tool execution, timing events and the answer cache."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import gol_service
+from src.services.gol_service import GolService
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+def _tool_call(index, call_id, name, arguments='{}'):
+    return SimpleNamespace(
+        index=index, id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+class _FakeCompletions:
+    """Replays one scripted list of chunks per create() call."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append([dict(m) for m in kwargs['messages']])
+        return iter(self.rounds.pop(0))
+
+
+class _FakeCache:
+    def __init__(self, version='v1'):
+        self.version = version
+
+    def current_version(self):
+        return self.version
+
+
+@pytest.fixture
+def service(app, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'x')
+    monkeypatch.setattr(gol_service, '_answer_cache', type(gol_service._answer_cache)())
+    svc = GolService()
+    svc.df_cache = _FakeCache()
+    return svc
+
+
+def _script(svc, rounds):
+    svc.client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions(rounds)))
+    return svc.client.chat.completions
+
+
+def _two_tool_round():
+    return [
+        _chunk(tool_calls=[_tool_call(0, 'a', 'run_analysis', '{"code": "result = 1"}')]),
+        _chunk(tool_calls=[_tool_call(1, 'b', 'run_analysis', '{"code": "result = 2"}')],
+               finish_reason='tool_calls'),
+    ]
+
+
+def _answer_round(text='Answer'):
+    return [_chunk(content=text[:3]), _chunk(content=text[3:], finish_reason='stop')]
+
+
+def test_tool_calls_in_a_round_run_concurrently(service, monkeypatch):
+    completions = _script(service, [_two_tool_round(), _answer_round()])
+    threads = set()
+
+    def _slow_tool(name, args):
+        threads.add(threading.get_ident())
+        time.sleep(0.3)
+        return {'result_type': 'scalar', 'value': args['code']}
+
+    monkeypatch.setattr(service, '_execute_tool', _slow_tool)
+
+    started = time.perf_counter()
+    events = list(service.chat('How many?', [{'role': 'user', 'content': 'hi'}], 's1'))
+    assert time.perf_counter() - started < 0.55
+    assert len(threads) == 2
+
+    kinds = [e['event'] for e in events]
+    assert kinds.count('tool_call') == 2 and kinds.count('data_card') == 2
+    timings = [e['data'] for e in events if e['event'] == 'timing']
+    assert [t['round'] for t in timings] == [0, 1]
+    assert [t['name'] for t in timings[0]['tools']] == ['run_analysis', 'run_analysis']
+    assert timings[0]['tool_ms'] >= 300
+
+    # Tool results are fed back in call order
+    tool_messages = [m for m in completions.calls[1] if m['role'] == 'tool']
+    assert [m['tool_call_id'] for m in tool_messages] == ['a', 'b']
+
+
+def test_first_turn_answers_are_cached_per_data_version(service, monkeypatch):
+    monkeypatch.setattr(service, '_execute_tool', lambda name, args: {'result_type': 'scalar', 'value': 1})
+    completions = _script(service, [_two_tool_round(), _answer_round('Hello there'),
+                                    _answer_round('Fresh data')])
+
+    first = list(service.chat('Who is top?', [], 's1'))
+    replay = list(service.chat('  who IS   top? ', [], 's2'))
+
+    assert len(completions.calls) == 2
+    assert ''.join(e['data']['content'] for e in replay if e['event'] == 'token') == 'Hello there'
+    assert [e for e in replay if e['event'] == 'data_card'] == [
+        e for e in first if e['event'] == 'data_card'
+    ]
+    assert replay[-1] == {'event': 'done', 'data': {'cached': True}}
+
+    service.df_cache.version = 'v2'
+    fresh = list(service.chat('Who is top?', [], 's3'))
+    assert len(completions.calls) == 3
+    assert fresh[-1] == {'event': 'done', 'data': {}}
+
+
+def test_web_search_answers_are_not_cached(service, monkeypatch):
+    monkeypatch.setattr(service, '_execute_tool', lambda name, args: {'results': []})
+    search_round = [_chunk(tool_calls=[_tool_call(0, 'a', 'search_web', '{"query": "x"}')],
+                           finish_reason='tool_calls')]
+    completions = _script(service, [search_round, _answer_round(), _answer_round()])
+
+    list(service.chat('Latest news?', [], 's1'))
+    list(service.chat('Latest news?', [], 's1'))
+    assert len(completions.calls) == 3
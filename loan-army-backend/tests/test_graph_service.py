@@ -0,0 +1,91 @@
+"""Tests for batched, fixture-keyed player graphs."""
+
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+
+from src.models.league import db
+from src.models.weekly import Fixture, FixturePlayerStats
+from src.services import graph_service
+from src.services.graph_service import GraphService
+
+
+def _add_match(fixture_api_id, day, stats):
+    fixture = Fixture(fixture_id_api=fixture_api_id, date_utc=datetime(2025, 1, day), season=2024)
+    db.session.add(fixture)
+    db.session.flush()
+    for player_id, minutes, rating in stats:
+        db.session.add(FixturePlayerStats(
+            fixture_id=fixture.id, player_api_id=player_id, team_api_id=1,
+            minutes=minutes, rating=rating,
+        ))
+    db.session.commit()
+    return fixture
+
+
+@pytest.fixture
+def seeded(app):
+    _add_match(100, 4, [(1, 90, 7.2), (2, 30, None)])
+    _add_match(101, 11, [(1, 75, 6.9)])
+
+
+@pytest.fixture
+def queries(app):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    sa.event.listen(db.engine, 'before_cursor_execute', _record)
+    yield statements
+    sa.event.remove(db.engine, 'before_cursor_execute', _record)
+
+
+@pytest.fixture
+def draws(monkeypatch):
+    calls = []
+    original = graph_service._render_graph
+
+    def _spy(kind, player_name, points, filepath, fmt):
+        calls.append((kind, [v for _, v in points]))
+        return original(kind, player_name, points, filepath, fmt)
+
+    monkeypatch.setattr(graph_service, '_render_graph', _spy)
+    return calls
+
+
+def test_batch_fetches_once_and_reuses_graphs_until_a_new_fixture(seeded, tmp_path, queries, draws):
+    service = GraphService(static_folder=str(tmp_path), fmt='svg')
+
+    graphs = service.generate_graphs_batch([(1, 'A. One'), (2, 'B. Two'), (3, 'No Stats')])
+    assert len(queries) == 2  # latest fixture ids + one stats query for every player
+    assert sorted(draws) == [('minutes', [30]), ('minutes', [90, 75]), ('rating', [7.2, 6.9])]
+    assert set(graphs) == {1, 2}
+    assert set(graphs[1]) == {'rating', 'minutes'}
+    assert set(graphs[2]) == {'minutes'}  # no rated appearances
+    assert graphs[1]['rating'].startswith('/static/graphs/rating_1_f')
+    assert (tmp_path / graphs[1]['rating'].rsplit('/', 1)[1]).read_text().startswith('<svg')
+
+    # Same data: served from disk after a single aggregate query
+    queries.clear()
+    draws.clear()
+    assert service.generate_player_graphs(1, 'A. One') == graphs[1]
+    assert len(queries) == 1 and draws == []
+
+    _add_match(102, 18, [(1, 90, 8.0)])
+    fresh = service.generate_player_graphs(1, 'A. One')
+    assert fresh['rating'] != graphs[1]['rating']
+    assert ('rating', [7.2, 6.9, 8.0]) in draws
+
+
+def test_png_graphs_render_without_pyplot(seeded, tmp_path, monkeypatch):
+    monkeypatch.setattr('src.services.chart_renderer.RENDER_WORKERS', 0)
+    service = GraphService(static_folder=str(tmp_path), fmt='png')
+
+    url = service.generate_player_rating_graph(1, 'A. One')
+    assert url.endswith('.png')
+    assert (tmp_path / url.rsplit('/', 1)[1]).read_bytes()[:4] == b'\x89PNG'
+    assert service.generate_player_minutes_graph(2, 'B. Two').endswith('.png')
+    assert service.generate_player_rating_graph(2, 'B. Two') is None
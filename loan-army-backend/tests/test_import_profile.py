@@ -0,0 +1,36 @@
+"""Tests for the start-up import profiler."""
+
+from src.utils.import_profile import check_budget, parse_importtime, profile_imports, summarize
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     openai.types
+import time:       300 |        420 |   openai
+import time:      1000 |       1000 |   src.models.league
+import time:       500 |       1920 | src.main
+some unrelated log line
+"""
+
+
+def test_parse_and_summarize_importtime_output():
+    entries = parse_importtime(SAMPLE)
+    assert [(e.module, e.depth) for e in entries] == [
+        ('openai.types', 2), ('openai', 1), ('src.models.league', 1), ('src.main', 0),
+    ]
+
+    summary = summarize(entries, top=1)
+    assert summary['total_ms'] == 1.9
+    assert summary['packages'] == [{'package': 'src', 'self_ms': 1.5}]
+    assert [row['module'] for row in summary['project_modules']] == ['src.main']
+    assert summary['deferred_loaded'] == ['openai']
+
+    assert check_budget(summary, max_ms=1) == [
+        'eagerly imported: openai',
+        'start-up imports took 1.9ms (budget 1ms)',
+    ]
+
+
+def test_web_routes_do_not_import_agents_or_llm_clients():
+    summary = summarize(profile_imports('src.routes.api', env={'API_USE_STUB_DATA': 'true'}))
+    assert summary['modules'] > 0
+    assert check_budget(summary) == []
@@ -0,0 +1,195 @@
+"""Tests for the database-backed job queue."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask import Flask
+
+from src.models.league import db, BackgroundJob
+from src.utils import job_queue
+from src.utils.job_queue import (
+    claim_next_job,
+    enqueue_job,
+    reap_stale_jobs,
+    register_job_handler,
+    run_claimed_job,
+)
+
+
+@pytest.fixture
+def queue_app(monkeypatch):
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    monkeypatch.setattr(job_queue, 'WORKER_MODE', 'external')
+    # Only the handlers registered by each test
+    monkeypatch.setattr(job_queue, '_handlers', {})
+    monkeypatch.setattr(job_queue, 'load_handlers', lambda: job_queue._handlers)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def calls(queue_app):
+    seen = []
+
+    @register_job_handler('echo', concurrency=2)
+    def echo(job_id, value=None):
+        seen.append(value)
+        return {'value': value}
+
+    @register_job_handler('flaky', max_attempts=2, backoff_seconds=30)
+    def flaky(job_id):
+        seen.append('flaky')
+        raise RuntimeError('boom')
+
+    @register_job_handler('stoppable')
+    def stoppable(job_id):
+        raise InterruptedError('stopped')
+
+    @register_job_handler('rebuild', group='heavy')
+    @register_job_handler('seed', group='heavy')
+    def heavy(job_id):
+        return None
+
+    return seen
+
+
+def _job(job_id):
+    db.session.expire_all()
+    return db.session.get(BackgroundJob, job_id)
+
+
+def test_enqueue_requires_a_registered_handler(queue_app):
+    with pytest.raises(ValueError):
+        enqueue_job('unknown')
+
+
+def test_claims_by_priority_then_age_and_runs_handler(calls):
+    low = enqueue_job('echo', {'value': 'low'}, priority=200)
+    high = enqueue_job('echo', {'value': 'high'}, priority=10)
+    assert _job(low).status == 'queued'
+
+    job = claim_next_job('w1')
+    assert job.id == high
+    assert (job.status, job.attempts, job.worker_id) == ('running', 1, 'w1')
+    assert job.heartbeat_at is not None
+
+    assert run_claimed_job(job) == 'completed'
+    assert calls == ['high']
+    done = _job(high)
+    assert done.status == 'completed' and done.completed_at is not None
+    assert done.to_dict()['results'] == {'value': 'high'}
+
+
+def test_concurrency_limits_are_shared_by_group(calls):
+    enqueue_job('rebuild')
+    enqueue_job('seed')
+    enqueue_job('echo')
+    enqueue_job('echo')
+    enqueue_job('echo')
+
+    claimed = [claim_next_job('w') for _ in range(5)]
+    types = sorted(job.job_type for job in claimed if job)
+    # One 'heavy' group slot, two 'echo' slots
+    assert len(types) == 3
+    assert types.count('echo') == 2
+    assert len({'rebuild', 'seed'} & set(types)) == 1
+
+
+def test_failures_retry_with_backoff_then_fail(calls):
+    job_id = enqueue_job('flaky')
+
+    assert run_claimed_job(claim_next_job('w')) == 'queued'
+    job = _job(job_id)
+    assert job.error == 'Attempt 1 failed: boom'
+    assert job.run_after.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc) + timedelta(seconds=20)
+    assert claim_next_job('w') is None  # still backing off
+
+    job.run_after = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db.session.commit()
+    assert run_claimed_job(claim_next_job('w')) == 'failed'
+    assert calls == ['flaky', 'flaky']
+    assert (_job(job_id).status, _job(job_id).error) == ('failed', 'boom')
+
+
+def test_interrupted_handler_and_cancelled_queue_entries(calls):
+    from src.utils.background_jobs import cancel_job
+
+    stopped = enqueue_job('stoppable')
+    assert run_claimed_job(claim_next_job('w')) == 'cancelled'
+    assert _job(stopped).error == 'stopped'
+
+    queued = enqueue_job('echo', {'value': 'never'})
+    assert cancel_job(queued)
+    assert claim_next_job('w') is None
+    assert calls == []
+
+
+def test_stale_heartbeats_are_requeued_until_attempts_run_out(calls):
+    job_id = enqueue_job('flaky')
+    job = claim_next_job('dead-worker')
+    job.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    db.session.commit()
+
+    assert reap_stale_jobs() == 1
+    job = _job(job_id)
+    assert job.status == 'queued' and 'dead-worker' in job.error
+
+    job = claim_next_job('w2')
+    job.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    db.session.commit()
+    assert reap_stale_jobs() == 1
+    assert _job(job_id).status == 'failed'
+
+
+def test_drain_worker_runs_queue_then_exits(calls, monkeypatch):
+    monkeypatch.setattr(job_queue, 'IDLE_EXIT_SECONDS', 0)
+    enqueue_job('echo', {'value': 1})
+    enqueue_job('echo', {'value': 2})
+
+    assert job_queue.run_worker(drain=True, worker_id='test') == 2
+    assert sorted(calls) == [1, 2]
+
+
+def test_drain_worker_waits_for_delayed_jobs(calls, monkeypatch):
+    monkeypatch.setattr(job_queue, 'IDLE_EXIT_SECONDS', 0)
+    monkeypatch.setattr(job_queue, 'POLL_SECONDS', 0)
+    enqueue_job('echo', {'value': 'later'}, delay_seconds=0.2)
+
+    assert job_queue.run_worker(drain=True, worker_id='test') == 1
+    assert calls == ['later']
+
+
+def test_dedupe_key_skips_active_and_recent_duplicates(calls):
+    first = enqueue_job('echo', {'value': 1}, dedupe_key='player:7', dedupe_seconds=3600)
+    assert enqueue_job('echo', {'value': 2}, dedupe_key='player:7', dedupe_seconds=3600) == first
+    assert enqueue_job('echo', {'value': 3}, dedupe_key='player:8') != first
+
+    # Finished within the window: still a duplicate; without a window: not
+    run_claimed_job(claim_next_job('w'))
+    assert _job(first).status == 'completed'
+    assert enqueue_job('echo', dedupe_key='player:7', dedupe_seconds=3600) == first
+    assert enqueue_job('echo', dedupe_key='player:7') != first
+
+
+def test_enqueue_leaves_the_callers_session_alone(calls):
+    pending = BackgroundJob(id='caller-row', job_type='echo', status='completed')
+    db.session.add(pending)
+
+    job_id = enqueue_job('echo', {'value': 1})
+    dupe = enqueue_job('echo', {'value': 2}, dedupe_key='player:9')
+    assert enqueue_job('echo', {'value': 3}, dedupe_key='player:9') == dupe
+    assert pending in db.session.new  # neither committed nor rolled back
+    db.session.rollback()
+
+    assert _job('caller-row') is None
+    assert _job(job_id).status == 'queued' and _job(job_id).started_at is not None
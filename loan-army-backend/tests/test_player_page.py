@@ -0,0 +1,140 @@
+"""Precomputed player page document and its invalidation."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.api_cache import PlayerPageCache
+from src.models.league import db, BackgroundJob, League, LoanedPlayer, PlayerLink, Team
+from src.models.weekly import Fixture, FixturePlayerStats
+from src.services import player_page
+
+
+@pytest.fixture
+def loanee(app):
+    league = League(league_id=39, name='Premier League', country='England', season=2025)
+    db.session.add(league)
+    db.session.flush()
+    parent = Team(team_id=33, name='Manchester United', country='England', season=2025, league_id=league.id)
+    loan_club = Team(team_id=50, name='Loan FC', country='England', season=2025, league_id=league.id)
+    db.session.add_all([parent, loan_club])
+    db.session.flush()
+    db.session.add(LoanedPlayer(
+        player_id=111, player_name='Test Player', primary_team_id=parent.id,
+        primary_team_name=parent.name, loan_team_id=loan_club.id, loan_team_name=loan_club.name,
+        window_key='2025-26::FULL', is_active=True, data_source='test',
+    ))
+    db.session.commit()
+    return 111
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+    original = player_page.build_player_page
+
+    def _counting(player_id):
+        calls.append(player_id)
+        return original(player_id)
+
+    monkeypatch.setattr(player_page, 'build_player_page', _counting)
+    return calls
+
+
+def _add_appearance(fixture_api_id):
+    fixture = Fixture(fixture_id_api=fixture_api_id, date_utc=datetime.now(timezone.utc).replace(tzinfo=None),
+                      season=2025, home_team_api_id=50, away_team_api_id=60)
+    db.session.add(fixture)
+    db.session.flush()
+    db.session.add(FixturePlayerStats(fixture_id=fixture.id, player_api_id=111, team_api_id=50, minutes=90))
+    db.session.commit()
+
+
+def test_page_combines_sections_and_revalidates(client, loanee, builds):
+    res = client.get(f'/api/players/{loanee}/page')
+    assert res.status_code == 200
+    page = res.get_json()
+    assert page['profile']['name'] == 'Test Player'
+    assert page['stats'] == [] and page['links'] == []
+    assert page['commentaries']['total_count'] == 0
+    assert {'season_stats', 'journey_map', 'stale', 'refreshing'} <= set(page)
+    # The endpoints serve the same section data
+    assert client.get(f'/api/players/{loanee}/commentaries').get_json() == page['commentaries']
+    assert client.get(f'/api/players/{loanee}/journey/map').status_code == 404 and page['journey_map'] is None
+    etag = res.headers['ETag']
+    assert res.headers['Last-Modified']
+
+    assert client.get(f'/api/players/{loanee}/page', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get(f'/api/players/{loanee}/page').get_json() == page
+    assert builds == [loanee]
+
+
+def test_source_row_writes_invalidate_the_page(client, loanee, builds):
+    first = client.get(f'/api/players/{loanee}/page')
+
+    _add_appearance(900)
+    assert PlayerPageCache.query.one().invalidated_at is not None
+    res = client.get(f'/api/players/{loanee}/page', headers={'If-None-Match': first.headers['ETag']})
+    assert res.status_code == 200
+    assert [row['minutes'] for row in res.get_json()['stats']] == [90]
+    assert len(builds) == 2
+
+    # Rows for other players leave it alone
+    db.session.add(PlayerLink(player_id=999, url='https://example.com', status='approved'))
+    db.session.commit()
+    client.get(f'/api/players/{loanee}/page')
+    assert len(builds) == 2
+
+
+def test_finished_refresh_and_moved_loans_invalidate_the_page(app, loanee):
+    player_page.get_player_page(loanee)
+    job = BackgroundJob.query.filter_by(job_type='player_refresh').one()
+    assert PlayerPageCache.query.one().is_fresh(3600)
+
+    # Retries keep the page's "refreshing" flag; a failure clears it
+    job.status = 'queued'
+    db.session.commit()
+    assert PlayerPageCache.query.one().invalidated_at is None
+    job.status = 'failed'
+    db.session.commit()
+    assert not PlayerPageCache.query.one().is_fresh(3600)
+
+    player_page.get_player_page(loanee)
+    LoanedPlayer.query.one().player_id = 222
+    db.session.commit()
+    assert not PlayerPageCache.query.one().is_fresh(3600)
+
+
+def test_rebuild_with_same_content_keeps_last_modified(app, loanee):
+    first = player_page.get_player_page(loanee)
+    etag, updated_at = first.etag, first.updated_at
+
+    second = player_page.get_player_page(loanee, rebuild=True)
+    assert (second.etag, second.updated_at) == (etag, updated_at)
+    assert second.built_at > updated_at
+
+
+def test_unknown_player_is_not_cached(client):
+    res = client.get('/api/players/424242/page')
+    assert res.status_code == 200 and res.get_json()['stats'] == []
+    assert PlayerPageCache.query.count() == 0
+
+
+def test_failing_section_is_nulled_and_retried(client, loanee, builds, monkeypatch):
+    from src.services import player_sections
+
+    def _broken(player_id):
+        raise RuntimeError('links backend down')
+
+    original = player_sections.player_links
+    monkeypatch.setattr(player_sections, 'player_links', _broken)
+    res = client.get(f'/api/players/{loanee}/page')
+    assert res.status_code == 200
+    page = res.get_json()
+    assert page['links'] is None and page['errors'] == ['links']
+    assert page['profile']['name'] == 'Test Player'
+
+    monkeypatch.setattr(player_sections, 'player_links', original)
+    page = client.get(f'/api/players/{loanee}/page').get_json()
+    assert page['links'] == [] and page['errors'] == []
+    assert len(builds) == 2
@@ -0,0 +1,101 @@
+"""Public player endpoints serve local data and queue background refreshes."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api_football_client import APIFootballClient
+from src.models.league import db, BackgroundJob, League, LoanedPlayer, Team
+from src.models.weekly import Fixture, FixturePlayerStats
+from src.routes import api as api_routes
+
+
+@pytest.fixture
+def loanee(app):
+    league = League(league_id=39, name='Premier League', country='England', season=2025)
+    db.session.add(league)
+    db.session.flush()
+    parent = Team(team_id=33, name='Manchester United', country='England', season=2025, league_id=league.id)
+    loan_club = Team(team_id=50, name='Loan FC', country='England', season=2025, league_id=league.id)
+    db.session.add_all([parent, loan_club])
+    db.session.flush()
+    db.session.add(LoanedPlayer(
+        player_id=111, player_name='Test Player', primary_team_id=parent.id,
+        primary_team_name=parent.name, loan_team_id=loan_club.id, loan_team_name=loan_club.name,
+        window_key='2025-26::FULL', is_active=True, data_source='test', can_fetch_stats=True,
+    ))
+    fixture = Fixture(fixture_id_api=900, date_utc=datetime.now(timezone.utc).replace(tzinfo=None), season=2025,
+                      home_team_api_id=50, away_team_api_id=60)
+    db.session.add(fixture)
+    db.session.flush()
+    db.session.add(FixturePlayerStats(fixture_id=fixture.id, player_api_id=111, team_api_id=50, minutes=90))
+    db.session.commit()
+    return 111
+
+
+@pytest.fixture
+def api_totals(monkeypatch):
+    """Cached totals per team (None = not cached); records any live lookups."""
+    cached = {}
+    live = []
+
+    def _totals(self, player_id, team_id, season, cached_only=False):
+        if not cached_only:
+            live.append((player_id, team_id))
+        return cached.get(team_id)
+
+    monkeypatch.setattr(APIFootballClient, '_fetch_player_team_season_totals_api', _totals)
+    return cached, live
+
+
+def _refresh_jobs():
+    return BackgroundJob.query.filter_by(job_type='player_refresh').all()
+
+
+def test_stats_serve_local_rows_and_queue_one_refresh(client, loanee, api_totals):
+    cached, live = api_totals
+
+    res = client.get(f'/api/players/{loanee}/stats')
+    assert res.status_code == 200
+    assert [row['minutes'] for row in res.get_json()] == [90]
+    assert (res.headers['X-Data-Stale'], res.headers['X-Data-Refreshing']) == ('1', '1')
+
+    client.get(f'/api/players/{loanee}/stats')
+    client.get(f'/api/players/{loanee}/season-stats')
+    profile = client.get(f'/api/players/{loanee}/profile').get_json()
+    assert (profile['stale'], profile['refreshing']) == (True, True)
+
+    [job] = _refresh_jobs()
+    assert job.status == 'queued' and job.dedupe_key == f'player_refresh:{loanee}'
+    assert live == []
+
+    # Cached totals that match local data are fresh
+    job.status, job.completed_at = 'completed', datetime.now(timezone.utc)
+    db.session.commit()
+    cached[50] = {'games_played': 1, 'minutes': 90, 'goals': 0, 'assists': 0}
+    res = client.get(f'/api/players/{loanee}/stats')
+    assert (res.headers['X-Data-Stale'], res.headers['X-Data-Refreshing']) == ('0', '0')
+    season = client.get(f'/api/players/{loanee}/season-stats').get_json()
+    assert (season['appearances'], season['stale'], season['refreshing']) == (1, False, False)
+    assert season['refreshed_at'] is not None
+    assert len(_refresh_jobs()) == 1
+
+
+def test_refresh_job_corrects_the_player_id_and_syncs(app, loanee, api_totals, monkeypatch):
+    cached, live = api_totals
+    cached[50] = {'games_played': 3}
+    synced = []
+    monkeypatch.setattr(APIFootballClient, 'verify_player_id_via_fixtures',
+                        lambda self, **kwargs: (222, 'fixtures'))
+    monkeypatch.setattr(api_routes, '_sync_player_club_fixtures',
+                        lambda player_id, team_id, season: synced.append((player_id, team_id)) or 2)
+    job = BackgroundJob(id='refresh-1', job_type='player_refresh', status='running')
+    db.session.add(job)
+    db.session.commit()
+
+    result = api_routes._run_player_refresh_job('refresh-1', loanee, 2025, [50], 'Test Player')
+
+    assert result == {'player_id': 222, 'corrected_from': loanee, 'synced': 2}
+    assert synced == [(222, 50)]
+    assert live == [(222, 50)]
+    assert LoanedPlayer.query.one().player_id == 222
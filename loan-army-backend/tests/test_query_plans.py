@@ -0,0 +1,163 @@
+"""Query-plan regression tests for the hot fixture / player stats queries.
+
+Each shape mirrors a query in the app and must be answered from one of the
+indexes added in migration fx01. SQLite always runs; PostgreSQL runs when
+TEST_POSTGRES_URL points at a scratch database (tables are created and
+dropped by the test).
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from src.models.weekly import Fixture, FixturePlayerStats
+
+TABLES = [Fixture.__table__, FixturePlayerStats.__table__]
+SEASONS = (2023, 2024, 2025)
+TEAMS = range(1, 41)
+PLAYERS = range(1000, 1600)
+
+# name -> (SQL, params, indexes any of which satisfies the plan)
+SHAPES = {
+    # /players/<id>/stats: a player's games at their loan clubs, by date
+    'player_stats_at_clubs': (
+        'SELECT s.id, f.date_utc FROM fixture_player_stats s '
+        'JOIN fixtures f ON s.fixture_id = f.id '
+        'WHERE s.player_api_id = :player AND s.team_api_id IN (:team, :team2) '
+        'ORDER BY f.date_utc',
+        {'player': 1010, 'team': 5, 'team2': 6},
+        {'ix_fixture_player_stats_player_fixture', 'ix_fixture_player_stats_team_player'},
+    ),
+    # /players/<id>/season-stats and _enrich_on_loan_stats: one player since a date
+    'player_since_date': (
+        'SELECT count(*), sum(s.minutes) FROM fixture_player_stats s '
+        'JOIN fixtures f ON s.fixture_id = f.id '
+        'WHERE s.player_api_id = :player AND f.date_utc >= :start',
+        {'player': 1010, 'start': '2025-08-01 00:00:00'},
+        {'ix_fixture_player_stats_player_fixture'},
+    ),
+    # LoanedPlayer._compute_stats: totals for a player at one club
+    'player_club_totals': (
+        'SELECT count(*), sum(goals), sum(assists) FROM fixture_player_stats '
+        'WHERE player_api_id = :player AND team_api_id = :team',
+        {'player': 1010, 'team': 5},
+        {'ix_fixture_player_stats_team_player'},
+    ),
+    # GraphService: latest appearance per player
+    'latest_fixture_per_player': (
+        'SELECT player_api_id, max(fixture_id) FROM fixture_player_stats '
+        'WHERE player_api_id IN (:p1, :p2, :p3) GROUP BY player_api_id',
+        {'p1': 1010, 'p2': 1020, 'p3': 1030},
+        {'ix_fixture_player_stats_player_fixture'},
+    ),
+    # API client / fixture sync: a club's fixtures in a season window
+    'club_fixtures_in_window': (
+        'SELECT id FROM fixtures WHERE season = :season '
+        'AND date_utc >= :start AND date_utc <= :end '
+        'AND (home_team_api_id = :team OR away_team_api_id = :team)',
+        {'season': 2025, 'start': '2025-09-01 00:00:00', 'end': '2025-09-30 00:00:00', 'team': 5},
+        {'ix_fixtures_home_team_season_date', 'ix_fixtures_away_team_season_date'},
+    ),
+    # Journalist weekly charts: all fixtures in a week
+    'fixtures_in_week': (
+        'SELECT id FROM fixtures WHERE date_utc >= :start AND date_utc <= :end ORDER BY date_utc',
+        {'start': '2025-09-01 00:00:00', 'end': '2025-09-07 23:59:59'},
+        {'ix_fixtures_date_utc'},
+    ),
+}
+
+
+def _seed(conn):
+    rng = random.Random(45)
+    fixtures = []
+    for season in SEASONS:
+        kickoff = datetime(season, 8, 1)
+        for round_no in range(38):
+            teams = list(TEAMS)
+            rng.shuffle(teams)
+            for home, away in zip(teams[::2], teams[1::2]):
+                fixtures.append({
+                    'id': len(fixtures) + 1,
+                    'fixture_id_api': 500000 + len(fixtures),
+                    'date_utc': kickoff + timedelta(days=7 * round_no, hours=rng.randint(0, 72)),
+                    'season': season,
+                    'home_team_api_id': home,
+                    'away_team_api_id': away,
+                })
+    conn.execute(Fixture.__table__.insert(), fixtures)
+
+    squads = {team: [p for p in PLAYERS if p % len(TEAMS) == team - 1] for team in TEAMS}
+    stats = []
+    for fixture in fixtures:
+        for team in (fixture['home_team_api_id'], fixture['away_team_api_id']):
+            for player in squads[team]:
+                stats.append({'fixture_id': fixture['id'], 'player_api_id': player,
+                              'team_api_id': team, 'minutes': 90, 'goals': 0, 'assists': 0})
+    conn.execute(FixturePlayerStats.__table__.insert(), stats)
+
+
+def _sqlite_indexes(conn, sql, params):
+    rows = conn.execute(sa.text('EXPLAIN QUERY PLAN ' + sql), params).fetchall()
+    used = set()
+    for row in rows:
+        # e.g. "SEARCH s USING COVERING INDEX ix_name (player_api_id=?)"
+        words = row[-1].split()
+        if 'INDEX' in words:
+            used.add(words[words.index('INDEX') + 1])
+    return used
+
+
+def _postgres_indexes(conn, sql, params):
+    plan = conn.execute(sa.text('EXPLAIN (FORMAT JSON) ' + sql), params).scalar()
+    used = set()
+    stack = [plan[0]['Plan']]
+    while stack:
+        node = stack.pop()
+        if 'Index Name' in node:
+            used.add(node['Index Name'])
+        stack.extend(node.get('Plans', []))
+    return used
+
+
+def _engines():
+    yield pytest.param('sqlite', id='sqlite')
+    yield pytest.param(
+        'postgresql', id='postgresql',
+        marks=pytest.mark.skipif(not os.getenv('TEST_POSTGRES_URL'), reason='TEST_POSTGRES_URL not set'),
+    )
+
+
+@pytest.fixture(scope='module', params=list(_engines()))
+def seeded(request):
+    if request.param == 'sqlite':
+        engine = sa.create_engine('sqlite://')
+        explain = _sqlite_indexes
+    else:
+        engine = sa.create_engine(os.environ['TEST_POSTGRES_URL'])
+        explain = _postgres_indexes
+    metadata = sa.MetaData()
+    tables = [table.to_metadata(metadata) for table in TABLES]
+    metadata.drop_all(engine, tables=tables)
+    metadata.create_all(engine, tables=tables)
+    with engine.begin() as conn:
+        _seed(conn)
+        conn.execute(sa.text('ANALYZE'))
+    yield engine, explain
+    metadata.drop_all(engine, tables=tables)
+    engine.dispose()
+
+
+@pytest.mark.parametrize('shape', sorted(SHAPES))
+def test_hot_query_uses_an_index(seeded, shape):
+    engine, explain = seeded
+    sql, params, expected = SHAPES[shape]
+    with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            # The seed is small; rule out sequential scans so the test checks
+            # that the shape can use the index at all.
+            conn.execute(sa.text('SET LOCAL enable_seqscan = off'))
+        used = explain(conn, sql, params)
+    assert used & expected, f'{shape} used {sorted(used) or "no index"}; expected one of {sorted(expected)}'
@@ -0,0 +1,142 @@
+"""Admin/status aggregates served from stats_snapshots and their invalidation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.api_cache import StatsSnapshot
+from src.models.league import db, BackgroundJob, LoanedPlayer, Team, UserSubscription
+from src.models.tracked_player import TrackedPlayer
+from src.routes.api import issue_user_token
+from src.services import stats_snapshot
+
+ADMIN_KEY = 'test-admin-key'
+
+
+@pytest.fixture(autouse=True)
+def _set_admin_key(monkeypatch):
+    monkeypatch.setenv('ADMIN_API_KEY', ADMIN_KEY)
+
+
+def _headers():
+    token = issue_user_token('admin@example.com', role='admin')['token']
+    return {'Authorization': f'Bearer {token}', 'X-API-Key': ADMIN_KEY}
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+    for key, (builder, max_age) in list(stats_snapshot.SNAPSHOTS.items()):
+        def _counting(session, key=key, builder=builder):
+            calls.append(key)
+            return builder(session)
+        monkeypatch.setitem(stats_snapshot.SNAPSHOTS, key, (_counting, max_age))
+    return calls
+
+
+@pytest.fixture
+def team(app):
+    row = Team(team_id=33, name='Parent FC', country='England', season=2025, is_tracked=True, logo='logo.png')
+    db.session.add(row)
+    db.session.commit()
+    return row
+
+
+def test_dashboard_served_from_snapshot_until_source_changes(client, team, builds):
+    db.session.add(TrackedPlayer(player_api_id=1, player_name='A', team_id=team.id, status='academy'))
+    db.session.commit()
+
+    first = client.get('/api/admin/dashboard-stats', headers=_headers()).get_json()
+    second = client.get('/api/admin/dashboard-stats', headers=_headers()).get_json()
+    assert builds == ['dashboard']
+    assert first == second
+    assert first['players'] == {'total': 1, 'academy': 1, 'on_loan': 0, 'first_team': 0, 'released': 0}
+    assert first['teams'] == {'tracked': 1}
+    assert datetime.fromisoformat(first['as_of']).tzinfo is not None
+
+    db.session.add(TrackedPlayer(player_api_id=2, player_name='B', team_id=team.id, status='on_loan'))
+    db.session.commit()
+    body = client.get('/api/admin/dashboard-stats', headers=_headers()).get_json()
+    assert builds == ['dashboard', 'dashboard']
+    assert body['players']['on_loan'] == 1
+
+    client.get('/api/admin/dashboard-stats', query_string={'refresh': '1'}, headers=_headers())
+    assert builds == ['dashboard'] * 3
+
+
+def test_unrelated_writes_and_rollbacks_leave_snapshot_fresh(client, team, builds):
+    client.get('/api/admin/dashboard-stats', headers=_headers())
+    db.session.add(LoanedPlayer(player_id=7, player_name='L', primary_team_id=team.id, primary_team_name='Parent FC',
+                                loan_team_name='Loan FC', window_key='2025-26::FULL'))
+    db.session.commit()
+    db.session.add(TrackedPlayer(player_api_id=3, player_name='C', team_id=team.id))
+    db.session.flush()
+    db.session.rollback()
+
+    client.get('/api/admin/dashboard-stats', headers=_headers())
+    assert builds == ['dashboard']
+    assert StatsSnapshot.query.filter_by(key='dashboard').one().invalidated_at is None
+
+
+def test_subscriber_stats_filter_the_snapshot(client, team, builds):
+    other = Team(team_id=34, name='Other Town', country='England', season=2025)
+    db.session.add(other)
+    db.session.flush()
+    db.session.add_all([
+        UserSubscription(team_id=team.id, email='a@example.com', active=True),
+        UserSubscription(team_id=team.id, email='b@example.com', active=False),
+        UserSubscription(team_id=other.id, email='a@example.com', active=True),
+    ])
+    db.session.commit()
+
+    body = client.get('/api/admin/subscriber-stats', headers=_headers()).get_json()
+    assert [(t['name'], t['subscriber_count'], t['active_subscriber_count']) for t in body['teams']] == [
+        ('Parent FC', 2, 1), ('Other Town', 1, 1),
+    ]
+    assert body['total_subscribers'] == 1 and body['as_of']
+
+    for query, names in (({'sort': 'asc'}, ['Other Town', 'Parent FC']),
+                         ({'search': 'town'}, ['Other Town']),
+                         ({'min_subscribers': 2}, ['Parent FC'])):
+        body = client.get('/api/admin/subscriber-stats', query_string=query, headers=_headers()).get_json()
+        assert [t['name'] for t in body['teams']] == names
+    assert builds == ['subscribers']
+
+
+def test_sync_status_follows_major_jobs(client, team, builds):
+    job = BackgroundJob(id='job-1', job_type='full_rebuild', status='running', progress=3, total=10)
+    db.session.add(job)
+    db.session.commit()
+
+    body = client.get('/api/sync-status').get_json()
+    assert body['syncing'] is True
+    assert (body['progress'], body['total']) == (3, 10)
+    assert body['teams'] == [{'name': 'Parent FC', 'logo': 'logo.png', 'team_id': 33}]
+
+    job.status = 'completed'
+    db.session.commit()
+    assert client.get('/api/sync-status').get_json()['syncing'] is False
+    assert builds == ['sync_status', 'sync_status']
+
+
+def test_sync_status_fails_stale_jobs_without_invalidating_itself(client, team, builds):
+    stale = datetime.now(timezone.utc) - timedelta(days=1)
+    db.session.add(BackgroundJob(id='job-2', job_type='seed_big6', status='running',
+                                 started_at=stale, created_at=stale, updated_at=stale))
+    db.session.commit()
+
+    assert client.get('/api/sync-status').get_json()['syncing'] is False
+    assert db.session.get(BackgroundJob, 'job-2').status == 'failed'
+    assert client.get('/api/sync-status').get_json()['syncing'] is False
+    assert builds == ['sync_status']
+
+
+def test_database_stats_count_tables(app, team):
+    db.session.add(LoanedPlayer(player_id=7, player_name='L', primary_team_id=team.id, primary_team_name='Parent FC',
+                                loan_team_name='Loan FC', window_key='2025-26::FULL', is_active=False))
+    db.session.commit()
+
+    stats = stats_snapshot.build_database_stats(db.session)
+    assert stats['estimated'] is False
+    assert stats['tables'] == {'leagues': 0, 'teams': 1, 'active_teams': 1, 'loans': 1, 'active_loans': 0,
+                               'newsletters': 0, 'subscriptions': 0}
@@ -0,0 +1,144 @@
+"""Tests for TrackedStatusRefreshService (prefetched refresh-statuses job)."""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.league import db, Team
+from src.models.journey import PlayerJourney, PlayerJourneyEntry
+from src.models.tracked_player import TrackedPlayer
+from src.services.tracked_status_refresh import (
+    RefreshCancelled,
+    TrackedStatusRefreshService,
+)
+from src.utils.academy_classifier import _get_latest_season, get_latest_seasons_bulk
+
+
+class _FakeApi:
+    """Records batch calls; returns canned squads and no transfers."""
+
+    def __init__(self, squads):
+        self.squads = squads
+        self.transfer_calls = []
+        self.squad_calls = []
+        self.single_transfer_calls = []
+
+    @staticmethod
+    def _bind_app_context(fn):
+        return fn
+
+    def batch_get_player_transfers(self, player_ids):
+        self.transfer_calls.append(list(player_ids))
+        return {pid: [] for pid in player_ids}
+
+    def get_player_transfers(self, player_id):
+        self.single_transfer_calls.append(player_id)
+        return []
+
+    def batch_get_team_players(self, team_ids):
+        self.squad_calls.append(list(team_ids))
+        return {tid: self.squads.get(tid, []) for tid in team_ids}
+
+
+def _squad(*player_ids):
+    return [{'player': {'id': pid}} for pid in player_ids]
+
+
+def _seed_player(team, player_api_id, current_club_id, current_club_name, season):
+    journey = PlayerJourney(
+        player_api_id=player_api_id,
+        player_name=f'Player {player_api_id}',
+        current_club_api_id=current_club_id,
+        current_club_name=current_club_name,
+        current_level='First Team',
+    )
+    db.session.add(journey)
+    db.session.flush()
+    db.session.add(PlayerJourneyEntry(
+        journey_id=journey.id, season=season,
+        club_api_id=current_club_id, club_name=current_club_name,
+    ))
+    tp = TrackedPlayer(
+        player_api_id=player_api_id,
+        player_name=f'Player {player_api_id}',
+        team_id=team.id,
+        status='academy',
+        journey_id=journey.id,
+    )
+    db.session.add(tp)
+    db.session.commit()
+    return tp
+
+
+@pytest.fixture
+def parent_team(app):
+    team = Team(team_id=33, name='Manchester United', country='England', season=2025)
+    db.session.add(team)
+    db.session.commit()
+    return team
+
+
+def test_refresh_prefetches_once_and_classifies(parent_team):
+    season = datetime.now().year
+    on_loan = _seed_player(parent_team, 101, 90, 'West Brom', season)
+    returned = _seed_player(parent_team, 102, 91, 'Sunderland', season)
+
+    api = _FakeApi({90: _squad(101), 91: _squad(), 33: _squad(102)})
+    service = TrackedStatusRefreshService(api_client=api, batch_size=1)
+    result = service.refresh()
+
+    assert result == {'total': 2, 'updated': 2}
+    assert len(api.transfer_calls) == 1
+    assert sorted(api.transfer_calls[0]) == [101, 102]
+    assert len(api.squad_calls) == 1
+    assert sorted(api.squad_calls[0]) == [33, 90, 91]
+
+    db.session.refresh(on_loan)
+    db.session.refresh(returned)
+    assert on_loan.status == 'on_loan'
+    assert on_loan.loan_club_api_id == 90
+    # Not in the loan club squad but in the parent's → back at parent
+    assert returned.status == 'first_team'
+    assert returned.loan_club_api_id is None
+
+
+def test_players_missing_from_the_prefetch_fetch_transfers_alone(parent_team):
+    season = datetime.now().year
+    _seed_player(parent_team, 301, 90, 'West Brom', season)
+    _seed_player(parent_team, 302, 90, 'West Brom', season)
+
+    api = _FakeApi({90: _squad(301, 302)})
+    api.batch_get_player_transfers = lambda player_ids: {301: []}
+    TrackedStatusRefreshService(api_client=api).refresh()
+
+    assert api.single_transfer_calls == [302]
+
+
+def test_refresh_reports_progress_and_honours_cancel(parent_team):
+    season = datetime.now().year
+    for pid in (201, 202, 203):
+        _seed_player(parent_team, pid, 90, 'West Brom', season)
+
+    api = _FakeApi({90: _squad(201, 202, 203)})
+    ticks = []
+    service = TrackedStatusRefreshService(api_client=api, batch_size=2)
+    with pytest.raises(RefreshCancelled):
+        service.refresh(progress_fn=lambda **kw: ticks.append(kw), cancel_fn=lambda: True)
+
+    assert ticks[0]['total'] == 3
+    assert any(t.get('progress') == 2 for t in ticks)
+    # First batch was committed before the cancel was noticed
+    assert TrackedPlayer.query.filter_by(status='on_loan').count() == 2
+
+
+def test_latest_seasons_bulk_matches_single_lookup(parent_team):
+    tp = _seed_player(parent_team, 301, 90, 'West Brom', 2024)
+    db.session.add(PlayerJourneyEntry(
+        journey_id=tp.journey_id, season=2022, club_api_id=33, club_name='Manchester United',
+    ))
+    db.session.commit()
+
+    bulk = get_latest_seasons_bulk({tp.journey_id: (33, 'Manchester United')})
+    single = _get_latest_season(tp.journey_id, parent_api_id=33, parent_club_name='Manchester United')
+    assert bulk[tp.journey_id] == single == 2022
+    assert get_latest_seasons_bulk({tp.journey_id: (999, None)})[tp.journey_id] == 2024
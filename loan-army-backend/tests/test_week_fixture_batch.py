@@ -0,0 +1,133 @@
+"""Fixture-centric weekly summaries share fetches and DB rows across loanees."""
+
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from src.api_football_client import APIFootballClient
+from src.models.league import db, LoanedPlayer, Team
+from src.models.weekly import Fixture, FixturePayload, FixturePlayerStats
+
+WEEK_START, WEEK_END = date(2025, 9, 15), date(2025, 9, 21)
+
+
+def _fixture(fixture_id, day):
+    return {
+        'fixture': {'id': fixture_id, 'date': f'2025-09-{day}T19:00:00+00:00', 'status': {'short': 'FT'}},
+        'league': {'name': 'League One', 'season': 2025},
+        'teams': {'home': {'id': 202, 'name': 'Loan FC'}, 'away': {'id': 303, 'name': 'Rivals'}},
+        'goals': {'home': 2, 'away': 1},
+    }
+
+
+def _line(player_id, minutes, goals):
+    return {
+        'player': {'id': player_id},
+        'statistics': [{'games': {'minutes': minutes, 'position': 'M', 'rating': '7.0'},
+                        'goals': {'total': goals, 'assists': 0}, 'cards': {}}],
+    }
+
+
+@pytest.fixture
+def parent(app):
+    parent = Team(team_id=101, name='Parent FC', country='England', season=2025)
+    loan_club = Team(team_id=202, name='Loan FC', country='England', season=2025)
+    db.session.add_all([parent, loan_club])
+    db.session.flush()
+    for player_id, name in ((1, 'Alex One'), (2, 'Billy Two')):
+        db.session.add(LoanedPlayer(
+            player_id=player_id, player_name=name, primary_team_id=parent.id,
+            primary_team_name=parent.name, loan_team_id=loan_club.id, loan_team_name=loan_club.name,
+            window_key='2025-26::FULL', is_active=True,
+        ))
+    db.session.commit()
+    return parent
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = APIFootballClient()
+    calls = Counter()
+    fixtures = [_fixture(9001, 16), _fixture(9002, 20)]
+    payloads = {
+        9001: [{'team': {'id': 202}, 'players': [_line(1, 90, 1), _line(2, 30, 0)]}],
+        9002: [{'team': {'id': 202}, 'players': [_line(1, 90, 0), _line(2, 90, 2)]}],
+    }
+
+    def _fixtures_for_team(team_id, season, start, end):
+        calls['fixtures', start] += 1
+        return fixtures if start == WEEK_START.isoformat() else []
+
+    def _fixture_players(fixture_id, team_id=None):
+        calls['players', fixture_id] += 1
+        return payloads[fixture_id]
+
+    monkeypatch.setattr(client, 'get_fixtures_for_team', _fixtures_for_team)
+    monkeypatch.setattr(client, 'get_fixture_players', _fixture_players)
+    monkeypatch.setattr(client, 'get_team_name', lambda *args, **kwargs: 'Loan FC')
+    monkeypatch.setattr(client, 'verify_player_id_via_fixtures', lambda **kwargs: (kwargs['candidate_player_id'], None))
+    monkeypatch.setattr(client, 'get_player_season_context', lambda **kwargs: {
+        'season_stats': {'games_played': 0, 'goals': 0, 'assists': 0}, 'recent_form': [], 'trends': {},
+    })
+    client.calls = calls
+    return client
+
+
+def _summarize(client, parent):
+    return client.summarize_parent_loans_week(
+        parent_team_db_id=parent.id, parent_team_api_id=parent.team_id, season=2025,
+        week_start=WEEK_START, week_end=WEEK_END, db_session=db.session,
+    )
+
+
+def test_teammates_share_fixture_payloads_and_rows(client, parent):
+    summary = _summarize(client, parent)
+
+    totals = {s['player_api_id']: s['totals'] for s in summary['loanees']}
+    assert (totals[1]['games_played'], totals[1]['goals'], totals[1]['minutes']) == (2, 1, 180)
+    assert (totals[2]['games_played'], totals[2]['goals'], totals[2]['minutes']) == (2, 2, 120)
+
+    # One fetch per fixture and per club/range, not per loanee
+    assert client.calls['players', 9001] == client.calls['players', 9002] == 1
+    assert client.calls['fixtures', WEEK_START.isoformat()] == 1
+
+    assert Fixture.query.count() == 2
+    assert FixturePlayerStats.query.count() == 4
+    kinds = Counter(kind for (kind,) in db.session.query(FixturePayload.kind))
+    assert kinds == {'fixture': 2, 'player': 4}
+
+
+def test_rerun_updates_rows_in_place(client, parent):
+    _summarize(client, parent)
+    db.session.commit()
+    first_ids = {r.id for r in FixturePlayerStats.query.all()}
+
+    summary = _summarize(client, parent)
+    db.session.commit()
+
+    assert {r.id for r in FixturePlayerStats.query.all()} == first_ids
+    assert all(s['totals']['games_played'] == 2 for s in summary['loanees'])
+
+
+def test_failed_flush_rolls_back_for_the_next_loanee(client, parent, monkeypatch):
+    from src.services import fixture_stats
+
+    original = fixture_stats.upsert_fixture_player_stats
+    attempts = []
+
+    def _flaky(rows, session=None, **kwargs):
+        attempts.append(len(rows))
+        if len(attempts) == 1:
+            session.add(FixturePlayerStats(fixture_id=None, player_api_id=1))
+            session.flush()  # fails and leaves the session needing a rollback
+        return original(rows, session=session, **kwargs)
+
+    monkeypatch.setattr(fixture_stats, 'upsert_fixture_player_stats', _flaky)
+    summary = _summarize(client, parent)
+    db.session.commit()
+
+    assert len(summary['loanees']) == 2 and len(attempts) == 2
+    # The second loanee's rows were written after the first flush rolled back
+    assert FixturePlayerStats.query.count() == 2
+    assert Fixture.query.count() == 2
@@ -211,6 +211,31 @@ const filterLatestSeasonTeams = (rows = []) => {
   return { season: latestSeason, teams }
 }
 
+// Loans fetched per keyset page in the admin loans table
+const ADMIN_LOANS_PAGE_SIZE = 100
+
+// /admin/loans query params for the admin loan filters
+const adminLoanListParams = (filters = {}) => {
+  const params = {
+    sort: filters.sortBy || 'created_at',
+    order: filters.sortOrder || 'desc',
+    active_only: filters.showActive === false ? 'false' : 'true',
+    limit: ADMIN_LOANS_PAGE_SIZE,
+  }
+  const playerName = (filters.player_name || '').trim()
+  if (playerName) params.player_name = playerName
+  const seasonYear = parseInt((filters.season || '').trim(), 10)
+  if (seasonYear) params.loan_season = seasonYear
+  return params
+}
+
+// "~1,200" for planner estimates, "1,200" for exact counts
+const formatListTotal = (total, isEstimate) => {
+  if (total == null) return null
+  const n = Number(total).toLocaleString()
+  return isEstimate ? `~${n}` : n
+}
+
 // Historical Newsletters page component
 function HistoricalNewslettersPage() {
   const [teams, setTeams] = useState([])
@@ -909,6 +934,9 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
   const [flags, setFlags] = useState([])
   const [flagEditors, setFlagEditors] = useState({})
   const [loans, setLoans] = useState([])
+  const [loansNextCursor, setLoansNextCursor] = useState(null)
+  const [loansTotal, setLoansTotal] = useState({ total: null, total_is_estimate: false })
+  const [loansLoading, setLoansLoading] = useState(false)
   const [loanForm, setLoanForm] = useState({
     player_id: '',
     player_name: '',
@@ -916,8 +944,10 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
     loan_team_api_id: '',
     season: '',
   })
-  const [loanFilters, setLoanFilters] = useState({ season: '', sortBy: 'created_at', sortOrder: 'desc', showActive: true })
-  const [loansPagination, setLoansPagination] = useState({ page: 1, pageSize: 25 })
+  const [loanFilters, setLoanFilters] = useState({ player_name: '', season: '', sortBy: 'created_at', sortOrder: 'desc', showActive: true })
+  // Current filters for the admin load callback, which doesn't re-run on filter edits
+  const loanFiltersRef = useRef(loanFilters)
+  useEffect(() => { loanFiltersRef.current = loanFilters }, [loanFilters])
   const [supplementalLoans, setSupplementalLoans] = useState([])
   const [supplementalFilters, setSupplementalFilters] = useState({ player_name: '', season: '' })
   const [supplementalForm, setSupplementalForm] = useState({ player_name: '', parent_team_name: '', loan_team_name: '', season_year: '' })
@@ -971,9 +1001,11 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
   const [reviewBatchDelete, setReviewBatchDelete] = useState([])
   const [reviewFinalizeBusy, setReviewFinalizeBusy] = useState(false)
   const [reviewTotalMatched, setReviewTotalMatched] = useState(0)
-  const [playersHubData, setPlayersHubData] = useState({ items: [], total: 0, page: 1, page_size: 50, total_pages: 1 })
+  const [playersHubData, setPlayersHubData] = useState({ items: [], total: 0, total_is_estimate: false, next_cursor: null })
   const [playersHubFilters, setPlayersHubFilters] = useState({ team_id: '', search: '', has_sofascore: '' })
-  const [playersHubPage, setPlayersHubPage] = useState(1)
+  // Keyset cursors of the pages walked so far; the last one is the page shown (null: first page)
+  const [playersHubCursors, setPlayersHubCursors] = useState([null])
+  const playersHubCursor = playersHubCursors[playersHubCursors.length - 1]
   const [playersHubLoading, setPlayersHubLoading] = useState(false)
   const [editingPlayerSofascore, setEditingPlayerSofascore] = useState({})
   const [inlinePlayerNameEdits, setInlinePlayerNameEdits] = useState({})
@@ -1219,9 +1251,11 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
       setRunStatus(rs.runs_paused)
       const pf = await APIService.adminListPendingFlags()
       setFlags(pf)
-      // initial loans set: active
-      const ls = await APIService.adminLoansList({ active_only: 'true' })
-      setLoans(ls)
+      // initial loans set: the first keyset page for the current filters
+      const ls = await APIService.adminLoansList(adminLoanListParams(loanFiltersRef.current))
+      setLoans(ls.items)
+      setLoansNextCursor(ls.next_cursor)
+      setLoansTotal({ total: ls.total, total_is_estimate: ls.total_is_estimate })
       // initial newsletters
       const nls = await APIService.adminNewslettersList({})
       setNewslettersAdmin(Array.isArray(nls) ? nls : [])
@@ -1237,6 +1271,7 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
     } else {
       setFlags([])
       setLoans([])
+      setLoansNextCursor(null)
       setNewslettersAdmin([])
       setSelectedNewsletterIds([])
     }
@@ -1490,8 +1525,7 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
       },
     }))
     try {
-      const rows = await APIService.adminLoansList({ player_id: flag.player_api_id, active_only: 'false' })
-      const list = Array.isArray(rows) ? rows : []
+      const { items: list } = await APIService.adminLoansList({ player_id: flag.player_api_id, active_only: 'false', count: 'none' })
       if (list.length === 0) {
         setFlagEditors((prev) => ({
           ...prev,
@@ -1666,11 +1700,32 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
       setMessage({ type: 'error', text: `Loan update failed: ${msg}` })
     }
   }
+  // Back to the first keyset page for the current filters
   const refreshLoans = async () => {
-    const params = { ...loanFilters }
-    if (params.player_name && params.player_name.trim() === '') delete params.player_name
-    const ls = await APIService.adminLoansList(params)
-    setLoans(ls)
+    setLoansLoading(true)
+    try {
+      const ls = await APIService.adminLoansList(adminLoanListParams(loanFilters))
+      setLoans(ls.items)
+      setLoansNextCursor(ls.next_cursor)
+      setLoansTotal({ total: ls.total, total_is_estimate: ls.total_is_estimate })
+    } catch (error) {
+      setMessage({ type: 'error', text: `Failed to load loans: ${error?.body?.error || error.message}` })
+    } finally {
+      setLoansLoading(false)
+    }
+  }
+  const loadMoreLoans = async () => {
+    if (!loansNextCursor) return
+    setLoansLoading(true)
+    try {
+      const ls = await APIService.adminLoansList({ ...adminLoanListParams(loanFilters), cursor: loansNextCursor, count: 'none' })
+      setLoans((prev) => [...prev, ...ls.items])
+      setLoansNextCursor(ls.next_cursor)
+    } catch (error) {
+      setMessage({ type: 'error', text: `Failed to load loans: ${error?.body?.error || error.message}` })
+    } finally {
+      setLoansLoading(false)
+    }
   }
   const backfillTeamLeagues = async () => {
     try {
@@ -1826,44 +1881,6 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
       setDeleteSupplementalLoanConfirm(null)
     }
   }
-  const teamIdToTeam = useMemo(() => {
-    const m = new Map()
-    for (const t of runTeams) m.set(t.id, t)
-    return m
-  }, [runTeams])
-  const filteredLoans = useMemo(() => {
-    const seasonStr = (loanFilters.season || '').trim()
-    if (!seasonStr) return loans
-    const seasonYear = parseInt(seasonStr, 10)
-    if (!seasonYear) return loans
-    const matchesSeason = (l) => {
-      const ls = l.loan_season
-      if (ls) {
-        const start = parseInt(String(ls).split('-')[0], 10)
-        return start === seasonYear
-      }
-      const wk = l.window_key || ''
-      try {
-        const start = parseInt(String(wk).split('::')[0].split('-')[0], 10)
-        return start === seasonYear
-      } catch {
-        return false
-      }
-    }
-    return loans.filter(matchesSeason)
-  }, [loans, loanFilters.season])
-  const loansByLeague = useMemo(() => {
-    const leagues = {}
-    for (const l of filteredLoans) {
-      const t = teamIdToTeam.get(l.primary_team_id)
-      const league = t?.league_name || 'Other'
-      if (!leagues[league]) leagues[league] = {}
-      const teamKey = l.primary_team_id
-      if (!leagues[league][teamKey]) leagues[league][teamKey] = { teamId: teamKey, teamName: l.primary_team_name, loans: [] }
-      leagues[league][teamKey].loans.push(l)
-    }
-    return leagues
-  }, [filteredLoans, teamIdToTeam])
   const refreshNewsletters = async () => {
     const params = {}
     if (nlFilters.published_only) params.published_only = nlFilters.published_only
@@ -2686,14 +2703,12 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
   }, [editingNl?.id])
 
   // Players Hub functions
-  const loadPlayersHub = async () => {
+  const loadPlayersHub = async (cursor = playersHubCursor) => {
     if (!adminReady) return
     setPlayersHubLoading(true)
     try {
-      const params = {
-        page: playersHubPage,
-        page_size: 50,
-      }
+      const params = { limit: 50 }
+      if (cursor) params.cursor = cursor
       if (playersHubFilters.team_id) params.team_id = playersHubFilters.team_id
       if (playersHubFilters.search) params.search = playersHubFilters.search
       if (playersHubFilters.has_sofascore) params.has_sofascore = playersHubFilters.has_sofascore
@@ -2721,13 +2736,13 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
   }
 
   const applyPlayersHubFilters = () => {
-    setPlayersHubPage(1)
-    loadPlayersHub()
+    setPlayersHubCursors([null])
+    loadPlayersHub(null)
   }
 
   const resetPlayersHubFilters = () => {
     setPlayersHubFilters({ team_id: '', search: '', has_sofascore: '' })
-    setPlayersHubPage(1)
+    setPlayersHubCursors([null])
   }
 
   const updatePlayerSofascoreId = async (playerId, sofascoreId) => {
@@ -3095,10 +3110,10 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
   }
 
   useEffect(() => {
-    if (adminReady && playersHubPage) {
+    if (adminReady) {
       loadPlayersHub()
     }
-  }, [adminReady, playersHubPage])
+  }, [adminReady, playersHubCursor])
 
   // Sandbox task loading functions (from AdminSandboxPage)
   const buildSandboxDefaults = useCallback((taskList) => {
@@ -3338,14 +3353,15 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
     }
   }, [ensureAdminSession])
 
-  const loadSubscriberStats = useCallback(async () => {
+  const loadSubscriberStats = useCallback(async ({ refresh = false } = {}) => {
     const startedAt = Date.now()
     const debugRequestId = (typeof crypto !== 'undefined' && crypto.randomUUID)
       ? crypto.randomUUID()
       : `sub-stats-${startedAt.toString(36)}-${Math.random().toString(36).slice(2, 8)}`
     const params = {
       search: subscriberSearch,
-      sort: subscriberSort
+      sort: subscriberSort,
+      refresh,
     }
     console.info(`[subscriber-stats:${debugRequestId}] fetching`, params)
     setSubscriberStatsLoading(true)
@@ -3833,7 +3849,7 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
                           <Button
                             variant="outline"
                             size="sm"
-                            onClick={loadSubscriberStats}
+                            onClick={() => loadSubscriberStats({ refresh: true })}
                             disabled={subscriberStatsLoading}
                           >
                             {subscriberStatsLoading ? <Loader2 className="h-4 w-4 animate-spin" /> : 'Refresh'}
@@ -4217,7 +4233,7 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
                           <div className="flex items-center justify-between w-full pr-4">
                             <h2 className="font-semibold text-lg">Players & Loans Manager</h2>
                             <div className="text-sm text-muted-foreground">
-                              {playersHubData.items.length} player{playersHubData.items.length !== 1 ? 's' : ''}
+                              {formatListTotal(playersHubData.total, playersHubData.total_is_estimate)} player{playersHubData.total !== 1 ? 's' : ''}
                             </div>
                           </div>
                         </AccordionTrigger>
@@ -4843,25 +4859,25 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
                               </div>
 
                               {/* Pagination */}
-                              {playersHubData.total_pages > 1 && (
+                              {(playersHubCursors.length > 1 || playersHubData.next_cursor) && (
                                 <div className="flex items-center justify-between border-t border-border pt-3">
                                   <span className="text-sm text-muted-foreground">
-                                    Page {playersHubData.page} of {playersHubData.total_pages}
+                                    Page {playersHubCursors.length} · {formatListTotal(playersHubData.total, playersHubData.total_is_estimate)} players
                                   </span>
                                   <div className="flex gap-2">
                                     <Button
                                       size="sm"
                                       variant="outline"
-                                      onClick={() => setPlayersHubPage(Math.max(1, playersHubPage - 1))}
-                                      disabled={playersHubPage === 1 || playersHubLoading}
+                                      onClick={() => setPlayersHubCursors((prev) => prev.slice(0, -1))}
+                                      disabled={playersHubCursors.length === 1 || playersHubLoading}
                                     >
                                       Previous
                                     </Button>
                                     <Button
                                       size="sm"
                                       variant="outline"
-                                      onClick={() => setPlayersHubPage(Math.min(playersHubData.total_pages, playersHubPage + 1))}
-                                      disabled={playersHubPage === playersHubData.total_pages || playersHubLoading}
+                                      onClick={() => setPlayersHubCursors((prev) => [...prev, playersHubData.next_cursor])}
+                                      disabled={!playersHubData.next_cursor || playersHubLoading}
                                     >
                                       Next
                                     </Button>
@@ -4874,6 +4890,67 @@ function AdminPage({ defaultTab = 'newsletters', includeSandbox = true, forcedTa
                       </AccordionItem>
                     </Accordion>
                   </div>
+                  <div id="admin-loans-list" className="border rounded p-4 md:col-span-2">
+                    <div className="flex items-center justify-between mb-3">
+                      <h2 className="font-semibold">Loans</h2>
+                      <span className="text-sm text-muted-foreground">
+                        Showing {loans.length}{loansTotal.total != null ? ` of ${formatListTotal(loansTotal.total, loansTotal.total_is_estimate)}` : ''}
+                      </span>
+                    </div>
+                    <div className="grid grid-cols-1 sm:grid-cols-4 gap-2 items-end mb-4">
+                      <div className="flex flex-col">
+                        <span className="text-xs text-muted-foreground">Player name</span>
+                        <input className="border rounded p-2 text-sm w-full" placeholder="e.g., Smith" value={loanFilters.player_name} onChange={e => setLoanFilters({ ...loanFilters, player_name: e.target.value })} />
+                      </div>
+                      <div className="flex flex-col">
+                        <span className="text-xs text-muted-foreground">Season (YYYY)</span>
+                        <input type="number" inputMode="numeric" pattern="[0-9]*" className="border rounded p-2 text-sm w-full" placeholder="2025" value={loanFilters.season} onChange={e => setLoanFilters({ ...loanFilters, season: e.target.value })} />
+                      </div>
+                      <label className="flex items-center gap-2 text-sm p-2">
+                        <input type="checkbox" checked={loanFilters.showActive} onChange={e => setLoanFilters({ ...loanFilters, showActive: e.target.checked })} />
+                        Active only
+                      </label>
+                      <Button size="sm" variant="outline" onClick={refreshLoans} disabled={loansLoading}>Apply Filters</Button>
+                    </div>
+                    {loans.length === 0 ? (
+                      <div className="text-sm text-muted-foreground">{loansLoading ? 'Loading loans…' : 'No loans match these filters.'}</div>
+                    ) : (
+                      <div className="overflow-x-auto">
+                        <table className="min-w-full text-sm border">
+                          <thead className="bg-secondary">
+                            <tr className="text-left border-b">
+                              <th className="p-2">Player</th>
+                              <th className="p-2">Parent Team</th>
+                              <th className="p-2">Loan Team</th>
+                              <th className="p-2">Window</th>
+                              <th className="p-2">Active</th>
+                            </tr>
+                          </thead>
+                          <tbody>
+                            {loans.map((l) => (
+                              <tr key={l.id} className="border-b">
+                                <td className="p-2 whitespace-nowrap">
+                                  <div className="font-medium">{l.player_name}</div>
+                                  <div className="text-muted-foreground text-xs">ID: {l.player_id}</div>
+                                </td>
+                                <td className="p-2">{l.primary_team_name}</td>
+                                <td className="p-2">{l.loan_team_name}</td>
+                                <td className="p-2">{l.window_key}</td>
+                                <td className="p-2">{l.is_active ? 'Yes' : 'No'}</td>
+                              </tr>
+                            ))}
+                          </tbody>
+                        </table>
+                      </div>
+                    )}
+                    {loansNextCursor && (
+                      <div className="flex justify-center pt-3">
+                        <Button size="sm" variant="outline" onClick={loadMoreLoans} disabled={loansLoading}>
+                          {loansLoading ? 'Loading…' : 'Load more'}
+                        </Button>
+                      </div>
+                    )}
+                  </div>
                   <div id="admin-supplemental-loans" className="border rounded p-4 md:col-span-2">
                     <h2 className="font-semibold mb-3">Manual Player Entries</h2>
                     <p className="text-sm text-muted-foreground mb-4">
@@ -22,7 +22,7 @@ export function BackgroundJobsProvider({ children }) {
     const [dismissed, setDismissed] = useState(new Set())
     const intervalRef = useRef(null)
 
-    const hasRunning = activeJobs.some(j => j.status === 'running')
+    const hasRunning = activeJobs.some(j => j.status === 'running' || j.status === 'queued')
 
     const fetchJobs = useCallback(async () => {
         try {
@@ -37,12 +37,66 @@ export function BackgroundJobsProvider({ children }) {
         fetchJobs()
     }, [fetchJobs])
 
+    // While jobs run, follow the server's SSE stream instead of polling.
+    // Falls back to polling if the stream can't be opened or drops.
+    const [streamFailed, setStreamFailed] = useState(false)
+    const [streamRound, setStreamRound] = useState(0)
+
+    useEffect(() => {
+        if (!hasRunning || streamFailed) return
+        const controller = new AbortController()
+
+        const follow = async () => {
+            const response = await APIService.streamAdminActiveJobs(controller.signal)
+            if (!response.ok || !response.body) throw new Error(`stream ${response.status}`)
+            const reader = response.body.getReader()
+            const decoder = new TextDecoder()
+            let buffer = ''
+            let eventType = 'message'
+            while (true) {
+                const { done, value } = await reader.read()
+                if (done) break
+                buffer += decoder.decode(value, { stream: true })
+                const lines = buffer.split('\n')
+                buffer = lines.pop() || ''
+                for (const line of lines) {
+                    if (line.startsWith('event: ')) {
+                        eventType = line.slice(7).trim()
+                    } else if (line.startsWith('data: ') && eventType === 'jobs') {
+                        try {
+                            setActiveJobs(JSON.parse(line.slice(6)) || [])
+                        } catch {
+                            // Ignore malformed frames
+                        }
+                    }
+                }
+            }
+        }
+
+        let reconnect = null
+        follow()
+            .then(() => {
+                // Server closes long-lived streams; refresh and reconnect
+                if (controller.signal.aborted) return
+                fetchJobs()
+                reconnect = setTimeout(() => setStreamRound(r => r + 1), POLL_ACTIVE)
+            })
+            .catch(() => {
+                if (!controller.signal.aborted) setStreamFailed(true)
+            })
+        return () => {
+            controller.abort()
+            clearTimeout(reconnect)
+        }
+    }, [hasRunning, streamFailed, streamRound, fetchJobs])
+
     useEffect(() => {
         if (intervalRef.current) clearInterval(intervalRef.current)
+        if (hasRunning && !streamFailed) return
         const delay = hasRunning ? POLL_ACTIVE : POLL_IDLE
         intervalRef.current = setInterval(fetchJobs, delay)
         return () => clearInterval(intervalRef.current)
-    }, [hasRunning, fetchJobs])
+    }, [hasRunning, streamFailed, fetchJobs])
 
     const isBlocking = activeJobs.some(
         j => j.status === 'running' && BLOCKING_JOB_TYPES.includes(j.type)
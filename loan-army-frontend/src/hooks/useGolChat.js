@@ -3,7 +3,7 @@ import { APIService } from '@/lib/api'
 
 export function useGolChat() {
   const [messages, setMessages] = useState([])
-  // Each message: {id, role: 'user'|'assistant', content: '', dataCards: [], toolCall: null}
+  // Each message: {id, role: 'user'|'assistant', content: '', dataCards: [], toolCall: null, timings: []}
   const [isStreaming, setIsStreaming] = useState(false)
   const [sessionId] = useState(() => crypto.randomUUID())
   const abortRef = useRef(null)
@@ -75,6 +75,15 @@ export function useGolChat() {
                   updated[updated.length - 1] = last
                   return updated
                 })
+              } else if (eventType === 'timing') {
+                // Per-round latency breakdown (LLM vs tools), kept for debugging
+                setMessages(prev => {
+                  const updated = [...prev]
+                  const last = { ...updated[updated.length - 1] }
+                  last.timings = [...(last.timings || []), data]
+                  updated[updated.length - 1] = last
+                  return updated
+                })
               } else if (eventType === 'done') {
                 setMessages(prev => {
                   const updated = [...prev]
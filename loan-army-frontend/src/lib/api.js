@@ -375,6 +375,11 @@ export class APIService {
         return this.request(`/players/${playerId}/season-stats`)
     }
 
+    // Profile, stats, season stats, journey map, commentaries and links in one document
+    static async getPlayerPage(playerId) {
+        return this.request(`/players/${playerId}/page`)
+    }
+
     static async getPlayerCommentaries(playerId) {
         return this.request(`/players/${playerId}/commentaries`)
     }
@@ -487,6 +492,7 @@ export class APIService {
         if (params.search) query.set('search', params.search)
         if (params.min_subscribers) query.set('min_subscribers', params.min_subscribers)
         if (params.sort) query.set('sort', params.sort)
+        if (params.refresh) query.set('refresh', '1')
         const queryString = query.toString()
         const url = `/admin/subscriber-stats${queryString ? '?' + queryString : ''}`
         const requestOptions = {}
@@ -659,7 +665,13 @@ export class APIService {
     }
     static async adminLoansList(params = {}) {
         const q = new URLSearchParams(params)
-        return this.request(`/admin/loans?${q}`, {}, { admin: true })
+        const data = await this.request(`/admin/loans?${q}`, {}, { admin: true })
+        return {
+            items: Array.isArray(data?.items) ? data.items : [],
+            total: data?.total ?? null,
+            total_is_estimate: Boolean(data?.total_is_estimate),
+            next_cursor: data?.next_cursor || null,
+        }
     }
     static async adminLoanCreate(payload) {
         return this.request('/admin/loans', { method: 'POST', body: JSON.stringify(payload) }, { admin: true })
@@ -826,14 +838,13 @@ export class APIService {
         const url = query ? `/admin/players?${query}` : '/admin/players'
         const data = await this.request(url, {}, { admin: true })
         if (!data) {
-            return { items: [], total: 0, page: 1, page_size: 50, total_pages: 1 }
+            return { items: [], total: 0, total_is_estimate: false, next_cursor: null }
         }
         return {
             items: Array.isArray(data.items) ? data.items : [],
             total: Number(data.total) || 0,
-            page: Number(data.page) || 1,
-            page_size: Number(data.page_size) || 50,
-            total_pages: Number(data.total_pages) || 1,
+            total_is_estimate: Boolean(data.total_is_estimate),
+            next_cursor: data.next_cursor || null,
         }
     }
     static async adminPlayerGet(playerId) {
@@ -1642,6 +1653,23 @@ export class APIService {
         return this.request('/admin/jobs/active', {}, { admin: true })
     }
 
+    // SSE stream of running jobs (`jobs` events); returns the raw fetch Response
+    static async streamAdminActiveJobs(signal) {
+        if (!this.userToken || !this.adminKey) {
+            const err = new Error('Admin credentials required')
+            err.status = 401
+            throw err
+        }
+        return fetch(`${API_BASE_URL}/admin/jobs/active/stream`, {
+            headers: {
+                'Authorization': `Bearer ${this.userToken}`,
+                'X-API-Key': this.adminKey,
+                'X-Admin-Key': this.adminKey,
+            },
+            signal,
+        })
+    }
+
     static async adminCancelJob(jobId) {
         return this.request(`/admin/jobs/${jobId}/cancel`, { method: 'POST' }, { admin: true })
     }
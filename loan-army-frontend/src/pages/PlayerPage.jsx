@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useRef } from 'react'
 import { useParams, Link, useNavigate } from 'react-router-dom'
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
@@ -96,6 +96,8 @@ const METRIC_CONFIG = {
 }
 
 const DEFAULT_POSITION = 'Midfielder'
+// The API refreshes stale player data in the background; re-read it once after this delay
+const BACKGROUND_REFRESH_RELOAD_MS = 30000
 
 export function PlayerPage() {
     const { playerId } = useParams()
@@ -120,6 +122,7 @@ export function PlayerPage() {
 
     // Journey data (lifted here so MiniProgressBar can access it from header)
     const [journeyData, setJourneyData] = useState(null)
+    const reloadTimer = useRef(null)
     
 
     // Smart back navigation - goes to previous page, or home if no history
@@ -137,24 +140,38 @@ export function PlayerPage() {
         if (playerId) {
             loadPlayerData()
         }
+        return () => clearTimeout(reloadTimer.current)
     }, [playerId])
 
+    // Quietly pick up the results of a background refresh
+    const reloadRefreshedData = async () => {
+        try {
+            const page = await APIService.getPlayerPage(playerId)
+            if (page.profile) setProfile(page.profile)
+            if (page.stats) setStats(page.stats)
+            if (page.season_stats) setSeasonStats(page.season_stats)
+        } catch (err) {
+            console.error('Failed to reload refreshed player data', err)
+        }
+    }
+
     const loadPlayerData = async () => {
         setLoading(true)
         setError(null)
         try {
-            const [profileData, statsData, seasonData, commentariesData, journeyMapData] = await Promise.all([
-                APIService.getPublicPlayerProfile(playerId).catch(() => null),
-                APIService.getPublicPlayerStats(playerId),
-                APIService.getPublicPlayerSeasonStats(playerId).catch(() => null),
-                APIService.getPlayerCommentaries(playerId).catch(() => ({ commentaries: [], authors: [], total_count: 0 })),
-                APIService.getPlayerJourneyMap(playerId).catch(() => null),
-            ])
+            const page = await APIService.getPlayerPage(playerId)
+            const statsData = page.stats
+            const journeyMapData = page.journey_map
 
-            setProfile(profileData)
+            setProfile(page.profile)
             setStats(statsData || [])
-            setSeasonStats(seasonData)
-            setCommentaries(commentariesData || { commentaries: [], authors: [], total_count: 0 })
+            setSeasonStats(page.season_stats)
+            setCommentaries(page.commentaries || { commentaries: [], authors: [], total_count: 0 })
+
+            clearTimeout(reloadTimer.current)
+            if (page.refreshing) {
+                reloadTimer.current = setTimeout(reloadRefreshedData, BACKGROUND_REFRESH_RELOAD_MS)
+            }
 
             // Journey: use cached data, or trigger on-demand sync if missing
             if (journeyMapData) {
@@ -24,9 +24,10 @@ export function AdminDashboard() {
 
     const rebuildRunning = isBlocking
 
-    const loadStats = useCallback(async () => {
+    const loadStats = useCallback(async ({ refresh = false } = {}) => {
         try {
-            const data = await APIService.request('/admin/dashboard-stats', {}, { admin: true })
+            const url = refresh ? '/admin/dashboard-stats?refresh=1' : '/admin/dashboard-stats'
+            const data = await APIService.request(url, {}, { admin: true })
             setStats(data)
         } catch (error) {
             console.error('Failed to load dashboard stats:', error)
@@ -56,7 +57,7 @@ export function AdminDashboard() {
                     type: 'success',
                     text: `Rebuild complete! Created ${r.total_created || 0} tracked players, synced ${r.players_synced || 0} journeys, linked ${r.journeys_linked || 0} orphans.`
                 })
-                loadStats()
+                loadStats({ refresh: true })
             } else if (job.status === 'failed') {
                 setRebuildMessage({
                     type: 'error',
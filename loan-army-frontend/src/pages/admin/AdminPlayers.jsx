@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { APIService } from '@/lib/api'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
@@ -32,6 +32,9 @@ const LEVEL_OPTIONS = [
 
 const POSITION_OPTIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Attacker']
 
+const STATUS_REFRESH_POLL_MS = 3000
+const STATUS_REFRESH_MAX_WAIT_MS = 30 * 60 * 1000
+
 function StatusBadge({ status }) {
     return <Badge className={STATUS_BADGE_CLASSES[status] || 'bg-secondary text-muted-foreground'}>{(status || '').replace('_', ' ')}</Badge>
 }
@@ -51,6 +54,29 @@ function AllPlayersTab({ teams, setMessage }) {
     const [deletingId, setDeletingId] = useState(null)
     const [refreshingStatuses, setRefreshingStatuses] = useState(false)
 
+    const mountedRef = useRef(true)
+    useEffect(() => {
+        mountedRef.current = true
+        return () => { mountedRef.current = false }
+    }, [])
+
+    // refresh-statuses runs as a background job; poll until it settles, the
+    // wait runs out or the tab unmounts (null: stop quietly)
+    const waitForStatusRefresh = useCallback(async (res) => {
+        if (!res?.job_id) return res
+        const deadline = Date.now() + STATUS_REFRESH_MAX_WAIT_MS
+        while (Date.now() < deadline) {
+            await new Promise((resolve) => setTimeout(resolve, STATUS_REFRESH_POLL_MS))
+            if (!mountedRef.current) return null
+            const job = await APIService.adminGetJobStatus(res.job_id)
+            if (job?.status === 'completed') return job.results || {}
+            if (job && !['queued', 'running'].includes(job.status)) {
+                throw new Error(job.error || `Job ${job.status}`)
+            }
+        }
+        throw new Error('Still running after 30 minutes; check the background jobs panel')
+    }, [])
+
     const [filters, setFilters] = useState({
         search: '',
         team_id: '',
@@ -175,7 +201,8 @@ function AllPlayersTab({ teams, setMessage }) {
                         setRefreshingStatuses(true)
                         try {
                             const payload = filters.team_id ? { team_id: Number(filters.team_id) } : {}
-                            const res = await APIService.adminRefreshTrackedPlayerStatuses(payload)
+                            const res = await waitForStatusRefresh(await APIService.adminRefreshTrackedPlayerStatuses(payload))
+                            if (!res) return
                             setMessage({ type: 'success', text: `Refreshed statuses: ${res.updated} of ${res.total} updated` })
                             loadPlayers()
                         } catch (error) {
@@ -201,7 +228,8 @@ function AllPlayersTab({ teams, setMessage }) {
                         setRefreshingStatuses(true)
                         try {
                             const payload = { team_id: Number(filters.team_id), resync_journeys: true }
-                            const res = await APIService.adminRefreshTrackedPlayerStatuses(payload)
+                            const res = await waitForStatusRefresh(await APIService.adminRefreshTrackedPlayerStatuses(payload))
+                            if (!res) return
                             const parts = [`${res.updated} of ${res.total} updated`]
                             if (res.journeys_resynced) parts.push(`${res.journeys_resynced} journeys re-synced`)
                             setMessage({ type: 'success', text: `Re-sync complete: ${parts.join(', ')}` })